@@ -2,3 +2,4 @@ HELP_PATH = '../../docs'
 DEFAULT_BINARY_PATHS = {
         'pg': '/usr/local/pgsql-11'
 }
+MODULE_MANIFEST = '/pgadmin4/modules.json'
@@ -0,0 +1,174 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# Micro-benchmark for the column descriptions of the dictionary cursor of the
+# psycopg2 driver.
+#
+# It transforms the rows of a synthetic wide result set (200 columns, with a
+# few duplicate names, and 1000 rows by default) into dictionaries the way the
+# DictCursor does on fetching, and converts the column descriptions the way
+# every poll of the Query Tool does, once using the wrapper which proxied each
+# attribute access to the psycopg2 column (the previous implementation), and
+# then using the precomputed descriptions.
+#
+# Run it from the top level directory of the source tree:
+#   python tools/benchmarks/cursor_description.py --columns 200 --rows 1000
+
+from __future__ import print_function
+import argparse
+import os
+import sys
+import timeit
+from collections import OrderedDict
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                    os.pardir, os.pardir, 'web')
+)
+
+from psycopg2.extensions import Column  # noqa
+from pgadmin.utils.driver.registry import DriverRegistry  # noqa
+
+# The driver registers itself on import, and the registry is normally
+# initialized by the application.
+if DriverRegistry.registry is None:
+    DriverRegistry.registry = dict()
+
+from pgadmin.utils.driver.psycopg2.cursor import wrap_description  # noqa
+
+
+class ProxyColumn(object):
+    """The previous implementation of the column description wrapper."""
+
+    def __init__(self, _col, _name):
+        self.orig_col = _col
+        self.dummy_name = _name
+
+    def __getattribute__(self, name):
+        if (name == 'orig_col' or name == 'dummy_name' or
+                name == '__class__' or name == 'to_dict'):
+            return object.__getattribute__(self, name)
+        elif name == 'name':
+            res = object.__getattribute__(self, 'dummy_name')
+            if res is not None:
+                return res
+        return self.orig_col.__getattribute__(name)
+
+    def __getitem__(self, idx):
+        if idx == 0 and self.dummy_name is not None:
+            return self.dummy_name
+        return self.orig_col.__getitem__(idx)
+
+    def to_dict(self):
+        ores = OrderedDict()
+        ores['name'] = self.orig_col.name
+        ores['type_code'] = self.orig_col.type_code
+        ores['display_size'] = self.orig_col.display_size
+        ores['internal_size'] = self.orig_col.internal_size
+        ores['precision'] = self.orig_col.precision
+        ores['scale'] = self.orig_col.scale
+        ores['null_ok'] = self.orig_col.null_ok
+        ores['table_oid'] = self.orig_col.table_oid
+        ores['table_column'] = self.orig_col.table_column
+
+        name = ores['name']
+        if self.dummy_name:
+            ores['name'] = self.dummy_name
+        ores['display_name'] = name
+        return ores
+
+
+def synthetic_result(num_columns, num_rows):
+    """Returns the description and the rows of a wide result set."""
+    desc = [
+        Column(
+            name=('col_%d' % (idx // 2) if idx % 10 == 0
+                  else 'col_%d' % idx),
+            type_code=(23, 25, 1700, 3802)[idx % 4],
+            internal_size=-1, table_oid=16384, table_column=idx + 1
+        ) for idx in range(num_columns)
+    ]
+    rows = [
+        tuple(row * num_columns + idx for idx in range(num_columns))
+        for row in range(num_rows)
+    ]
+    return desc, rows
+
+
+def proxy_description(desc):
+    names = set()
+    res = []
+    for d in desc:
+        dummy = None
+        if d.name in names:
+            dummy = '%s-%d' % (d.name, 2)
+        names.add(d.name)
+        res.append(ProxyColumn(d, dummy))
+    return tuple(res)
+
+
+def fetch_before(desc, rows):
+    odt_desc = proxy_description(desc)
+    return [dict((k[0], v) for k, v in zip(odt_desc, tup)) for tup in rows]
+
+
+def fetch_after(desc, rows):
+    odt_desc = wrap_description(desc)
+    odt_names = tuple(d[0] for d in odt_desc)
+    return [dict(zip(odt_names, tup)) for tup in rows]
+
+
+def best(func, repeat, number):
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+if __name__ == '__main__':
+    args_parser = argparse.ArgumentParser(
+        description="Cursor column description micro-benchmark"
+    )
+    args_parser.add_argument(
+        '--columns', type=int, default=200,
+        help="Number of the columns of the result set"
+    )
+    args_parser.add_argument(
+        '--rows', type=int, default=1000,
+        help="Number of the rows fetched"
+    )
+    args_parser.add_argument(
+        '--polls', type=int, default=100,
+        help="Number of the polls (the descriptions converted) per run"
+    )
+    args_parser.add_argument(
+        '--repeat', type=int, default=5,
+        help="Number of the runs (the best one is reported)"
+    )
+    args = args_parser.parse_args()
+
+    desc, rows = synthetic_result(args.columns, args.rows)
+    proxy_desc = proxy_description(desc)
+    wrapped_desc = wrap_description(desc)
+    assert fetch_before(desc, rows) == fetch_after(desc, rows)
+    assert [d.to_dict() for d in proxy_desc] == \
+        [d.to_dict() for d in wrapped_desc]
+
+    row_before = best(lambda: fetch_before(desc, rows), args.repeat, 1)
+    row_after = best(lambda: fetch_after(desc, rows), args.repeat, 1)
+    poll_before = best(
+        lambda: [d.to_dict() for d in proxy_desc], args.repeat, args.polls
+    )
+    poll_after = best(
+        lambda: [d.to_dict() for d in wrapped_desc], args.repeat, args.polls
+    )
+
+    print("%d columns, %d rows" % (args.columns, args.rows))
+    print("%-28s %12s %12s" % ("", "before (us)", "after (us)"))
+    print("%-28s %12.2f %12.2f" % ("per row", row_before * 1e6 / args.rows,
+                                   row_after * 1e6 / args.rows))
+    print("%-28s %12.2f %12.2f" % ("per poll", poll_before * 1e6,
+                                   poll_after * 1e6))
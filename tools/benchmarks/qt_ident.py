@@ -0,0 +1,119 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# Micro-benchmark for the identifier quoting functions (qtIdent and
+# qtTypeIdent) of the psycopg2 driver.
+#
+# It quotes all the identifiers of a synthetic schema (10000 objects by
+# default) the way the reverse engineered SQL and the browser tree listing
+# do, once with the quoted identifier cache disabled, and then with the cold
+# and warm cache.
+#
+# Run it from the top level directory of the source tree:
+#   python tools/benchmarks/qt_ident.py --objects 10000 --repeat 5
+
+from __future__ import print_function
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                    os.pardir, os.pardir, 'web')
+)
+
+from pgadmin.utils.driver.registry import DriverRegistry  # noqa
+
+# The driver registers itself on import, and the registry is normally
+# initialized by the application.
+if DriverRegistry.registry is None:
+    DriverRegistry.registry = dict()
+
+import pgadmin.utils.driver.psycopg2 as driver  # noqa
+from pgadmin.utils.driver.psycopg2 import Driver  # noqa
+
+COLUMN_NAMES = [
+    'id', 'name', 'created_at', 'updated_at', 'OwnerId', 'status', 'user',
+    'order', 'amount', 'description', 'Customer Name', 'tenant_id'
+]
+COLUMN_TYPES = [
+    'integer', 'bigint', 'text', 'character varying', 'numeric',
+    'timestamp with time zone', 'boolean', 'jsonb', 'int[]', 'MyEnum'
+]
+
+
+def synthetic_schema(num_objects):
+    """Returns a list of (schema, table, [(column, type), ...])."""
+    objects = []
+    for idx in range(num_objects):
+        if idx % 7 == 0:
+            table = 'Table_{0}'.format(idx)
+        elif idx % 11 == 0:
+            table = 'select_{0}'.format(idx)
+        else:
+            table = 'table_{0}'.format(idx)
+        columns = [
+            (COLUMN_NAMES[(idx + col) % len(COLUMN_NAMES)],
+             COLUMN_TYPES[(idx + col) % len(COLUMN_TYPES)])
+            for col in range(8)
+        ]
+        objects.append(('tenant_{0}'.format(idx % 4), table, columns))
+    return objects
+
+
+def quote_schema(objects):
+    for schema, table, columns in objects:
+        # Node name, CREATE TABLE, and ALTER TABLE ... OWNER TO
+        Driver.qtIdent(None, schema, table)
+        Driver.qtIdent(None, schema, table)
+        Driver.qtIdent(None, table)
+        for column, col_type in columns:
+            Driver.qtIdent(None, column)
+            Driver.qtTypeIdent(None, col_type)
+
+
+def run(objects, repeat, cache_size):
+    driver.quoted_ident_cache.maxsize = cache_size
+    driver.quoted_ident_cache.clear()
+
+    cold = timeit.timeit(lambda: quote_schema(objects), number=1)
+    warm = min(
+        timeit.repeat(lambda: quote_schema(objects), number=1, repeat=repeat)
+    )
+    return cold, warm
+
+
+if __name__ == '__main__':
+    args_parser = argparse.ArgumentParser(
+        description="Identifier quoting micro-benchmark"
+    )
+    args_parser.add_argument(
+        '--objects', type=int, default=10000,
+        help="Number of the objects in the synthetic schema"
+    )
+    args_parser.add_argument(
+        '--repeat', type=int, default=5,
+        help="Number of the warm runs (the best one is reported)"
+    )
+    args = args_parser.parse_args()
+
+    objects = synthetic_schema(args.objects)
+    calls = len(objects) * (3 + 2 * len(objects[0][2]))
+
+    cache_size = driver.QUOTED_IDENT_CACHE_SIZE
+    nocache_cold, nocache_warm = run(objects, args.repeat, 0)
+    cache_cold, cache_warm = run(objects, args.repeat, cache_size)
+
+    print("%d objects, %d quoting calls per run" % (len(objects), calls))
+    print("%-28s %10s %10s" % ("", "cold (s)", "warm (s)"))
+    print("%-28s %10.4f %10.4f" % ("without cache", nocache_cold,
+                                   nocache_warm))
+    print("%-28s %10.4f %10.4f" % ("with cache (%d entries)" % cache_size,
+                                   cache_cold, cache_warm))
@@ -0,0 +1,121 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# Micro-benchmark for the logging of the queries executed by the psycopg2
+# driver (at the SQL level).
+#
+# It logs a large generated query (a grant wizard like script of 2000 GRANT
+# statements by default) the way Connection.execute_dict does, with the SQL
+# level logged (to a null stream) and not logged, once formatting the record
+# eagerly (the previous implementation), and then using the lazy records.
+# If a connection string is given, the query is also executed, to compare
+# the overhead with the time of execute_dict itself.
+#
+# Run it from the top level directory of the source tree:
+#   python tools/benchmarks/sql_logging.py --statements 2000 \
+#       [--dsn "host=localhost dbname=postgres"]
+
+from __future__ import print_function
+import argparse
+import logging
+import os
+import sys
+import timeit
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                    os.pardir, os.pardir, 'web')
+)
+
+from flask import Flask  # noqa
+from pgadmin.utils.driver.registry import DriverRegistry  # noqa
+
+# The driver registers itself on import, and the registry is normally
+# initialized by the application.
+if DriverRegistry.registry is None:
+    DriverRegistry.registry = dict()
+
+from pgadmin.utils.driver.psycopg2.query_logging import log_query  # noqa
+
+
+def eager_log_query(logger, query):
+    """The previous implementation of the logging of the queries."""
+    logger.log(
+        25,
+        u"Execute (dict) for server #{server_id} - {conn_id} (Query-id: "
+        u"{query_id}):\n{query}".format(
+            server_id=1,
+            conn_id='CONN:1234',
+            query=query,
+            query_id=1234
+        )
+    )
+
+
+def generated_query(num_statements):
+    return u'\n'.join(
+        u'GRANT SELECT, INSERT, UPDATE ON TABLE public."Table_{0}" TO '
+        u'"role_{1}";'.format(idx, idx % 10)
+        for idx in range(num_statements)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--statements', type=int, default=2000)
+    parser.add_argument('--number', type=int, default=200)
+    parser.add_argument('--dsn', help='connection string, to execute the '
+                                      'query too')
+    args = parser.parse_args()
+
+    query = generated_query(args.statements)
+    print('Query of {0} characters'.format(len(query)))
+
+    # Same setup as create_app: DEBUG logger, handlers filtering the records
+    app = Flask('pgadmin')
+    logging.addLevelName(25, 'SQL')
+    app.logger.setLevel(logging.DEBUG)
+    app.logger.handlers = []
+    app.logger.propagate = False
+    handler = logging.StreamHandler(open(os.devnull, 'w'))
+    handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
+    app.logger.addHandler(handler)
+
+    execute = None
+    if args.dsn:
+        import psycopg2
+        conn = psycopg2.connect(args.dsn)
+        cur = conn.cursor()
+        select = 'SELECT 1'
+
+        def execute():
+            cur.execute(select)
+            cur.fetchall()
+
+    with app.app_context():
+        for level, name in ((25, 'SQL logged'), (logging.WARNING,
+                                                 'SQL not logged')):
+            handler.setLevel(level)
+            eager = timeit.timeit(
+                lambda: eager_log_query(app.logger, query),
+                number=args.number) / args.number
+            lazy = timeit.timeit(
+                lambda: log_query('dict', 1, 'CONN:1234', 1234, query),
+                number=args.number) / args.number
+            print('{0:>15}: eager {1:10.1f} us, lazy {2:10.1f} us per '
+                  'query'.format(name, eager * 1e6, lazy * 1e6))
+
+        if execute is not None:
+            took = timeit.timeit(execute, number=args.number) / args.number
+            print('{0:>15}: {1:10.1f} us per query'.format(
+                'execute (SELECT 1)', took * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# Startup profiler of the application.
+#
+# It creates the application (using the configuration of the source tree,
+# i.e. config_local.py) and reports the time spent creating it, and the time
+# spent importing and registering each module, the slowest first. If a
+# module manifest is given (see MODULE_MANIFEST), it is used to find the
+# modules; generate one using:
+#   python web/setup.py --dump-module-manifest /tmp/modules.json
+#
+# The configuration database must exist (i.e. run web/setup.py first).
+#
+# Run it from the top level directory of the source tree:
+#   python tools/benchmarks/startup.py --limit 20 \
+#       [--manifest /tmp/modules.json]
+
+from __future__ import print_function
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                    os.pardir, os.pardir, 'web')
+)
+
+if sys.version_info[0] >= 3:
+    import builtins
+else:
+    import __builtin__ as builtins
+
+builtins.SERVER_MODE = None
+
+import config  # noqa
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--limit', type=int, default=20,
+                        help='number of modules to report')
+    parser.add_argument('--manifest', help='module manifest to use')
+    args = parser.parse_args()
+
+    config.UPGRADE_CHECK_ENABLED = False
+    if args.manifest:
+        config.MODULE_MANIFEST = args.manifest
+
+    from pgadmin import create_app
+    from pgadmin.model import SCHEMA_VERSION
+
+    config.SETTINGS_SCHEMA_VERSION = SCHEMA_VERSION
+    start = time.time()
+    app = create_app()
+    print('create_app: {0:.1f} ms'.format((time.time() - start) * 1000))
+    print('{0} modules of pgAdmin imported'.format(
+        len([m for m in sys.modules if m.startswith('pgadmin')])))
+    print(app.startup_report(args.limit))
+
+
+if __name__ == '__main__':
+    main()
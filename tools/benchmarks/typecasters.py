@@ -0,0 +1,120 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+# Benchmark for the profiles of the type casters used for the results of the
+# query tool (see QUERY_TOOL_TYPECASTER_PROFILE in config.py).
+#
+# It fetches a synthetic result set (bigint, text and integer columns, 100000
+# rows by default) from a database server the way the query tool does, using
+# the compatibility and the fast profile, for each of the client encodings
+# given (UTF8, a single byte encoding and SQL_ASCII by default).
+#
+# Run it from the top level directory of the source tree:
+#   python tools/benchmarks/typecasters.py --dsn "host=localhost \
+#       dbname=postgres user=postgres" --rows 100000 --repeat 3
+
+from __future__ import print_function
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.realpath(__file__)),
+                    os.pardir, os.pardir, 'web')
+)
+
+import psycopg2  # noqa
+from pgadmin.utils.driver.registry import DriverRegistry  # noqa
+
+# The driver registers itself on import, and the registry is normally
+# initialized by the application.
+if DriverRegistry.registry is None:
+    DriverRegistry.registry = dict()
+
+from pgadmin.utils.driver.psycopg2.cursor import DictCursor  # noqa
+from pgadmin.utils.driver.psycopg2.typecast import \
+    register_global_typecasters, register_string_typecasters, \
+    register_native_typecasters, register_array_to_string_typecasters, \
+    TYPECASTER_PROFILES, FAST_PROFILE  # noqa
+
+QUERY = """SELECT g::int8 * 1000003 AS id, 'name ' || g AS name,
+    'path\\\\' || g AS path, g::int4 AS size
+FROM generate_series(1, %s) g"""
+
+
+def connect(dsn, encoding, profile):
+    conn = psycopg2.connect(dsn)
+    conn.set_client_encoding(encoding)
+
+    register_string_typecasters(conn, profile)
+    if profile == FAST_PROFILE:
+        register_native_typecasters(conn)
+    register_array_to_string_typecasters(conn)
+    return conn
+
+
+def fetch(conn, profile, rows):
+    cur = conn.cursor(cursor_factory=DictCursor)
+    cur.typecaster_profile = profile
+    cur.execute(QUERY, (rows,))
+    result = [
+        [row[col.name] for col in cur.ordered_description()]
+        for row in cur.fetchall()
+    ]
+    cur.close()
+    return result
+
+
+if __name__ == '__main__':
+    args_parser = argparse.ArgumentParser(
+        description="Query tool type casters benchmark"
+    )
+    args_parser.add_argument(
+        '--dsn', required=True,
+        help="Connection string of the database server"
+    )
+    args_parser.add_argument(
+        '--rows', type=int, default=100000,
+        help="Number of the rows fetched"
+    )
+    args_parser.add_argument(
+        '--encodings', default='UTF8,LATIN1,SQL_ASCII',
+        help="Comma separated list of the client encodings"
+    )
+    args_parser.add_argument(
+        '--repeat', type=int, default=3,
+        help="Number of the runs (the best one is reported)"
+    )
+    args = args_parser.parse_args()
+
+    register_global_typecasters()
+
+    print("%d rows" % args.rows)
+    print("%-12s" % "" + "".join(
+        "%16s" % ("%s (s)" % profile) for profile in TYPECASTER_PROFILES
+    ))
+    for encoding in args.encodings.split(','):
+        timings = []
+        results = []
+        for profile in TYPECASTER_PROFILES:
+            conn = connect(args.dsn, encoding, profile)
+            results.append(fetch(conn, profile, args.rows))
+            timings.append(min(timeit.repeat(
+                lambda: fetch(conn, profile, args.rows), number=1,
+                repeat=args.repeat
+            )))
+            conn.close()
+
+        # Same values (the numbers aside, fetched as strings otherwise)
+        assert [[str(v) for v in row] for row in results[0]] == \
+            [[str(v) for v in row] for row in results[1]]
+        print("%-12s" % encoding + "".join(
+            "%16.4f" % timing for timing in timings
+        ))
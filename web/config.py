@@ -96,6 +96,13 @@ LANGUAGES = {
 # List of modules to skip when dynamically loading
 MODULE_BLACKLIST = ['test']
 
+# Manifest of the packages defining the modules, generated using:
+#   python setup.py --dump-module-manifest <file>
+# If set, only these packages are imported at startup, instead of scanning
+# all the packages. It must be regenerated whenever a module is added or
+# removed (it is ignored if generated for another version of pgAdmin).
+MODULE_MANIFEST = None
+
 # DO NOT CHANGE UNLESS YOU KNOW WHAT YOU ARE DOING!
 # List of treeview browser nodes to skip when dynamically loading
 NODE_BLACKLIST = []
@@ -205,6 +212,18 @@ DEBUG = False
 CONSOLE_LOG_LEVEL = logging.WARNING
 FILE_LOG_LEVEL = logging.WARNING
 
+# Maximum length of the queries logged at the SQL level (0 to log them in
+# full), and the fraction of the queries which are logged (i.e. to log a
+# sample of the queries on a busy server).
+SQL_LOG_MAX_LENGTH = 0
+SQL_LOG_SAMPLE_RATE = 1.0
+
+# Set to True to record the count and the duration of the session load/save,
+# template rendering, queries and JSON encoding of each request. They are
+# returned in the Server-Timing header of the responses, and aggregated per
+# endpoint at /misc/instrumentation (for the administrators).
+PERFORMANCE_INSTRUMENTATION = False
+
 # Log format.
 CONSOLE_LOG_FORMAT = '%(asctime)s: %(levelname)s\t%(name)s:\t%(message)s'
 FILE_LOG_FORMAT = '%(asctime)s: %(levelname)s\t%(name)s:\t%(message)s'
@@ -249,6 +268,11 @@ ALLOW_SAVE_PASSWORD = True
 # Maximum number of history queries stored per user/server/database
 MAX_QUERY_HIST_STORED = 20
 
+# Save the plans of EXPLAIN with the query history, to compare the plans of
+# the same query (i.e. to find the queries which regressed after a deploy or
+# an ANALYZE).
+QUERY_HISTORY_PLANS = True
+
 ##########################################################################
 # Server-side session storage path
 #
@@ -317,6 +341,10 @@ UPGRADE_CHECK_URL = 'https://www.pgadmin.org/versions.json'
 # What key should we look at in the upgrade data file?
 UPGRADE_CHECK_KEY = 'pgadmin4'
 
+# How often (in seconds) should we check? The check runs in the background,
+# the first time shortly after the main page is first opened.
+UPGRADE_CHECK_INTERVAL = 24 * 60 * 60
+
 # Which CA file should we use?
 # Default to cacert.pem in the same directory as config.py et al.
 CA_FILE = os.path.join(os.path.dirname(os.path.realpath(__file__)),
@@ -380,6 +408,58 @@ SQLALCHEMY_TRACK_MODIFICATIONS = False
 ##########################################################################
 ON_DEMAND_RECORD_COUNT = 1000
 
+# Type casters used for the results of the query tool and View/Edit Data:
+#   'compatibility' - bigint values are fetched as strings, and the text
+#                     values of the databases not using UTF8 are re-decoded
+#                     one by one by a Python function.
+#   'fast'          - bigint values are fetched as numbers by psycopg2, and
+#                     only the ones beyond the range of the Javascript
+#                     numbers (2^53) are converted to strings, and the text
+#                     values are only re-decoded where needed, column by
+#                     column after the rows are fetched.
+QUERY_TOOL_TYPECASTER_PROFILE = 'compatibility'
+
+##########################################################################
+# Number of seconds the dashboard statistics sampled from a server are
+# shared between all the dashboards showing it, before being sampled again.
+# This is kept just below the minimum refresh rate of the graphs, so a
+# single dashboard still gets a fresh sample every time. Set it to 0 to
+# query the server for every request.
+##########################################################################
+DASHBOARD_CACHE_TTL = 0.9
+
+# Number of samples (i.e. minutes, when graphs are refreshed every second)
+# of the dashboard graphs kept in memory per server and database, to be
+# shown when a dashboard is opened. Set it to 0 to disable the history.
+DASHBOARD_HISTORY_MINUTES = 60
+
+# Number of seconds after which the samples (and the history) of a server or
+# database, not shown by any dashboard, are dropped. Set it to 0 to keep them
+# until the server or database is disconnected by all of its viewers.
+DASHBOARD_COLLECTOR_IDLE_TIMEOUT = 30 * 60
+
+# Maximum number of the servers and databases whose samples (and history)
+# are kept, i.e. up to about 500KB each with the default history. The least
+# recently used ones are dropped beyond it.
+DASHBOARD_MAX_COLLECTORS = 20
+
+##########################################################################
+# Maximum number of the background processes (i.e. backup, restore,
+# import/export and maintenance) running at once, in total (for all the
+# users) and per server. Further processes are queued, and started in the
+# order of their priority and creation as the running ones finish. Set it
+# to 0 for no limit.
+##########################################################################
+BG_PROCESS_MAX_RUNNING = 4
+BG_PROCESS_MAX_RUNNING_PER_SERVER = 2
+
+##########################################################################
+# Maximum number of the connections used by one background process running
+# in parallel (i.e. the maintenance of the tables of a database or schema,
+# or the import/export of the chunks of a table).
+##########################################################################
+BG_PROCESS_MAX_JOBS = 8
+
 ##########################################################################
 # Allow users to display Gravatar image for their username in Server mode
 ##########################################################################
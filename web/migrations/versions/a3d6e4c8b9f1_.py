@@ -0,0 +1,39 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""Added the server, priority and environment of the queued utility process
+
+Revision ID: a3d6e4c8b9f1
+Revises: 35f29b1701bd
+Create Date: 2019-05-20 11:42:17.521843
+
+"""
+from pgadmin.model import db
+
+# revision identifiers, used by Alembic.
+revision = 'a3d6e4c8b9f1'
+down_revision = '35f29b1701bd'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    db.engine.execute(
+        'ALTER TABLE process ADD COLUMN server_id INTEGER'
+    )
+    db.engine.execute(
+        'ALTER TABLE process ADD COLUMN priority INTEGER DEFAULT 0'
+    )
+    db.engine.execute(
+        'ALTER TABLE process ADD COLUMN env TEXT'
+    )
+
+
+def downgrade():
+    pass
@@ -12,8 +12,9 @@ such as setup of logging, dynamic loading of modules etc."""
 import logging
 import os
 import sys
+import time
 from types import MethodType
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 from importlib import import_module
 
 from flask import Flask, abort, request, current_app, session, url_for
@@ -30,13 +31,15 @@ from werkzeug.utils import find_modules
 
 from pgadmin.model import db, Role, Server, ServerGroup, \
     User, Keys, Version, SCHEMA_VERSION as CURRENT_SCHEMA_VERSION
-from pgadmin.utils import PgAdminModule, driver, KeyManager
+from pgadmin.utils import PgAdminModule, driver, KeyManager, \
+    instrumentation
 from pgadmin.utils.preferences import Preferences
 from pgadmin.utils.session import create_session_interface, pga_unauthorised
 from pgadmin.utils.versioned_template_loader import VersionedTemplateLoader
 from datetime import timedelta
 from pgadmin.setup import get_version, set_version
 from pgadmin.utils.ajax import internal_server_error
+from pgadmin.utils.module_manifest import find_blueprints, load_manifest
 from pgadmin.utils.csrf import pgCSRFProtect
 
 
@@ -59,21 +62,85 @@ class PgAdmin(Flask):
             loader=VersionedTemplateLoader(self)
         )
         self.logout_hooks = []
+        # Packages defining a module per package (see MODULE_MANIFEST)
+        self.module_manifest = None
+        # Time spent importing and registering each module at startup
+        self.startup_timings = OrderedDict()
+        self._registering = []
 
         super(PgAdmin, self).__init__(*args, **kwargs)
 
     def find_submodules(self, basemodule):
-        for module_name in find_modules(basemodule, True):
+        if self.module_manifest is not None and \
+                basemodule in self.module_manifest:
+            module_names = self.module_manifest[basemodule]
+        else:
+            module_names = find_modules(basemodule, True)
+
+        for module_name in module_names:
             if module_name in self.config['MODULE_BLACKLIST']:
                 self.logger.info(
                     'Skipping blacklisted module: %s' % module_name
                 )
                 continue
             self.logger.info('Examining potential module: %s' % module_name)
+            start = time.time()
             module = import_module(module_name)
-            for key in list(module.__dict__.keys()):
-                if isinstance(module.__dict__[key], PgAdminModule):
-                    yield module.__dict__[key]
+            elapsed = time.time() - start
+            self._startup_timing(module_name, 'import', elapsed)
+            # Not a part of the registration of the parent module
+            if self._registering:
+                self._registering[-1] += elapsed
+
+            for blueprint in find_blueprints(module):
+                yield blueprint
+
+    def register_blueprint(self, blueprint, **options):
+        # Time the registration, excluding the registration (and import) of
+        # the sub-modules
+        self._registering.append(0)
+        start = time.time()
+        try:
+            super(PgAdmin, self).register_blueprint(blueprint, **options)
+        finally:
+            elapsed = time.time() - start
+            self._startup_timing(
+                blueprint.import_name, 'register',
+                elapsed - self._registering.pop()
+            )
+            if self._registering:
+                self._registering[-1] += elapsed
+
+    def _startup_timing(self, module_name, step, elapsed):
+        timings = self.startup_timings.setdefault(
+            module_name, {'import': 0, 'register': 0}
+        )
+        timings[step] += elapsed
+
+    def startup_report(self, limit=None):
+        """
+        Returns the report of the time spent importing and registering the
+        modules at startup, the slowest (up to limit) modules first.
+        """
+        timings = sorted(
+            self.startup_timings.items(),
+            key=lambda item: item[1]['import'] + item[1]['register'],
+            reverse=True
+        )
+        total_import = sum(t['import'] for name, t in timings)
+        total_register = sum(t['register'] for name, t in timings)
+
+        lines = [
+            'Startup: %d modules, %.1f ms import, %.1f ms registration' % (
+                len(timings), total_import * 1000, total_register * 1000
+            ),
+            '%10s %10s  %s' % ('import', 'register', 'module')
+        ]
+        for module_name, t in timings[:limit]:
+            lines.append('%7.1f ms %7.1f ms  %s' % (
+                t['import'] * 1000, t['register'] * 1000, module_name
+            ))
+        return '\n'.join(lines)
 
     @property
     def submodules(self):
@@ -387,6 +454,9 @@ def create_app(app_name=None):
         app, config.SESSION_SKIP_PATHS
     )
 
+    # Instrument the requests (first, to time the other handlers too)
+    instrumentation.init_app(app)
+
     # Make the Session more secure against XSS & CSRF when running in web mode
     if config.SERVER_MODE:
         paranoid = Paranoid(app)
@@ -603,11 +673,16 @@ def create_app(app_name=None):
     ##########################################################################
     # Load plugin modules
     ##########################################################################
+    if config.MODULE_MANIFEST:
+        app.module_manifest = load_manifest(config.MODULE_MANIFEST, app.logger)
+
     for module in app.find_submodules('pgadmin'):
         app.logger.info('Registering blueprint module: %s' % module)
         app.register_blueprint(module)
         app.register_logout_hook(module)
 
+    app.logger.info(app.startup_report())
+
     ##########################################################################
     # Handle the desktop login
     ##########################################################################
@@ -39,17 +39,14 @@ from pgadmin.utils import PgAdminModule
 from pgadmin.utils.ajax import make_json_response
 from pgadmin.utils.csrf import pgCSRFProtect
 from pgadmin.utils.preferences import Preferences
+from pgadmin.utils.render_cache import cached_render
+from pgadmin.browser import upgrade_check
 from pgadmin.browser.register_browser_preferences import \
     register_browser_preferences
 from pgadmin.utils.master_password import validate_master_password, \
     set_masterpass_check_text, cleanup_master_password, get_crypt_key, \
     set_crypt_key, process_masterpass_disabled
 
-try:
-    import urllib.request as urlreq
-except ImportError as e:
-    import urllib2 as urlreq
-
 MODULE_NAME = 'browser'
 
 
@@ -501,43 +498,22 @@ def index():
             base_url=None
         )
 
-    # Get the current version info from the website, and flash a message if
-    # the user is out of date, and the check is enabled.
+    # Flash a message if the user is out of date, and the check is enabled.
+    # The version info is fetched from the website in the background.
     if config.UPGRADE_CHECK_ENABLED:
-        data = None
-        url = '%s?version=%s' % (config.UPGRADE_CHECK_URL, config.APP_VERSION)
-        current_app.logger.debug('Checking version data at: %s' % url)
-
-        try:
-            # Do not wait for more than 5 seconds.
-            # It stuck on rendering the browser.html, while working in the
-            # broken network.
-            if os.path.exists(config.CA_FILE):
-                response = urlreq.urlopen(url, data, 5, cafile=config.CA_FILE)
-            else:
-                response = urlreq.urlopen(url, data, 5)
-            current_app.logger.debug(
-                'Version check HTTP response code: %d' % response.getcode()
-            )
-
-            if response.getcode() == 200:
-                data = json.loads(response.read().decode('utf-8'))
-                current_app.logger.debug('Response data: %s' % data)
-        except Exception:
-            current_app.logger.exception('Exception when checking for update')
+        upgrade_check.start(current_app.logger)
 
+        data = upgrade_check.get_upgrade_version()
         if data is not None:
-            if data[config.UPGRADE_CHECK_KEY]['version_int'] > \
-                    config.APP_VERSION_INT:
-                msg = render_template(
-                    MODULE_NAME + "/upgrade.html",
-                    current_version=config.APP_VERSION,
-                    upgrade_version=data[config.UPGRADE_CHECK_KEY]['version'],
-                    product_name=config.APP_NAME,
-                    download_url=data[config.UPGRADE_CHECK_KEY]['download_url']
-                )
+            msg = render_template(
+                MODULE_NAME + "/upgrade.html",
+                current_version=config.APP_VERSION,
+                upgrade_version=data['version'],
+                product_name=config.APP_NAME,
+                download_url=data['download_url']
+            )
 
-                flash(msg, 'warning')
+            flash(msg, 'warning')
 
     response = Response(render_template(
         MODULE_NAME + "/index.html",
@@ -571,6 +547,7 @@ def index():
 @blueprint.route("/js/utils.js")
 @pgCSRFProtect.exempt
 @login_required
+@cached_render(per_session=True)
 def utils():
     layout = get_setting('Browser/Layout', default='')
     snippets = []
@@ -637,6 +614,7 @@ def utils():
 
 @blueprint.route("/js/endpoints.js")
 @pgCSRFProtect.exempt
+@cached_render()
 def exposed_urls():
     return make_response(
         render_template('browser/js/endpoints.js'),
@@ -655,6 +633,7 @@ def error_js():
 
 @blueprint.route("/js/messages.js")
 @pgCSRFProtect.exempt
+@cached_render()
 def messages_js():
     return make_response(
         render_template('browser/js/messages.js', _=gettext),
@@ -664,6 +643,7 @@ def messages_js():
 @blueprint.route("/browser.css")
 @pgCSRFProtect.exempt
 @login_required
+@cached_render()
 def browser_css():
     """Render and return CSS snippets from the nodes and modules."""
     snippets = []
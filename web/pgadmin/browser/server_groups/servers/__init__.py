@@ -28,6 +28,7 @@ from pgadmin.model import db, Server, ServerGroup, User
 from pgadmin.utils.driver import get_driver
 from pgadmin.utils.master_password import get_crypt_key
 from pgadmin.utils.exception import CryptKeyMissing
+from pgadmin.utils.render_cache import cached_render
 
 
 def has_any(data, keys):
@@ -933,6 +934,7 @@ class ServerNode(PGChildNodeView):
     def dependents(self, gid, sid):
         return make_json_response(data='')
 
+    @cached_render()
     def supported_servers(self, **kwargs):
         """
         This property defines (if javascript) exists for this node.
@@ -1155,8 +1157,10 @@ class ServerNode(PGChildNodeView):
             return bad_request(gettext("Server not found."))
 
         # Release Connection
+        from pgadmin.dashboard.collector import release_collectors
         manager = get_driver(PG_DEFAULT_DRIVER).connection_manager(sid)
 
+        release_collectors(manager)
         status = manager.release()
 
         if not status:
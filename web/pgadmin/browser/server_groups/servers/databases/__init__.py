@@ -477,8 +477,11 @@ class DatabaseView(PGChildNodeView):
 
         # Release Connection
         from pgadmin.utils.driver import get_driver
+        from pgadmin.dashboard.collector import \
+            release_monitoring_connection
         manager = get_driver(PG_DEFAULT_DRIVER).connection_manager(sid)
 
+        release_monitoring_connection(manager, did)
         status = manager.release(did=did)
 
         if not status:
@@ -28,7 +28,7 @@ from pgadmin.browser.server_groups.servers.utils import parse_priv_from_db, \
     parse_priv_to_db
 from pgadmin.browser.utils import PGChildNodeView
 from pgadmin.utils.ajax import make_json_response, internal_server_error, \
-    make_response as ajax_response, gone
+    make_response as ajax_response, gone, bad_request
 from pgadmin.utils.driver import get_driver
 
 from config import PG_DEFAULT_DRIVER
@@ -370,14 +370,27 @@ class FunctionView(PGChildNodeView, DataTypeReader):
             sid: Server Id
             did: Database Id
             scid: Schema Id
+            fnid: Function Id
+
+        See get_nodes_paging() for the paging arguments.
         """
+        paging = None
+        if fnid is None:
+            try:
+                paging = self.get_nodes_paging()
+            except ValueError as e:
+                return bad_request(errormsg=str(e))
+
+        def render_sql(paging):
+            return render_template(
+                "/".join([self.sql_template_path, 'node.sql']),
+                scid=scid,
+                fnid=fnid,
+                paging=paging
+            )
 
         res = []
-        SQL = render_template(
-            "/".join([self.sql_template_path, 'node.sql']),
-            scid=scid,
-            fnid=fnid
-        )
+        SQL = render_sql(paging)
         status, rset = self.conn.execute_2darray(SQL)
 
         if not status:
@@ -413,10 +426,7 @@ class FunctionView(PGChildNodeView, DataTypeReader):
                     language=row['lanname']
                 ))
 
-        return make_json_response(
-            data=res,
-            status=200
-        )
+        return self.make_nodes_response(res, rset['rows'], paging, render_sql)
 
     @check_precondition
     def properties(self, gid, sid, did, scid, fnid=None):
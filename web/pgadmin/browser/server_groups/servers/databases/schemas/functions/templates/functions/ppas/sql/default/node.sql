@@ -1,5 +1,6 @@
+{% import 'macros/paging.macros' as PAGING %}
 SELECT
-    pr.oid, pr.proname || '(' || COALESCE(pg_catalog.pg_get_function_identity_arguments(pr.oid), '') || ')' AS name,
+    pr.oid{{ PAGING.KEY(paging, 'pr', 'proname') }}, pr.proname || '(' || COALESCE(pg_catalog.pg_get_function_identity_arguments(pr.oid), '') || ')' AS name,
     lanname, pg_get_userbyid(proowner) AS funcowner, description
 FROM
     pg_proc pr
@@ -18,6 +19,6 @@ WHERE
 {% if scid %}
     AND pronamespace = {{scid}}::oid
 {% endif %}
-    AND typname NOT IN ('trigger', 'event_trigger')
+    AND typname NOT IN ('trigger', 'event_trigger'){{ PAGING.FILTER(paging, 'pr', 'proname') }}
 ORDER BY
-    proname;
+    {{ PAGING.ORDER_BY(paging, 'pr', 'proname') }}{{ PAGING.LIMIT(paging) }};
@@ -1,5 +1,6 @@
+{% import 'macros/paging.macros' as PAGING %}
 SELECT
-    pr.oid, pr.proname || '()' as name,
+    pr.oid{{ PAGING.KEY(paging, 'pr', 'proname') }}, pr.proname || '()' as name,
     lanname, pg_get_userbyid(proowner) as funcowner, description
 FROM
     pg_proc pr
@@ -17,6 +18,6 @@ WHERE
 {% if scid %}
     AND pronamespace = {{scid}}::oid
 {% endif %}
-    AND typname = 'trigger' AND lanname != 'edbspl'
+    AND typname = 'trigger' AND lanname != 'edbspl'{{ PAGING.FILTER(paging, 'pr', 'proname') }}
 ORDER BY
-    proname;
+    {{ PAGING.ORDER_BY(paging, 'pr', 'proname') }}{{ PAGING.LIMIT(paging) }};
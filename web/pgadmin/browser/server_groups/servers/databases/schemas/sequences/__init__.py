@@ -20,7 +20,7 @@ from pgadmin.browser.server_groups.servers.utils import parse_priv_from_db, \
     parse_priv_to_db
 from pgadmin.browser.utils import PGChildNodeView
 from pgadmin.utils.ajax import make_json_response, internal_server_error, \
-    make_response as ajax_response, gone
+    make_response as ajax_response, gone, bad_request
 from pgadmin.utils.driver import get_driver
 from config import PG_DEFAULT_DRIVER
 from pgadmin.utils import IS_PY2
@@ -190,14 +190,26 @@ class SequenceView(PGChildNodeView):
           scid: Schema ID
 
         Returns:
-
+            JSON of available sequence nodes (see get_nodes_paging() for the
+            paging arguments)
         """
+        paging = None
+        if seid is None:
+            try:
+                paging = self.get_nodes_paging()
+            except ValueError as e:
+                return bad_request(errormsg=str(e))
+
+        def render_sql(paging):
+            return render_template(
+                "/".join([self.template_path, 'nodes.sql']),
+                scid=scid,
+                seid=seid,
+                paging=paging
+            )
+
         res = []
-        SQL = render_template(
-            "/".join([self.template_path, 'nodes.sql']),
-            scid=scid,
-            seid=seid
-        )
+        SQL = render_sql(paging)
         status, rset = self.conn.execute_dict(SQL)
         if not status:
             return internal_server_error(errormsg=rset)
@@ -226,10 +238,9 @@ class SequenceView(PGChildNodeView):
                     icon="icon-%s" % self.node_type
                 ))
 
-        return make_json_response(
-            data=res,
-            status=200
-        )
+        # The sequences of the identity columns are filtered out of the page,
+        # hence 'next' is based on the rows fetched.
+        return self.make_nodes_response(res, rset['rows'], paging, render_sql)
 
     def _get_sequence_nodes(self, nodes):
         """
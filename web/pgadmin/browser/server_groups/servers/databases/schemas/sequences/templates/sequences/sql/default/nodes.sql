@@ -1,4 +1,5 @@
-SELECT cl.oid as oid, relname as name, relnamespace as schema
+{% import 'macros/paging.macros' as PAGING %}
+SELECT cl.oid as oid{{ PAGING.KEY(paging, 'cl', 'relname') }}, relname as name, relnamespace as schema
 FROM pg_class cl
 WHERE
     relkind = 'S'
@@ -7,5 +8,5 @@ WHERE
 {% endif %}
 {% if seid %}
     AND cl.oid = {{seid|qtLiteral}}::oid
-{% endif %}
-ORDER BY relname
+{% endif %}{{ PAGING.FILTER(paging, 'cl', 'relname') }}
+ORDER BY {{ PAGING.ORDER_BY(paging, 'cl', 'relname') }}{{ PAGING.LIMIT(paging) }}
@@ -19,7 +19,7 @@ from pgadmin.browser.server_groups.servers.databases.schemas.utils \
     import SchemaChildModule, DataTypeReader, VacuumSettings
 from pgadmin.browser.server_groups.servers.utils import parse_priv_to_db
 from pgadmin.utils.ajax import make_json_response, internal_server_error, \
-    make_response as ajax_response, gone
+    make_response as ajax_response, gone, bad_request
 from .utils import BaseTableView
 from pgadmin.utils.preferences import Preferences
 
@@ -212,6 +212,7 @@ class TableView(BaseTableView, DataTypeReader, VacuumSettings):
         ],
         'delete': [{'delete': 'delete'}, {'delete': 'delete'}],
         'children': [{'get': 'children'}],
+        'expand': [{'get': 'expand'}],
         'nodes': [{'get': 'node'}, {'get': 'nodes'}],
         'sql': [{'get': 'sql'}],
         'msql': [{'get': 'msql'}, {'get': 'msql'}],
@@ -329,13 +330,22 @@ class TableView(BaseTableView, DataTypeReader, VacuumSettings):
             scid: Schema ID
 
         Returns:
-            JSON of available table nodes
+            JSON of available table nodes (see get_nodes_paging() for the
+            paging arguments)
         """
+        try:
+            paging = self.get_nodes_paging()
+        except ValueError as e:
+            return bad_request(errormsg=str(e))
+
+        def render_sql(paging):
+            return render_template(
+                "/".join([self.table_template_path, 'nodes.sql']),
+                scid=scid, paging=paging
+            )
+
         res = []
-        SQL = render_template(
-            "/".join([self.table_template_path, 'nodes.sql']),
-            scid=scid
-        )
+        SQL = render_sql(paging)
         status, rset = self.conn.execute_2darray(SQL)
         if not status:
             return internal_server_error(errormsg=rset)
@@ -355,10 +365,7 @@ class TableView(BaseTableView, DataTypeReader, VacuumSettings):
                     rows_cnt=0
                 ))
 
-        return make_json_response(
-            data=res,
-            status=200
-        )
+        return self.make_nodes_response(res, rset['rows'], paging, render_sql)
 
     @BaseTableView.check_precondition
     def get_all_tables(self, gid, sid, did, scid, tid=None):
@@ -73,8 +73,6 @@ class IndexesModule(CollectionNodeModule):
         material view
         """
         if super(IndexesModule, self).BackendSupported(manager, **kwargs):
-            conn = manager.connection(did=kwargs['did'])
-
             # If PG version > 100000 and < 110000 then index is
             # not supported for partitioned table.
             if 'tid' in kwargs and 100000 <= manager.version < 110000:
@@ -83,12 +81,19 @@ class IndexesModule(CollectionNodeModule):
             if 'vid' not in kwargs:
                 return True
 
-            template_path = 'index/sql/#{0}#'.format(manager.version)
-            SQL = render_template(
-                "/".join([template_path, 'backend_support.sql']),
-                vid=kwargs['vid']
+            def probe():
+                conn = manager.connection(did=kwargs['did'])
+
+                template_path = 'index/sql/#{0}#'.format(manager.version)
+                SQL = render_template(
+                    "/".join([template_path, 'backend_support.sql']),
+                    vid=kwargs['vid']
+                )
+                return conn.execute_scalar(SQL)
+
+            status, res = manager.capability(
+                ('mview', kwargs['vid']), probe, did=kwargs['did']
             )
-            status, res = conn.execute_scalar(SQL)
 
             # check if any errors
             if not status:
@@ -29,14 +29,21 @@ from pgadmin.browser.utils import PGChildModule
 def backend_supported(module, manager, **kwargs):
     if 'tid' in kwargs and CollectionNodeModule.BackendSupported(
             module, manager, **kwargs):
-        conn = manager.connection(did=kwargs['did'])
+        def probe():
+            conn = manager.connection(did=kwargs['did'])
 
-        template_path = 'partitions/sql/{0}/#{0}#{1}#'.format(
-            manager.server_type, manager.version
+            template_path = 'partitions/sql/{0}/#{0}#{1}#'.format(
+                manager.server_type, manager.version
+            )
+            SQL = render_template("/".join(
+                [template_path, 'backend_support.sql']), tid=kwargs['tid'])
+            return conn.execute_scalar(SQL)
+
+        # Whether the table is partitioned does not change, hence it is
+        # probed only once per connection.
+        status, res = manager.capability(
+            ('partitioned', kwargs['tid']), probe, did=kwargs['did']
         )
-        SQL = render_template("/".join(
-            [template_path, 'backend_support.sql']), tid=kwargs['tid'])
-        status, res = conn.execute_scalar(SQL)
 
         # check if any errors
         if not status:
@@ -113,6 +113,8 @@ class TestBackendSupport(BaseTestGenerator):
         module.manager = Mock()
         module.manager.server_type = self.manager['server_type']
         module.manager.version = self.manager['version']
+        module.manager.capability.side_effect = \
+            lambda key, probe, did=None: probe()
         connection_mock = Mock()
         connection_mock.execute_scalar.return_value = \
             self.connection_execution_return_value
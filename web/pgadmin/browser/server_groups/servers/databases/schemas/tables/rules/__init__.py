@@ -54,16 +54,21 @@ class RuleModule(CollectionNodeModule):
         material view
         """
         if super(RuleModule, self).BackendSupported(manager, **kwargs):
-            conn = manager.connection(did=kwargs['did'])
-
             if 'vid' not in kwargs:
                 return True
 
-            self.template_path = 'rules/sql'
-            SQL = render_template("/".join(
-                [self.template_path, 'backend_support.sql']
-            ), vid=kwargs['vid'])
-            status, res = conn.execute_scalar(SQL)
+            def probe():
+                conn = manager.connection(did=kwargs['did'])
+
+                self.template_path = 'rules/sql'
+                SQL = render_template("/".join(
+                    [self.template_path, 'backend_support.sql']
+                ), vid=kwargs['vid'])
+                return conn.execute_scalar(SQL)
+
+            status, res = manager.capability(
+                ('not_mview', kwargs['vid']), probe, did=kwargs['did']
+            )
             # check if any errors
             if not status:
                 return internal_server_error(errormsg=res)
@@ -110,6 +110,10 @@ define('pgadmin.node.table', [
           applies: ['object', 'context'], callback: 'count_table_rows',
           category: 'Count', priority: 2, label: gettext('Count Rows'),
           enable: true,
+        },{
+          name: 'expand_all_table', node: 'table', module: this,
+          applies: ['context'], callback: 'expand_all', priority: 2,
+          label: gettext('Expand All'), enable: true,
         },
         ]);
         pgBrowser.Events.on(
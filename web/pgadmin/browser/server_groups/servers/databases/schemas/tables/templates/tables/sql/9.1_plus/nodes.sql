@@ -1,7 +1,8 @@
-SELECT rel.oid, rel.relname AS name,
+{% import 'macros/paging.macros' as PAGING %}
+SELECT rel.oid{{ PAGING.KEY(paging, 'rel', 'relname') }}, rel.relname AS name,
     (SELECT count(*) FROM pg_trigger WHERE tgrelid=rel.oid AND tgisinternal = FALSE) AS triggercount,
     (SELECT count(*) FROM pg_trigger WHERE tgrelid=rel.oid AND tgisinternal = FALSE AND tgenabled = 'O') AS has_enable_triggers
 FROM pg_class rel
     WHERE rel.relkind IN ('r','s','t') AND rel.relnamespace = {{ scid }}::oid
-    {% if tid %} AND rel.oid = {{tid}}::OID {% endif %}
-    ORDER BY rel.relname;
+    {% if tid %} AND rel.oid = {{tid}}::OID {% endif %}{{ PAGING.FILTER(paging, 'rel', 'relname') }}
+    ORDER BY {{ PAGING.ORDER_BY(paging, 'rel', 'relname') }}{{ PAGING.LIMIT(paging) }};
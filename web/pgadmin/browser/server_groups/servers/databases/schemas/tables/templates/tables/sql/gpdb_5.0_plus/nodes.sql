@@ -1,4 +1,5 @@
-SELECT rel.oid, rel.relname AS name,
+{% import 'macros/paging.macros' as PAGING %}
+SELECT rel.oid{{ PAGING.KEY(paging, 'rel', 'relname') }}, rel.relname AS name,
     (SELECT count(*) FROM pg_trigger WHERE tgrelid=rel.oid) AS triggercount,
     (SELECT count(*) FROM pg_trigger WHERE tgrelid=rel.oid AND tgenabled = 'O') AS has_enable_triggers,
     (CASE WHEN (SELECT count(*) from pg_partition where parrelid = rel.oid) > 0 THEN true ELSE false END) AS is_partitioned
@@ -8,5 +9,5 @@ FROM pg_class rel
       AND rel.oid NOT IN (SELECT reloid from pg_exttable)
     {% if tid %}
       AND rel.oid = {{tid}}::OID
-    {% endif %}
-    ORDER BY rel.relname;
+    {% endif %}{{ PAGING.FILTER(paging, 'rel', 'relname') }}
+    ORDER BY {{ PAGING.ORDER_BY(paging, 'rel', 'relname') }}{{ PAGING.LIMIT(paging) }};
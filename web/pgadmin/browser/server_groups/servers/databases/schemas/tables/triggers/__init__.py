@@ -73,17 +73,21 @@ class TriggerModule(CollectionNodeModule):
         if manager.server_type == 'gpdb':
             return False
         if super(TriggerModule, self).BackendSupported(manager, **kwargs):
-            conn = manager.connection(did=kwargs['did'])
-
             if 'vid' not in kwargs:
                 return True
 
-            template_path = 'triggers/sql/#{0}#'.format(manager.version)
-            SQL = render_template("/".join(
-                [template_path, 'backend_support.sql']), vid=kwargs['vid']
-            )
+            def probe():
+                conn = manager.connection(did=kwargs['did'])
 
-            status, res = conn.execute_scalar(SQL)
+                template_path = 'triggers/sql/#{0}#'.format(manager.version)
+                SQL = render_template("/".join(
+                    [template_path, 'backend_support.sql']), vid=kwargs['vid']
+                )
+                return conn.execute_scalar(SQL)
+
+            status, res = manager.capability(
+                ('not_mview', kwargs['vid']), probe, did=kwargs['did']
+            )
 
             # check if any errors
             if not status:
@@ -23,7 +23,7 @@ from pgadmin.browser.server_groups.servers.utils import parse_priv_from_db, \
     parse_priv_to_db
 from pgadmin.browser.utils import PGChildNodeView
 from pgadmin.utils.ajax import make_json_response, internal_server_error, \
-    make_response as ajax_response, gone
+    make_response as ajax_response, gone, bad_request
 from pgadmin.utils.driver import get_driver
 
 """
@@ -271,6 +271,7 @@ class ViewNode(PGChildNodeView, VacuumSettings):
         'children': [{
             'get': 'children'
         }],
+        'expand': [{'get': 'expand'}],
         'delete': [{'delete': 'delete'}, {'delete': 'delete'}],
         'nodes': [{'get': 'node'}, {'get': 'nodes'}],
         'sql': [{'get': 'sql'}],
@@ -370,11 +371,21 @@ class ViewNode(PGChildNodeView, VacuumSettings):
     @check_precondition
     def nodes(self, gid, sid, did, scid):
         """
-        Lists all views under the Views Collection node
+        Lists all views under the Views Collection node (see
+        get_nodes_paging() for the paging arguments)
         """
+        try:
+            paging = self.get_nodes_paging()
+        except ValueError as e:
+            return bad_request(errormsg=str(e))
+
+        def render_sql(paging):
+            return render_template("/".join(
+                [self.template_path, 'sql/nodes.sql']), scid=scid,
+                paging=paging)
+
         res = []
-        SQL = render_template("/".join(
-            [self.template_path, 'sql/nodes.sql']), scid=scid)
+        SQL = render_sql(paging)
         status, rset = self.conn.execute_2darray(SQL)
         if not status:
             return internal_server_error(errormsg=rset)
@@ -389,10 +400,7 @@ class ViewNode(PGChildNodeView, VacuumSettings):
                     else "icon-mview"
                 ))
 
-        return make_json_response(
-            data=res,
-            status=200
-        )
+        return self.make_nodes_response(res, rset['rows'], paging, render_sql)
 
     @check_precondition
     def properties(self, gid, sid, did, scid, vid):
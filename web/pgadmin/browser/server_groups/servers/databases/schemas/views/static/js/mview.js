@@ -118,6 +118,10 @@ define('pgadmin.node.mview', [
           applies: ['object', 'context'], callback: 'refresh_mview',
           label: gettext('With no data (concurrently)'),
           icon: 'fa fa-refresh',
+        },{
+          name: 'expand_all_mview', node: 'mview', module: this,
+          applies: ['context'], callback: 'expand_all', priority: 2,
+          label: gettext('Expand All'), enable: true,
         }]);
       },
 
@@ -87,6 +87,10 @@ define('pgadmin.node.view', [
           category: 'create', priority: 17, label: gettext('View...'),
           icon: 'wcTabIcon icon-view', data: {action: 'create', check: false},
           enable: 'canCreate',
+        },{
+          name: 'expand_all_view', node: 'view', module: this,
+          applies: ['context'], callback: 'expand_all', priority: 2,
+          label: gettext('Expand All'), enable: true,
         },
         ]);
       },
@@ -1,5 +1,6 @@
+{% import 'macros/paging.macros' as PAGING %}
 SELECT
-    c.oid,
+    c.oid{{ PAGING.KEY(paging, 'c', 'relname') }},
     c.relname AS name
 FROM pg_class c
 WHERE
@@ -7,7 +8,7 @@ WHERE
 {% if (vid and datlastsysoid) %}
     AND c.oid = {{vid}}::oid
 {% elif scid %}
-    AND c.relnamespace = {{scid}}::oid
+    AND c.relnamespace = {{scid}}::oid{{ PAGING.FILTER(paging, 'c', 'relname') }}
 ORDER BY
-    c.relname
+    {{ PAGING.ORDER_BY(paging, 'c', 'relname') }}{{ PAGING.LIMIT(paging) }}
 {% endif %}
\ No newline at end of file
@@ -25,6 +25,41 @@ from pgadmin.utils.driver import get_driver
 from pgadmin.utils.preferences import Preferences
 
 
+def pgagent_capability(manager):
+    """
+    Returns the pgAgent capability of the server, i.e. whether the pgAgent
+    schema is installed and accessible ('has_priviledge'), and whether the
+    job steps can have the connection string ('has_connstr').
+
+    It is probed only once per connection to the server.
+
+    Returns:
+        (status, capability or error message)
+    """
+    def probe():
+        status, res = manager.connection().execute_dict("""
+SELECT
+    CASE WHEN EXISTS(
+        SELECT cl.oid FROM pg_class cl
+        LEFT JOIN pg_namespace ns ON ns.oid=relnamespace
+        WHERE relname='pga_job' AND nspname='pgagent'
+    ) THEN has_table_privilege(
+      'pgagent.pga_job', 'INSERT, SELECT, UPDATE'
+    ) ELSE false END has_priviledge,
+    EXISTS(
+        SELECT 1 FROM information_schema.columns
+        WHERE
+            table_schema='pgagent' AND table_name='pga_jobstep' AND
+            column_name='jstconnstr'
+    ) has_connstr""")
+        if not status:
+            return False, res
+
+        return True, res['rows'][0]
+
+    return manager.capability('pgAgent', probe)
+
+
 class JobModule(CollectionNodeModule):
     NODE_TYPE = 'pga_job'
     COLLECTION_LABEL = _("pgAgent Jobs")
@@ -49,35 +84,12 @@ class JobModule(CollectionNodeModule):
             if not self.show_node:
                 return False
 
-        conn = manager.connection()
-
         if manager.server_type == 'gpdb':
             return False
 
-        status, res = conn.execute_scalar("""
-SELECT
-    has_table_privilege(
-      'pgagent.pga_job', 'INSERT, SELECT, UPDATE'
-    ) has_priviledge
-WHERE EXISTS(
-    SELECT has_schema_privilege('pgagent', 'USAGE')
-    WHERE EXISTS(
-        SELECT cl.oid FROM pg_class cl
-        LEFT JOIN pg_namespace ns ON ns.oid=relnamespace
-        WHERE relname='pga_job' AND nspname='pgagent'
-    )
-)
-""")
-        if status and res:
-            status, res = conn.execute_dict("""
-SELECT EXISTS(
-        SELECT 1 FROM information_schema.columns
-        WHERE
-            table_schema='pgagent' AND table_name='pga_jobstep' AND
-            column_name='jstconnstr'
-    ) has_connstr""")
-
-            manager.db_info['pgAgent'] = res['rows'][0]
+        status, res = pgagent_capability(manager)
+        if status and res['has_priviledge']:
+            manager.db_info['pgAgent'] = res
             return True
         return False
 
@@ -162,15 +174,11 @@ class JobView(PGChildNodeView):
             self.template_path = 'pga_job/sql/pre3.4'
 
             if not ('pgAgent' in self.manager.db_info):
-                status, res = self.conn.execute_dict("""
-SELECT EXISTS(
-        SELECT 1 FROM information_schema.columns
-        WHERE
-            table_schema='pgagent' AND table_name='pga_jobstep' AND
-            column_name='jstconnstr'
-    ) has_connstr""")
+                status, res = pgagent_capability(self.manager)
+                if not status:
+                    return internal_server_error(errormsg=res)
 
-                self.manager.db_info['pgAgent'] = res['rows'][0]
+                self.manager.db_info['pgAgent'] = res
 
             return f(self, *args, **kwargs)
         return wrap
@@ -16,6 +16,7 @@ from flask import render_template, request, jsonify
 from flask_babelex import gettext
 from pgadmin.browser.collection import CollectionNodeModule
 from pgadmin.browser.utils import PGChildNodeView
+from pgadmin.browser.server_groups.servers.pgagent import pgagent_capability
 from pgadmin.utils.ajax import make_json_response, gone, \
     make_response as ajax_response, internal_server_error
 from pgadmin.utils.driver import get_driver
@@ -200,15 +201,11 @@ class JobStepView(PGChildNodeView):
             self.template_path = 'pga_jobstep/sql/pre3.4'
 
             if not ('pgAgent' in self.manager.db_info):
-                status, res = self.conn.execute_dict("""
-SELECT EXISTS(
-        SELECT 1 FROM information_schema.columns
-        WHERE
-            table_schema='pgagent' AND table_name='pga_jobstep' AND
-            column_name='jstconnstr'
-    ) has_connstr""")
-
-                self.manager.db_info['pgAgent'] = res['rows'][0]
+                status, res = pgagent_capability(self.manager)
+                if not status:
+                    return internal_server_error(errormsg=res)
+
+                self.manager.db_info['pgAgent'] = res
 
             return f(*args, **kwargs)
 
@@ -54,8 +54,7 @@ define('pgadmin.browser', [
     }
   };
 
-  var processTreeData = function(payload) {
-    var data = JSON.parse(payload).data;
+  var processTreeNodes = function(data) {
     if (data.length && data[0]._type !== 'column' &&
       data[0]._type !== 'catalog_object_column') {
       data = data.sort(function(a, b) {
@@ -65,10 +64,17 @@ define('pgadmin.browser', [
     _.each(data, function(d){
       d._label = d.label;
       d.label = _.escape(d.label);
+      // Nodes expanded along with their parent (see 'expand_all')
+      if (d.branch)
+        d.branch = processTreeNodes(d.branch);
     });
     return data;
   };
 
+  var processTreeData = function(payload) {
+    return processTreeNodes(JSON.parse(payload).data);
+  };
+
   var initializeBrowserTree = pgAdmin.Browser.initializeBrowserTree =
     function(b) {
       $('#tree').aciTree({
@@ -82,8 +88,12 @@ define('pgadmin.browser', [
           if (item != null) {
             var d = this.itemData(item);
             var n = b.Nodes[d._type];
-            if (n)
-              settings.url = n.generate_url(item, 'children', d, true);
+            if (n) {
+              settings.url = n.generate_url(
+                item, d._expand_all ? 'expand' : 'children', d, true
+              );
+              delete d._expand_all;
+            }
           }
         },
         loaderDelay: 100,
@@ -807,6 +807,27 @@ define('pgadmin.browser.node', [
           },
           null).show();
       },
+      // Callback to reload the children of the node, along with the nodes
+      // of the child collections, using a single request
+      expand_all: function(args, item) {
+        var t = pgBrowser.tree,
+          i = item || t.selected(),
+          d = i && i.length == 1 ? t.itemData(i) : undefined;
+
+        if (!d)
+          return;
+
+        d._expand_all = true;
+        if (t.wasLoad(i)) {
+          t.unload(i, {
+            success: function() {
+              t.open(i);
+            },
+          });
+        } else {
+          t.open(i);
+        }
+      },
       // Callback for creating script(s) & opening them in Query editor
       show_script: function(args, item) {
         var scriptType = args.script,
@@ -0,0 +1,74 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import sys
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.utils.ajax import make_json_response, internal_server_error
+from pgadmin.browser.server_groups.servers.databases.schemas.tables.columns \
+    import blueprint as columns_blueprint
+from pgadmin.browser.server_groups.servers.databases.schemas.views \
+    import ViewNode
+
+if sys.version_info < (3, 3):
+    from mock import patch
+else:
+    from unittest.mock import patch
+
+
+def _raise_error():
+    raise Exception('The server has closed the connection.')
+
+
+class ExpandNodesTestCase(BaseTestGenerator):
+    """
+    This class validates that the nodes of the child collections are fetched
+    in-process, as the browser tree would fetch them.
+    """
+
+    scenarios = [(
+        'TestCase for the nodes of the collection', dict(
+            response=lambda: make_json_response(
+                data=[{'_id': 1, 'label': 'a'}], status=200
+            ),
+            expected=[{'_id': 1, 'label': 'a'}]
+        )), (
+        'TestCase for the error fetching the nodes', dict(
+            response=lambda: internal_server_error(errormsg='error'),
+            expected=None
+        )), (
+        'TestCase for the exception fetching the nodes', dict(
+            response=_raise_error,
+            expected=None
+        ))
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        calls = []
+
+        def nodes(**kwargs):
+            calls.append(kwargs)
+            return self.response()
+
+        endpoint = '{0}.nodes'.format(columns_blueprint.name)
+        with self.app.test_request_context('/'), patch.dict(
+            self.app.view_functions, {endpoint: nodes}
+        ):
+            res = ViewNode(cmd='expand').get_collection_nodes(
+                columns_blueprint, gid=1, sid=2, did=3, scid=4, vid=5
+            )
+
+        self.assertEqual(res, self.expected)
+        # The view is the parent of the columns, identified by position
+        self.assertEqual(
+            calls, [{'gid': 1, 'sid': 2, 'did': 3, 'scid': 4, 'tid': 5}]
+        )
@@ -0,0 +1,113 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import simplejson as json
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.browser.utils import PGChildNodeView
+
+
+class NodesPagingTestCase(BaseTestGenerator):
+    """
+    This class validates the paging and filtering arguments of the 'nodes'
+    of the collections.
+    """
+
+    scenarios = [(
+        'TestCase for no paging arguments', dict(
+            query_string='',
+            expected=None,
+            rows=[{'oid': 1, 'name': 'a'}, {'oid': 2, 'name': 'b'}],
+            expected_result=None
+        )), (
+        'TestCase for limit and offset', dict(
+            query_string='limit=2&offset=4',
+            expected={
+                'limit': 2, 'offset': 4, 'after': None, 'prefix': '',
+                'pattern': None, 'count': False
+            },
+            rows=[{'oid': 1, 'paging_name': 'a'},
+                  {'oid': 2, 'paging_name': 'b'}],
+            expected_result={'next': '2:b'}
+        )), (
+        'TestCase for the last page', dict(
+            query_string='limit=2&after=10:a',
+            expected={
+                'limit': 2, 'offset': None,
+                'after': {'oid': 10, 'name': "'a'"}, 'prefix': '',
+                'pattern': None, 'count': False
+            },
+            rows=[{'oid': 11, 'paging_name': 'b'}],
+            expected_result={'next': None}
+        )), (
+        'TestCase for the name of the last node with quote and colon', dict(
+            query_string="limit=1&after=10:a'b:c",
+            expected={
+                'limit': 1, 'offset': None,
+                'after': {'oid': 10, 'name': "'a''b:c'"}, 'prefix': '',
+                'pattern': None, 'count': False
+            },
+            rows=[{'oid': 5, 'paging_name': "a'b:d"}],
+            expected_result={'next': "5:a'b:d"}
+        )), (
+        'TestCase for name prefix with wildcards', dict(
+            query_string='prefix=a_b%25%23',
+            expected={
+                'limit': None, 'offset': None, 'after': None,
+                'prefix': 'a_b%#', 'pattern': "'a#_b#%##%'",
+                'count': False
+            },
+            rows=[],
+            expected_result={'next': None}
+        )), (
+        'TestCase for invalid limit', dict(
+            query_string='limit=-1',
+            expected=ValueError,
+            rows=None,
+            expected_result=None
+        )), (
+        'TestCase for invalid offset', dict(
+            query_string='offset=abc',
+            expected=ValueError,
+            rows=None,
+            expected_result=None
+        )), (
+        'TestCase for the last node without its name', dict(
+            query_string='after=10',
+            expected=ValueError,
+            rows=None,
+            expected_result=None
+        )), (
+        'TestCase for the last node with invalid oid', dict(
+            query_string='after=-1:a',
+            expected=ValueError,
+            rows=None,
+            expected_result=None
+        ))
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        with self.app.test_request_context('/?' + self.query_string):
+            if self.expected is ValueError:
+                self.assertRaises(ValueError, PGChildNodeView.get_nodes_paging)
+                return
+
+            paging = PGChildNodeView.get_nodes_paging()
+            self.assertEqual(paging, self.expected)
+
+            nodes = [{'_id': row['oid']} for row in self.rows]
+            response = PGChildNodeView(cmd='nodes').make_nodes_response(
+                nodes, self.rows, paging, None
+            )
+            res = json.loads(response.data.decode('utf-8'))
+            self.assertEqual(res['data'], nodes)
+            self.assertEqual(res['result'], self.expected_result)
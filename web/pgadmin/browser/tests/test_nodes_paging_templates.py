@@ -0,0 +1,74 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import re
+
+from flask import render_template
+
+from pgadmin.utils.route import BaseTestGenerator
+
+PAGING = {
+    'limit': 50, 'offset': None,
+    'after': {'oid': 16384, 'name': "'orders'"}, 'prefix': '',
+    'pattern': None, 'count': False
+}
+
+
+class NodesPagingTemplatesTestCase(BaseTestGenerator):
+    """
+    This class validates that the 'nodes' templates select the key of the
+    paging, and continue after the name and the oid of the last node, as
+    given (not looked up by its oid, as it may have been dropped).
+    """
+
+    scenarios = [(
+        'TestCase for the tables without paging', dict(
+            template='tables/sql/default/nodes.sql',
+            paging=None,
+            expected_select='SELECT rel.oid, rel.relname AS name,',
+            expected_filter=None,
+            expected_order='ORDER BY rel.relname;'
+        )), (
+        'TestCase for the tables after the last node', dict(
+            template='tables/sql/default/nodes.sql',
+            paging=PAGING,
+            expected_select='SELECT rel.oid, rel.relname AS paging_name, '
+                            'rel.relname AS name,',
+            expected_filter="AND (rel.relname, rel.oid) > "
+                            "('orders', 16384::oid)",
+            expected_order='ORDER BY rel.relname, rel.oid LIMIT 50;'
+        )), (
+        'TestCase for the functions after the last node', dict(
+            template='functions/pg/sql/11_plus/node.sql',
+            paging=PAGING,
+            expected_select='SELECT pr.oid, pr.proname AS paging_name, '
+                            'pr.proname ||',
+            expected_filter="AND (pr.proname, pr.oid) > "
+                            "('orders', 16384::oid)",
+            expected_order='ORDER BY pr.proname, pr.oid LIMIT 50;'
+        ))
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        with self.app.app_context():
+            sql = render_template(
+                self.template, scid=2200, paging=self.paging
+            )
+        sql = re.sub(r'\s+', ' ', sql).strip().replace(' ;', ';')
+
+        self.assertIn(self.expected_select, sql)
+        self.assertTrue(sql.endswith(self.expected_order), sql)
+        self.assertNotIn('SELECT relname, oid', sql)
+        if self.expected_filter is None:
+            self.assertNotIn('>', sql)
+        else:
+            self.assertIn(self.expected_filter, sql)
@@ -0,0 +1,113 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import json
+import time
+from threading import Thread
+
+try:
+    from http.server import HTTPServer, BaseHTTPRequestHandler
+except ImportError:
+    from BaseHTTPServer import HTTPServer, BaseHTTPRequestHandler
+
+import config
+from pgadmin.browser import upgrade_check
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class VersionsHandler(BaseHTTPRequestHandler):
+    """Serves the version data of the test (in place of the website)."""
+    status = 200
+    data = None
+
+    def do_GET(self):
+        body = json.dumps(self.data).encode('utf-8')
+        self.send_response(self.status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _version_data(version_int):
+    return {
+        config.UPGRADE_CHECK_KEY: {
+            'version': 'x.y', 'version_int': version_int,
+            'download_url': 'https://www.pgadmin.org/download/'
+        }
+    }
+
+
+class UpgradeCheckTestCase(BaseTestGenerator):
+    """
+    This class validates that the version data is fetched from the website
+    (a local HTTP server here) in the background, and kept.
+    """
+    scenarios = [
+        ('When a newer version is available', dict(
+            status=200, data=_version_data(config.APP_VERSION_INT + 1),
+            expected_checked=True, expected_upgrade=True
+        )),
+        ('When the running version is the latest', dict(
+            status=200, data=_version_data(config.APP_VERSION_INT),
+            expected_checked=True, expected_upgrade=False
+        )),
+        ('When the website fails', dict(
+            status=500, data={}, expected_checked=False,
+            expected_upgrade=False
+        ))
+    ]
+
+    def setUp(self):
+        upgrade_check.reset()
+
+        handler = type('Handler', (VersionsHandler, ), dict(
+            status=self.status, data=self.data
+        ))
+        self.server = HTTPServer(('127.0.0.1', 0), handler)
+        self.url = 'http://127.0.0.1:%d/versions.json' % \
+            self.server.server_address[1]
+        self.server_thread = Thread(target=self.server.serve_forever)
+        self.server_thread.daemon = True
+        self.server_thread.start()
+
+    def runTest(self):
+        data = upgrade_check.check_version(self.app.logger, self.url)
+        self.assertEqual(data is not None, self.expected_checked)
+        self.assertEqual(
+            upgrade_check.get_upgrade_version() is not None,
+            self.expected_upgrade
+        )
+
+        # In the background
+        upgrade_check.reset()
+        upgrade_check.start(self.app.logger, self.url)
+        deadline = time.time() + 5
+        while upgrade_check.get_version_data() is None and \
+                time.time() < deadline and self.expected_checked:
+            time.sleep(0.05)
+        upgrade_check.stop(5)
+
+        self.assertEqual(
+            upgrade_check.get_version_data() is not None,
+            self.expected_checked
+        )
+        self.assertEqual(
+            upgrade_check.get_upgrade_version() is not None,
+            self.expected_upgrade
+        )
+
+    def tearDown(self):
+        upgrade_check.stop(5)
+        upgrade_check.reset()
+        self.server.shutdown()
+        self.server.server_close()
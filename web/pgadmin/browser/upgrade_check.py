@@ -0,0 +1,133 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Check for new versions of the application in the background.
+
+The version data is fetched from UPGRADE_CHECK_URL periodically (every
+UPGRADE_CHECK_INTERVAL seconds) by a background thread, started on the first
+request of the main page, and kept in memory - hence - the main page never
+waits for the website.
+"""
+
+import json
+import os
+from threading import Event, Lock, Thread
+
+import config
+
+try:
+    import urllib.request as urlreq
+except ImportError as e:
+    import urllib2 as urlreq
+
+# Delay (in seconds) before checking again, after a failed check
+RETRY_INTERVAL = 60 * 60
+
+_version_data = None
+_thread = None
+_stop_event = Event()
+_lock = Lock()
+
+
+def check_version(logger, url=None, timeout=5):
+    """
+    Fetches the version data from the website (or the given url), and
+    keeps it (unless the check failed).
+
+    Returns the version data, or None if the check failed.
+    """
+    global _version_data
+
+    data = None
+    url = '%s?version=%s' % (url or config.UPGRADE_CHECK_URL,
+                             config.APP_VERSION)
+    logger.debug('Checking version data at: %s' % url)
+
+    try:
+        if os.path.exists(config.CA_FILE):
+            response = urlreq.urlopen(url, None, timeout,
+                                      cafile=config.CA_FILE)
+        else:
+            response = urlreq.urlopen(url, None, timeout)
+        logger.debug(
+            'Version check HTTP response code: %d' % response.getcode()
+        )
+
+        if response.getcode() == 200:
+            data = json.loads(response.read().decode('utf-8'))
+            logger.debug('Response data: %s' % data)
+    except Exception:
+        logger.exception('Exception when checking for update')
+
+    if data is not None:
+        _version_data = data
+    return data
+
+
+def get_version_data():
+    """Returns the version data of the last successful check (or None)."""
+    return _version_data
+
+
+def get_upgrade_version():
+    """
+    Returns the version data of the application (i.e. version, version_int
+    and download_url) if newer than the running one, or None.
+    """
+    data = _version_data
+    if data is None or config.UPGRADE_CHECK_KEY not in data:
+        return None
+
+    data = data[config.UPGRADE_CHECK_KEY]
+    if data['version_int'] > config.APP_VERSION_INT:
+        return data
+    return None
+
+
+def _run(logger, url):
+    while not _stop_event.is_set():
+        data = check_version(logger, url)
+        interval = config.UPGRADE_CHECK_INTERVAL if data is not None \
+            else min(RETRY_INTERVAL, config.UPGRADE_CHECK_INTERVAL)
+        _stop_event.wait(interval)
+
+
+def start(logger, url=None):
+    """Starts the background check, unless already running."""
+    global _thread
+
+    with _lock:
+        if _thread is not None and _thread.is_alive():
+            return
+
+        _stop_event.clear()
+        _thread = Thread(target=_run, args=(logger, url),
+                         name='pgAdminUpgradeCheck')
+        _thread.daemon = True
+        _thread.start()
+
+
+def stop(timeout=None):
+    """Stops the background check."""
+    global _thread
+
+    with _lock:
+        thread = _thread
+        _thread = None
+        _stop_event.set()
+
+    if thread is not None:
+        thread.join(timeout)
+
+
+def reset():
+    """Forgets the version data (i.e. for the tests)."""
+    global _version_data
+    _version_data = None
@@ -12,12 +12,15 @@
 from abc import abstractmethod
 
 import flask
+import simplejson as json
 from flask import render_template, current_app
 from flask.views import View, MethodViewType, with_metaclass
 from flask_babelex import gettext
+from werkzeug.exceptions import HTTPException
 
 from config import PG_DEFAULT_DRIVER
-from pgadmin.utils.ajax import make_json_response, precondition_required
+from pgadmin.utils.ajax import make_json_response, precondition_required, \
+    internal_server_error
 from pgadmin.utils.exception import ConnectionLost, SSHTunnelConnectionLost,\
     CryptKeyMissing
 
@@ -349,15 +352,209 @@ class PGChildNodeView(NodeView):
                     manager is not None and
                     module.BackendSupported(manager, **kwargs)
                 ):
-                    nodes.extend(module.get_nodes(**kwargs))
+                    nodes.extend(
+                        (module, node) for node in module.get_nodes(**kwargs)
+                    )
             else:
-                nodes.extend(module.get_nodes(**kwargs))
+                nodes.extend(
+                    (module, node) for node in module.get_nodes(**kwargs)
+                )
+
+        if self.cmd == 'expand':
+            for module, node in nodes:
+                branch = self.get_collection_nodes(module, **kwargs)
+                if branch is not None:
+                    node['branch'] = branch
+                    node['open'] = True
 
         # Return sorted nodes based on label
         return make_json_response(
             data=sorted(
-                nodes, key=lambda c: c['label']
+                (node for module, node in nodes), key=lambda c: c['label']
+            )
+        )
+
+    def expand(self, **kwargs):
+        """
+        Build a list of treeview nodes from the child nodes (see children()),
+        along with the nodes of each child collection as its 'branch', so
+        that the browser tree can expand all of them using a single request.
+        """
+        return self.children(**kwargs)
+
+    def get_collection_nodes(self, module, **kwargs):
+        """
+        Returns the nodes of the given child collection, fetched in-process
+        using its 'nodes' view, i.e. as the browser tree would fetch them on
+        expanding the collection.
+
+        Returns None, when the nodes could not be fetched, in which case the
+        collection will be loaded by the browser tree, when expanded.
+        """
+        from pgadmin.browser.collection import CollectionNodeModule
+
+        if not isinstance(module, CollectionNodeModule):
+            return None
+
+        # The child collections identify their parent by position, in the
+        # same way as the urls generated by the browser tree.
+        url = u'{0}/nodes/{1}/'.format(
+            module.node_path, u'/'.join(
+                str(kwargs[p['id']]) for p in self.parent_ids + self.ids
+            )
+        )
+
+        try:
+            endpoint, args = current_app.create_url_adapter(
+                flask.request
+            ).match(url, method='GET')
+        except HTTPException:
+            return None
+
+        try:
+            response = current_app.view_functions[endpoint](**args)
+
+            if response.status_code != 200:
+                return None
+
+            res = json.loads(response.data.decode('utf-8'))
+        except Exception as e:
+            current_app.logger.exception(e)
+            return None
+
+        if not res.get('success', 0) or not isinstance(res['data'], list):
+            return None
+
+        return res['data']
+
+    @staticmethod
+    def get_nodes_paging():
+        """
+        Returns the paging and filtering arguments of the 'nodes' request, or
+        None when none of them is given (i.e. all the nodes are requested).
+
+        The node views supporting these, pass them to the 'nodes.sql' template
+        as 'paging' (see macros/paging.macros), and return the nodes using
+        make_nodes_response().
+
+        Request arguments:
+            limit: maximum number of the nodes to return
+            offset: number of the nodes to skip
+            after: oid and name ('<oid>:<name>') of the last node of the
+                   previous page (keyset paging), i.e. 'next' from the
+                   result of the previous page
+            prefix: return only the nodes with the name starting with it
+            count: 'true' to return the total number of the (matching) nodes
+
+        The 'pattern' in the returned paging is the quoted LIKE pattern for
+        the prefix, and 'after' has the 'oid' and the quoted 'name' of the
+        last node.
+
+        Raises:
+            ValueError: for the invalid arguments
+        """
+        args = flask.request.args
+
+        if not any(
+            arg in args for arg in ('limit', 'offset', 'after', 'prefix',
+                                    'count')
+        ):
+            return None
+
+        def _get_int(name):
+            value = args.get(name, '')
+            if value == '':
+                return None
+            try:
+                value = int(value)
+            except ValueError:
+                value = -1
+            if value < 0:
+                raise ValueError(
+                    gettext("Invalid value specified for '{0}'.").format(name)
+                )
+            return value
+
+        from pgadmin.utils.driver import get_driver
+        driver = get_driver(PG_DEFAULT_DRIVER)
+
+        after = args.get('after', '')
+        if after == '':
+            after = None
+        else:
+            # The name is compared as it is, so that the paging goes on
+            # even when the last node has been dropped (or renamed).
+            oid, sep, name = after.partition(':')
+            if not sep or not oid.isdigit():
+                raise ValueError(
+                    gettext("Invalid value specified for '{0}'.").format(
+                        'after')
+                )
+            after = {'oid': int(oid), 'name': driver.qtLiteral(name)}
+
+        prefix = args.get('prefix', '')
+        pattern = None
+        if prefix:
+            # '#' is used as the escape character of the LIKE pattern
+            pattern = driver.qtLiteral(
+                prefix.replace('#', '##').replace('%', '#%').replace(
+                    '_', '#_') + '%'
             )
+
+        return {
+            'limit': _get_int('limit'),
+            'offset': _get_int('offset'),
+            'after': after,
+            'prefix': prefix,
+            'pattern': pattern,
+            'count': args.get('count', '').lower() == 'true'
+        }
+
+    def make_nodes_response(self, nodes, rows, paging, render_sql):
+        """
+        Returns the response for the 'nodes' request.
+
+        When paging, the result of the response has:
+            next: the 'after' argument to fetch the next page (see
+                  get_nodes_paging()), or None when this is the last page
+            count: total number of the (matching) nodes, when requested
+
+        Args:
+            nodes: list of the browser nodes
+            rows: the rows fetched using the 'nodes.sql' template
+            paging: the paging arguments (see get_nodes_paging())
+            render_sql: function(paging) rendering the 'nodes.sql' template
+        """
+        if paging is None:
+            return make_json_response(
+                data=nodes,
+                status=200
+            )
+
+        result = {'next': None}
+
+        if paging['limit'] and len(rows) == paging['limit']:
+            result['next'] = u'{0}:{1}'.format(
+                rows[-1]['oid'], rows[-1]['paging_name']
+            )
+
+        if paging['count']:
+            sql = render_sql(
+                dict(paging, limit=None, offset=None, after=None)
+            )
+            status, count = self.conn.execute_scalar(
+                u"SELECT count(*) FROM ({0}) nodes".format(
+                    sql.strip().rstrip(';')
+                )
+            )
+            if not status:
+                return internal_server_error(errormsg=count)
+            result['count'] = count
+
+        return make_json_response(
+            data=nodes,
+            result=result,
+            status=200
         )
 
     def get_dependencies(self, conn, object_id, where=None,
@@ -8,6 +8,7 @@
 ##########################################################################
 
 """A blueprint module implementing the dashboard frame."""
+import time
 from functools import wraps
 from flask import render_template, url_for, Response, g, request
 from flask_babelex import gettext
@@ -15,11 +16,12 @@ from flask_security import login_required
 import simplejson as json
 from pgadmin.utils import PgAdminModule
 from pgadmin.utils.ajax import make_response as ajax_response,\
-    internal_server_error
+    internal_server_error, bad_request
 from pgadmin.utils.ajax import precondition_required
 from pgadmin.utils.driver import get_driver
 from pgadmin.utils.menu import Panel
 from pgadmin.utils.preferences import Preferences
+from pgadmin.dashboard.collector import get_collector, monitoring_connection
 
 from config import PG_DEFAULT_DRIVER
 
@@ -158,6 +160,9 @@ class DashboardModule(PgAdminModule):
             'dashboard.dashboard_stats',
             'dashboard.dashboard_stats_sid',
             'dashboard.dashboard_stats_did',
+            'dashboard.dashboard_stats_history',
+            'dashboard.dashboard_stats_history_sid',
+            'dashboard.dashboard_stats_history_did',
             'dashboard.activity',
             'dashboard.get_activity_by_server_id',
             'dashboard.get_activity_by_database_id',
@@ -315,13 +320,36 @@ def index(sid=None, did=None):
         )
 
 
-def get_data(sid, did, template):
+def activity_row_id(row):
+    """Identifies a session by its pid, and the start time of the backend."""
+    return u'{0}:{1}'.format(row['pid'], row['backend_start'])
+
+
+LOCK_ID_COLUMNS = (
+    'pid', 'locktype', 'datname', 'relation', 'page', 'tuple',
+    'transactionid', 'classid', 'objid', 'objsubid', 'virtualtransaction',
+    'mode'
+)
+
+
+def lock_row_id(row):
+    """Identifies a lock by the locked object, the mode and the holder."""
+    return u':'.join(
+        u'' if row.get(col, None) is None else u'{0}'.format(row[col])
+        for col in LOCK_ID_COLUMNS
+    )
+
+
+def get_data(sid, did, template, row_id=None):
     """
     Generic function to get server stats based on an SQL template
     Args:
         sid: The server ID
         did: The database ID
         template: The SQL template name
+        row_id: Function identifying the rows. When given, and the request
+            has 'since' argument, only the changes since the snapshot
+            identified by it are returned (see StatsCollector.get_snapshot)
 
     Returns:
 
@@ -334,17 +362,53 @@ def get_data(sid, did, template):
     sql = render_template(
         "/".join([g.template_path, template]), did=did
     )
-    status, res = g.conn.execute_dict(sql)
+
+    def fetch(stale):
+        status, conn = monitoring_connection(g.manager, did)
+        if not status:
+            return False, conn
+
+        status, res = conn.execute_dict(sql)
+        if not status:
+            return False, res
+
+        return True, {sql: res['rows']}
+
+    if row_id is not None and 'since' in request.args:
+        status, res = get_collector(g.manager, did).get_snapshot(
+            sql, fetch, row_id, request.args['since']
+        )
+
+        if not status:
+            return internal_server_error(errormsg=res)
+
+        return ajax_response(
+            response=res,
+            status=200
+        )
+
+    status, res = get_collector(g.manager, did).get([sql], fetch)
 
     if not status:
         return internal_server_error(errormsg=res)
 
     return ajax_response(
-        response=res['rows'],
+        response=res[sql],
         status=200
     )
 
 
+def get_stats_sql(did, chart_names):
+    """
+    Returns the SQL to fetch the statistics of the given graphs. The SQL of a
+    single graph is also used as the key of its samples and history.
+    """
+    return render_template(
+        "/".join([g.template_path, 'dashboard_stats.sql']), did=did,
+        chart_names=chart_names,
+    )
+
+
 @blueprint.route('/dashboard_stats',
                  endpoint='dashboard_stats')
 @blueprint.route('/dashboard_stats/<int:sid>',
@@ -362,15 +426,90 @@ def dashboard_stats(sid=None, did=None):
         if not sid:
             return internal_server_error(errormsg='Server ID not specified.')
 
-        sql = render_template(
-            "/".join([g.template_path, 'dashboard_stats.sql']), did=did,
-            chart_names=chart_names,
+        # Each chart is cached on its own (keyed by its query), so that the
+        # dashboards showing different set of charts can share the samples.
+        charts = dict(
+            (get_stats_sql(did, [chart_name]), chart_name)
+            for chart_name in chart_names
+        )
+
+        def fetch(stale):
+            status, conn = monitoring_connection(g.manager, did)
+            if not status:
+                return False, conn
+
+            sql = get_stats_sql(did, [charts[key] for key in stale])
+            status, res = conn.execute_dict(sql)
+            if not status:
+                return False, res
+
+            rows = dict(
+                (chart_row['chart_name'], json.loads(chart_row['chart_data']))
+                for chart_row in res['rows']
+            )
+            return True, dict(
+                (key, rows.get(charts[key], None)) for key in stale
+            )
+
+        status, res = get_collector(g.manager, did).get(
+            list(charts.keys()), fetch, history=True
         )
-        status, res = g.conn.execute_dict(sql)
+        if not status:
+            return internal_server_error(errormsg=res)
 
-        for chart_row in res['rows']:
-            resp_data[chart_row['chart_name']] = \
-                json.loads(chart_row['chart_data'])
+        for key, chart_data in res.items():
+            if chart_data is not None:
+                resp_data[charts[key]] = chart_data
+
+    return ajax_response(
+        response=resp_data,
+        status=200
+    )
+
+
+@blueprint.route('/dashboard_stats_history',
+                 endpoint='dashboard_stats_history')
+@blueprint.route('/dashboard_stats_history/<int:sid>',
+                 endpoint='dashboard_stats_history_sid')
+@blueprint.route('/dashboard_stats_history/<int:sid>/<int:did>',
+                 endpoint='dashboard_stats_history_did')
+@login_required
+@check_precondition
+def dashboard_stats_history(sid=None, did=None):
+    """
+    This function returns the recent samples of the graphs, taken for any of
+    the dashboards showing the same server (or database).
+
+    Query parameters:
+        chart_names: comma separated list of the graphs
+        minutes: number of minutes of the history to return
+        step: number of seconds between the samples (the refresh rate)
+
+    Returns: {chart_name: {'labels': [...], 'data': [[...] or null, ...]}}
+    """
+    resp_data = {}
+
+    if request.args.get('chart_names', '') != '':
+        if not sid:
+            return internal_server_error(errormsg='Server ID not specified.')
+
+        try:
+            minutes = float(request.args.get('minutes', 5))
+            step = float(request.args.get('step', 1))
+        except ValueError as e:
+            return bad_request(errormsg=str(e))
+
+        if step <= 0:
+            return bad_request(errormsg=gettext('Invalid step specified.'))
+
+        collector = get_collector(g.manager, did)
+        since = time.time() - minutes * 60
+
+        for chart_name in request.args['chart_names'].split(','):
+            key = get_stats_sql(did, [chart_name])
+            labels, data = collector.get_history(key, since, step)
+            if labels is not None:
+                resp_data[chart_name] = {'labels': labels, 'data': data}
 
     return ajax_response(
         response=resp_data,
@@ -391,7 +530,7 @@ def activity(sid=None, did=None):
     :param sid: server id
     :return:
     """
-    return get_data(sid, did, 'activity.sql')
+    return get_data(sid, did, 'activity.sql', activity_row_id)
 
 
 @blueprint.route('/locks/', endpoint='locks')
@@ -407,7 +546,7 @@ def locks(sid=None, did=None):
     :param sid: server id
     :return:
     """
-    return get_data(sid, did, 'locks.sql')
+    return get_data(sid, did, 'locks.sql', lock_row_id)
 
 
 @blueprint.route('/prepared/', endpoint='prepared')
@@ -460,6 +599,8 @@ def cancel_query(sid=None, did=None, pid=None):
     if not status:
         return internal_server_error(errormsg=res)
 
+    get_collector(g.manager, did).invalidate()
+
     return ajax_response(
         response=gettext("Success") if res else gettext("Failed"),
         status=200
@@ -487,6 +628,8 @@ def terminate_session(sid=None, did=None, pid=None):
     if not status:
         return internal_server_error(errormsg=res)
 
+    get_collector(g.manager, did).invalidate()
+
     return ajax_response(
         response=gettext("Success") if res else gettext("Failed"),
         status=200
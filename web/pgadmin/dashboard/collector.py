@@ -0,0 +1,493 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Shared sampler for the dashboard statistics.
+
+Every open dashboard polls the server on its own timer. Rather than running
+the monitoring queries once per viewer, the results are sampled once per
+interval per server (and database) and served to all the viewers from a
+short lived cache.
+
+The samples of the graphs are also kept in a fixed size history, so that a
+newly opened dashboard can draw the recent past without querying the server.
+The collectors (holding the samples) are dropped when the server or database
+is disconnected, when not used for DASHBOARD_COLLECTOR_IDLE_TIMEOUT seconds,
+and the least recently used ones beyond DASHBOARD_MAX_COLLECTORS, so that the
+memory used by the history is bounded.
+
+The samples of the tables (i.e. activity & locks) are versioned, so that the
+dashboard only needs to receive the rows changed since its last refresh.
+"""
+
+import math
+import time
+import uuid
+from array import array
+from collections import deque, OrderedDict
+from threading import Lock
+from weakref import WeakKeyDictionary
+
+import simplejson as json
+
+import config
+
+MONITORING_CONN_ID = u'dashboard-{0}'
+
+# Number of the previous versions of a table kept to compute the changes from
+SNAPSHOTS_KEPT = 5
+
+
+class ChartHistory(object):
+    """
+    class ChartHistory
+
+    Ring buffer of the samples of one graph. The sample times, and the values
+    of each label of the graph are stored in typed arrays, i.e. 8 bytes per
+    value, rather than as the list of dictionaries.
+
+    Samples taken within 'resolution' seconds from the previous one are
+    ignored, hence the buffer holds at least 'size' x 'resolution' seconds of
+    history.
+    """
+
+    def __init__(self, labels, size, resolution=0.5):
+        self.labels = list(labels)
+        self.size = size
+        self.resolution = resolution
+        self.times = array('d', [0.0]) * size
+        self.values = [array('d', [0.0]) * size for _ in self.labels]
+        # Position of the next sample, and the number of samples stored
+        self.pos = 0
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def append(self, ts, sample):
+        """
+        Adds the sample (dictionary of label to value) taken at 'ts'.
+        """
+        if self.count > 0 and \
+                ts - self.times[(self.pos - 1) % self.size] < self.resolution:
+            return
+
+        self.times[self.pos] = ts
+        for idx, label in enumerate(self.labels):
+            value = sample.get(label, None)
+            self.values[idx][self.pos] = \
+                float('nan') if value is None else float(value)
+
+        self.pos = (self.pos + 1) % self.size
+        self.count = min(self.count + 1, self.size)
+
+    def series(self, since, step, until=None):
+        """
+        Returns the samples taken after 'since', downsampled to (about) one
+        sample per 'step' seconds.
+
+        Returns:
+            list of the samples (oldest first) 'step' seconds apart, each
+            being either the list of values (in the order of the labels) or
+            None when no sample was taken at that time.
+        """
+        until = time.time() if until is None else until
+        step = max(step, self.resolution)
+        res = []
+        newest = last = None
+        idx = self.pos
+
+        # Walk from the newest sample backwards, picking the samples (about)
+        # one step apart, and fill the gaps with None.
+        for _ in range(self.count):
+            idx = (idx - 1) % self.size
+            ts = self.times[idx]
+            if ts <= since:
+                break
+            if ts > until:
+                continue
+            if last is not None:
+                if last - ts < step * 0.75:
+                    continue
+                res.extend([None] * (int(round((last - ts) / step)) - 1))
+            else:
+                newest = ts
+            res.append([self.__value(values[idx]) for values in self.values])
+            last = ts
+
+        res.reverse()
+        if newest is not None:
+            res.extend([None] * (int(round((until - newest) / step)) - 1))
+
+        limit = int(math.ceil((until - since) / step))
+        return res[-limit:] if limit > 0 else []
+
+    @staticmethod
+    def __value(value):
+        if math.isnan(value):
+            return None
+        if value.is_integer():
+            return int(value)
+        return value
+
+
+class Snapshot(object):
+    """
+    class Snapshot
+
+    A version of the rows of a table (sampled at 'ts'), identified by the
+    token. Each row is identified using the 'row_id' function, and the
+    digests of the rows are kept to find the changed rows, when compared with
+    a later version.
+    """
+
+    def __init__(self, token, ts, rows, row_id):
+        self.token = token
+        self.ts = ts
+        self.rows = rows
+        self.ids = []
+        self.digests = dict()
+
+        for row in rows:
+            rid = base_id = row_id(row)
+            # Make sure the identifiers are unique
+            dup = 0
+            while rid in self.digests:
+                dup += 1
+                rid = u'{0}#{1}'.format(base_id, dup)
+            self.ids.append(rid)
+            self.digests[rid] = hash(
+                json.dumps(row, sort_keys=True, default=str)
+            )
+
+    def full(self):
+        """Returns all the rows, along with their identifiers."""
+        return {
+            'token': self.token,
+            'full': True,
+            'rows': [
+                dict(row, id=rid) for rid, row in zip(self.ids, self.rows)
+            ]
+        }
+
+    def delta(self, since):
+        """
+        Returns the rows added, and changed after the 'since' snapshot, and
+        the identifiers of the removed rows.
+        """
+        added = []
+        changed = []
+
+        for rid, row in zip(self.ids, self.rows):
+            digest = since.digests.get(rid, None)
+            if digest is None:
+                added.append(dict(row, id=rid))
+            elif digest != self.digests[rid]:
+                changed.append(dict(row, id=rid))
+
+        return {
+            'token': self.token,
+            'full': False,
+            'added': added,
+            'changed': changed,
+            'removed': [
+                rid for rid in since.ids if rid not in self.digests
+            ]
+        }
+
+
+class StatsCollector(object):
+    """
+    class StatsCollector
+
+    Holds the latest samples of the dashboard queries for one server and
+    database, as seen by one database role.
+
+    The samples are keyed by the query (or chart) they were taken with, and
+    are considered fresh for 'ttl' seconds. The sampling itself is serialised
+    using a lock, so that only one of the concurrent viewers queries the
+    server, while the rest wait and use its result.
+
+    When requested, the samples are also recorded in a ChartHistory per key.
+    """
+
+    def __init__(self, ttl=None, history_size=None):
+        self.ttl = config.DASHBOARD_CACHE_TTL if ttl is None else ttl
+        self.history_size = history_size if history_size is not None else \
+            int(config.DASHBOARD_HISTORY_MINUTES * 60)
+        self.lock = Lock()
+        self.samples = dict()
+        self.history = dict()
+        self.snapshots = dict()
+        # Makes the tokens of the snapshots unique across the collectors
+        self.token_prefix = uuid.uuid4().hex[:8]
+        self.version = 0
+        self.last_used = time.time()
+        # Time of the last request by connection manager (i.e. per user
+        # session), managed by get_collector() and release_collectors().
+        self.viewers = WeakKeyDictionary()
+
+    def __fresh(self, keys, now):
+        res = dict()
+        for key in keys:
+            sample = self.samples.get(key, None)
+            if sample is not None and now - sample[0] < self.ttl:
+                res[key] = sample[1]
+        return res
+
+    def get(self, keys, fetch, history=False):
+        """
+        Returns the samples for the given keys, calling 'fetch' with the
+        list of keys, which do not have a fresh sample.
+
+        Args:
+            keys: list of the sample keys
+            fetch: function(stale_keys) returning (status, {key: value})
+            history: record the fetched samples (dictionaries of label to
+                value) in the history
+
+        Returns:
+            (status, {key: value}) or (False, error message)
+        """
+        if self.ttl <= 0:
+            status, res = fetch(keys)
+            if status and history:
+                with self.lock:
+                    self.__record(time.time(), res)
+            return status, res
+
+        res = self.__fresh(keys, time.time())
+        if len(res) == len(keys):
+            return True, res
+
+        with self.lock:
+            # Some other viewer may have sampled while we were waiting.
+            res = self.__fresh(keys, time.time())
+            stale = [key for key in keys if key not in res]
+
+            if stale:
+                status, values = fetch(stale)
+                if not status:
+                    return False, values
+
+                now = time.time()
+                for key in stale:
+                    value = values.get(key, None)
+                    self.samples[key] = (now, value)
+                    res[key] = value
+
+                if history:
+                    self.__record(now, values)
+
+        return True, res
+
+    def __record(self, ts, values):
+        if self.history_size <= 0:
+            return
+
+        for key, sample in values.items():
+            if sample is None:
+                continue
+            hist = self.history.get(key, None)
+            if hist is None or set(hist.labels) != set(sample.keys()):
+                hist = self.history[key] = ChartHistory(
+                    sample.keys(), self.history_size
+                )
+            hist.append(ts, sample)
+
+    def get_history(self, key, since, step):
+        """
+        Returns the labels and the downsampled history of the given key, see
+        ChartHistory.series().
+
+        Returns:
+            (labels, buckets) or (None, None) if there is no history.
+        """
+        with self.lock:
+            hist = self.history.get(key, None)
+            if hist is None or len(hist) == 0:
+                return None, None
+            return list(hist.labels), hist.series(since, step)
+
+    def get_snapshot(self, key, fetch, row_id, since=None):
+        """
+        Returns the rows of the given key (see get()) as a versioned
+        snapshot, i.e. the changes since the snapshot identified by the
+        'since' token, or all the rows when that snapshot is not known
+        (anymore).
+
+        Args:
+            key: the sample key
+            fetch: function(stale_keys) returning (status, {key: rows})
+            row_id: function(row) returning the identifier of the row
+            since: token of the snapshot known to the caller
+
+        Returns:
+            (status, changes) or (False, error message)
+        """
+        started = time.time()
+        status, res = self.get([key], fetch)
+        if not status:
+            return False, res
+
+        rows = res[key]
+
+        with self.lock:
+            # Time of the sample, as another viewer may have sampled again
+            # (and created a newer version) meanwhile.
+            sample = self.samples.get(key, None)
+            ts = sample[0] if sample is not None and sample[1] is rows \
+                else started
+
+            snapshots = self.snapshots.get(key, None)
+            if snapshots is None:
+                snapshots = self.snapshots[key] = deque(maxlen=SNAPSHOTS_KEPT)
+
+            # Create a new version only when the rows were sampled again, and
+            # after the latest version (the older samples are not used).
+            if not snapshots or (
+                snapshots[-1].rows is not rows and snapshots[-1].ts <= ts
+            ):
+                # Only the digests of the older versions are needed
+                if snapshots:
+                    snapshots[-1].rows = None
+                self.version += 1
+                snapshots.append(Snapshot(
+                    u'{0}.{1}'.format(self.token_prefix, self.version),
+                    ts, rows, row_id
+                ))
+
+            current = snapshots[-1]
+            previous = None
+            if since:
+                for snapshot in snapshots:
+                    if snapshot.token == since:
+                        previous = snapshot
+                        break
+
+            # The rows of the current version are dropped, when a newer one
+            # is added, hence - the changes are computed within the lock.
+            if previous is None:
+                return True, current.full()
+
+            return True, current.delta(previous)
+
+    def invalidate(self):
+        """Forget all the samples, i.e. after a session was terminated."""
+        with self.lock:
+            self.samples = dict()
+
+
+# Collectors by their key (see collector_key()), least recently used first
+_collectors = OrderedDict()
+_collectors_lock = Lock()
+
+
+def collector_key(manager, did=None):
+    """
+    Returns the key identifying the server, database and role, whose
+    statistics can be shared.
+
+    Two server definitions pointing at the same server share the samples,
+    when they connect using the same role, as they see the same rows in the
+    statistics views.
+    """
+    return (
+        manager.host, manager.hostaddr, manager.port, manager.service,
+        manager.tunnel_host if manager.use_ssh_tunnel else None,
+        manager.role or manager.user,
+        did if did is not None else manager.db
+    )
+
+
+def get_collector(manager, did=None):
+    """Returns the shared collector for the server (and database)."""
+    key = collector_key(manager, did)
+    now = time.time()
+
+    with _collectors_lock:
+        collector = _collectors.pop(key, None)
+        if collector is None:
+            collector = StatsCollector()
+        collector.last_used = now
+        collector.viewers[manager] = now
+        # Most recently used
+        _collectors[key] = collector
+
+        # Drop the idle collectors, and the least recently used ones beyond
+        # the limit.
+        timeout = config.DASHBOARD_COLLECTOR_IDLE_TIMEOUT
+        while _collectors:
+            oldest = next(iter(_collectors.values()))
+            if 0 < timeout <= now - oldest.last_used or \
+                    len(_collectors) > max(config.DASHBOARD_MAX_COLLECTORS, 1):
+                _collectors.popitem(False)
+            else:
+                break
+
+        return collector
+
+
+def release_collectors(manager, did=None):
+    """
+    Releases the collectors of the server, or of the database, for the
+    given connection manager, i.e. when it is disconnected.
+
+    A collector (and so the history) is dropped, when it is not used by any
+    other (not idle) viewer.
+    """
+    key = collector_key(manager, did)
+    now = time.time()
+    timeout = config.DASHBOARD_COLLECTOR_IDLE_TIMEOUT
+
+    with _collectors_lock:
+        for k in list(_collectors):
+            if k == key or (did is None and k[:-1] == key[:-1]):
+                viewers = _collectors[k].viewers
+                viewers.pop(manager, None)
+
+                if not any(
+                    timeout <= 0 or now - last_used < timeout
+                    for last_used in list(viewers.values())
+                ):
+                    del _collectors[k]
+
+
+def monitoring_connection(manager, did=None):
+    """
+    Returns the dedicated (connected) monitoring connection for the server
+    or database, so that the sampling does not interfere with the
+    connection used by the browser tree.
+
+    Returns:
+        (status, connection or error message)
+    """
+    conn = manager.connection(
+        did=did, conn_id=MONITORING_CONN_ID.format(
+            did if did is not None else 'server'
+        ), async_=False
+    )
+
+    if not conn.connected():
+        status, msg = conn.connect()
+        if not status:
+            return False, msg
+
+    return True, conn
+
+
+def release_monitoring_connection(manager, did=None):
+    """
+    Releases the monitoring connection for the server or database, along
+    with the collectors.
+    """
+    release_collectors(manager, did)
+    return manager.release(conn_id=MONITORING_CONN_ID.format(
+        did if did is not None else 'server'
+    ))
@@ -32,6 +32,9 @@ define('pgadmin.dashboard', [
     is_server_dashboard = false,
     is_database_dashboard = false;
 
+  /* Number of data points shown in the graphs */
+  const CHART_MAX_POINTS = 101;
+
   // Custom BackGrid cell, Responsible for cancelling active sessions
   var customDashboardActionCell = Backgrid.Extension.DeleteCell.extend({
     render: function() {
@@ -414,7 +417,8 @@ define('pgadmin.dashboard', [
           return(`Seconds ago: ${parseInt(currVal.x * refresh)}</br>
                   Value: ${currVal.y}`);
         },
-        curr_epoch=commonUtils.getEpoch();
+        curr_epoch=commonUtils.getEpoch(),
+        new_charts=[];
 
       self.stopChartsPoller();
 
@@ -447,10 +451,108 @@ define('pgadmin.dashboard', [
             'refresh_on': curr_epoch,
             'refresh_rate': self.preferences[chart_config.refresh_pref_name],
           };
+          new_charts.push(chart_config.chart_name);
+        }
+      });
+
+      /* Draw the recent history of the new charts (sampled for the other
+       * dashboards of the same server), before polling for the new data */
+      self.loadChartsHistory(self.chart_store, new_charts, self.sid, self.did)
+        .always(function() {
+          self.startChartsPoller(self.chart_store, self.sid, self.did);
+        });
+    },
+
+    getStatsHistoryUrl: function(sid=-1, did=-1, chart_names=[], step=1) {
+      let base_url = url_for('dashboard.dashboard_stats_history');
+      base_url += '/' + sid;
+      base_url += (did > 0) ? ('/' + did) : '';
+      base_url += '?chart_names=' + chart_names.join(',');
+      /* As many samples as the chart can show */
+      base_url += '&minutes=' + (CHART_MAX_POINTS * step / 60);
+      base_url += '&step=' + step;
+      return base_url;
+    },
+
+    loadChartsHistory: function(chart_store, chart_names, sid, did) {
+      let self = this,
+        by_refresh_rate = _.groupBy(chart_names, function(chart_name) {
+          return chart_store[chart_name].refresh_rate;
+        });
+
+      if (!sid || sid < 0 || chart_names.length == 0) {
+        return $.Deferred().resolve().promise();
+      }
+
+      return $.when.apply($, _.map(by_refresh_rate, function(names, refresh_rate) {
+        return $.ajax({
+          url: self.getStatsHistoryUrl(sid, did, names, refresh_rate),
+          type: 'GET',
+        })
+          .done(function(resp) {
+            let next_epoch = commonUtils.getEpoch() + parseInt(refresh_rate);
+            for(let chart_name in resp) {
+              if (!chart_store[chart_name]) continue;
+              self.setChartHistory(chart_store[chart_name].chart_obj, resp[chart_name]);
+              chart_store[chart_name].refresh_on = next_epoch;
+            }
+          })
+          /* Not having the history is not an error, the poller will report
+           * the problem with the server (if any) */
+          .then(null, function() {
+            return $.Deferred().resolve().promise();
+          });
+      }));
+    },
+
+    setChartHistory: function(chart_obj, history) {
+      // history format:
+      // {
+      //     labels: ['Label 1', 'Label 2'...],
+      //     data: [[y1, y2...], null, [y1, y2...]...] (oldest first)
+      // }
+      let counter = chart_obj.getOtherData('counter') || false,
+        dataset = _.map(history.labels, function(label) {
+          return {'data': [], 'label': label};
+        }),
+        prev_values = null;
+
+      _.each(history.data, function(values, ind) {
+        /* Counter stats plot the difference from the previous sample, hence
+         * the first sample only gives the base */
+        if (!counter || ind > 0) {
+          _.each(dataset, function(label_data, label_ind) {
+            let y = (values === null) ? null : values[label_ind];
+            if (counter && y !== null) {
+              y = (prev_values === null || prev_values[label_ind] === null) ?
+                null : y - prev_values[label_ind];
+            }
+            label_data['data'].unshift([0, y]);
+          });
         }
+        prev_values = values;
       });
 
-      self.startChartsPoller(self.chart_store, self.sid, self.did);
+      _.each(dataset, function(label_data) {
+        label_data['data'] = label_data['data'].slice(0, CHART_MAX_POINTS);
+        for (let time_ind = 0; time_ind < label_data['data'].length; time_ind++) {
+          label_data['data'][time_ind][0] = time_ind;
+        }
+      });
+
+      if (prev_values !== null) {
+        chart_obj.setOtherData('counter_prev_data', _.object(history.labels, prev_values));
+      }
+
+      if (dataset.length == 0 || dataset[0]['data'].length == 0) {
+        return;
+      }
+
+      chart_obj.setOtherData('dataset', dataset);
+
+      if (chart_obj.isInPage() && chart_obj.isVisible()) {
+        chart_obj.draw(dataset);
+      }
     },
 
     getStatsUrl: function(sid=-1, did=-1, chart_names=[]) {
@@ -507,7 +609,7 @@ define('pgadmin.dashboard', [
 
       // Remove old data points
       for (let label_ind = 0; label_ind < dataset.length; label_ind++) {
-        if (dataset[label_ind]['data'].length > 101) {
+        if (dataset[label_ind]['data'].length > CHART_MAX_POINTS) {
           dataset[label_ind]['data'].pop();
         }
       }
@@ -643,7 +745,7 @@ define('pgadmin.dashboard', [
     },
 
     // Render a grid
-    render_grid: function(container, url, columns) {
+    render_grid: function(container, url, columns, delta=false) {
       var Datum = Backbone.Model.extend({}),
         self = this;
 
@@ -658,6 +760,43 @@ define('pgadmin.dashboard', [
         mode: 'client',
       });
 
+      if (delta) {
+        /* Fetch only the rows changed since the last refresh, and apply
+         * them on the rows we already have */
+        Data = Data.extend({
+          snapshot_token: '',
+          snapshot_rows: [],
+
+          fetch: function(options) {
+            options = _.extend({data: {since: this.snapshot_token}}, options);
+            return Backbone.Collection.prototype.fetch.call(this, options);
+          },
+
+          parse: function(resp) {
+            let rows = resp.rows;
+
+            if (!resp.full) {
+              let removed = _.object(resp.removed, resp.removed),
+                changed = _.indexBy(resp.changed, 'id');
+
+              rows = _.map(
+                _.reject(this.snapshot_rows, (row) => _.has(removed, row.id)),
+                (row) => changed[row.id] || row
+              );
+
+              if (resp.added.length > 0) {
+                rows = _.sortBy(rows.concat(resp.added), 'pid');
+              }
+            }
+
+            this.snapshot_token = resp.token;
+            this.snapshot_rows = rows;
+
+            return rows;
+          },
+        });
+      }
+
       var data = new Data();
 
       // Set up the grid
@@ -1163,10 +1302,10 @@ define('pgadmin.dashboard', [
 
         // Render the tabs, but only get data for the activity tab for now
         pgAdmin.Dashboard.render_grid(
-          div_server_activity, url_for('dashboard.activity'), server_activity_columns
+          div_server_activity, url_for('dashboard.activity'), server_activity_columns, true
         );
         pgAdmin.Dashboard.render_grid(
-          div_server_locks, url_for('dashboard.locks'), server_locks_columns
+          div_server_locks, url_for('dashboard.locks'), server_locks_columns, true
         );
         pgAdmin.Dashboard.render_grid(
           div_server_prepared, url_for('dashboard.prepared'), server_prepared_columns
@@ -1394,10 +1533,10 @@ define('pgadmin.dashboard', [
 
         // Render the tabs, but only get data for the activity tab for now
         pgAdmin.Dashboard.render_grid(
-          div_database_activity, url_for('dashboard.activity'), database_activity_columns
+          div_database_activity, url_for('dashboard.activity'), database_activity_columns, true
         );
         pgAdmin.Dashboard.render_grid(
-          div_database_locks, url_for('dashboard.locks'), database_locks_columns
+          div_database_locks, url_for('dashboard.locks'), database_locks_columns, true
         );
         pgAdmin.Dashboard.render_grid(
           div_database_prepared, url_for('dashboard.prepared'), database_prepared_columns
@@ -0,0 +1,86 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.dashboard.collector import StatsCollector
+from pgadmin.dashboard import activity_row_id
+
+
+def _session(pid, state, backend_start='2019-01-01 00:00:00 UTC'):
+    return {'pid': pid, 'backend_start': backend_start, 'state': state}
+
+
+class ActivitySnapshotTestCase(BaseTestGenerator):
+    """
+    This class validates that the activity is returned as the changes since
+    the snapshot known to the dashboard.
+    """
+
+    scenarios = [(
+        'TestCase for unchanged activity', dict(
+            before=[_session(1, 'idle'), _session(2, 'active')],
+            after=[_session(1, 'idle'), _session(2, 'active')],
+            expected_added=[],
+            expected_changed=[],
+            expected_removed=[]
+        )), (
+        'TestCase for changed activity', dict(
+            before=[_session(1, 'idle'), _session(2, 'active')],
+            after=[_session(1, 'active'), _session(3, 'idle')],
+            expected_added=[3],
+            expected_changed=[1],
+            expected_removed=['2:2019-01-01 00:00:00 UTC']
+        )), (
+        'TestCase for reused pid', dict(
+            before=[_session(1, 'idle')],
+            after=[_session(1, 'idle', '2019-01-02 00:00:00 UTC')],
+            expected_added=[1],
+            expected_changed=[],
+            expected_removed=['1:2019-01-01 00:00:00 UTC']
+        ))
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        collector = StatsCollector(ttl=0)
+        samples = [self.before, self.after]
+
+        def fetch(stale):
+            return True, {'activity': samples.pop(0)}
+
+        status, first = collector.get_snapshot(
+            'activity', fetch, activity_row_id, ''
+        )
+        self.assertTrue(status)
+        self.assertTrue(first['full'])
+        self.assertEqual(len(first['rows']), len(self.before))
+
+        status, res = collector.get_snapshot(
+            'activity', fetch, activity_row_id, first['token']
+        )
+        self.assertTrue(status)
+        self.assertFalse(res['full'])
+        self.assertNotEqual(res['token'], first['token'])
+        self.assertEqual(
+            [row['pid'] for row in res['added']], self.expected_added
+        )
+        self.assertEqual(
+            [row['pid'] for row in res['changed']], self.expected_changed
+        )
+        self.assertEqual(res['removed'], self.expected_removed)
+
+        # Unknown snapshot gets all the rows
+        status, res = collector.get_snapshot(
+            'activity', lambda stale: (True, {'activity': self.after}),
+            activity_row_id, 'unknown'
+        )
+        self.assertTrue(res['full'])
+        self.assertEqual(len(res['rows']), len(self.after))
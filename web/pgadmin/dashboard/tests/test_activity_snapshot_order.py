@@ -0,0 +1,58 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.dashboard.collector import StatsCollector
+from pgadmin.dashboard import activity_row_id
+
+
+def _session(pid, state):
+    return {
+        'pid': pid, 'backend_start': '2019-01-01 00:00:00 UTC',
+        'state': state
+    }
+
+
+class ActivitySnapshotOrderTestCase(BaseTestGenerator):
+    """
+    This class validates that a sample taken before the latest snapshot (by
+    a concurrent viewer) is not made the latest snapshot.
+    """
+
+    scenarios = [(
+        'TestCase for an older sample completed later', dict(
+            older=[_session(1, 'idle')],
+            newer=[_session(1, 'active'), _session(2, 'idle')]
+        ))
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        collector = StatsCollector(ttl=0)
+        newer = []
+
+        def fetch_newer(stale):
+            return True, {'activity': self.newer}
+
+        def fetch_older(stale):
+            # Another viewer samples (and creates a snapshot) meanwhile
+            newer.append(collector.get_snapshot(
+                'activity', fetch_newer, activity_row_id, ''
+            )[1])
+            return True, {'activity': self.older}
+
+        status, res = collector.get_snapshot(
+            'activity', fetch_older, activity_row_id, ''
+        )
+        self.assertTrue(status)
+        self.assertTrue(res['full'])
+        self.assertEqual(res['token'], newer[0]['token'])
+        self.assertEqual(len(res['rows']), len(self.newer))
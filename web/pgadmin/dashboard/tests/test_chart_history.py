@@ -0,0 +1,80 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.dashboard.collector import ChartHistory, StatsCollector
+
+
+class ChartHistoryTestCase(BaseTestGenerator):
+    """
+    This class validates the history of the dashboard graphs, kept in a ring
+    buffer and downsampled to the refresh rate of the graph.
+    """
+
+    scenarios = [(
+        'TestCase for all the samples', dict(
+            size=10,
+            samples=[(1, 1), (2, 2), (3, 3)],
+            since=0, step=1, until=3,
+            expected=[[1], [2], [3]]
+        )), (
+        'TestCase for samples overwritten in the ring buffer', dict(
+            size=3,
+            samples=[(1, 1), (2, 2), (3, 3), (4, 4), (5, 5)],
+            since=0, step=1, until=5,
+            expected=[[3], [4], [5]]
+        )), (
+        'TestCase for samples after since only', dict(
+            size=10,
+            samples=[(1, 1), (2, 2), (3, 3), (4, 4)],
+            since=2, step=1, until=4,
+            expected=[[3], [4]]
+        )), (
+        'TestCase for downsampled samples', dict(
+            size=10,
+            samples=[(1, 1), (2, 2), (3, 3), (4, 4), (5, 5)],
+            since=0, step=2, until=5,
+            expected=[[1], [3], [5]]
+        )), (
+        'TestCase for samples within the resolution ignored', dict(
+            size=10,
+            samples=[(1, 1), (1.1, 2), (2, 3)],
+            since=0, step=1, until=2,
+            expected=[[1], [3]]
+        )), (
+        'TestCase for missing samples', dict(
+            size=10,
+            samples=[(1, 1), (4, 4), (5, None)],
+            since=0, step=1, until=7,
+            expected=[[1], None, None, [4], [None], None]
+        ))
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        hist = ChartHistory(['Total'], self.size)
+        for ts, value in self.samples:
+            hist.append(ts, {'Total': value})
+
+        self.assertEqual(
+            hist.series(self.since, self.step, self.until), self.expected
+        )
+
+        # The collector records the fetched samples in the history
+        collector = StatsCollector(ttl=0, history_size=self.size)
+        collector.get(
+            ['key'], lambda stale: (True, {'key': {'Total': 1, 'Idle': 2}}),
+            history=True
+        )
+        labels, data = collector.get_history('key', 0, 1)
+        self.assertEqual(labels, ['Total', 'Idle'])
+        self.assertEqual(data[-1], [1, 2])
+        self.assertEqual(collector.get_history('other', 0, 1), (None, None))
@@ -0,0 +1,91 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import sys
+import time
+
+import config
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.dashboard import collector
+
+if sys.version_info < (3, 3):
+    from mock import patch, MagicMock
+else:
+    from unittest.mock import patch, MagicMock
+
+
+def _manager(host):
+    manager = MagicMock()
+    manager.host = host
+    manager.hostaddr = manager.service = manager.role = None
+    manager.port = 5432
+    manager.use_ssh_tunnel = 0
+    manager.user = 'postgres'
+    manager.db = 'postgres'
+    return manager
+
+
+class CollectorEvictionTestCase(BaseTestGenerator):
+    """
+    This class validates that the collectors are dropped when idle, beyond
+    the limit (least recently used first), and when the server or database
+    is disconnected.
+    """
+
+    scenarios = [(
+        'TestCase for the idle collectors', dict(
+            idle_timeout=0.01, max_collectors=10, wait=0.02,
+            requests=[('a', None), ('b', None)], release=None,
+            expected=[('b', None)]
+        )), (
+        'TestCase for the least recently used collectors', dict(
+            idle_timeout=0, max_collectors=2, wait=0,
+            requests=[('a', None), ('b', None), ('a', None), ('c', None)],
+            release=None, expected=[('a', None), ('c', None)]
+        )), (
+        'TestCase for the disconnected server', dict(
+            idle_timeout=0, max_collectors=10, wait=0,
+            requests=[('a', None), ('a', 1), ('b', None)],
+            release=('a', None), expected=[('b', None)]
+        )), (
+        'TestCase for the disconnected database', dict(
+            idle_timeout=0, max_collectors=10, wait=0,
+            requests=[('a', None), ('a', 1), ('b', None)],
+            release=('a', 1), expected=[('a', None), ('b', None)]
+        ))
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        managers = dict()
+
+        with patch.object(
+            config, 'DASHBOARD_COLLECTOR_IDLE_TIMEOUT', self.idle_timeout
+        ), patch.object(
+            config, 'DASHBOARD_MAX_COLLECTORS', self.max_collectors
+        ), patch.dict(collector._collectors, clear=True):
+            for idx, (host, did) in enumerate(self.requests):
+                if idx == len(self.requests) - 1:
+                    time.sleep(self.wait)
+                manager = managers.setdefault(host, _manager(host))
+                collector.get_collector(manager, did)
+
+            if self.release is not None:
+                host, did = self.release
+                collector.release_collectors(managers[host], did)
+
+            self.assertEqual(
+                list(collector._collectors),
+                [
+                    collector.collector_key(managers[host], did)
+                    for host, did in self.expected
+                ]
+            )
@@ -0,0 +1,81 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import sys
+import time
+
+import config
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.dashboard import collector
+
+if sys.version_info < (3, 3):
+    from mock import patch, MagicMock
+else:
+    from unittest.mock import patch, MagicMock
+
+
+def _manager():
+    manager = MagicMock()
+    manager.host = 'localhost'
+    manager.hostaddr = manager.service = manager.role = None
+    manager.port = 5432
+    manager.use_ssh_tunnel = 0
+    manager.user = 'postgres'
+    manager.db = 'postgres'
+    return manager
+
+
+class CollectorViewersTestCase(BaseTestGenerator):
+    """
+    This class validates that a collector shared by the viewers (i.e. the
+    sessions of the users) is only dropped, when the last of its viewers
+    disconnects.
+    """
+
+    scenarios = [(
+        'TestCase for a viewer disconnecting, while another one views',
+        dict(
+            idle_timeout=0, wait=0,
+            requests=['alice', 'bob'], release=['alice'], expected=True
+        )), (
+        'TestCase for a user disconnecting, without viewing', dict(
+            idle_timeout=0, wait=0,
+            requests=['alice'], release=['bob'], expected=True
+        )), (
+        'TestCase for all the viewers disconnecting', dict(
+            idle_timeout=0, wait=0,
+            requests=['alice', 'bob'], release=['bob', 'alice'],
+            expected=False
+        )), (
+        'TestCase for a viewer disconnecting, while the other one is idle',
+        dict(
+            idle_timeout=0.05, wait=0.1,
+            requests=['bob', 'alice'], release=['alice'], expected=False
+        ))
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        managers = dict(alice=_manager(), bob=_manager())
+        key = collector.collector_key(managers['alice'], 1)
+
+        with patch.object(
+            config, 'DASHBOARD_COLLECTOR_IDLE_TIMEOUT', self.idle_timeout
+        ), patch.dict(collector._collectors, clear=True):
+            for idx, viewer in enumerate(self.requests):
+                if idx == len(self.requests) - 1:
+                    time.sleep(self.wait)
+                collector.get_collector(managers[viewer], 1)
+
+            for viewer in self.release:
+                collector.release_collectors(managers[viewer])
+
+            self.assertEqual(key in collector._collectors, self.expected)
@@ -0,0 +1,75 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import time
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.dashboard.collector import StatsCollector
+
+
+class StatsCollectorTestCase(BaseTestGenerator):
+    """
+    This class validates that the dashboard statistics are sampled once per
+    interval, and shared between the requests.
+    """
+
+    scenarios = [(
+        'TestCase for sample shared within the ttl', dict(
+            ttl=60,
+            requests=[['session_stats'], ['session_stats']],
+            wait=0,
+            expected_fetches=[['session_stats']]
+        )), (
+        'TestCase for only the stale charts fetched', dict(
+            ttl=60,
+            requests=[['session_stats'], ['session_stats', 'bio_stats']],
+            wait=0,
+            expected_fetches=[['session_stats'], ['bio_stats']]
+        )), (
+        'TestCase for sample expired after the ttl', dict(
+            ttl=0.01,
+            requests=[['session_stats'], ['session_stats']],
+            wait=0.02,
+            expected_fetches=[['session_stats'], ['session_stats']]
+        )), (
+        'TestCase for caching disabled', dict(
+            ttl=0,
+            requests=[['session_stats'], ['session_stats']],
+            wait=0,
+            expected_fetches=[['session_stats'], ['session_stats']]
+        ))
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        collector = StatsCollector(ttl=self.ttl)
+        fetches = []
+
+        def fetch(stale):
+            fetches.append(list(stale))
+            return True, dict((key, len(fetches)) for key in stale)
+
+        for keys in self.requests:
+            status, res = collector.get(keys, fetch)
+            self.assertTrue(status)
+            self.assertEqual(sorted(res.keys()), sorted(keys))
+            time.sleep(self.wait)
+
+        self.assertEqual(fetches, self.expected_fetches)
+
+        # A failed sample must not be cached
+        collector.invalidate()
+        status, res = collector.get(
+            ['session_stats'], lambda stale: (False, 'error')
+        )
+        self.assertFalse(status)
+        self.assertEqual(res, 'error')
+        self.assertEqual(collector.samples, dict())
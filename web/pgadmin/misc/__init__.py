@@ -12,7 +12,9 @@
 import pgadmin.utils.driver as driver
 from flask import url_for, render_template, Response, request
 from flask_babelex import gettext
-from pgadmin.utils import PgAdminModule
+from flask_security import roles_required
+from pgadmin.utils import PgAdminModule, instrumentation
+from pgadmin.utils.ajax import make_json_response
 from pgadmin.utils.csrf import pgCSRFProtect
 from pgadmin.utils.preferences import Preferences
 from pgadmin.utils.session import cleanup_session_files
@@ -108,6 +110,27 @@ def cleanup():
     return ""
 
 
+##########################################################################
+# The statistics of the instrumentation of the requests (per endpoint)
+##########################################################################
+@blueprint.route("/instrumentation", methods=['GET', 'DELETE'],
+                 endpoint='instrumentation')
+@roles_required('Administrator')
+def get_instrumentation():
+    """
+    Returns the count and the durations (total, maximum and histogram, in
+    ms) of each category of the instrumented requests, per endpoint, and
+    resets them on DELETE.
+    """
+    if request.method == 'DELETE':
+        instrumentation.reset_statistics()
+
+    return make_json_response(data=dict(
+        instrumentation.get_statistics(),
+        enabled=config.PERFORMANCE_INSTRUMENTATION
+    ))
+
+
 @blueprint.route("/explain/explain.js")
 def explain_js():
     """
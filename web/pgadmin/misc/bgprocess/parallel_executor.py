@@ -0,0 +1,476 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL License
+#
+##########################################################################
+
+"""
+This python script runs the statements of a background process (i.e. the
+maintenance of each table of a database, or the COPY of each chunk of a
+table) across multiple connections, like 'vacuumdb --jobs' does.
+
+It is run by the process executor, and hence - must not depend on pgAdmin
+itself.
+
+This script will:
+* Read the plan (see BatchProcess.set_plan()) from the 'plan.json' file in
+  the output directory. The work items of the plan are expected to be
+  ordered by their size (largest first), so that the biggest ones do not
+  end up running alone at the end.
+* Run the 'exclusive' items one by one first (i.e. the maintenance of the
+  system catalogs, which may deadlock, when processed in parallel), and the
+  rest of them using the given number of connections.
+* Copy the data of the 'copy' items from/to their (optionally gzip
+  compressed) files.
+* Log each started, and finished item on the standard output, and the
+  server messages (i.e. VERBOSE output) on the standard error.
+* Replace the 'progress' file in the output directory every second, with
+  the current phase of the running items as reported by the
+  pg_stat_progress_* views.
+* Write the manifest of the plan (if any), along with the number of rows
+  copied by each item, once all the items succeeded.
+
+The plan is a JSON document:
+  {
+    "snapshot": <true to run all the items using the same snapshot>,
+    "items": [{
+      "name": <name shown in the logs and the progress>,
+      "query": <statement to run>,
+      "exclusive": <true to run it before the rest, one at a time>,
+      "copy": <"to" or "from" for the COPY TO STDOUT/FROM STDIN query>,
+      "file": <file to copy the data to/from>,
+      "compress": <true if the file is gzip compressed>
+    }, ...],
+    "manifest": {"file": <path>, "data": <document>}
+  }
+
+Args:
+  --host, --port, --username, --dbname - connection parameters
+  --jobs - number of the connections to use
+
+The password, and the rest of the connection parameters are taken by libpq
+from the environment (i.e. PGPASSWORD, PGHOST, PGSSLMODE, etc.).
+
+It also depends on the following environment variable.
+OUTDIR - Output directory
+"""
+from __future__ import print_function
+
+import argparse
+import gzip
+import json
+import os
+import sys
+import time
+from threading import Lock, Thread
+
+import psycopg2
+from psycopg2.extensions import ISOLATION_LEVEL_REPEATABLE_READ
+
+_IS_PY2 = (sys.version_info[0] == 2)
+
+PLAN_FILE = 'plan.json'
+PROGRESS_FILE = 'progress'
+
+# Interval (in seconds) of sampling the progress of the running items
+PROGRESS_INTERVAL = 1
+
+# (minimum server version, view, phase, total column, done column)
+PROGRESS_VIEWS = [
+    (90600, 'pg_stat_progress_vacuum', 'phase', 'heap_blks_total',
+     'heap_blks_scanned'),
+    (120000, 'pg_stat_progress_cluster', 'phase', 'heap_blks_total',
+     'heap_blks_scanned'),
+    (120000, 'pg_stat_progress_create_index', 'phase', 'blocks_total',
+     'blocks_done'),
+    (130000, 'pg_stat_progress_analyze', 'phase', 'sample_blks_total',
+     'sample_blks_scanned'),
+    (140000, 'pg_stat_progress_copy', 'command', 'bytes_total',
+     'bytes_processed'),
+]
+
+
+def progress_query(server_version):
+    """
+    Returns the query fetching the phase, and the total, and done amount of
+    work of the given backends, or None if the server does not report the
+    progress of any of the commands.
+    """
+    queries = [
+        'SELECT pid, {0}::text AS phase, {1} AS total, {2} AS done '
+        'FROM pg_catalog.{3} WHERE pid = ANY(%(pids)s)'.format(
+            phase, total, done, view
+        )
+        for version, view, phase, total, done in PROGRESS_VIEWS
+        if server_version >= version
+    ]
+
+    return ' UNION ALL '.join(queries) if queries else None
+
+
+def open_file(item):
+    mode = 'wb' if item['copy'] == 'to' else 'rb'
+    if item.get('compress', False):
+        return gzip.open(item['file'], mode)
+    return open(item['file'], mode)
+
+
+class ParallelRunner(object):
+    """
+    class ParallelRunner
+
+    Hands out the work items to the workers, and keeps the counters, and the
+    log of the process.
+    """
+
+    def __init__(self, items, connect, jobs, snapshot=False):
+        self.connect = connect
+        self.jobs = max(1, jobs)
+        self.snapshot = snapshot
+        self.exclusive = [item for item in items if item.get('exclusive')]
+        self.items = [item for item in items if not item.get('exclusive')]
+        self.total = len(items)
+        self.started = 0
+        self.done = 0
+        self.failed = 0
+        self.workers = []
+        self.lock = Lock()
+
+        # Position of the next item to be handed out in each phase
+        self._queue = None
+        self._pos = 0
+
+    def log(self, msg, stream=None):
+        stream = stream or sys.stdout
+        with self.lock:
+            if _IS_PY2 and isinstance(msg, unicode):
+                msg = msg.encode('utf-8')
+            stream.write(msg + '\n')
+            stream.flush()
+
+    def next_item(self):
+        with self.lock:
+            if self._pos >= len(self._queue):
+                return None
+            item = self._queue[self._pos]
+            self._pos += 1
+            self.started += 1
+            return self.started, item
+
+    def finished(self, error=None):
+        with self.lock:
+            if error is None:
+                self.done += 1
+            else:
+                self.failed += 1
+
+    def run_phase(self, items, workers):
+        self._queue = items
+        self._pos = 0
+
+        threads = [Thread(target=worker.run) for worker in workers]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def export_snapshot(self):
+        """
+        Exports the snapshot of a new repeatable read transaction, which
+        must be kept open, while the workers import it.
+        """
+        conn = self.connect()
+        conn.autocommit = False
+        conn.set_isolation_level(ISOLATION_LEVEL_REPEATABLE_READ)
+        cur = conn.cursor()
+        cur.execute('SELECT pg_catalog.pg_export_snapshot()')
+        snapshot_id = cur.fetchone()[0]
+        cur.close()
+
+        return conn, snapshot_id
+
+    def run(self, out_dir):
+        connections = []
+        snapshot_conn = snapshot_id = None
+
+        if self.snapshot:
+            snapshot_conn, snapshot_id = self.export_snapshot()
+            connections.append(snapshot_conn)
+
+        # Open all the connections upfront, like vacuumdb does.
+        workers = []
+        for _ in range(min(self.jobs, max(len(self.items), 1))):
+            conn = self.connect()
+            connections.append(conn)
+            workers.append(Worker(self, conn, snapshot_id))
+
+        self.workers = workers
+        monitor_conn = self.connect()
+        connections.append(monitor_conn)
+        monitor = ProgressMonitor(self, monitor_conn, out_dir)
+        monitor.start()
+
+        start = time.time()
+        try:
+            if self.exclusive:
+                self.run_phase(self.exclusive, self.workers[:1])
+            if self.items:
+                self.run_phase(self.items, self.workers)
+        finally:
+            monitor.stop()
+            for conn in connections:
+                conn.close()
+
+        self.log(
+            'Processed {0} item(s) using {1} connection(s) in {2:.2f} '
+            'seconds, {3} failed.'.format(
+                self.done + self.failed, len(self.workers),
+                time.time() - start, self.failed
+            )
+        )
+
+        return 1 if self.failed else 0
+
+
+class Worker(object):
+    """
+    class Worker
+
+    Runs the work items handed out by the runner on its own connection, in
+    a transaction using the exported snapshot (if any).
+    """
+
+    def __init__(self, runner, conn, snapshot_id=None):
+        self.runner = runner
+        self.conn = conn
+        self.snapshot_id = snapshot_id
+        self.pid = conn.get_backend_pid()
+        # Work item being run, and the time it was started at
+        self.item = None
+        self.item_start = None
+
+        if snapshot_id is None:
+            # VACUUM cannot run inside a transaction block
+            conn.autocommit = True
+        else:
+            conn.autocommit = False
+            conn.set_isolation_level(ISOLATION_LEVEL_REPEATABLE_READ)
+            self.begin()
+
+    def begin(self):
+        cur = self.conn.cursor()
+        cur.execute('SET TRANSACTION SNAPSHOT %s', (self.snapshot_id,))
+        cur.close()
+
+    def flush_notices(self):
+        for notice in self.conn.notices:
+            self.runner.log(notice.rstrip('\n'), sys.stderr)
+        del self.conn.notices[:]
+
+    def execute(self, cur, item):
+        if not item.get('copy', None):
+            cur.execute(item['query'])
+            return
+
+        with open_file(item) as f:
+            cur.copy_expert(item['query'], f)
+        item['rows'] = cur.rowcount if cur.rowcount >= 0 else None
+
+    def run(self):
+        cur = self.conn.cursor()
+
+        while True:
+            res = self.runner.next_item()
+            if res is None:
+                break
+
+            seq, item = res
+            self.item_start = time.time()
+            self.item = item
+            self.runner.log('[{0}/{1}] {2}'.format(
+                seq, self.runner.total, item['query']
+            ))
+
+            error = None
+            try:
+                self.execute(cur, item)
+            except (psycopg2.Error, IOError, OSError) as e:
+                error = e
+            finally:
+                self.item = None
+                self.flush_notices()
+
+            if error is not None and self.snapshot_id is not None:
+                # Continue with the rest of the items in a new transaction
+                try:
+                    self.conn.rollback()
+                    self.begin()
+                except psycopg2.Error:
+                    pass
+
+            self.runner.finished(error)
+
+            if error is None:
+                self.runner.log(
+                    '[{0}/{1}] {2} done in {3:.2f} seconds.'.format(
+                        seq, self.runner.total, item['name'],
+                        time.time() - self.item_start
+                    )
+                )
+            else:
+                self.runner.log('[{0}/{1}] {2} failed: {3}'.format(
+                    seq, self.runner.total, item['name'],
+                    str(error).strip()
+                ), sys.stderr)
+
+        cur.close()
+
+        if self.snapshot_id is not None:
+            self.conn.rollback()
+
+
+class ProgressMonitor(Thread):
+    """
+    class ProgressMonitor
+
+    Samples the progress of the running work items, using a separate
+    connection, and replaces the progress file with it.
+    """
+
+    def __init__(self, runner, conn, out_dir):
+        super(ProgressMonitor, self).__init__()
+        self.daemon = True
+        self.runner = runner
+        self.conn = conn
+        self.conn.autocommit = True
+        self.query = progress_query(conn.server_version)
+        self.progress_file = os.path.join(out_dir, PROGRESS_FILE)
+        self.stopped = False
+
+    def sample(self):
+        running = [
+            (worker.pid, worker.item, worker.item_start)
+            for worker in self.runner.workers if worker.item is not None
+        ]
+
+        phases = dict()
+        if self.query and running:
+            cur = self.conn.cursor()
+            cur.execute(self.query, {'pids': [pid for pid, _, _ in running]})
+            for pid, phase, total, done in cur.fetchall():
+                phases[pid] = (phase, total, done)
+            cur.close()
+
+        now = time.time()
+        res = []
+        for pid, item, item_start in running:
+            phase, total, done = phases.get(pid, (None, None, None))
+            res.append({
+                'name': item['name'],
+                'phase': phase,
+                'total': total,
+                'done': done,
+                'percent': int(done * 100 / total) if total else None,
+                'elapsed': round(now - item_start, 2)
+            })
+
+        return {
+            'total': self.runner.total,
+            'done': self.runner.done,
+            'failed': self.runner.failed,
+            'running': res
+        }
+
+    def write(self, progress):
+        tmp_file = self.progress_file + '.tmp'
+        with open(tmp_file, 'w') as f:
+            json.dump(progress, f)
+
+        if hasattr(os, 'replace'):
+            os.replace(tmp_file, self.progress_file)
+        else:
+            if os.path.exists(self.progress_file):
+                os.remove(self.progress_file)
+            os.rename(tmp_file, self.progress_file)
+
+    def run(self):
+        while not self.stopped:
+            try:
+                self.write(self.sample())
+            except (psycopg2.Error, IOError, OSError):
+                # Progress is informative only, do not fail the job for it.
+                pass
+            time.sleep(PROGRESS_INTERVAL)
+
+    def stop(self):
+        self.stopped = True
+        self.join(PROGRESS_INTERVAL * 2)
+        if os.path.exists(self.progress_file):
+            os.remove(self.progress_file)
+
+
+def write_manifest(manifest, items):
+    """
+    Writes the manifest along with the (base) name of the file, and the
+    number of the rows of each item.
+    """
+    data = dict(manifest['data'])
+    data['chunks'] = [{
+        'file': os.path.basename(item['file']),
+        'rows': item.get('rows', None)
+    } for item in items if item.get('file', None)]
+
+    with open(manifest['file'], 'w') as f:
+        json.dump(data, f, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--host')
+    parser.add_argument('--port')
+    parser.add_argument('--username')
+    parser.add_argument('--dbname')
+    parser.add_argument('--jobs', type=int, default=1)
+    args = parser.parse_args()
+
+    out_dir = os.environ['OUTDIR']
+    with open(os.path.join(out_dir, PLAN_FILE), 'r') as f:
+        plan = json.load(f)
+
+    conn_args = dict(
+        host=args.host, port=args.port, user=args.username,
+        dbname=args.dbname
+    )
+    conn_args = dict(
+        (key, value) for key, value in conn_args.items() if value
+    )
+
+    def connect():
+        return psycopg2.connect(
+            application_name='pgAdmin 4 - Parallel Executor', **conn_args
+        )
+
+    try:
+        runner = ParallelRunner(
+            plan['items'], connect, args.jobs, plan.get('snapshot', False)
+        )
+        exit_code = runner.run(out_dir)
+    except psycopg2.Error as e:
+        print(str(e).strip(), file=sys.stderr)
+        return 1
+
+    if exit_code == 0 and plan.get('manifest', None):
+        write_manifest(plan['manifest'], plan['items'])
+        print('Manifest written to {0}.'.format(plan['manifest']['file']))
+
+    return exit_code
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -14,18 +14,20 @@ Introduce a function to run the process executor in detached mode.
 import csv
 import os
 import sys
-import psutil
+import time
+import simplejson as json
 from abc import ABCMeta, abstractproperty, abstractmethod
 from datetime import datetime
 from pickle import dumps, loads
 from subprocess import Popen
+from threading import Lock, Thread
 
 from pgadmin.utils import IS_PY2, u, file_quote, fs_encoding, \
     get_complete_file_path
 
 import pytz
 from dateutil import parser
-from flask import current_app
+from flask import current_app, has_request_context
 from flask_babelex import gettext as _
 from flask_security import current_user
 
@@ -40,6 +42,20 @@ PROCESS_NOT_STARTED = 0
 PROCESS_STARTED = 1
 PROCESS_FINISHED = 2
 PROCESS_TERMINATED = 3
+PROCESS_QUEUED = 4
+
+# Exit code of the queued process, cancelled before it was started
+PROCESS_CANCELLED_EXIT_CODE = -1
+
+# Interval (in seconds) of starting the queued processes in the background
+QUEUE_CHECK_INTERVAL = 5
+
+# Serialises starting the queued processes within this pgAdmin process
+_queue_lock = Lock()
+# Completion callbacks of the processes queued by this pgAdmin process (by
+# their id), whose environment (i.e. the password) is available here
+_queued_callbacks = dict()
+_scheduler = None
 
 
 def get_current_time(format='%Y-%m-%d %H:%M:%S.%f %z'):
@@ -51,6 +67,105 @@ def get_current_time(format='%Y-%m-%d %H:%M:%S.%f %z'):
     ).strftime(format)
 
 
+def _which(program, paths):
+    def is_exe(fpath):
+        return os.path.exists(fpath) and os.access(fpath, os.X_OK)
+
+    for path in paths:
+        if not os.path.isdir(path):
+            continue
+        exe_file = os.path.join(u(path, fs_encoding), program)
+        if is_exe(exe_file):
+            return file_quote(exe_file)
+    return None
+
+
+def python_interpreter():
+    """
+    Find the python interpreter, which runs the process executor (and the
+    python scripts run by it, e.g. the parallel maintenance runner).
+
+    Returns:
+        path of the interpreter or 'python' if it could not be found
+    """
+    paths = os.environ['PATH'].split(os.pathsep)
+    interpreter = None
+
+    if os.name == 'nt':
+        paths.insert(0, os.path.join(u(sys.prefix), u'Scripts'))
+        paths.insert(0, u(sys.prefix))
+
+        interpreter = _which(u'pythonw.exe', paths)
+        if interpreter is None:
+            interpreter = _which(u'python.exe', paths)
+
+        if interpreter is None and current_app.PGADMIN_RUNTIME:
+            # We've faced an issue with Windows 2008 R2 (x86) regarding,
+            # not honouring the environment variables set under the Qt
+            # (e.g. runtime), and also setting PYTHONHOME same as
+            # sys.executable (i.e. pgAdmin4.exe).
+            #
+            # As we know, we're running it under the runtime, we can assume
+            # that 'venv' directory will be available outside of 'bin'
+            # directory.
+            #
+            # We would try out luck to find python executable based on that
+            # assumptions.
+            bin_path = os.path.dirname(sys.executable)
+
+            venv = os.path.realpath(
+                os.path.join(bin_path, u'..\\venv')
+            )
+
+            interpreter = _which(u'pythonw.exe', [venv])
+            if interpreter is None:
+                interpreter = _which(u'pythonw.exe', [venv])
+
+            if interpreter is not None:
+                # Our assumptions are proven right.
+                # Let's append the 'bin' directory to the PATH environment
+                # variable. And, also set PYTHONHOME environment variable
+                # to 'venv' directory.
+                os.environ['PATH'] = bin_path + ';' + os.environ['PATH']
+                os.environ['PYTHONHOME'] = venv
+    else:
+        # Let's not use sys.prefix in runtime.
+        # 'sys.prefix' is not identified on *nix systems for some unknown
+        # reason, while running under the runtime.
+        # We're already adding '<installation path>/pgAdmin 4/venv/bin'
+        # directory in the PATH environment variable. Hence - it will
+        # anyway be the redundant value in paths.
+        if not current_app.PGADMIN_RUNTIME:
+            paths.insert(0, os.path.join(u(sys.prefix), u'bin'))
+        interpreter = _which(u'python', paths)
+
+    return interpreter if interpreter is not None else 'python'
+
+
+def get_parallel_jobs(jobs):
+    """
+    Returns the number of the connections requested for the process running
+    in parallel, limited by BG_PROCESS_MAX_JOBS.
+    """
+    try:
+        jobs = int(jobs or 1)
+    except (TypeError, ValueError):
+        jobs = 1
+
+    return max(1, min(jobs, config.BG_PROCESS_MAX_JOBS))
+
+
+def parallel_executor():
+    """
+    Returns the command, and the arguments running the parallel executor,
+    which runs the work items of the plan of the process (see
+    BatchProcess.set_plan()) using multiple connections.
+    """
+    return python_interpreter(), [file_quote(os.path.join(
+        os.path.dirname(u(__file__)), u'parallel_executor.py'
+    ))]
+
+
 class IProcessDesc(object):
     __metaclass__ = ABCMeta
 
@@ -68,18 +183,23 @@ class BatchProcess(object):
 
         self.id = self.desc = self.cmd = self.args = self.log_dir = \
             self.stdout = self.stderr = self.stime = self.etime = \
-            self.ecode = None
+            self.ecode = self.server_id = None
         self.env = dict()
+        # Queued processes with the higher priority are started first
+        self.priority = kwargs.get('priority', 0)
 
         if 'id' in kwargs:
-            self._retrieve_process(kwargs['id'])
+            self._retrieve_process(kwargs['id'], kwargs.get('user_id', None))
         else:
             self._create_process(
                 kwargs['desc'], kwargs['cmd'], kwargs['args']
             )
 
-    def _retrieve_process(self, _id):
-        p = Process.query.filter_by(pid=_id, user_id=current_user.id).first()
+    def _retrieve_process(self, _id, user_id=None):
+        p = Process.query.filter_by(
+            pid=_id,
+            user_id=current_user.id if user_id is None else user_id
+        ).first()
 
         if p is None:
             raise LookupError(
@@ -120,6 +240,12 @@ class BatchProcess(object):
         self.ecode = p.exit_code
         # Process State
         self.process_state = p.process_state
+        # Server
+        self.server_id = p.server_id
+        # Priority
+        self.priority = p.priority or 0
+        # Environment variables (kept only while queued)
+        self.env = json.loads(p.env) if p.env else dict()
 
     def _create_process(self, _desc, _cmd, _args):
         ctime = get_current_time(format='%y%m%d%H%M%S%f')
@@ -211,24 +337,119 @@ class BatchProcess(object):
             if IS_PY2 and hasattr(args_val, 'decode') else args_val,
             logdir=log_dir,
             desc=tmp_desc,
-            user_id=current_user.id
+            user_id=current_user.id,
+            priority=self.priority
         )
         db.session.add(j)
         db.session.commit()
 
+    def set_plan(self, plan):
+        """
+        Stores the plan of the process in its log directory, i.e. the work
+        items run by the parallel executor (see parallel_executor.py for its
+        format), or the number of the jobs planned for the utility. The
+        outcome of the process is added to it, when it finishes (see
+        set_outcome()).
+        """
+        with open(os.path.join(self.log_dir, 'plan.json'), 'w') as f:
+            json.dump(plan, f)
+
+    @staticmethod
+    def set_outcome(p):
+        """
+        Stores the outcome of the finished process (execution time, exit code
+        and number of the jobs used) in its plan (if any), to compare the
+        plans with the time taken.
+        """
+        plan_file = os.path.join(p.logdir, 'plan.json')
+        if not os.path.isfile(plan_file):
+            return
+
+        args = []
+        for arg in csv.reader(
+            StringIO(
+                p.arguments.encode('utf-8')
+                if hasattr(p.arguments, 'decode') else p.arguments
+            ), delimiter=str(',')
+        ):
+            args = args + arg
+        jobs = 1
+        if '--jobs' in args[:-1]:
+            try:
+                jobs = int(args[args.index('--jobs') + 1])
+            except ValueError:
+                pass
+
+        try:
+            with open(plan_file, 'r') as f:
+                plan = json.load(f)
+
+            plan['outcome'] = {
+                'execution_time': BatchProcess.total_seconds(
+                    parser.parse(p.end_time) - parser.parse(p.start_time)
+                ),
+                'exit_code': p.exit_code,
+                'jobs': jobs
+            }
+
+            with open(plan_file, 'w') as f:
+                json.dump(plan, f)
+        except (IOError, OSError, ValueError) as e:
+            current_app.logger.warning(
+                _("Outcome of the background process '{0}' could not be "
+                  "stored.").format(p.pid)
+            )
+            current_app.logger.exception(e)
+
     def start(self, cb=None):
+        """
+        Starts the process, or queues it when other processes are already
+        queued (to keep their order), or when the limits of the running
+        processes do not allow to start it now (see can_start()). The queued
+        processes are started by start_queued().
+        """
+        if self.stime is not None:
+            if self.etime is None:
+                raise Exception(_('The process has already been started.'))
+            raise Exception(
+                _('The process has already finished and cannot be restarted.')
+            )
 
-        def which(program, paths):
-            def is_exe(fpath):
-                return os.path.exists(fpath) and os.access(fpath, os.X_OK)
+        # The slots are checked, and taken within the lock, so that the
+        # concurrent requests do not exceed the limits.
+        with _queue_lock:
+            if not BatchProcess.has_queued() and \
+                    BatchProcess.can_start(self.server_id):
+                self._start(cb)
+                return
 
-            for path in paths:
-                if not os.path.isdir(path):
-                    continue
-                exe_file = os.path.join(u(path, fs_encoding), program)
-                if is_exe(exe_file):
-                    return file_quote(exe_file)
-            return None
+            self._queue(cb)
+
+        # It may be its turn already
+        BatchProcess.start_queued()
+
+    def _queue(self, cb=None):
+        """
+        Queues the process, along with its environment variables, so that it
+        can be started later (along with the completion callback 'cb').
+        The caller must hold the _queue_lock.
+        """
+        p = Process.query.filter_by(
+            pid=self.id, user_id=current_user.id
+        ).first()
+        p.server_id = self.server_id
+        p.env = json.dumps(self.env)
+        p.process_state = self.process_state = PROCESS_QUEUED
+
+        db.session.commit()
+        _queued_callbacks[self.id] = cb
+        _start_scheduler(current_app._get_current_object())
+
+        current_app.logger.info(
+            u"The process '%s' has been queued.", self.id
+        )
+
+    def _start(self, cb=None):
 
         def convert_environment_variables(env):
             """
@@ -249,72 +470,12 @@ class BatchProcess(object):
                 temp_env[key] = value
             return temp_env
 
-        if self.stime is not None:
-            if self.etime is None:
-                raise Exception(_('The process has already been started.'))
-            raise Exception(
-                _('The process has already finished and cannot be restarted.')
-            )
-
         executor = file_quote(os.path.join(
             os.path.dirname(u(__file__)), u'process_executor.py'
         ))
-        paths = os.environ['PATH'].split(os.pathsep)
-        interpreter = None
-
-        if os.name == 'nt':
-            paths.insert(0, os.path.join(u(sys.prefix), u'Scripts'))
-            paths.insert(0, u(sys.prefix))
-
-            interpreter = which(u'pythonw.exe', paths)
-            if interpreter is None:
-                interpreter = which(u'python.exe', paths)
-
-            if interpreter is None and current_app.PGADMIN_RUNTIME:
-                # We've faced an issue with Windows 2008 R2 (x86) regarding,
-                # not honouring the environment variables set under the Qt
-                # (e.g. runtime), and also setting PYTHONHOME same as
-                # sys.executable (i.e. pgAdmin4.exe).
-                #
-                # As we know, we're running it under the runtime, we can assume
-                # that 'venv' directory will be available outside of 'bin'
-                # directory.
-                #
-                # We would try out luck to find python executable based on that
-                # assumptions.
-                bin_path = os.path.dirname(sys.executable)
-
-                venv = os.path.realpath(
-                    os.path.join(bin_path, u'..\\venv')
-                )
-
-                interpreter = which(u'pythonw.exe', [venv])
-                if interpreter is None:
-                    interpreter = which(u'pythonw.exe', [venv])
-
-                if interpreter is not None:
-                    # Our assumptions are proven right.
-                    # Let's append the 'bin' directory to the PATH environment
-                    # variable. And, also set PYTHONHOME environment variable
-                    # to 'venv' directory.
-                    os.environ['PATH'] = bin_path + ';' + os.environ['PATH']
-                    os.environ['PYTHONHOME'] = venv
-        else:
-            # Let's not use sys.prefix in runtime.
-            # 'sys.prefix' is not identified on *nix systems for some unknown
-            # reason, while running under the runtime.
-            # We're already adding '<installation path>/pgAdmin 4/venv/bin'
-            # directory in the PATH environment variable. Hence - it will
-            # anyway be the redundant value in paths.
-            if not current_app.PGADMIN_RUNTIME:
-                paths.insert(0, os.path.join(u(sys.prefix), u'bin'))
-            interpreter = which(u'python', paths)
 
         p = None
-        cmd = [
-            interpreter if interpreter is not None else 'python',
-            executor, self.cmd
-        ]
+        cmd = [python_interpreter(), executor, self.cmd]
         cmd.extend(self.args)
 
         if os.name == 'nt' and IS_PY2:
@@ -397,20 +558,164 @@ class BatchProcess(object):
             # as standard output, and standard error were redirected to
             # devnull.
             p = Process.query.filter_by(
-                pid=self.id, user_id=current_user.id
+                pid=self.id
             ).first()
             p.start_time = p.end_time = get_current_time()
             if not p.exit_code:
                 p.exit_code = self.ecode
             p.process_state = PROCESS_FINISHED
+            p.server_id = self.server_id
+            p.env = None
             db.session.commit()
         else:
             # Update the process state to "Started"
             p = Process.query.filter_by(
-                pid=self.id, user_id=current_user.id
+                pid=self.id
             ).first()
             p.process_state = PROCESS_STARTED
+            p.server_id = self.server_id
+            p.env = None
             db.session.commit()
+        self.process_state = p.process_state
+
+    @staticmethod
+    def running_processes():
+        """
+        Returns the list of the server ids of the running processes of all
+        the users.
+        """
+        changed = False
+        # psutil is slow to import, and only needed by the background
+        # processes
+        import psutil
+
+        res = []
+
+        for p in Process.query.filter(
+            Process.process_state.in_([PROCESS_STARTED, PROCESS_TERMINATED]),
+            Process.end_time.is_(None)
+        ):
+            status, updated = BatchProcess.update_process_info(p)
+            changed = changed or updated
+
+            if p.end_time is not None:
+                continue
+            # The process executor died, without updating the status
+            if p.utility_pid and not psutil.pid_exists(p.utility_pid):
+                continue
+            res.append(p.server_id)
+
+        if changed:
+            db.session.commit()
+
+        return res
+
+    @staticmethod
+    def _has_slot(running, server_id):
+        """
+        Checks whether the limits of the running processes (given as the
+        list of their server ids) allow to start a process for the server.
+        """
+        max_running = config.BG_PROCESS_MAX_RUNNING
+        max_per_server = config.BG_PROCESS_MAX_RUNNING_PER_SERVER
+
+        if 0 < max_running <= len(running):
+            return False
+
+        if 0 < max_per_server and server_id is not None and \
+                running.count(server_id) >= max_per_server:
+            return False
+
+        return True
+
+    @staticmethod
+    def has_queued():
+        """Checks whether any process (of any user) is queued."""
+        return Process.query.filter_by(
+            process_state=PROCESS_QUEUED
+        ).first() is not None
+
+    @staticmethod
+    def can_start(server_id=None):
+        """
+        Checks whether a process for the given server can be started now,
+        i.e. the number of the running processes is within the
+        BG_PROCESS_MAX_RUNNING, and BG_PROCESS_MAX_RUNNING_PER_SERVER limits.
+        """
+        if config.BG_PROCESS_MAX_RUNNING <= 0 and (
+            config.BG_PROCESS_MAX_RUNNING_PER_SERVER <= 0 or
+            server_id is None
+        ):
+            return True
+
+        return BatchProcess._has_slot(
+            BatchProcess.running_processes(), server_id
+        )
+
+    @staticmethod
+    def start_queued():
+        """
+        Starts the queued processes of all the users, in the order of their
+        priority and creation, as long as the limits of the running
+        processes allow.
+
+        It is called periodically in the background, while this pgAdmin
+        process has queued processes, and while the users are polling the
+        status of the processes. The processes queued before pgAdmin was
+        restarted are started only while their owner is polling, as the
+        password needs to be exported using the session of the owner.
+        """
+        owner = current_user.id if has_request_context() and \
+            current_user.is_authenticated else None
+
+        with _queue_lock:
+            queued = Process.query.filter_by(
+                process_state=PROCESS_QUEUED
+            ).order_by(Process.priority.desc(), Process.pid).all()
+
+            # Forget the callbacks of the processes not queued anymore
+            pids = set(p.pid for p in queued)
+            for pid in list(_queued_callbacks):
+                if pid not in pids:
+                    del _queued_callbacks[pid]
+
+            if not queued:
+                return
+
+            running = BatchProcess.running_processes()
+
+            for p in queued:
+                queued_here = p.pid in _queued_callbacks
+                if not queued_here and p.user_id != owner:
+                    continue
+
+                if not BatchProcess._has_slot(running, p.server_id):
+                    continue
+
+                process = BatchProcess(id=p.pid, user_id=p.user_id)
+
+                # The password is exported for the process, when it is
+                # created, but not after pgAdmin has been restarted.
+                if not queued_here and process.server_id is not None and \
+                        str(process.id) not in os.environ:
+                    from pgadmin.utils.driver import get_driver
+                    get_driver(config.PG_DEFAULT_DRIVER).connection_manager(
+                        process.server_id
+                    ).export_password_env(process.id)
+
+                try:
+                    process._start(_queued_callbacks.pop(p.pid, None))
+                except Exception as e:
+                    # Do not try to start it again
+                    current_app.logger.exception(e)
+                    p.start_time = p.end_time = get_current_time()
+                    p.exit_code = PROCESS_CANCELLED_EXIT_CODE
+                    p.process_state = PROCESS_FINISHED
+                    p.env = None
+                    db.session.commit()
+                    continue
+
+                running.append(p.server_id)
 
     def status(self, out=0, err=0):
         import re
@@ -470,6 +775,10 @@ class BatchProcess(object):
         execution_time = None
 
         if j is not None:
+            if j.process_state == PROCESS_QUEUED:
+                BatchProcess.start_queued()
+                self.process_state = j.process_state
+
             status, updated = BatchProcess.update_process_info(j)
             if updated:
                 db.session.commit()
@@ -493,12 +802,16 @@ class BatchProcess(object):
         else:
             out_completed = err_completed = False
 
+        stime = parser.parse(self.stime) if self.stime is not None else None
+
         if out == -1 or err == -1:
             return {
+                'stime': stime,
                 'start_time': self.stime,
                 'exit_code': self.ecode,
                 'execution_time': execution_time,
-                'process_state': self.process_state
+                'process_state': self.process_state,
+                'progress': self.progress()
             }
 
         return {
@@ -512,12 +825,34 @@ class BatchProcess(object):
                 'lines': stderr,
                 'done': err_completed
             },
+            'stime': stime,
             'start_time': self.stime,
             'exit_code': self.ecode,
             'execution_time': execution_time,
-            'process_state': self.process_state
+            'process_state': self.process_state,
+            'progress': self.progress()
         }
 
+    def progress(self):
+        """
+        Returns the progress reported by the running process (if any) in the
+        'progress' file of its log directory, i.e. a JSON document replaced
+        by the process from time to time.
+        """
+        if self.ecode is not None or self.log_dir is None:
+            return None
+
+        progress_file = os.path.join(self.log_dir, 'progress')
+        if not os.path.isfile(progress_file):
+            return None
+
+        try:
+            with open(progress_file, 'r') as f:
+                return json.load(f)
+        except (IOError, OSError, ValueError):
+            # The process is replacing it right now
+            return None
+
     @staticmethod
     def update_process_info(p):
         if p.start_time is None or p.end_time is None:
@@ -542,6 +877,7 @@ class BatchProcess(object):
                             # We can't have 'end_time' without the 'exit_code'.
                             if 'end_time' in data and data['end_time']:
                                 p.end_time = data['end_time']
+                                BatchProcess.set_outcome(p)
 
                     # get the pid of the utility.
                     if 'pid' in data:
@@ -562,27 +898,38 @@ class BatchProcess(object):
     def list():
         processes = Process.query.filter_by(user_id=current_user.id)
         changed = False
+        queued = False
 
         res = []
         for p in processes:
-            status, updated = BatchProcess.update_process_info(p)
-            if not status:
-                continue
+            if p.process_state == PROCESS_QUEUED:
+                queued = True
+            else:
+                status, updated = BatchProcess.update_process_info(p)
+                if not status:
+                    continue
+
+                if not changed:
+                    changed = updated
 
-            if not changed:
-                changed = updated
+                # The process has just finished, and lets a queued one start
+                if updated and p.end_time is not None:
+                    queued = True
 
-            if p.start_time is None or (
+            if (
+                p.start_time is None and p.process_state != PROCESS_QUEUED
+            ) or (
                 p.acknowledge is not None and p.end_time is None
             ):
                 continue
 
-            execution_time = None
+            stime = execution_time = None
 
-            stime = parser.parse(p.start_time)
-            etime = parser.parse(p.end_time or get_current_time())
+            if p.start_time is not None:
+                stime = parser.parse(p.start_time)
+                etime = parser.parse(p.end_time or get_current_time())
 
-            execution_time = BatchProcess.total_seconds(etime - stime)
+                execution_time = BatchProcess.total_seconds(etime - stime)
             desc = ""
             try:
                 desc = loads(p.desc.encode('latin-1')) if \
@@ -625,6 +972,9 @@ class BatchProcess(object):
         if changed:
             db.session.commit()
 
+        if queued:
+            BatchProcess.start_queued()
+
         return res
 
     @staticmethod
@@ -662,6 +1012,8 @@ class BatchProcess(object):
     def set_env_variables(self, server, **kwargs):
         """Set environment variables"""
         if server:
+            self.server_id = server.id
+
             # Set SSL related ENV variables
             if server.sslcert and server.sslkey and server.sslrootcert:
                 # SSL environment variables
@@ -692,6 +1044,25 @@ class BatchProcess(object):
                 _("Could not find a process with the specified ID.")
             )
 
+        if p.process_state == PROCESS_QUEUED:
+            # Cancel the process, which has not been started yet
+            open(os.path.join(p.logdir, 'out'), 'ab').close()
+            with open(os.path.join(p.logdir, 'err'), 'ab') as fp:
+                fp.write(u'{0},{1}\n'.format(
+                    get_current_time(format='%Y%m%d%H%M%S%f'),
+                    _('The process was cancelled before it was started.')
+                ).encode('utf-8'))
+            p.start_time = p.end_time = get_current_time()
+            p.exit_code = PROCESS_CANCELLED_EXIT_CODE
+            p.process_state = PROCESS_TERMINATED
+            p.env = None
+            with _queue_lock:
+                db.session.commit()
+                _queued_callbacks.pop(p.pid, None)
+            return
+
+        import psutil
+
         try:
             process = psutil.Process(p.utility_pid)
             process.terminate()
@@ -704,3 +1075,42 @@ class BatchProcess(object):
                     p.utility_pid)
             )
             current_app.logger.exception(e)
+
+
+def _run_scheduler(app):
+    """
+    Starts the queued processes periodically (see BatchProcess.start_queued),
+    as long as this pgAdmin process has queued processes.
+    """
+    global _scheduler
+
+    while True:
+        time.sleep(QUEUE_CHECK_INTERVAL)
+
+        with app.app_context():
+            try:
+                BatchProcess.start_queued()
+            except Exception as e:
+                app.logger.exception(e)
+
+        with _queue_lock:
+            if not _queued_callbacks:
+                _scheduler = None
+                return
+
+
+def _start_scheduler(app):
+    """
+    Starts the scheduler of the queued processes, unless already running.
+    The caller must hold the _queue_lock.
+    """
+    global _scheduler
+
+    if _scheduler is not None:
+        return
+
+    _scheduler = Thread(
+        target=_run_scheduler, args=(app, ), name='pgAdminProcessQueue'
+    )
+    _scheduler.daemon = True
+    _scheduler.start()
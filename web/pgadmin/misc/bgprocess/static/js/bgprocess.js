@@ -59,7 +59,8 @@ define('misc.bgprocess', [
           details: false,
           notify: (_.isUndefined(notify) || notify),
           curr_status: null,
-          state: 0, // 0: NOT Started, 1: Started, 2: Finished, 3: Terminated
+          // 0: NOT Started, 1: Started, 2: Finished, 3: Terminated, 4: Queued
+          state: 0,
           completed: false,
 
           id: info['id'],
@@ -70,6 +71,8 @@ define('misc.bgprocess', [
           exit_code: null,
           acknowledge: info['acknowledge'],
           execution_time: null,
+          // Progress reported by the running process (if any)
+          progress: null,
           out: -1,
           err: -1,
           lot_more: false,
@@ -140,10 +143,10 @@ define('misc.bgprocess', [
           out = [],
           err = [];
 
-        if ('stime' in data)
+        if (data.stime)
           self.stime = new Date(data.stime);
 
-        if ('execution_time' in data)
+        if ('execution_time' in data && !_.isNull(data.execution_time))
           self.execution_time = parseFloat(data.execution_time);
 
         if ('type_desc' in data)
@@ -161,6 +164,9 @@ define('misc.bgprocess', [
         if ('process_state' in data)
           self.state = data.process_state;
 
+        if ('progress' in data)
+          self.progress = data.progress;
+
         if ('out' in data) {
           self.out = data.out && data.out.pos;
 
@@ -212,6 +218,15 @@ define('misc.bgprocess', [
           });
         }
 
+        if (self.state == 4 && !self.stime) {
+          // Waiting for the running processes to finish
+          self.curr_status = self.other_status_tpl({status_text:gettext('Queued')});
+
+          setTimeout(function() {
+            self.show.apply(self);
+          }, 10);
+        }
+
         if (self.stime) {
           self.curr_status = self.other_status_tpl({status_text:gettext('Started')});
 
@@ -231,7 +246,7 @@ define('misc.bgprocess', [
             }
           }
 
-          if (self.state == 0 && self.stime) {
+          if ((self.state == 0 || self.state == 4) && self.stime) {
             self.state = 1;
             pgBrowser.Events && pgBrowser.Events.trigger(
               'pgadmin-bgprocess:started:' + self.id, self, self
@@ -259,6 +274,33 @@ define('misc.bgprocess', [
         }
       },
 
+      progress_el: function() {
+        var self = this,
+          progress = self.progress,
+          $el = $('<div></div>');
+
+        if (!progress || !_.isNull(self.exit_code))
+          return $el;
+
+        $el.append($('<div></div>').text(
+          S(gettext('%s of %s item(s) processed, %s failed.')).sprintf(
+            String(progress.done + progress.failed), String(progress.total),
+            String(progress.failed)
+          ).value()
+        ));
+
+        _.each(progress.running, function(r) {
+          var text = r.name + ': ' + (r.phase || gettext('running'));
+
+          if (!_.isNull(r.percent) && !_.isUndefined(r.percent))
+            text += ' (' + r.percent + '%)';
+
+          $el.append($('<div></div>', {class: 'pl-2'}).text(text));
+        });
+
+        return $el;
+      },
+
       status: function() {
         var self = this;
 
@@ -299,7 +341,8 @@ define('misc.bgprocess', [
               </div>
               <div class="card-body px-2">
                 <div class="py-1">${self.desc}</div>
-                <div class="py-1">${self.stime.toString()}</div>
+                <div class="py-1 pg-bg-stime"></div>
+                <div class="py-1 pg-bg-progress"></div>
                 <div class="d-flex py-1">
                   <div class="my-auto mr-2">
                     <span class="fa fa-clock-o fa-2x"></span>
@@ -356,6 +399,13 @@ define('misc.bgprocess', [
             content.find('.bg-process-stop').off('click').on('click', self.stop_process.bind(this));
           }
 
+          self.container.find('.pg-bg-stime').text(
+            self.stime ? self.stime.toString() : ''
+          );
+          self.container.find('.pg-bg-progress').empty().append(
+            self.progress_el()
+          );
+
           // TODO:: Formatted execution time
           self.container.find('.pg-bg-etime').empty().append(
             $('<span></span>').text(
@@ -423,6 +473,11 @@ define('misc.bgprocess', [
           self.stime
         );
 
+        // set progress
+        $header.find('.bg-process-progress').empty().append(
+          self.progress_el()
+        );
+
         // set status
         $footer.find('.bg-process-status').html(self.curr_status);
 
@@ -616,6 +671,7 @@ define('misc.bgprocess', [
                   '<button type="button" class="btn btn-danger bg-process-stop"><span class="fa fa-times-circle"></span>&nbsp;' + gettext('Stop Process') + '</button>' +
                 '</div>' +
               '</div>' +
+              '<div class="bg-process-progress py-1"></div>' +
             '</div>' +
             '<div class="bg-process-watcher">' +
             '</div>' +
@@ -0,0 +1,255 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import gzip
+import json
+import os
+import shutil
+import sys
+import tempfile
+from threading import Lock
+
+import psycopg2
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.misc.bgprocess.parallel_executor import ParallelRunner, \
+    PROGRESS_FILE, progress_query, write_manifest
+
+if sys.version_info < (3, 3):
+    from mock import patch
+    from StringIO import StringIO
+else:
+    from unittest.mock import patch
+    from io import StringIO
+
+
+class FakeCursor(object):
+    def __init__(self, conn):
+        self.conn = conn
+        self.rowcount = -1
+
+    def execute(self, query, params=None):
+        if query.startswith('SET TRANSACTION SNAPSHOT'):
+            self.conn.snapshots.append(params[0])
+            return
+        # The progress is sampled with the parameters
+        if params is not None or 'pg_export_snapshot' in query:
+            return
+        with self.conn.lock:
+            self.conn.executed.append((self.conn.pid, query))
+        if 'fail' in query:
+            raise psycopg2.ProgrammingError('failed')
+        self.conn.notices.append('INFO:  done\n')
+
+    def copy_expert(self, query, f):
+        self.execute(query)
+        if 'TO STDOUT' in query:
+            f.write(b'1\n2\n')
+            self.rowcount = 2
+        else:
+            self.rowcount = len(f.read().splitlines())
+
+    def fetchone(self):
+        return ['00000003-1']
+
+    def fetchall(self):
+        return []
+
+    def close(self):
+        pass
+
+
+class FakeConnection(object):
+    server_version = 140000
+
+    def __init__(self, pid, executed, lock):
+        self.pid = pid
+        self.executed = executed
+        self.lock = lock
+        self.notices = []
+        self.snapshots = []
+        self.autocommit = False
+        self.closed = False
+
+    def get_backend_pid(self):
+        return self.pid
+
+    def set_isolation_level(self, level):
+        pass
+
+    def rollback(self):
+        pass
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def close(self):
+        self.closed = True
+
+
+def _item(name, exclusive=False):
+    return {
+        'name': name, 'query': 'VACUUM {0};'.format(name),
+        'exclusive': exclusive
+    }
+
+
+def _copy(name, compress=False):
+    return {
+        'name': name,
+        'query': 'COPY (SELECT * FROM t WHERE {0}) TO STDOUT;'.format(name),
+        'copy': 'to',
+        'file': name + ('.gz' if compress else ''),
+        'compress': compress
+    }
+
+
+class ParallelExecutorTestCase(BaseTestGenerator):
+    """
+    This class validates that the parallel executor runs all the work items,
+    the exclusive ones first and one at a time.
+    """
+
+    scenarios = [(
+        'TestCase for parallel items', dict(
+            items=[_item('t{0}'.format(i)) for i in range(10)],
+            jobs=3,
+            snapshot=False,
+            expected_connections=3,
+            expected_exit_code=0,
+            expected_stderr='INFO:  done'
+        )), (
+        'TestCase for exclusive items', dict(
+            items=[
+                _item('c1', True), _item('t1'), _item('c2', True),
+                _item('t2'), _item('t3')
+            ],
+            jobs=2,
+            snapshot=False,
+            expected_connections=2,
+            expected_exit_code=0,
+            expected_stderr='INFO:  done'
+        )), (
+        'TestCase for fewer items than jobs', dict(
+            items=[_item('t1')],
+            jobs=4,
+            snapshot=False,
+            expected_connections=1,
+            expected_exit_code=0,
+            expected_stderr='INFO:  done'
+        )), (
+        'TestCase for failed item', dict(
+            items=[_item('t1'), _item('fail'), _item('t2')],
+            jobs=2,
+            snapshot=False,
+            expected_connections=2,
+            expected_exit_code=1,
+            expected_stderr='fail failed: failed'
+        )), (
+        'TestCase for copy using the same snapshot', dict(
+            items=[_copy('a < 10', True), _copy('a >= 10')],
+            jobs=2,
+            snapshot=True,
+            expected_connections=2,
+            expected_exit_code=0,
+            expected_stderr=''
+        ))
+    ]
+
+    def setUp(self):
+        self.out_dir = tempfile.mkdtemp()
+        for item in self.items:
+            if 'file' in item:
+                item['file'] = os.path.join(
+                    self.out_dir, os.path.basename(item['file'])
+                )
+
+    def runTest(self):
+        executed = []
+        lock = Lock()
+        connections = []
+
+        def connect():
+            conn = FakeConnection(len(connections) + 1, executed, lock)
+            connections.append(conn)
+            return conn
+
+        runner = ParallelRunner(
+            self.items, connect, self.jobs, self.snapshot
+        )
+
+        with patch('sys.stdout', new_callable=StringIO) as stdout, \
+                patch('sys.stderr', new_callable=StringIO) as stderr:
+            exit_code = runner.run(self.out_dir)
+
+        self.assertEqual(exit_code, self.expected_exit_code)
+        # The workers, the progress monitor (and the exported snapshot)
+        self.assertEqual(
+            len(connections),
+            self.expected_connections + 1 + (1 if self.snapshot else 0)
+        )
+        self.assertTrue(all(conn.closed for conn in connections))
+
+        queries = [query for _, query in executed]
+        self.assertEqual(
+            sorted(queries), sorted(item['query'] for item in self.items)
+        )
+
+        exclusive = [
+            item['query'] for item in self.items if item.get('exclusive')
+        ]
+        self.assertEqual(queries[:len(exclusive)], exclusive)
+        # Run one at a time, using the same connection
+        self.assertEqual(
+            len(set(pid for pid, _ in executed[:len(exclusive)])),
+            1 if exclusive else 0
+        )
+
+        self.assertIn('Processed {0} item(s)'.format(
+            len(self.items)
+        ), stdout.getvalue())
+        self.assertIn(self.expected_stderr, stderr.getvalue())
+        self.assertFalse(
+            os.path.exists(os.path.join(self.out_dir, PROGRESS_FILE))
+        )
+
+        if self.snapshot:
+            # All the workers imported the snapshot
+            workers = [conn for conn in connections if conn.snapshots]
+            self.assertEqual(len(workers), self.expected_connections)
+            self.check_copy()
+
+        # Progress views available as per the server version
+        self.assertIsNone(progress_query(90500))
+        self.assertIn('pg_stat_progress_vacuum', progress_query(90600))
+        self.assertNotIn('pg_stat_progress_cluster', progress_query(110000))
+        self.assertIn('pg_stat_progress_create_index', progress_query(120000))
+        self.assertIn('pg_stat_progress_copy', progress_query(140000))
+
+    def check_copy(self):
+        for item in self.items:
+            opener = gzip.open if item['compress'] else open
+            with opener(item['file'], 'rb') as f:
+                self.assertEqual(f.read(), b'1\n2\n')
+            self.assertEqual(item['rows'], 2)
+
+        manifest_file = os.path.join(self.out_dir, 'manifest')
+        write_manifest(
+            {'file': manifest_file, 'data': {'table': 't'}}, self.items
+        )
+        with open(manifest_file, 'r') as f:
+            manifest = json.load(f)
+        self.assertEqual(manifest['table'], 't')
+        self.assertEqual(manifest['chunks'], [
+            {'file': os.path.basename(item['file']), 'rows': 2}
+            for item in self.items
+        ])
+
+    def tearDown(self):
+        shutil.rmtree(self.out_dir, True)
@@ -0,0 +1,83 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import os
+import shutil
+import sys
+import tempfile
+
+import simplejson as json
+
+from pgadmin.misc.bgprocess.processes import BatchProcess
+from pgadmin.utils.route import BaseTestGenerator
+
+if sys.version_info < (3, 3):
+    from mock import MagicMock
+else:
+    from unittest.mock import MagicMock
+
+
+class ProcessOutcomeTestCase(BaseTestGenerator):
+    """
+    This class validates that the outcome of a finished process is stored in
+    its plan, next to the planned jobs.
+    """
+
+    scenarios = [(
+        'TestCase for a finished backup with its jobs', dict(
+            plan={'jobs': 4, 'tables': 12},
+            arguments='--file,/tmp/backup,--jobs,4,--format=d,postgres',
+            status={'start_time': '2019-06-17 10:00:00.000000 +0000',
+                    'end_time': '2019-06-17 10:01:30.500000 +0000',
+                    'exit_code': 0},
+            expected={'execution_time': 90.5, 'exit_code': 0, 'jobs': 4}
+        )), (
+        'TestCase for a failed process without jobs', dict(
+            plan={'items': []},
+            arguments='--database,postgres',
+            status={'start_time': '2019-06-17 10:00:00.000000 +0000',
+                    'end_time': '2019-06-17 10:00:02.000000 +0000',
+                    'exit_code': 1},
+            expected={'execution_time': 2.0, 'exit_code': 1, 'jobs': 1}
+        )), (
+        'TestCase for a running process', dict(
+            plan={'jobs': 2},
+            arguments='--jobs,2',
+            status={'start_time': '2019-06-17 10:00:00.000000 +0000'},
+            expected=None
+        ))
+    ]
+
+    def setUp(self):
+        self.log_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.log_dir)
+
+    def runTest(self):
+        with open(os.path.join(self.log_dir, 'plan.json'), 'w') as f:
+            json.dump(self.plan, f)
+        with open(os.path.join(self.log_dir, 'status'), 'w') as f:
+            json.dump(self.status, f)
+
+        p = MagicMock()
+        p.logdir = self.log_dir
+        p.arguments = self.arguments
+        p.start_time = p.end_time = p.exit_code = None
+
+        with self.app.app_context():
+            BatchProcess.update_process_info(p)
+
+        with open(os.path.join(self.log_dir, 'plan.json'), 'r') as f:
+            plan = json.load(f)
+
+        self.assertEqual(plan.get('outcome'), self.expected)
+        # The plan itself is kept as it is
+        plan.pop('outcome', None)
+        self.assertEqual(plan, self.plan)
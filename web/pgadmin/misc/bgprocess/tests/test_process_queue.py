@@ -0,0 +1,124 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import os
+import sys
+
+import config
+from pgadmin.misc.bgprocess import processes
+from pgadmin.misc.bgprocess.processes import BatchProcess
+from pgadmin.utils.route import BaseTestGenerator
+
+if sys.version_info < (3, 3):
+    from mock import patch, MagicMock
+else:
+    from unittest.mock import patch, MagicMock
+
+
+class ProcessQueueTestCase(BaseTestGenerator):
+    """
+    This class validates that the queued processes are started within the
+    limits of the running processes, along with their completion callbacks.
+    The processes queued before a restart (i.e. not queued here) are started
+    only for their owner.
+    """
+
+    scenarios = [(
+        'TestCase for the total, and per server limits', dict(
+            max_running=2,
+            max_per_server=1,
+            running=[1],
+            queued=[('a', 1), ('b', 2), ('c', 3)],
+            not_queued_here=[],
+            expected=['b']
+        )), (
+        'TestCase for the per server limit', dict(
+            max_running=0,
+            max_per_server=2,
+            running=[1],
+            queued=[('a', 1), ('b', 1), ('c', 2)],
+            not_queued_here=[],
+            expected=['a', 'c']
+        )), (
+        'TestCase for no limits', dict(
+            max_running=0,
+            max_per_server=0,
+            running=[1, 1, 1],
+            queued=[('a', 1), ('b', 1)],
+            not_queued_here=[],
+            expected=['a', 'b']
+        )), (
+        'TestCase for the processes queued before a restart', dict(
+            max_running=0,
+            max_per_server=0,
+            running=[],
+            queued=[('a', 1), ('b', 1), ('c', 2)],
+            not_queued_here=['a', 'b'],
+            expected=['c']
+        ))
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        servers = dict(self.queued)
+        started = []
+
+        callbacks = dict(
+            (pid, MagicMock()) for pid in servers
+            if pid not in self.not_queued_here
+        )
+
+        def retrieve_process(process, _id, user_id=None):
+            process.id = _id
+            process.server_id = servers[_id]
+
+        def start(process, cb=None):
+            started.append(process.id)
+            self.assertIs(cb, callbacks[process.id])
+
+        queued = []
+        for pid, sid in self.queued:
+            p = MagicMock()
+            p.pid = pid
+            p.server_id = sid
+            # Queued by another user
+            p.user_id = 2
+            queued.append(p)
+
+        with patch.object(
+            config, 'BG_PROCESS_MAX_RUNNING', self.max_running
+        ), patch.object(
+            config, 'BG_PROCESS_MAX_RUNNING_PER_SERVER', self.max_per_server
+        ), patch(
+            'pgadmin.misc.bgprocess.processes.Process'
+        ) as process_mock, patch(
+            'pgadmin.misc.bgprocess.processes.current_user'
+        ), patch.object(
+            BatchProcess, 'running_processes',
+            return_value=list(self.running)
+        ), patch.object(
+            BatchProcess, '_retrieve_process', retrieve_process
+        ), patch.object(
+            BatchProcess, '_start', start
+        ), patch.dict(
+            # The passwords have already been exported for the processes
+            os.environ, dict((pid, '') for pid in servers)
+        ), patch.dict(processes._queued_callbacks, callbacks, clear=True):
+            process_mock.query.filter_by.return_value.order_by.\
+                return_value.all.return_value = queued
+
+            self.assertEqual(
+                BatchProcess.can_start(1),
+                BatchProcess._has_slot(self.running, 1)
+            )
+            BatchProcess.start_queued()
+
+        self.assertEqual(started, self.expected)
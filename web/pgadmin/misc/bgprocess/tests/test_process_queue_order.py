@@ -0,0 +1,78 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import sys
+
+from pgadmin.misc.bgprocess import processes
+from pgadmin.misc.bgprocess.processes import BatchProcess
+from pgadmin.utils.route import BaseTestGenerator
+
+if sys.version_info < (3, 3):
+    from mock import patch
+else:
+    from unittest.mock import patch
+
+
+class ProcessQueueOrderTestCase(BaseTestGenerator):
+    """
+    This class validates that a new process does not skip ahead of the
+    queued ones, and that the free slots are taken within the lock.
+    """
+
+    scenarios = [(
+        'TestCase for a free slot, while a process is waiting', dict(
+            has_queued=True,
+            can_start=True,
+            expected='queued'
+        )), (
+        'TestCase for a free slot', dict(
+            has_queued=False,
+            can_start=True,
+            expected='started'
+        )), (
+        'TestCase for no free slot', dict(
+            has_queued=False,
+            can_start=False,
+            expected='queued'
+        ))
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        calls = []
+
+        def record(name):
+            def call(*args, **kwargs):
+                calls.append((name, processes._queue_lock.locked()))
+            return call
+
+        process = BatchProcess.__new__(BatchProcess)
+        process.id = 'a'
+        process.stime = process.etime = process.server_id = None
+
+        with patch.object(
+            BatchProcess, 'has_queued', return_value=self.has_queued
+        ), patch.object(
+            BatchProcess, 'can_start', return_value=self.can_start
+        ), patch.object(
+            BatchProcess, '_start', record('started')
+        ), patch.object(
+            BatchProcess, '_queue', record('queued')
+        ), patch.object(
+            BatchProcess, 'start_queued', record('start_queued')
+        ):
+            process.start()
+
+        expected = [(self.expected, True)]
+        if self.expected == 'queued':
+            # It may be its turn already
+            expected.append(('start_queued', False))
+        self.assertEqual(calls, expected)
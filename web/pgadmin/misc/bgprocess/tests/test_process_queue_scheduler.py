@@ -0,0 +1,62 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import sys
+
+from pgadmin.misc.bgprocess import processes
+from pgadmin.misc.bgprocess.processes import BatchProcess
+from pgadmin.utils.route import BaseTestGenerator
+
+if sys.version_info < (3, 3):
+    from mock import patch
+else:
+    from unittest.mock import patch
+
+
+class ProcessQueueSchedulerTestCase(BaseTestGenerator):
+    """
+    This class validates that the queued processes are started in the
+    background, until none is left.
+    """
+
+    scenarios = [(
+        'TestCase for the scheduler of the queued processes', dict(
+            queued=['a', 'b']
+        ))
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        calls = []
+
+        def start_queued():
+            calls.append(list(processes._queued_callbacks))
+            # One process started each time
+            processes._queued_callbacks.pop(
+                sorted(processes._queued_callbacks)[0]
+            )
+
+        with patch.object(
+            processes, 'QUEUE_CHECK_INTERVAL', 0
+        ), patch.object(
+            BatchProcess, 'start_queued', start_queued
+        ), patch.dict(
+            processes._queued_callbacks,
+            dict((pid, None) for pid in self.queued), clear=True
+        ):
+            with processes._queue_lock:
+                processes._start_scheduler(self.app)
+                scheduler = processes._scheduler
+            scheduler.join(5)
+
+            self.assertFalse(scheduler.is_alive())
+            self.assertIsNone(processes._scheduler)
+            self.assertEqual(calls, [['a', 'b'], ['b']])
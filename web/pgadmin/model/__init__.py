@@ -29,7 +29,7 @@ from flask_sqlalchemy import SQLAlchemy
 #
 ##########################################################################
 
-SCHEMA_VERSION = 23
+SCHEMA_VERSION = 24
 
 ##########################################################################
 #
@@ -261,6 +261,9 @@ class Process(db.Model):
     acknowledge = db.Column(db.String(), nullable=True)
     utility_pid = db.Column(db.Integer, nullable=False)
     process_state = db.Column(db.Integer, nullable=False)
+    server_id = db.Column(db.Integer, nullable=True)
+    priority = db.Column(db.Integer, nullable=False, default=0)
+    env = db.Column(db.String(), nullable=True)
 
 
 class Keys(db.Model):
@@ -28,6 +28,14 @@ export function callRenderAfterPoll(sqlEditor, alertify, res) {
   sqlEditor.rows_affected = res.rows_affected;
   sqlEditor.has_more_rows = res.has_more_rows;
 
+  // Report the time of each statement of a script, before its result
+  if (res.script_report) {
+    res.additional_messages = res.script_report + '\n\n' + (res.additional_messages || '');
+    if (!hasResultsToDisplay(res)) {
+      res.result = res.script_report + '\n\n' + res.result;
+    }
+  }
+
   if (hasResultsToDisplay(res)) {
     sqlEditor._render(res);
   } else {
@@ -52,7 +52,7 @@ class ExecuteQuery {
       }, self.sqlServerObject.POLL_FALLBACK_TIME());
   }
 
-  execute(sqlStatement, explainPlan, connect) {
+  execute(sqlStatement, explainPlan, connect, script) {
     // If it is an empty query, do nothing.
     if (sqlStatement.length <= 0) return;
 
@@ -60,6 +60,10 @@ class ExecuteQuery {
     self.explainPlan = explainPlan;
 
     const sqlStatementWithAnalyze = ExecuteQuery.prepareAnalyzeSql(sqlStatement, explainPlan);
+    // Run the statements one by one, and report the time of each of them
+    if (script) {
+      sqlStatementWithAnalyze.script = true;
+    }
 
     self.initializeExecutionOnSqlEditor(sqlStatementWithAnalyze);
     axios.post(
@@ -133,8 +137,15 @@ class ExecuteQuery {
             self.sqlServerObject.update_notifications(httpMessage.data.data.notifies);
         } else if (ExecuteQuery.isQueryStillRunning(httpMessage)) {
           // If status is Busy then poll the result by recursive call to the poll function
-          this.delayedPoll();
           self.sqlServerObject.setIsQueryRunning(true);
+          if (httpMessage.data.data.script_progress) {
+            // The poll waits for the statements of the script, poll again
+            // right away to run the next ones.
+            self.poll();
+            self.loadingScreen.setMessage(httpMessage.data.data.script_progress);
+          } else {
+            this.delayedPoll();
+          }
           if (httpMessage.data.data.result) {
             self.sqlServerObject.update_msg_history(httpMessage.data.data.status, httpMessage.data.data.result, false);
           }
@@ -40,6 +40,11 @@ let queryToolActions = {
     }
   },
 
+  executeScript: function (sqlEditorController) {
+    this._clearMessageTab();
+    sqlEditorController.execute(undefined, false, true);
+  },
+
   explainAnalyze: function (sqlEditorController) {
     let costEnabled = this._costsEnabled();
     let verbose = this._verbose();
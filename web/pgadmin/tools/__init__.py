@@ -15,6 +15,7 @@ from flask_babelex import Domain, gettext
 
 from pgadmin.utils import PgAdminModule
 from pgadmin.utils.ajax import bad_request
+from pgadmin.utils.render_cache import cached_render
 
 MODULE_NAME = 'tools'
 
@@ -60,6 +61,7 @@ def index():
 
 
 @blueprint.route("/translations.js")
+@cached_render()
 def translations():
     """Return a js file that will handle translations so Flask interpolation
     can be isolated
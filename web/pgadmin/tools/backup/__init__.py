@@ -11,16 +11,20 @@
 
 from __future__ import unicode_literals
 import simplejson as json
+import math
+import multiprocessing
 import os
 
 from flask import render_template, request, current_app, \
     url_for, Response
 from flask_babelex import gettext as _
 from flask_security import login_required, current_user
-from pgadmin.misc.bgprocess.processes import BatchProcess, IProcessDesc
+from pgadmin.misc.bgprocess.processes import BatchProcess, IProcessDesc, \
+    get_parallel_jobs
 from pgadmin.utils import PgAdminModule, get_storage_directory, html, \
     fs_short_path, document_dir, is_utility_exists
-from pgadmin.utils.ajax import make_json_response, bad_request
+from pgadmin.utils.ajax import make_json_response, bad_request, \
+    internal_server_error
 
 from config import PG_DEFAULT_DRIVER
 from pgadmin.model import Server
@@ -29,6 +33,10 @@ from pgadmin.model import Server
 MODULE_NAME = 'backup'
 server_info = {}
 
+# Size of the data below which dumping in parallel is not worth the
+# additional connections.
+PARALLEL_MIN_SIZE = 64 * 1024 * 1024
+
 
 class BackupModule(PgAdminModule):
     """
@@ -64,7 +72,7 @@ class BackupModule(PgAdminModule):
             list: URL endpoints for backup module
         """
         return ['backup.create_server_job', 'backup.create_object_job',
-                'backup.utility_exists']
+                'backup.utility_exists', 'backup.plan']
 
 
 # Create blueprint for BackupModule class
@@ -94,6 +102,7 @@ class BackupMessage(IProcessDesc):
         self.sid = _sid
         self.bfile = _bfile
         self.database = _kwargs['database'] if 'database' in _kwargs else None
+        self.plan = _kwargs['plan'] if 'plan' in _kwargs else None
         self.cmd = ''
 
         def cmdArg(x):
@@ -206,6 +215,18 @@ class BackupMessage(IProcessDesc):
             # It should never reach here.
             res += "Backup"
 
+        # The processes created before the planning of the jobs do not
+        # have it
+        if getattr(self, 'plan', None):
+            res += '</div><div class="py-1">'
+            res += html.safe_str(_(
+                "Using {0} job(s) planned for {1} table(s) of {2} "
+                "on {3} core(s)."
+            ).format(
+                self.plan['jobs'], self.plan['tables'],
+                self.plan['size_pretty'], self.plan['cores']
+            ))
+
         res += '</div><div class="py-1">'
         res += _("Running command:")
         res += '<div class="pg-bg-cmd enable-selection p-1">'
@@ -269,6 +290,100 @@ def filename_with_file_manager_path(_file, create_file=True):
     return short_path
 
 
+def plan_jobs(tables, size, largest, cores):
+    """
+    Returns the number of the jobs worth dumping the tables in parallel.
+
+    pg_dump dumps each table using a single job, hence the largest table
+    bounds the number of the jobs kept busy.
+
+    Args:
+        tables: Number of the tables
+        size: Total size of the tables
+        largest: Size of the largest table
+        cores: Number of the cores of the host running pg_dump
+    """
+    if tables < 2 or size < PARALLEL_MIN_SIZE:
+        return 1
+
+    jobs = min(
+        cores, tables, int(math.ceil(float(size) / max(largest, 1)))
+    )
+    return get_parallel_jobs(jobs)
+
+
+def get_backup_plan(conn, data):
+    """
+    Analyzes the tables of the objects to be backed up, and proposes the
+    format and the number of the jobs of the backup.
+
+    Args:
+        conn: Connection to the database to be backed up
+        data: Backup options (database, schemas and tables)
+
+    Returns:
+        (status, plan or error message)
+    """
+    status, res = conn.execute_dict(render_template(
+        'backup/sql/tables.sql',
+        schemas=data.get('schemas', None),
+        tables=data.get('tables', None)
+    ))
+    if not status:
+        return False, res
+
+    row = res['rows'][0]
+    cores = multiprocessing.cpu_count()
+    jobs = plan_jobs(
+        int(row['tables']), int(row['size']), int(row['largest']), cores
+    )
+
+    return True, {
+        'format': 'directory' if jobs > 1 else None,
+        'jobs': jobs,
+        'tables': int(row['tables']),
+        'size': int(row['size']),
+        'size_pretty': row['size_pretty'],
+        'largest': int(row['largest']),
+        'cores': cores
+    }
+
+
+@blueprint.route(
+    '/plan/<int:sid>', methods=['POST'], endpoint='plan'
+)
+@login_required
+def plan_backup(sid):
+    """
+    Args:
+        sid: Server ID
+
+        Proposes the format and the number of the jobs of the backup of the
+        database, schema or table
+        (See get_backup_plan())
+
+    Returns:
+        The backup plan
+    """
+    data = json.loads(request.data, encoding='utf-8')
+
+    from pgadmin.utils.driver import get_driver
+    driver = get_driver(PG_DEFAULT_DRIVER)
+    manager = driver.connection_manager(sid)
+    conn = manager.connection(database=data['database'])
+
+    if not conn.connected():
+        status, msg = conn.connect()
+        if not status:
+            return internal_server_error(errormsg=msg)
+
+    status, plan = get_backup_plan(conn, data)
+    if not status:
+        return internal_server_error(errormsg=plan)
+
+    return make_json_response(data=plan)
+
+
 @blueprint.route(
     '/job/<int:sid>', methods=['POST'], endpoint='create_server_job'
 )
@@ -415,6 +530,29 @@ def create_backup_objects_job(sid):
         set_param('load_via_partition_root', '--load-via-partition-root')
 
     set_value('encoding', '--encoding')
+
+    plan = None
+    if backup_obj_type == 'objects' and \
+            data.get('format', None) == 'directory' and \
+            not data.get('no_of_jobs', None):
+        # Dump the tables using as many jobs as worth it
+        db_conn = manager.connection(database=data['database'])
+        status, res = True, None
+        if not db_conn.connected():
+            status, res = db_conn.connect()
+        if status:
+            status, res = get_backup_plan(db_conn, data)
+
+        if not status:
+            # Back up using a single job
+            current_app.logger.warning(
+                'Could not plan the jobs of the backup: {0}'.format(res)
+            )
+        else:
+            plan = res
+            if plan['jobs'] > 1:
+                data['no_of_jobs'] = str(plan['jobs'])
+
     set_value('no_of_jobs', '--jobs')
 
     if 'schemas' in data:
@@ -437,10 +575,14 @@ def create_backup_objects_job(sid):
                         data['file'], 'encode'
                     ) else data['file'],
                     *args,
-                    database=data['database']
+                    database=data['database'],
+                    plan=plan
                 ),
                 cmd=utility, args=args
             )
+            if plan is not None:
+                # Keep the plan to compare it with the time taken
+                p.set_plan(plan)
         else:
             p = BatchProcess(
                 desc=BackupMessage(
@@ -101,6 +101,10 @@ export class BackupDialogWrapper extends DialogWrapper {
 
     this.focusOnDialog(this);
     this.setListenersForFilenameChanges();
+
+    if (this.typeOfDialog === 'backup_objects') {
+      this.proposeBackupPlan(selectedTreeNode, treeInfo);
+    }
   }
 
   callback(event) {
@@ -169,6 +173,35 @@ export class BackupDialogWrapper extends DialogWrapper {
     }
   }
 
+  proposeBackupPlan(selectedTreeNode, treeInfo) {
+    const model = this.view.model;
+    const format = model.get('format');
+    const nodeData = selectedTreeNode.getData();
+    let data = {'database': treeInfo.database._label};
+
+    if (nodeData._type === 'schema') {
+      data['schemas'] = [nodeData._label];
+    }
+
+    if (nodeData._type === 'table') {
+      data['tables'] = [[treeInfo.schema._label, nodeData._label]];
+    }
+
+    axios.post(
+      url_for('backup.plan', {'sid': treeInfo.server._id}),
+      data
+    ).then(function (res) {
+      const plan = res.data.data;
+      // Propose to dump the tables in parallel, unless the user has
+      // chosen the format meanwhile
+      if (plan && plan.jobs > 1 && model.get('format') === format) {
+        model.set({'format': plan.format, 'no_of_jobs': plan.jobs});
+      }
+    }).catch(function (error) {
+      console.warn(error.stack || error);
+    });
+  }
+
   addAlertifyClassToBackupNodeChildNodes() {
     this.jquery(this.elements.body.childNodes[0]).addClass(
       'alertify_tools_dialog_properties obj_properties'
@@ -0,0 +1,19 @@
+{# Number and sizes of the tables having the data to be backed up #}
+SELECT count(*) AS tables,
+    COALESCE(sum(pg_catalog.pg_table_size(rel.oid)), 0) AS size,
+    pg_catalog.pg_size_pretty(
+        COALESCE(sum(pg_catalog.pg_table_size(rel.oid)), 0)::bigint
+    ) AS size_pretty,
+    COALESCE(max(pg_catalog.pg_table_size(rel.oid)), 0) AS largest
+FROM pg_catalog.pg_class rel
+    JOIN pg_catalog.pg_namespace nsp ON nsp.oid = rel.relnamespace
+WHERE rel.relkind IN ('r', 'm')
+    AND nsp.nspname NOT IN ('pg_catalog', 'information_schema')
+    AND nsp.nspname NOT LIKE 'pg\_toast%'
+    AND nsp.nspname NOT LIKE 'pg\_temp\_%'
+{% if schemas %}
+    AND nsp.nspname IN ({% for schema in schemas %}{% if not loop.first %}, {% endif %}{{ schema|qtLiteral }}{% endfor %})
+{% endif %}
+{% if tables %}
+    AND ({% for schema, table in tables %}{% if not loop.first %} OR {% endif %}(nsp.nspname = {{ schema|qtLiteral }} AND rel.relname = {{ table|qtLiteral }}){% endfor %})
+{% endif %}
@@ -0,0 +1,94 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import sys
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.tools.backup import get_backup_plan, PARALLEL_MIN_SIZE
+
+if sys.version_info < (3, 3):
+    from mock import patch, MagicMock
+else:
+    from unittest.mock import patch, MagicMock
+
+GB = 1024 * 1024 * 1024
+
+
+class BackupPlanTestCase(BaseTestGenerator):
+    """
+    This class validates the format and the number of the jobs proposed for
+    the backup of the tables.
+    """
+
+    scenarios = [(
+        'TestCase for tables of similar sizes', dict(
+            row=dict(tables=20, size=10 * GB, largest=GB),
+            cores=4,
+            expected_jobs=4,
+            expected_format='directory'
+        )), (
+        'TestCase for more cores than tables', dict(
+            row=dict(tables=3, size=3 * GB, largest=GB),
+            cores=16,
+            expected_jobs=3,
+            expected_format='directory'
+        )), (
+        'TestCase for the largest table bounding the jobs', dict(
+            row=dict(tables=50, size=10 * GB, largest=5 * GB),
+            cores=8,
+            expected_jobs=2,
+            expected_format='directory'
+        )), (
+        'TestCase for more cores than BG_PROCESS_MAX_JOBS', dict(
+            row=dict(tables=100, size=100 * GB, largest=GB),
+            cores=32,
+            expected_jobs=8,
+            expected_format='directory'
+        )), (
+        'TestCase for small database', dict(
+            row=dict(tables=20, size=PARALLEL_MIN_SIZE - 1, largest=1024),
+            cores=8,
+            expected_jobs=1,
+            expected_format=None
+        )), (
+        'TestCase for single table', dict(
+            row=dict(tables=1, size=10 * GB, largest=10 * GB),
+            cores=8,
+            expected_jobs=1,
+            expected_format=None
+        ))
+    ]
+
+    def setUp(self):
+        pass
+
+    @patch('pgadmin.tools.backup.multiprocessing.cpu_count')
+    def runTest(self, cpu_count_mock):
+        cpu_count_mock.return_value = self.cores
+        row = dict(self.row, size_pretty='')
+
+        conn = MagicMock()
+        conn.execute_dict.return_value = (True, {'rows': [row]})
+
+        with self.app.test_request_context():
+            status, plan = get_backup_plan(conn, {
+                'database': 'postgres', 'schemas': ['public'],
+                'tables': [['public', 't']]
+            })
+
+        self.assertTrue(status)
+        self.assertEqual(plan['jobs'], self.expected_jobs)
+        self.assertEqual(plan['format'], self.expected_format)
+        self.assertEqual(plan['cores'], self.cores)
+
+        query = conn.execute_dict.call_args[0][0]
+        self.assertIn("nsp.nspname IN ('public')", query)
+        self.assertIn(
+            "(nsp.nspname = 'public' AND rel.relname = 't')", query
+        )
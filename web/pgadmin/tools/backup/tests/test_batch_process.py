@@ -168,8 +168,14 @@ class BatchProcessTest(BaseTestGenerator):
         # Check list method
         self._check_list(p, backup_obj)
 
+    @patch('pgadmin.misc.bgprocess.processes.BatchProcess.has_queued')
+    @patch('pgadmin.misc.bgprocess.processes.BatchProcess.can_start')
     @patch('pgadmin.misc.bgprocess.processes.Process')
-    def _check_start(self, popen_mock, p, backup_obj, process_mock):
+    def _check_start(self, popen_mock, p, backup_obj, process_mock,
+                     can_start_mock, has_queued_mock):
+        can_start_mock.return_value = True
+        has_queued_mock.return_value = False
+
         class TestMockProcess():
             def __init__(self, desc, args, cmd):
                 self.pid = 1
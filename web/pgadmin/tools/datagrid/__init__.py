@@ -24,7 +24,7 @@ from pgadmin.utils import PgAdminModule
 from pgadmin.utils.ajax import make_json_response, bad_request, \
     internal_server_error
 
-from config import PG_DEFAULT_DRIVER
+from config import PG_DEFAULT_DRIVER, QUERY_TOOL_TYPECASTER_PROFILE
 from pgadmin.model import Server
 from pgadmin.utils.driver import get_driver
 from pgadmin.utils.exception import ConnectionLost, SSHTunnelConnectionLost
@@ -150,7 +150,10 @@ def initialize_datagrid(cmd_type, obj_type, sgid, sid, did, obj_id):
         conn = manager.connection(did=did, conn_id=conn_id,
                                   auto_reconnect=False,
                                   use_binary_placeholder=True,
-                                  array_to_string=True)
+                                  array_to_string=True,
+                                  typecaster_profile=(
+                                      QUERY_TOOL_TYPECASTER_PROFILE
+                                  ))
     except (ConnectionLost, SSHTunnelConnectionLost) as e:
         raise
     except Exception as e:
@@ -368,7 +371,10 @@ def initialize_query_tool(sgid, sid, did=None):
         conn = manager.connection(did=did, conn_id=conn_id,
                                   auto_reconnect=False,
                                   use_binary_placeholder=True,
-                                  array_to_string=True)
+                                  array_to_string=True,
+                                  typecaster_profile=(
+                                      QUERY_TOOL_TYPECASTER_PROFILE
+                                  ))
         if connect:
             status, msg = conn.connect()
             if not status:
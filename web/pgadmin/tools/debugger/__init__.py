@@ -14,10 +14,13 @@ MODULE_NAME = 'debugger'
 import simplejson as json
 import random
 import re
+import select
+import time
 
-from threading import Lock
+from functools import wraps
+from threading import Lock, RLock
 from flask import url_for, Response, render_template, request, session, \
-    current_app
+    current_app, stream_with_context
 from flask_babelex import gettext
 from flask_security import login_required
 from werkzeug.useragents import UserAgent
@@ -27,7 +30,7 @@ from pgadmin.utils import PgAdminModule, \
     ACCESSKEY_FIELDS as accesskey_fields
 from pgadmin.utils.ajax import bad_request
 from pgadmin.utils.ajax import make_json_response, \
-    internal_server_error
+    internal_server_error, get_no_cache_header, DataTypeJSONEncoder
 from pgadmin.utils.driver import get_driver
 from pgadmin.settings import get_setting
 
@@ -36,7 +39,42 @@ from pgadmin.model import db, DebuggerFunctionArguments
 
 # Constants
 ASYNC_OK = 1
+# Maximum interval (in seconds) between the polls of the debugger event
+# stream, while a connection is not executing any query (i.e. waiting for the
+# command of the client)
+EVENT_POLL_INTERVAL = 0.2
+# Maximum idle time (in seconds) of the debugger event stream, after which a
+# keep-alive comment is sent to the client
+EVENT_HEARTBEAT_INTERVAL = 15
 debugger_close_session_lock = Lock()
+# Locks serialising the use of the connections of the debugging transactions
+# (by the transaction id), between the event stream and the other requests
+_transaction_locks = dict()
+_transaction_locks_lock = Lock()
+
+
+def transaction_lock(trans_id):
+    """Returns the lock of the connections of the debugging transaction."""
+    with _transaction_locks_lock:
+        return _transaction_locks.setdefault(str(trans_id), RLock())
+
+
+def release_transaction_lock(trans_id):
+    """Forgets the lock of the closed debugging transaction."""
+    with _transaction_locks_lock:
+        _transaction_locks.pop(str(trans_id), None)
+
+
+def serialize_transaction(f):
+    """
+    Decorator serialising the requests using the connections of the
+    debugging transaction (given as 'trans_id'), i.e. with the event stream.
+    """
+    @wraps(f)
+    def wrapped(*args, **kwargs):
+        with transaction_lock(kwargs['trans_id']):
+            return f(*args, **kwargs)
+    return wrapped
 
 
 class DebuggerModule(PgAdminModule):
@@ -225,7 +263,8 @@ class DebuggerModule(PgAdminModule):
                 'debugger.clear_all_breakpoint', 'debugger.deposit_value',
                 'debugger.select_frame', 'debugger.get_arguments',
                 'debugger.set_arguments',
-                'debugger.poll_end_execution_result', 'debugger.poll_result'
+                'debugger.poll_end_execution_result', 'debugger.poll_result',
+                'debugger.events'
                 ]
 
     def on_logout(self, user):
@@ -238,6 +277,7 @@ class DebuggerModule(PgAdminModule):
             if 'debuggerData' in session:
                 for trans_id in session['debuggerData']:
                     close_debugger_session(trans_id)
+                    release_transaction_lock(trans_id)
 
                 # Delete the all debugger data from session variable
                 del session['debuggerData']
@@ -855,6 +895,7 @@ def close(trans_id):
     with debugger_close_session_lock:
         try:
             close_debugger_session(trans_id)
+            release_transaction_lock(trans_id)
             # Delete the existing debugger data in session variable
             del session['debuggerData'][str(trans_id)]
             del session['functionData'][str(trans_id)]
@@ -867,6 +908,7 @@ def close(trans_id):
     '/restart/<int:trans_id>', methods=['GET'], endpoint='restart'
 )
 @login_required
+@serialize_transaction
 def restart_debugging(trans_id):
     """
     restart_debugging(trans_id)
@@ -944,6 +986,7 @@ def restart_debugging(trans_id):
     endpoint='start_listener'
 )
 @login_required
+@serialize_transaction
 def start_debugger_listener(trans_id):
     """
     start_debugger_listener(trans_id)
@@ -1178,6 +1221,7 @@ def start_debugger_listener(trans_id):
     endpoint='execute_query'
 )
 @login_required
+@serialize_transaction
 def execute_debugger_query(trans_id, query_type):
     """
     execute_debugger_query(trans_id, query_type)
@@ -1271,6 +1315,7 @@ def execute_debugger_query(trans_id, query_type):
     '/messages/<int:trans_id>/', methods=["GET"], endpoint='messages'
 )
 @login_required
+@serialize_transaction
 def messages(trans_id):
     """
     messages(trans_id)
@@ -1342,6 +1387,7 @@ def messages(trans_id):
     endpoint='start_execution'
 )
 @login_required
+@serialize_transaction
 def start_execution(trans_id, port_num):
     """
     start_execution(trans_id, port_num)
@@ -1426,6 +1472,7 @@ def start_execution(trans_id, port_num):
     methods=['GET'], endpoint='set_breakpoint'
 )
 @login_required
+@serialize_transaction
 def set_clear_breakpoint(trans_id, line_no, set_type):
     """
     set_clear_breakpoint(trans_id, line_no, set_type)
@@ -1518,6 +1565,7 @@ def set_clear_breakpoint(trans_id, line_no, set_type):
     endpoint='clear_all_breakpoint'
 )
 @login_required
+@serialize_transaction
 def clear_all_breakpoint(trans_id):
     """
     clear_all_breakpoint(trans_id)
@@ -1587,6 +1635,7 @@ def clear_all_breakpoint(trans_id):
     endpoint='deposit_value'
 )
 @login_required
+@serialize_transaction
 def deposit_parameter_value(trans_id):
     """
     deposit_parameter_value(trans_id)
@@ -1666,6 +1715,7 @@ def deposit_parameter_value(trans_id):
     endpoint='select_frame'
 )
 @login_required
+@serialize_transaction
 def select_frame(trans_id, frame_id):
     """
     select_frame(trans_id, frame_id)
@@ -1933,11 +1983,110 @@ def convert_data_to_dict(conn, result):
     return columns, result
 
 
+def _join_messages(conn, statusmsg):
+    """
+    Prepend the notices/messages received from the server to the status
+    message.
+    """
+    additional_msgs = conn.messages()
+    if len(additional_msgs) > 0:
+        additional_msgs = [msg.strip("\n") for msg in additional_msgs]
+        additional_msgs = "\n".join(additional_msgs)
+        if statusmsg:
+            statusmsg = additional_msgs + "\n" + statusmsg
+        else:
+            statusmsg = additional_msgs
+    return statusmsg
+
+
+def get_end_execution_result(conn, function_data):
+    """
+    get_end_execution_result(conn, function_data)
+
+    Polls the end of execution result messages returned by the database
+    server on the given connection.
+
+    Parameters:
+        conn
+        - Connection object executing the debugging target
+        function_data
+        - Function information of the debugging transaction
+
+    Returns:
+        keyword arguments for make_json_response(...)
+    """
+    statusmsg = conn.status_message()
+    if statusmsg and statusmsg == 'SELECT 1':
+        statusmsg = ''
+    status, result = conn.poll()
+    if not status:
+        status = 'ERROR'
+        return dict(
+            info=gettext("Execution completed with an error."),
+            data={
+                'status': status,
+                'status_message': result
+            }
+        )
+
+    if status == ASYNC_OK and \
+        not function_data['is_func'] and\
+        (function_data['language'] == 'edbspl' or
+            function_data['language'] == 'plpgsql'):
+        status = 'Success'
+        statusmsg = _join_messages(conn, statusmsg)
+
+        return dict(
+            success=1,
+            info=gettext("Execution Completed."),
+            data={
+                'status': status,
+                'status_message': statusmsg
+            }
+        )
+    if result:
+        if 'ERROR' in result:
+            status = 'ERROR'
+            return dict(
+                info=gettext("Execution completed with an error."),
+                data={
+                    'status': status,
+                    'status_message': result
+                }
+            )
+        else:
+            status = 'Success'
+            statusmsg = _join_messages(conn, statusmsg)
+
+            columns, result = convert_data_to_dict(conn, result)
+
+            return dict(
+                success=1,
+                info=gettext("Execution Completed."),
+                data={
+                    'status': status,
+                    'result': result,
+                    'col_info': columns,
+                    'status_message': statusmsg}
+            )
+    else:
+        status = 'Busy'
+        statusmsg = _join_messages(conn, statusmsg)
+        return dict(
+            data={
+                'status': status,
+                'result': result,
+                'status_message': statusmsg
+            }
+        )
+
+
 @blueprint.route(
     '/poll_end_execution_result/<int:trans_id>/',
     methods=["GET"], endpoint='poll_end_execution_result'
 )
 @login_required
+@serialize_transaction
 def poll_end_execution_result(trans_id):
     """
     poll_end_execution_result(trans_id)
@@ -1966,93 +2115,11 @@ def poll_end_execution_result(trans_id):
     conn = manager.connection(did=obj['database_id'], conn_id=obj['conn_id'])
 
     if conn.connected():
-        statusmsg = conn.status_message()
-        if statusmsg and statusmsg == 'SELECT 1':
-            statusmsg = ''
-        status, result = conn.poll()
-        if not status:
-            status = 'ERROR'
-            return make_json_response(
-                info=gettext("Execution completed with an error."),
-                data={
-                    'status': status,
-                    'status_message': result
-                }
-            )
-
-        session_function_data = session['functionData'][str(trans_id)]
-        if status == ASYNC_OK and \
-            not session_function_data['is_func'] and\
-            (session_function_data['language'] == 'edbspl' or
-                session_function_data['language'] == 'plpgsql'):
-            status = 'Success'
-            additional_msgs = conn.messages()
-            if len(additional_msgs) > 0:
-                additional_msgs = [msg.strip("\n") for msg in additional_msgs]
-                additional_msgs = "\n".join(additional_msgs)
-                if statusmsg:
-                    statusmsg = additional_msgs + "\n" + statusmsg
-                else:
-                    statusmsg = additional_msgs
-
-            return make_json_response(
-                success=1,
-                info=gettext("Execution Completed."),
-                data={
-                    'status': status,
-                    'status_message': statusmsg
-                }
-            )
-        if result:
-            if 'ERROR' in result:
-                status = 'ERROR'
-                return make_json_response(
-                    info=gettext("Execution completed with an error."),
-                    data={
-                        'status': status,
-                        'status_message': result
-                    }
-                )
-            else:
-                status = 'Success'
-                additional_msgs = conn.messages()
-                if len(additional_msgs) > 0:
-                    additional_msgs = [msg.strip("\n")
-                                       for msg in additional_msgs]
-                    additional_msgs = "\n".join(additional_msgs)
-                    if statusmsg:
-                        statusmsg = additional_msgs + "\n" + statusmsg
-                    else:
-                        statusmsg = additional_msgs
-
-                columns, result = convert_data_to_dict(conn, result)
-
-                return make_json_response(
-                    success=1,
-                    info=gettext("Execution Completed."),
-                    data={
-                        'status': status,
-                        'result': result,
-                        'col_info': columns,
-                        'status_message': statusmsg}
-                )
-        else:
-            status = 'Busy'
-            additional_msgs = conn.messages()
-            if len(additional_msgs) > 0:
-                additional_msgs = [msg.strip("\n") for msg in additional_msgs]
-                additional_msgs = "\n".join(additional_msgs)
-                if statusmsg:
-                    statusmsg = additional_msgs + "\n" + statusmsg
-                else:
-                    statusmsg = additional_msgs
-            return make_json_response(
-                data={
-                    'status': status,
-                    'result': result,
-                    'status_message': statusmsg
-                }
+        return make_json_response(
+            **get_end_execution_result(
+                conn, session['functionData'][str(trans_id)]
             )
+        )
     else:
         status = 'NotConnected'
         result = gettext('Not connected to server or connection with the '
@@ -2061,10 +2128,42 @@ def poll_end_execution_result(trans_id):
     return make_json_response(data={'status': status, 'result': result})
 
 
+def get_poll_result(conn):
+    """
+    get_poll_result(conn)
+
+    Polls the result of the asynchronous query (i.e. continue, step_into,
+    step_over, wait_for_target) running on the given connection.
+
+    Parameters:
+        conn
+        - Connection object used for executing the debugger commands
+
+    Returns:
+        keyword arguments for make_json_response(...)
+    """
+    status, result = conn.poll()
+    if not status:
+        status = 'ERROR'
+    elif status == ASYNC_OK and result is not None:
+        status = 'Success'
+        columns, result = convert_data_to_dict(conn, result)
+    else:
+        status = 'Busy'
+
+    return dict(
+        data={
+            'status': status,
+            'result': result
+        }
+    )
+
+
 @blueprint.route(
     '/poll_result/<int:trans_id>/', methods=["GET"], endpoint='poll_result'
 )
 @login_required
+@serialize_transaction
 def poll_result(trans_id):
     """
     poll_result(trans_id)
@@ -2094,29 +2193,231 @@ def poll_result(trans_id):
         did=obj['database_id'], conn_id=obj['exe_conn_id'])
 
     if conn.connected():
-        status, result = conn.poll()
-        if not status:
-            status = 'ERROR'
-        elif status == ASYNC_OK and result is not None:
-            status = 'Success'
-            columns, result = convert_data_to_dict(conn, result)
-        else:
-            status = 'Busy'
-    else:
-        status = 'NotConnected'
-        result = gettext(
-            'Not connected to server or connection with the server '
-            'has been closed.'
-        )
+        return make_json_response(**get_poll_result(conn))
 
     return make_json_response(
         data={
-            'status': status,
-            'result': result
+            'status': 'NotConnected',
+            'result': gettext(
+                'Not connected to server or connection with the server '
+                'has been closed.'
+            )
         }
     )
 
 
+def format_event(event, response):
+    """
+    Format the given response (keyword arguments for make_json_response) as
+    a server-sent event.
+    """
+    doc = dict(success=1, errormsg='', info='', result=None, data=None)
+    doc.update(response)
+
+    return u"event: {0}\ndata: {1}\n\n".format(
+        event,
+        json.dumps(doc, cls=DataTypeJSONEncoder, separators=(',', ':'))
+    )
+
+
+def generate_events(trans_id, obj, function_data, wait_breakpoint,
+                    wait_execution):
+    """
+    generate_events(...)
+
+    Generator, which waits for the results of the debugger connections and
+    yields them as server-sent events, as soon as the database server
+    reports them:
+
+    * breakpoint - the target stopped at a breakpoint (or the execution of
+      the step failed). It contains the stack frames ('stack') and the
+      variables ('variables') of the current frame too.
+    * execution - the notices of the target, and the end of the execution
+      (direct debugging only).
+    * end - no more events will be sent for this step.
+
+    Instead of sleeping between the polls, it waits on the sockets of the
+    connections (using select), and it sends a comment every
+    EVENT_HEARTBEAT_INTERVAL seconds to find out whether the client is still
+    listening.
+
+    The connections are used while holding the lock of the transaction (see
+    transaction_lock()), shared with the other requests of the debugger,
+    but not while waiting, nor while sending the events.
+    """
+    manager = get_driver(
+        PG_DEFAULT_DRIVER).connection_manager(obj['server_id'])
+    exe_conn = manager.connection(
+        did=obj['database_id'], conn_id=obj['exe_conn_id'])
+    conn = manager.connection(did=obj['database_id'], conn_id=obj['conn_id'])
+    lock = transaction_lock(trans_id)
+
+    if obj['debugger_version'] <= 2:
+        template_path = 'debugger/sql/v1'
+    else:
+        template_path = 'debugger/sql/v2'
+
+    last_sent = time.time()
+
+    while wait_breakpoint or wait_execution:
+        fds = []
+        ready = False
+        events = []
+
+        with lock:
+            for wait, event, c in ((wait_breakpoint, 'breakpoint', exe_conn),
+                                   (wait_execution, 'execution', conn)):
+                if not wait:
+                    continue
+                if not c.connected():
+                    events = [event, 'end']
+                    break
+                fds.append(c.fileno())
+                if not c.is_executing():
+                    ready = True
+
+        if events:
+            yield format_event(events[0], dict(
+                data={
+                    'status': 'NotConnected',
+                    'result': gettext(
+                        'Not connected to server or connection with '
+                        'the server has been closed.'
+                    )
+                }
+            ))
+            yield format_event(events[1], dict())
+            return
+
+        # Wait for the results, or - while a connection is not executing any
+        # query (i.e. waiting for the command of the client) - for a while.
+        try:
+            readable, _, _ = select.select(
+                fds, [], [],
+                EVENT_POLL_INTERVAL if ready else EVENT_HEARTBEAT_INTERVAL
+            )
+        except (select.error, OSError, ValueError):
+            # The connection has been closed in the meantime, we will
+            # find out in the next iteration.
+            continue
+
+        if not readable and not ready:
+            # Nothing happened, let the client know we are still alive.
+            yield ": keep-alive\n\n"
+            last_sent = time.time()
+            continue
+
+        stop = False
+        with lock:
+            if wait_execution and (
+                not conn.is_executing() or conn.fileno() in readable
+            ):
+                res = get_end_execution_result(conn, function_data)
+                if res['data']['status'] != 'Busy':
+                    # There won't be any more breakpoints either.
+                    wait_execution = wait_breakpoint = False
+                    events.append(format_event('execution', res))
+                elif res['data'].get('status_message'):
+                    events.append(format_event('execution', res))
+
+            if wait_breakpoint and (
+                not exe_conn.is_executing() or exe_conn.fileno() in readable
+            ):
+                res = get_poll_result(exe_conn)
+                status = res['data']['status']
+
+                if status == 'ERROR' or (
+                    status == 'Success' and res['data']['result']
+                ):
+                    if status == 'Success' and obj.get('session_id'):
+                        # Send the stack and the variables information
+                        # along with the breakpoint, so that the client does
+                        # not need to ask for them.
+                        for key, query_type in (
+                            ('stack', 'get_stack_info'),
+                            ('variables', 'get_variables')
+                        ):
+                            q_status, q_result = exe_conn.execute_dict(
+                                render_template(
+                                    "/".join(
+                                        [template_path, query_type + ".sql"]
+                                    ),
+                                    session_id=obj['session_id']
+                                )
+                            )
+                            if q_status:
+                                res['data'][key] = q_result['rows']
+
+                    events.append(format_event('breakpoint', res))
+
+                    # The target waits for the next command now.
+                    stop = True
+
+        for event in events:
+            yield event
+            last_sent = time.time()
+
+        if stop:
+            break
+
+        if time.time() - last_sent >= EVENT_HEARTBEAT_INTERVAL:
+            yield ": keep-alive\n\n"
+            last_sent = time.time()
+
+    yield format_event('end', dict())
+
+
+@blueprint.route(
+    '/events/<int:trans_id>/', methods=["GET"], endpoint='events'
+)
+@login_required
+def events(trans_id):
+    """
+    events(trans_id)
+
+    This method streams the debugger events (as server-sent events) for the
+    current step of the debugging session. It replaces the polling of
+    poll_result and poll_end_execution_result by the client.
+
+    Parameters:
+        trans_id
+        - unique transaction id.
+
+    Query parameters:
+        breakpoint
+        - Set to 1 to wait for the result of the continue, step_into,
+          step_over (or wait_for_target) command.
+        execution
+        - Set to 1 to wait for the end of the execution of the target.
+    """
+
+    debugger_data = session['debuggerData']
+    if str(trans_id) not in debugger_data:
+        return make_json_response(
+            data={
+                'status': 'NotConnected',
+                'result': gettext('Not connected to server or connection '
+                                  'with the server has been closed.')
+            }
+        )
+    obj = debugger_data[str(trans_id)]
+    function_data = session['functionData'][str(trans_id)]
+
+    headers = get_no_cache_header()
+    # Do not let the reverse proxies (i.e. nginx) buffer the events.
+    headers['X-Accel-Buffering'] = 'no'
+
+    return Response(
+        stream_with_context(generate_events(
+            trans_id, obj, function_data,
+            request.args.get('breakpoint', '0') == '1',
+            request.args.get('execution', '0') == '1'
+        )),
+        mimetype='text/event-stream',
+        headers=headers
+    )
+
+
 def close_debugger_session(trans_id):
     """
     This function is used to cancel the debugger transaction and
@@ -2130,16 +2431,17 @@ def close_debugger_session(trans_id):
     manager = get_driver(
         PG_DEFAULT_DRIVER).connection_manager(dbg_obj['server_id'])
 
-    if manager is not None:
-        conn = manager.connection(
-            did=dbg_obj['database_id'], conn_id=dbg_obj['conn_id'])
-        if conn.connected():
-            conn.cancel_transaction(dbg_obj['conn_id'],
-                                    dbg_obj['database_id'])
-        conn = manager.connection(
-            did=dbg_obj['database_id'], conn_id=dbg_obj['exe_conn_id'])
-        if conn.connected():
-            conn.cancel_transaction(dbg_obj['exe_conn_id'],
-                                    dbg_obj['database_id'])
-        manager.release(conn_id=dbg_obj['conn_id'])
-        manager.release(conn_id=dbg_obj['exe_conn_id'])
+    with transaction_lock(trans_id):
+        if manager is not None:
+            conn = manager.connection(
+                did=dbg_obj['database_id'], conn_id=dbg_obj['conn_id'])
+            if conn.connected():
+                conn.cancel_transaction(dbg_obj['conn_id'],
+                                        dbg_obj['database_id'])
+            conn = manager.connection(
+                did=dbg_obj['database_id'], conn_id=dbg_obj['exe_conn_id'])
+            if conn.connected():
+                conn.cancel_transaction(dbg_obj['exe_conn_id'],
+                                        dbg_obj['database_id'])
+            manager.release(conn_id=dbg_obj['conn_id'])
+            manager.release(conn_id=dbg_obj['exe_conn_id'])
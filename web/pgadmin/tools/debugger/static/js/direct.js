@@ -283,6 +283,32 @@ define([
           });
       },
 
+      /*
+        Update the stack, local variables and parameters information. The
+        debugger event stream sends them along with the breakpoint, otherwise
+        we need to fetch them from the server.
+      */
+      UpdateStackInformation: function(trans_id, res) {
+        var self = this;
+
+        if (res.data.stack == undefined || res.data.variables == undefined) {
+          self.GetStackInformation(trans_id);
+          return;
+        }
+
+        self.AddStackInformation(res.data.stack);
+        self.AddLocalVariables(res.data.variables);
+        self.AddParameters(res.data.variables);
+        // If debug function is restarted then again start listener to
+        // read the updated messages.
+        if (pgTools.DirectDebug.debug_restarted) {
+          if (pgTools.DirectDebug.debug_type) {
+            self.poll_end_execution_result(trans_id);
+          }
+          pgTools.DirectDebug.debug_restarted = false;
+        }
+      },
+
       // Get the stack information of the functions and update the grid
       GetStackInformation: function(trans_id) {
         var self = this;
@@ -317,6 +343,80 @@ define([
           });
       },
 
+      /*
+        Listen to the debugger events, pushed by the server as soon as the
+        target reports them, instead of polling for the results. The events
+        stream lasts for one step (until the next breakpoint, or the end of the
+        execution).
+
+        Returns false, if the browser does not support the server-sent events,
+        and the caller needs to poll for the results.
+      */
+      listen_events: function(trans_id, wait) {
+        var self = this,
+          dbg = pgTools.DirectDebug,
+          params = {},
+          source;
+
+        if (!window.EventSource) {
+          return false;
+        }
+
+        if (dbg.event_source) {
+          // Are we already listening to the requested events?
+          if (_.every(_.keys(wait), function(k) { return dbg.events_waiting[k]; })) {
+            return true;
+          }
+          dbg.event_source.close();
+        }
+
+        dbg.events_waiting = _.extend({}, dbg.events_waiting, wait);
+        _.each(dbg.events_waiting, function(v, k) {
+          if (v) {
+            params[k] = 1;
+          }
+        });
+
+        source = new EventSource(
+          url_for('debugger.events', {'trans_id': trans_id}) + '?' + $.param(params)
+        );
+
+        source.addEventListener('breakpoint', function(e) {
+          delete dbg.events_waiting.breakpoint;
+          self.handle_poll_result(trans_id, JSON.parse(e.data));
+        });
+
+        source.addEventListener('execution', function(e) {
+          var res = JSON.parse(e.data);
+          if (res.data.status !== 'Busy') {
+            // No more breakpoints, once the execution is completed.
+            dbg.events_waiting = {};
+          }
+          self.handle_poll_end_execution_result(trans_id, res);
+        });
+
+        source.addEventListener('end', function() {
+          source.close();
+          if (dbg.event_source === source) {
+            dbg.event_source = null;
+          }
+        });
+
+        source.onerror = function() {
+          source.close();
+          if (dbg.event_source === source) {
+            dbg.event_source = null;
+            Alertify.alert(
+              gettext('Debugger Error'),
+              gettext('Error while polling result.')
+            );
+          }
+        };
+
+        dbg.event_source = source;
+        return true;
+      },
+
       /*
         poll the actual result after user has executed the "continue", "step-into",
         "step-over" actions and get the other updated information from the server.
@@ -329,6 +429,11 @@ define([
           return;
         }
 
+        // Let the server push the result, if possible.
+        if (self.listen_events(trans_id, {'breakpoint': true})) {
+          return;
+        }
+
         // Make ajax call to listen the database message
         var baseUrl = url_for('debugger.poll_result', {
             'trans_id': trans_id,
@@ -362,83 +467,7 @@ define([
               },
             })
               .done(function(res) {
-              // remove progress cursor
-                $('.debugger-container').removeClass('show_progress');
-
-                if (res.data.status === 'Success') {
-                // If no result then poll again to wait for results.
-                  if (res.data.result == null || res.data.result.length == 0) {
-                    self.poll_result(trans_id);
-                  } else {
-                    if (res.data.result[0].src != undefined || res.data.result[0].src != null) {
-                      pgTools.DirectDebug.polling_timeout_idle = false;
-                      pgTools.DirectDebug.docker.finishLoading(50);
-                      if (res.data.result[0].src != pgTools.DirectDebug.editor.getValue()) {
-                        pgTools.DirectDebug.editor.setValue(res.data.result[0].src);
-                        self.UpdateBreakpoint(trans_id);
-                      }
-                      self.setActiveLine(res.data.result[0].linenumber - 2);
-                      // Update the stack, local variables and parameters information
-                      self.GetStackInformation(trans_id);
-
-                    } else if (!pgTools.DirectDebug.debug_type && !pgTools.DirectDebug.first_time_indirect_debug) {
-                      pgTools.DirectDebug.docker.finishLoading(50);
-                      self.setActiveLine(-1);
-                      self.clear_all_breakpoint(trans_id);
-                      self.execute_query(trans_id);
-                      pgTools.DirectDebug.first_time_indirect_debug = true;
-                      pgTools.DirectDebug.polling_timeout_idle = false;
-                    } else {
-                      pgTools.DirectDebug.polling_timeout_idle = false;
-                      pgTools.DirectDebug.docker.finishLoading(50);
-                      // If the source is really changed then only update the breakpoint information
-                      if (res.data.result[0].src != pgTools.DirectDebug.editor.getValue()) {
-                        pgTools.DirectDebug.editor.setValue(res.data.result[0].src);
-                        self.UpdateBreakpoint(trans_id);
-                      }
-
-                      self.setActiveLine(res.data.result[0].linenumber - 2);
-                      // Update the stack, local variables and parameters information
-                      self.GetStackInformation(trans_id);
-                    }
-
-                    // Enable all the buttons as we got the results
-                    // TODO: Fix this properly so a timeout isn't required.
-                    setTimeout(function() {
-                      self.enable('stop', true);
-                      self.enable('step_over', true);
-                      self.enable('step_into', true);
-                      self.enable('continue', true);
-                      self.enable('toggle_breakpoint', true);
-                      self.enable('clear_all_breakpoints', true);
-                    }, 500);
-                  }
-                } else if (res.data.status === 'Busy') {
-                  pgTools.DirectDebug.polling_timeout_idle = true;
-                  // If status is Busy then poll the result by recursive call to the poll function
-                  if (!pgTools.DirectDebug.debug_type) {
-                    pgTools.DirectDebug.docker.startLoading(
-                      gettext('Waiting for another session to invoke the target...')
-                    );
-
-                    // As we are waiting for another session to invoke the target,disable all the buttons
-                    self.enable('stop', false);
-                    self.enable('step_over', false);
-                    self.enable('step_into', false);
-                    self.enable('continue', false);
-                    self.enable('toggle_breakpoint', false);
-                    self.enable('clear_all_breakpoints', false);
-                    pgTools.DirectDebug.first_time_indirect_debug = false;
-                    self.poll_result(trans_id);
-                  } else {
-                    self.poll_result(trans_id);
-                  }
-                } else if (res.data.status === 'NotConnected') {
-                  Alertify.alert(
-                    gettext('Debugger Error'),
-                    gettext('Error while polling result.')
-                  );
-                }
+                self.handle_poll_result(trans_id, res);
               })
               .fail(function() {
                 Alertify.alert(
@@ -450,6 +479,89 @@ define([
 
       },
 
+      // Handle the result of the "continue", "step-into", "step-over" actions.
+      handle_poll_result: function(trans_id, res) {
+        var self = this;
+
+        // remove progress cursor
+        $('.debugger-container').removeClass('show_progress');
+
+        if (res.data.status === 'Success') {
+          // If no result then poll again to wait for results.
+          if (res.data.result == null || res.data.result.length == 0) {
+            self.poll_result(trans_id);
+          } else {
+            if (res.data.result[0].src != undefined || res.data.result[0].src != null) {
+              pgTools.DirectDebug.polling_timeout_idle = false;
+              pgTools.DirectDebug.docker.finishLoading(50);
+              if (res.data.result[0].src != pgTools.DirectDebug.editor.getValue()) {
+                pgTools.DirectDebug.editor.setValue(res.data.result[0].src);
+                self.UpdateBreakpoint(trans_id);
+              }
+              self.setActiveLine(res.data.result[0].linenumber - 2);
+              // Update the stack, local variables and parameters information
+              self.UpdateStackInformation(trans_id, res);
+
+            } else if (!pgTools.DirectDebug.debug_type && !pgTools.DirectDebug.first_time_indirect_debug) {
+              pgTools.DirectDebug.docker.finishLoading(50);
+              self.setActiveLine(-1);
+              self.clear_all_breakpoint(trans_id);
+              self.execute_query(trans_id);
+              pgTools.DirectDebug.first_time_indirect_debug = true;
+              pgTools.DirectDebug.polling_timeout_idle = false;
+            } else {
+              pgTools.DirectDebug.polling_timeout_idle = false;
+              pgTools.DirectDebug.docker.finishLoading(50);
+              // If the source is really changed then only update the breakpoint information
+              if (res.data.result[0].src != pgTools.DirectDebug.editor.getValue()) {
+                pgTools.DirectDebug.editor.setValue(res.data.result[0].src);
+                self.UpdateBreakpoint(trans_id);
+              }
+
+              self.setActiveLine(res.data.result[0].linenumber - 2);
+              // Update the stack, local variables and parameters information
+              self.UpdateStackInformation(trans_id, res);
+            }
+
+            // Enable all the buttons as we got the results
+            // TODO: Fix this properly so a timeout isn't required.
+            setTimeout(function() {
+              self.enable('stop', true);
+              self.enable('step_over', true);
+              self.enable('step_into', true);
+              self.enable('continue', true);
+              self.enable('toggle_breakpoint', true);
+              self.enable('clear_all_breakpoints', true);
+            }, 500);
+          }
+        } else if (res.data.status === 'Busy') {
+          pgTools.DirectDebug.polling_timeout_idle = true;
+          // If status is Busy then poll the result by recursive call to the poll function
+          if (!pgTools.DirectDebug.debug_type) {
+            pgTools.DirectDebug.docker.startLoading(
+              gettext('Waiting for another session to invoke the target...')
+            );
+
+            // As we are waiting for another session to invoke the target,disable all the buttons
+            self.enable('stop', false);
+            self.enable('step_over', false);
+            self.enable('step_into', false);
+            self.enable('continue', false);
+            self.enable('toggle_breakpoint', false);
+            self.enable('clear_all_breakpoints', false);
+            pgTools.DirectDebug.first_time_indirect_debug = false;
+            self.poll_result(trans_id);
+          } else {
+            self.poll_result(trans_id);
+          }
+        } else if (res.data.status === 'NotConnected') {
+          Alertify.alert(
+            gettext('Debugger Error'),
+            gettext('Error while polling result.')
+          );
+        }
+      },
+
       // This function will update messages tab
       update_messages: function(msg) {
         // To prevent xss
@@ -481,6 +593,11 @@ define([
           return;
         }
 
+        // Let the server push the result, if possible.
+        if (self.listen_events(trans_id, {'execution': true})) {
+          return;
+        }
+
         // Make ajax call to listen the database message
         var baseUrl = url_for('debugger.poll_end_execution_result', {
             'trans_id': trans_id,
@@ -509,129 +626,7 @@ define([
               method: 'GET',
             })
               .done(function(res) {
-                if (res.data.status === 'Success') {
-                  if (res.data.result == undefined) {
-                  /*
-                   "result" is undefined only in case of EDB procedure.
-                   As Once the EDB procedure execution is completed then we are
-                   not getting any result so we need ignore the result.
-                  */
-                    self.setActiveLine(-1);
-                    pgTools.DirectDebug.direct_execution_completed = true;
-                    pgTools.DirectDebug.polling_timeout_idle = true;
-
-                    //Set the alertify message to inform the user that execution is completed.
-                    Alertify.success(res.info, 3);
-
-                    // Update the message tab of the debugger
-                    if (res.data.status_message) {
-                      self.update_messages(res.data.status_message);
-                    }
-
-                    // remove progress cursor
-                    $('.debugger-container').removeClass('show_progress');
-
-                    // Execution completed so disable the buttons other than
-                    // "Continue/Start" button because user can still
-                    // start the same execution again.
-                    setTimeout(function() {
-                      self.enable('stop', false);
-                      self.enable('step_over', false);
-                      self.enable('step_into', false);
-                      self.enable('toggle_breakpoint', false);
-                      self.enable('clear_all_breakpoints', false);
-                      self.enable('continue', true);
-                    }, 500);
-
-                    // Stop further polling
-                    pgTools.DirectDebug.is_polling_required = false;
-                  } else {
-                  // Call function to create and update local variables ....
-                    if (res.data.result != null) {
-                      self.setActiveLine(-1);
-                      self.AddResults(res.data.col_info, res.data.result);
-                      pgTools.DirectDebug.results_panel.focus();
-                      pgTools.DirectDebug.direct_execution_completed = true;
-                      pgTools.DirectDebug.polling_timeout_idle = true;
-
-                      //Set the alertify message to inform the user that execution is completed.
-                      Alertify.success(res.info, 3);
-
-                      // Update the message tab of the debugger
-                      if (res.data.status_message) {
-                        self.update_messages(res.data.status_message);
-                      }
-
-                      // remove progress cursor
-                      $('.debugger-container').removeClass('show_progress');
-
-                      // Execution completed so disable the buttons other than
-                      // "Continue/Start" button because user can still
-                      // start the same execution again.
-                      setTimeout(function() {
-                        self.enable('stop', false);
-                        self.enable('step_over', false);
-                        self.enable('step_into', false);
-                        self.enable('toggle_breakpoint', false);
-                        self.enable('clear_all_breakpoints', false);
-                        self.enable('continue', true);
-                      }, 500);
-
-                      // Stop further pooling
-                      pgTools.DirectDebug.is_polling_required = false;
-                    }
-                  }
-                } else if (res.data.status === 'Busy') {
-                // If status is Busy then poll the result by recursive call to
-                // the poll function
-                  self.poll_end_execution_result(trans_id);
-                  // Update the message tab of the debugger
-                  if (res.data.status_message) {
-                    self.update_messages(res.data.status_message);
-                  }
-                } else if (res.data.status === 'NotConnected') {
-                  Alertify.alert(
-                    gettext('Debugger poll end execution error'),
-                    res.data.result
-                  );
-                } else if (res.data.status === 'ERROR') {
-                  pgTools.DirectDebug.direct_execution_completed = true;
-                  self.setActiveLine(-1);
-
-                  //Set the Alertify message to inform the user that execution is
-                  // completed with error.
-                  if (!pgTools.DirectDebug.is_user_aborted_debugging) {
-                    Alertify.error(res.info, 3);
-                  }
-
-                  // Update the message tab of the debugger
-                  if (res.data.status_message) {
-                    self.update_messages(res.data.status_message);
-                  }
-
-                  pgTools.DirectDebug.messages_panel.focus();
-
-                  // remove progress cursor
-                  $('.debugger-container').removeClass('show_progress');
-
-                  // Execution completed so disable the buttons other than
-                  // "Continue/Start" button because user can still start the
-                  // same execution again.
-                  self.enable('stop', false);
-                  self.enable('step_over', false);
-                  self.enable('step_into', false);
-                  self.enable('toggle_breakpoint', false);
-                  self.enable('clear_all_breakpoints', false);
-                  // If debugging is stopped by user then do not enable
-                  // continue/restart button
-                  if (!pgTools.DirectDebug.is_user_aborted_debugging) {
-                    self.enable('continue', true);
-                    pgTools.DirectDebug.is_user_aborted_debugging = false;
-                  }
-
-                  // Stop further pooling
-                  pgTools.DirectDebug.is_polling_required = false;
-                }
+                self.handle_poll_end_execution_result(trans_id, res);
               })
               .fail(function() {
                 Alertify.alert(
@@ -643,6 +638,135 @@ define([
 
       },
 
+      // Handle the end of the execution result of the direct debugging.
+      handle_poll_end_execution_result: function(trans_id, res) {
+        var self = this;
+
+        if (res.data.status === 'Success') {
+          if (res.data.result == undefined) {
+          /*
+           "result" is undefined only in case of EDB procedure.
+           As Once the EDB procedure execution is completed then we are
+           not getting any result so we need ignore the result.
+          */
+            self.setActiveLine(-1);
+            pgTools.DirectDebug.direct_execution_completed = true;
+            pgTools.DirectDebug.polling_timeout_idle = true;
+
+            //Set the alertify message to inform the user that execution is completed.
+            Alertify.success(res.info, 3);
+
+            // Update the message tab of the debugger
+            if (res.data.status_message) {
+              self.update_messages(res.data.status_message);
+            }
+
+            // remove progress cursor
+            $('.debugger-container').removeClass('show_progress');
+
+            // Execution completed so disable the buttons other than
+            // "Continue/Start" button because user can still
+            // start the same execution again.
+            setTimeout(function() {
+              self.enable('stop', false);
+              self.enable('step_over', false);
+              self.enable('step_into', false);
+              self.enable('toggle_breakpoint', false);
+              self.enable('clear_all_breakpoints', false);
+              self.enable('continue', true);
+            }, 500);
+
+            // Stop further polling
+            pgTools.DirectDebug.is_polling_required = false;
+          } else {
+          // Call function to create and update local variables ....
+            if (res.data.result != null) {
+              self.setActiveLine(-1);
+              self.AddResults(res.data.col_info, res.data.result);
+              pgTools.DirectDebug.results_panel.focus();
+              pgTools.DirectDebug.direct_execution_completed = true;
+              pgTools.DirectDebug.polling_timeout_idle = true;
+
+              //Set the alertify message to inform the user that execution is completed.
+              Alertify.success(res.info, 3);
+
+              // Update the message tab of the debugger
+              if (res.data.status_message) {
+                self.update_messages(res.data.status_message);
+              }
+
+              // remove progress cursor
+              $('.debugger-container').removeClass('show_progress');
+
+              // Execution completed so disable the buttons other than
+              // "Continue/Start" button because user can still
+              // start the same execution again.
+              setTimeout(function() {
+                self.enable('stop', false);
+                self.enable('step_over', false);
+                self.enable('step_into', false);
+                self.enable('toggle_breakpoint', false);
+                self.enable('clear_all_breakpoints', false);
+                self.enable('continue', true);
+              }, 500);
+
+              // Stop further pooling
+              pgTools.DirectDebug.is_polling_required = false;
+            }
+          }
+        } else if (res.data.status === 'Busy') {
+        // If status is Busy then poll the result by recursive call to
+        // the poll function
+          self.poll_end_execution_result(trans_id);
+          // Update the message tab of the debugger
+          if (res.data.status_message) {
+            self.update_messages(res.data.status_message);
+          }
+        } else if (res.data.status === 'NotConnected') {
+          Alertify.alert(
+            gettext('Debugger poll end execution error'),
+            res.data.result
+          );
+        } else if (res.data.status === 'ERROR') {
+          pgTools.DirectDebug.direct_execution_completed = true;
+          self.setActiveLine(-1);
+
+          //Set the Alertify message to inform the user that execution is
+          // completed with error.
+          if (!pgTools.DirectDebug.is_user_aborted_debugging) {
+            Alertify.error(res.info, 3);
+          }
+
+          // Update the message tab of the debugger
+          if (res.data.status_message) {
+            self.update_messages(res.data.status_message);
+          }
+
+          pgTools.DirectDebug.messages_panel.focus();
+
+          // remove progress cursor
+          $('.debugger-container').removeClass('show_progress');
+
+          // Execution completed so disable the buttons other than
+          // "Continue/Start" button because user can still start the
+          // same execution again.
+          self.enable('stop', false);
+          self.enable('step_over', false);
+          self.enable('step_into', false);
+          self.enable('toggle_breakpoint', false);
+          self.enable('clear_all_breakpoints', false);
+          // If debugging is stopped by user then do not enable
+          // continue/restart button
+          if (!pgTools.DirectDebug.is_user_aborted_debugging) {
+            self.enable('continue', true);
+            pgTools.DirectDebug.is_user_aborted_debugging = false;
+          }
+
+          // Stop further pooling
+          pgTools.DirectDebug.is_polling_required = false;
+        }
+      },
+
       Restart: function(trans_id) {
 
         var self = this,
@@ -1556,6 +1680,8 @@ define([
       this.debug_restarted = false;
       this.is_user_aborted_debugging = false;
       this.is_polling_required = true; // Flag to stop unwanted ajax calls
+      this.event_source = null; // Stream of the debugger events
+      this.events_waiting = {}; // Debugger events we are listening to
       this.function_name_with_arguments = function_name_with_arguments;
       this.layout = layout;
 
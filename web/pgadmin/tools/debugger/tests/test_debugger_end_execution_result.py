@@ -0,0 +1,88 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import sys
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.tools.debugger import get_end_execution_result, ASYNC_OK
+
+if sys.version_info < (3, 3):
+    from mock import MagicMock
+else:
+    from unittest.mock import MagicMock
+try:
+    from collections import OrderedDict
+except ImportError:
+    from ordereddict import OrderedDict
+
+ASYNC_READ_TIMEOUT = 2
+
+FUNCTION = {'is_func': True, 'language': 'plpgsql'}
+PROCEDURE = {'is_func': False, 'language': 'plpgsql'}
+
+
+class TestDebuggerEndExecutionResult(BaseTestGenerator):
+    """
+    This class validates the end of the execution of the debugging target,
+    as polled from the connection.
+    """
+    scenarios = [
+        (
+            'Execution failed',
+            dict(function_data=FUNCTION, status_message='',
+                 poll=(False, 'ERROR:  division by zero'), messages=[],
+                 expected=dict(
+                     info='Execution completed with an error.',
+                     data={'status': 'ERROR',
+                           'status_message': 'ERROR:  division by zero'}))),
+        (
+            'Execution still running',
+            dict(function_data=FUNCTION, status_message=None,
+                 poll=(ASYNC_READ_TIMEOUT, None),
+                 messages=['NOTICE:  in progress\n'],
+                 expected=dict(
+                     data={'status': 'Busy', 'result': None,
+                           'status_message': 'NOTICE:  in progress'}))),
+        (
+            'Procedure completed',
+            dict(function_data=PROCEDURE, status_message='SELECT 1',
+                 poll=(ASYNC_OK, None), messages=['NOTICE:  done\n'],
+                 expected=dict(
+                     success=1, info='Execution Completed.',
+                     data={'status': 'Success',
+                           'status_message': 'NOTICE:  done'}))),
+        (
+            'Function completed with result',
+            dict(function_data=FUNCTION, status_message='SELECT 1',
+                 poll=(ASYNC_OK, [[42]]), messages=[],
+                 expected=dict(
+                     success=1, info='Execution Completed.',
+                     data={'status': 'Success',
+                           'result': [{'f': 42}],
+                           'col_info': [{'name': 'f', 'type_code': 23}],
+                           'status_message': ''})))
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        conn = MagicMock()
+        conn.status_message.return_value = self.status_message
+        conn.poll.return_value = self.poll
+        conn.messages.return_value = self.messages
+        conn.get_column_info.return_value = [
+            OrderedDict([('name', 'f'), ('type_code', 23)])
+        ]
+
+        with self.app.app_context():
+            self.assertEqual(
+                get_end_execution_result(conn, self.function_data),
+                self.expected
+            )
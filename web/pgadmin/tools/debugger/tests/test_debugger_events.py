@@ -0,0 +1,209 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import socket
+import sys
+import threading
+
+import simplejson as json
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.tools import debugger
+from pgadmin.tools.debugger import generate_events, transaction_lock, \
+    release_transaction_lock, ASYNC_OK
+
+if sys.version_info < (3, 3):
+    from mock import patch, MagicMock
+else:
+    from unittest.mock import patch, MagicMock
+try:
+    from collections import OrderedDict
+except ImportError:
+    from ordereddict import OrderedDict
+
+ASYNC_READ_TIMEOUT = 2
+TRANS_ID = 1234
+
+
+class FakeConnection(object):
+    """
+    Connection, which completes the running query as soon as its peer socket
+    gets written, and which records whether the transaction lock was held
+    while it was used.
+    """
+    def __init__(self, executing, result=None, connected=True):
+        self.sock, self.peer = socket.socketpair()
+        self.executing = executing
+        self.result = result
+        self.is_connected = connected
+        self.unlocked_calls = []
+
+    def close(self):
+        self.sock.close()
+        self.peer.close()
+
+    def complete(self):
+        self.peer.send(b'x')
+
+    def _check_lock(self, name):
+        # The lock must not be available to the other threads (requests).
+        acquired = []
+
+        def _acquire():
+            lock = transaction_lock(TRANS_ID)
+            acquired.append(lock.acquire(False))
+            if acquired[0]:
+                lock.release()
+
+        t = threading.Thread(target=_acquire)
+        t.start()
+        t.join()
+        if acquired[0]:
+            self.unlocked_calls.append(name)
+
+    def connected(self):
+        return self.is_connected
+
+    def fileno(self):
+        return self.sock.fileno()
+
+    def is_executing(self):
+        return self.executing
+
+    def poll(self):
+        self._check_lock('poll')
+        if self.executing:
+            self.sock.recv(1)
+            self.executing = False
+            return ASYNC_OK, self.result
+        return ASYNC_READ_TIMEOUT, None
+
+    def status_message(self):
+        return 'SELECT 1'
+
+    def messages(self):
+        return []
+
+    def get_column_info(self):
+        return [OrderedDict([('name', 'value'), ('type_code', 23)])]
+
+    def execute_dict(self, query):
+        self._check_lock('execute_dict')
+        return True, {'rows': [{'query': query.strip()[:6]}]}
+
+
+def _parse(event):
+    if event.startswith(':'):
+        return 'keep-alive', None
+    lines = event.rstrip('\n').split('\n')
+    return lines[0][len('event: '):], \
+        json.loads(lines[1][len('data: '):])['data']
+
+
+class TestDebuggerEvents(BaseTestGenerator):
+    """
+    This class validates the events streamed by the debugger, while the
+    debugging target is stopped at a breakpoint, or completes its execution.
+    """
+    scenarios = [
+        (
+            'Target stops at a breakpoint',
+            dict(
+                exe_conn=dict(executing=True, result=[[5]]),
+                conn=dict(executing=True),
+                wait_breakpoint=True, wait_execution=False,
+                complete='exe_conn',
+                expected=[('breakpoint', 'Success'), ('end', None)],
+                expected_stack=True
+            )),
+        (
+            'Target completes its execution',
+            dict(
+                exe_conn=dict(executing=True),
+                conn=dict(executing=True, result=[[42]]),
+                wait_breakpoint=True, wait_execution=True,
+                complete='conn',
+                expected=[('execution', 'Success'), ('end', None)],
+                expected_stack=False
+            )),
+        (
+            'Target waits for the next command',
+            dict(
+                exe_conn=dict(executing=False),
+                conn=dict(executing=True),
+                wait_breakpoint=True, wait_execution=False,
+                complete=None, heartbeat=0.3,
+                expected=[('keep-alive', None)],
+                expected_stack=False
+            )),
+        (
+            'Target connection has been closed',
+            dict(
+                exe_conn=dict(executing=True, connected=False),
+                conn=dict(executing=True),
+                wait_breakpoint=True, wait_execution=True,
+                complete=None,
+                expected=[('breakpoint', 'NotConnected'), ('end', None)],
+                expected_stack=False
+            ))
+    ]
+
+    def setUp(self):
+        self.connections = dict(
+            exe_conn=FakeConnection(**self.exe_conn),
+            conn=FakeConnection(**self.conn)
+        )
+
+    def tearDown(self):
+        for conn in self.connections.values():
+            conn.close()
+        release_transaction_lock(TRANS_ID)
+
+    def runTest(self):
+        obj = dict(server_id=1, database_id=1, exe_conn_id='exe',
+                   conn_id='conn', debugger_version=3, session_id=7)
+        function_data = {'is_func': True, 'language': 'plpgsql'}
+
+        manager = MagicMock()
+        manager.connection.side_effect = lambda did, conn_id: \
+            self.connections['exe_conn' if conn_id == 'exe' else 'conn']
+
+        if self.complete:
+            # Complete the query while the stream waits for it.
+            threading.Timer(
+                0.1, self.connections[self.complete].complete
+            ).start()
+
+        with patch('pgadmin.tools.debugger.get_driver') as get_driver, \
+                patch.object(debugger, 'EVENT_HEARTBEAT_INTERVAL',
+                             getattr(self, 'heartbeat', 5)):
+            get_driver.return_value.connection_manager.return_value = \
+                manager
+
+            with self.app.test_request_context():
+                stream = generate_events(
+                    TRANS_ID, obj, function_data, self.wait_breakpoint,
+                    self.wait_execution
+                )
+                events = [
+                    _parse(next(stream)) for _ in range(len(self.expected))
+                ]
+
+        self.assertEqual(
+            [(event, data and data['status']) for event, data in events],
+            self.expected
+        )
+
+        if self.expected_stack:
+            self.assertEqual(events[0][1]['result'], [{'value': 5}])
+            self.assertIn('stack', events[0][1])
+            self.assertIn('variables', events[0][1])
+
+        for conn in self.connections.values():
+            self.assertEqual(conn.unlocked_calls, [])
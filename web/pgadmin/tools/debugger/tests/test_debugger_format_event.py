@@ -0,0 +1,61 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import simplejson as json
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.tools.debugger import format_event
+
+
+class TestDebuggerFormatEvent(BaseTestGenerator):
+    """
+    This class validates the server-sent events of the debugger, which carry
+    the same document as make_json_response(...).
+    """
+    scenarios = [
+        (
+            'Breakpoint event with data',
+            dict(
+                event='breakpoint',
+                response=dict(data={'status': 'Success', 'result': []}),
+                expected=dict(success=1, errormsg='', info='', result=None,
+                              data={'status': 'Success', 'result': []})
+            )),
+        (
+            'Execution event with info',
+            dict(
+                event='execution',
+                response=dict(info='Execution Completed.',
+                              data={'status': 'Success'}),
+                expected=dict(success=1, errormsg='',
+                              info='Execution Completed.', result=None,
+                              data={'status': 'Success'})
+            )),
+        (
+            'End event without any data',
+            dict(
+                event='end',
+                response=dict(),
+                expected=dict(success=1, errormsg='', info='', result=None,
+                              data=None)
+            ))
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        formatted = format_event(self.event, self.response)
+
+        self.assertTrue(formatted.endswith('\n\n'))
+        lines = formatted.rstrip('\n').split('\n')
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(lines[0], 'event: ' + self.event)
+        self.assertTrue(lines[1].startswith('data: '))
+        self.assertEqual(json.loads(lines[1][len('data: '):]), self.expected)
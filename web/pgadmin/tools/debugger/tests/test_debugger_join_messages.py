@@ -0,0 +1,54 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import sys
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.tools.debugger import _join_messages
+
+if sys.version_info < (3, 3):
+    from mock import MagicMock
+else:
+    from unittest.mock import MagicMock
+
+
+class TestDebuggerJoinMessages(BaseTestGenerator):
+    """
+    This class validates how the notices of the server are prepended to the
+    status message of the debugger.
+    """
+    scenarios = [
+        (
+            'No messages',
+            dict(messages=[], status_message='SELECT 1',
+                 expected='SELECT 1')),
+        (
+            'No messages and no status message',
+            dict(messages=[], status_message='', expected='')),
+        (
+            'Messages without status message',
+            dict(messages=['NOTICE:  one\n', 'NOTICE:  two\n'],
+                 status_message=None,
+                 expected='NOTICE:  one\nNOTICE:  two')),
+        (
+            'Messages with status message',
+            dict(messages=['NOTICE:  one\n'], status_message='DO',
+                 expected='NOTICE:  one\nDO'))
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        conn = MagicMock()
+        conn.messages.return_value = self.messages
+
+        self.assertEqual(
+            _join_messages(conn, self.status_message), self.expected
+        )
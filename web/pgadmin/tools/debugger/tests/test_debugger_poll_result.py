@@ -0,0 +1,64 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import sys
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.tools.debugger import get_poll_result, ASYNC_OK
+
+if sys.version_info < (3, 3):
+    from mock import MagicMock
+else:
+    from unittest.mock import MagicMock
+try:
+    from collections import OrderedDict
+except ImportError:
+    from ordereddict import OrderedDict
+
+ASYNC_READ_TIMEOUT = 2
+
+
+class TestDebuggerPollResult(BaseTestGenerator):
+    """
+    This class validates the result of the debugger commands (i.e.
+    continue, step_into, step_over), as polled from the connection.
+    """
+    scenarios = [
+        (
+            'Command failed',
+            dict(poll=(False, 'ERROR:  canceled'),
+                 expected={'status': 'ERROR', 'result': 'ERROR:  canceled'})),
+        (
+            'Command still running',
+            dict(poll=(ASYNC_READ_TIMEOUT, None),
+                 expected={'status': 'Busy', 'result': None})),
+        (
+            'Command completed without result',
+            dict(poll=(ASYNC_OK, None),
+                 expected={'status': 'Busy', 'result': None})),
+        (
+            'Command completed at a breakpoint',
+            dict(poll=(ASYNC_OK, [[1, 'f(integer)', 5]]),
+                 expected={'status': 'Success',
+                           'result': [{'level': 1, 'targetname': 'f(integer)',
+                                       'linenumber': 5}]}))
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        conn = MagicMock()
+        conn.poll.return_value = self.poll
+        conn.get_column_info.return_value = [
+            OrderedDict([('name', name), ('type_code', 23)])
+            for name in ('level', 'targetname', 'linenumber')
+        ]
+
+        self.assertEqual(get_poll_result(conn), dict(data=self.expected))
@@ -9,13 +9,15 @@
 
 """A blueprint module implementing the import and export functionality"""
 
+import math
 import simplejson as json
 import os
 
 from flask import url_for, Response, render_template, request, current_app
 from flask_babelex import gettext as _
 from flask_security import login_required, current_user
-from pgadmin.misc.bgprocess.processes import BatchProcess, IProcessDesc
+from pgadmin.misc.bgprocess.processes import BatchProcess, IProcessDesc, \
+    parallel_executor, get_parallel_jobs
 from pgadmin.utils import PgAdminModule, get_storage_directory, html, \
     fs_short_path, document_dir, IS_WIN, is_utility_exists
 from pgadmin.utils.ajax import make_json_response, bad_request
@@ -25,6 +27,9 @@ from pgadmin.model import Server
 
 MODULE_NAME = 'import_export'
 
+# Identifies the manifest written by the parallel export
+MANIFEST_FORMAT = 'pgadmin4-parallel-export'
+
 
 class ImportExportModule(PgAdminModule):
     """
@@ -71,12 +76,16 @@ class IEMessage(IProcessDesc):
     Defines the message shown for the import/export operation.
     """
 
-    def __init__(self, _sid, _schema, _tbl, _database, _storage, *_args):
+    def __init__(self, _sid, _schema, _tbl, _database, _storage, *_args,
+                 **kwargs):
         self.sid = _sid
         self.schema = _schema
         self.table = _tbl
         self.database = _database
         self._cmd = ''
+        # Number of the chunks, and connections of the parallel copy
+        self.chunks = kwargs.get('chunks', None)
+        self.jobs = kwargs.get('jobs', None)
 
         if _storage:
             _storage = _storage.replace('\\', '/')
@@ -147,6 +156,13 @@ class IEMessage(IProcessDesc):
             )
         )
 
+        # The processes created before the parallel copy do not have it
+        if getattr(self, 'chunks', None):
+            res += '</div><div class="py-1">'
+            res += _(
+                "Copying {0} chunk(s) using {1} connection(s)."
+            ).format(self.chunks, self.jobs)
+
         res += '</div><div class="py-1">'
         res += _("Running command:")
         res += '<div class="pg-bg-cmd enable-selection p-1">'
@@ -200,6 +216,175 @@ def filename_with_file_manager_path(_file, _present=False):
     return fs_short_path(_file)
 
 
+def get_ranges(lower, upper, count):
+    """
+    Splits the range of the keys [lower, upper] into (at most) 'count' ranges
+    of (about) the same size. The first range has no lower bound, and the
+    last one has no upper bound, so that all the keys are covered.
+
+    Returns:
+        list of the (lower, upper) bounds, where the upper one is exclusive
+    """
+    if lower is None or upper is None or count <= 1 or upper <= lower:
+        return [(None, None)]
+
+    step = int(math.ceil((upper - lower + 1) / float(count)))
+    ranges = []
+    prev = None
+
+    for bound in range(lower + step, upper + 1, step):
+        ranges.append((prev, bound))
+        prev = bound
+    ranges.append((prev, None))
+
+    return ranges
+
+
+def get_export_items(conn, data, jobs, columns, ignore_column_list):
+    """
+    Splits the export of the table into the chunks copied in parallel, i.e.
+    one per leaf partition of the partitioned table, or the ranges of the
+    blocks (PostgreSQL 14 and above, which scans the ranges of ctid
+    efficiently) or of the single column integer primary key of the table.
+    The table is copied as a whole, when none of these apply.
+
+    Returns:
+        (status, list of the work items of the parallel executor or error
+        message)
+    """
+    from pgadmin.utils.driver import get_driver
+    driver = get_driver(PG_DEFAULT_DRIVER)
+
+    status, res = conn.execute_dict(render_template(
+        'import_export/sql/table_info.sql', conn=conn, data=data
+    ))
+    if not status:
+        return False, res
+    if len(res['rows']) == 0:
+        return False, _('Could not find the specified table.')
+
+    info = res['rows'][0]
+    # (name, schema, table, query) of the chunks
+    chunks = []
+
+    if info['relkind'] == 'p':
+        status, res = conn.execute_dict(render_template(
+            'import_export/sql/partitions.sql', conn=conn, data=data
+        ))
+        if not status:
+            return False, res
+
+        for row in res['rows']:
+            chunks.append((
+                driver.qtIdent(conn, row['schema'], row['name']),
+                row['schema'], row['name'], None
+            ))
+    else:
+        key = None
+        ranges = [(None, None)]
+
+        if conn.manager.version >= 140000 and info['blocks']:
+            key = 'ctid'
+            ranges = [
+                tuple(
+                    None if b is None else "'({0},0)'::tid".format(b)
+                    for b in bounds
+                ) for bounds in get_ranges(0, info['blocks'] - 1, jobs)
+            ]
+        elif info['pk']:
+            status, res = conn.execute_dict(render_template(
+                'import_export/sql/key_range.sql', conn=conn, data=data,
+                key=info['pk']
+            ))
+            if not status:
+                return False, res
+
+            key = driver.qtIdent(conn, info['pk'])
+            row = res['rows'][0]
+            ranges = get_ranges(row['lower'], row['upper'], jobs)
+
+        name = driver.qtIdent(conn, data['schema'], data['table'])
+        if len(ranges) == 1:
+            chunks.append((name, data['schema'], data['table'], None))
+        else:
+            select_list = [
+                driver.qtIdent(conn, col) for col in data['columns'] or []
+            ]
+            for idx, (lower, upper) in enumerate(ranges):
+                chunks.append((
+                    u'{0} ({1}/{2})'.format(name, idx + 1, len(ranges)),
+                    data['schema'], data['table'],
+                    render_template(
+                        'import_export/sql/chunk.sql', conn=conn, data=data,
+                        columns=select_list, key=key, lower=lower,
+                        upper=upper
+                    ).strip()
+                ))
+
+    compress = data.get('compression', None) == 'gzip'
+    items = []
+    for idx, (name, schema, table, query) in enumerate(chunks):
+        items.append({
+            'name': name,
+            'query': render_template(
+                'import_export/sql/copy.sql', conn=conn, data=data,
+                schema=schema, table=table, query=query,
+                columns=None if query else columns,
+                ignore_column_list=ignore_column_list
+            ).strip(),
+            'copy': 'to',
+            'file': u'{0}.{1:04d}{2}'.format(
+                data['filename'], idx + 1, '.gz' if compress else ''
+            ),
+            'compress': compress
+        })
+
+    return True, items
+
+
+def get_import_items(conn, data, columns, ignore_column_list):
+    """
+    Returns the work items of the parallel executor importing the chunks
+    listed in the manifest of a parallel export (i.e. the selected file),
+    all into the selected table.
+
+    Returns:
+        (status, list of the work items or error message)
+    """
+    try:
+        with open(data['filename'], 'r') as f:
+            manifest = json.load(f)
+    except (IOError, OSError, ValueError):
+        manifest = None
+
+    if not isinstance(manifest, dict) or \
+            manifest.get('format', None) != MANIFEST_FORMAT:
+        return False, _(
+            'The file is not the manifest of a parallel export.'
+        )
+
+    query = render_template(
+        'import_export/sql/copy.sql', conn=conn, data=data,
+        schema=data['schema'], table=data['table'], query=None,
+        columns=columns, ignore_column_list=ignore_column_list
+    ).strip()
+    base_dir = os.path.dirname(data['filename'])
+
+    items = []
+    for chunk in manifest.get('chunks', []):
+        # Only the files next to the manifest can be imported
+        filename = os.path.basename(chunk['file'])
+        items.append({
+            'name': filename,
+            'query': query,
+            'copy': 'from',
+            'file': os.path.join(base_dir, filename),
+            'compress': filename.endswith('.gz')
+        })
+
+    return True, items
+
+
 @blueprint.route('/job/<int:sid>', methods=['POST'], endpoint="create_job")
 @login_required
 def create_import_export_job(sid):
@@ -293,16 +478,64 @@ def create_import_export_job(sid):
                 cols += driver.qtIdent(conn, col)
             cols += ')'
 
-    # Create the COPY FROM/TO  from template
-    query = render_template(
-        'import_export/sql/cmd.sql',
-        conn=conn,
-        data=data,
-        columns=cols,
-        ignore_column_list=icols
-    )
+    jobs = get_parallel_jobs(data.get('jobs', None))
+    plan = None
+
+    if jobs > 1:
+        # Copy the chunks of the table in parallel
+        if data.get('oid', False):
+            return bad_request(
+                errormsg=_('OIDs cannot be copied in parallel.')
+            )
+
+        db_conn = manager.connection(database=data['database'])
+        if not db_conn.connected():
+            status, msg = db_conn.connect()
+            if not status:
+                return bad_request(errormsg=msg)
+
+        if data['is_import']:
+            status, items = get_import_items(db_conn, data, cols, icols)
+            plan = {'items': items}
+        else:
+            status, items = get_export_items(db_conn, data, jobs, cols, icols)
+            plan = {
+                # Export the consistent data of all the chunks
+                'snapshot': True,
+                'items': items,
+                'manifest': {
+                    'file': data['filename'],
+                    'data': {
+                        'format': MANIFEST_FORMAT,
+                        'version': 1,
+                        'schema': data['schema'],
+                        'table': data['table'],
+                        'columns': data['columns'],
+                        'copy_format': data['format'],
+                        'compression': data.get('compression', None)
+                    }
+                }
+            }
+
+        if not status:
+            return bad_request(errormsg=items)
+
+        jobs = min(jobs, max(len(items), 1))
+        utility, args = parallel_executor()
+        args.extend(['--jobs', str(jobs)])
+        desc_kwargs = {'chunks': len(items), 'jobs': jobs}
+    else:
+        # Create the COPY FROM/TO  from template
+        query = render_template(
+            'import_export/sql/cmd.sql',
+            conn=conn,
+            data=data,
+            columns=cols,
+            ignore_column_list=icols
+        )
 
-    args = ['--command', query]
+        args = ['--command', query]
+        desc_kwargs = dict()
 
     try:
         p = BatchProcess(
@@ -312,10 +545,12 @@ def create_import_export_job(sid):
                 data['table'],
                 data['database'],
                 storage_dir,
-                utility, *args
+                utility, *args, **desc_kwargs
             ),
             cmd=utility, args=args
         )
+        if plan is not None:
+            p.set_plan(plan)
         manager.export_password_env(p.id)
 
         env = dict()
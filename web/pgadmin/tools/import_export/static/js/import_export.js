@@ -45,6 +45,8 @@ define([
       database: undefined,
       schema: undefined,
       table: undefined,
+      jobs: 1,
+      compression: undefined,
     },
     schema: [{
       id: 'is_import',
@@ -112,6 +114,32 @@ define([
         url: 'get_encodings',
         first_empty: true,
         group: gettext('File Info'),
+      }, {
+        id: 'jobs',
+        label: gettext('Number of jobs'),
+        type: 'int',
+        min: 1,
+        max: 8,
+        group: gettext('File Info'),
+        helpMessage: gettext('Copy the table in chunks (i.e. per partition) using the given number of connections in parallel. The chunks are exported into the files next to the selected file, which lists them; select that file to import them in parallel.'),
+      }, {
+        id: 'compression',
+        label: gettext('Compression'),
+        cell: 'string',
+        control: 'select2',
+        group: gettext('File Info'),
+        deps: ['is_import', 'jobs'],
+        options: [{
+          'label': 'gzip',
+          'value': 'gzip',
+        }],
+        disabled: 'isDisabled',
+        select2: {
+          allowClear: true,
+          width: '100%',
+          placeholder: gettext('None'),
+        },
+        helpMessage: gettext('Compress the exported chunks, when copying in parallel.'),
       }],
     }, {
       id: 'columns',
@@ -378,6 +406,8 @@ define([
       case 'null_string':
       case 'delimiter':
         return (m.get('format') == 'binary');
+      case 'compression':
+        return (m.get('is_import') || !(m.get('jobs') > 1));
       default:
         return false;
       }
@@ -0,0 +1 @@
+SELECT {% if columns %}{{ columns|join(', ') }}{% else %}*{% endif %} FROM {{ conn|qtIdent(data.schema, data.table) }} WHERE {% if lower is not none %}{{ key }} >= {{ lower }}{% endif %}{% if lower is not none and upper is not none %} AND {% endif %}{% if upper is not none %}{{ key }} < {{ upper }}{% endif %}
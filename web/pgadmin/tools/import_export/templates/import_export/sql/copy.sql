@@ -0,0 +1,2 @@
+{% import 'import_export/macros/options.macros' as COPY %}
+COPY {% if query %}({{ query }}){% else %}{{ conn|qtIdent(schema, table) }}{% if columns %} {{ columns }}{% endif %}{% endif %} {% if data.is_import %}FROM STDIN{% else %}TO STDOUT{% endif %}{% if data.format == 'binary' %} BINARY{% endif %}{{ COPY.OPTIONS(data, ignore_column_list) }};
@@ -0,0 +1,2 @@
+SELECT min({{ conn|qtIdent(key) }}) AS lower, max({{ conn|qtIdent(key) }}) AS upper
+FROM {{ conn|qtIdent(data.schema, data.table) }}
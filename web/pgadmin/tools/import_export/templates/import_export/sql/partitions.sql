@@ -0,0 +1,14 @@
+{# Leaf partitions of the partitioned table, largest first #}
+WITH RECURSIVE parts(oid) AS (
+    SELECT inh.inhrelid FROM pg_catalog.pg_inherits inh
+    WHERE inh.inhparent = {{ conn|qtIdent(data.schema, data.table)|qtLiteral }}::regclass
+    UNION ALL
+    SELECT inh.inhrelid FROM pg_catalog.pg_inherits inh
+        JOIN parts ON inh.inhparent = parts.oid
+)
+SELECT nsp.nspname AS schema, rel.relname AS name
+FROM parts
+    JOIN pg_catalog.pg_class rel ON rel.oid = parts.oid
+    JOIN pg_catalog.pg_namespace nsp ON nsp.oid = rel.relnamespace
+WHERE rel.relkind <> 'p'
+ORDER BY pg_catalog.pg_relation_size(rel.oid) DESC, nsp.nspname, rel.relname
@@ -0,0 +1,15 @@
+{# Kind, size (in blocks) and the single column integer primary key #}
+SELECT rel.relkind,
+    pg_catalog.pg_relation_size(rel.oid) /
+        pg_catalog.current_setting('block_size')::bigint AS blocks,
+    (SELECT att.attname
+     FROM pg_catalog.pg_index ind
+         JOIN pg_catalog.pg_attribute att
+             ON att.attrelid = ind.indrelid AND att.attnum = ind.indkey[0]
+     WHERE ind.indrelid = rel.oid AND ind.indisprimary
+         AND ind.indnatts = 1
+         AND att.atttypid IN ('int2'::regtype, 'int4'::regtype,
+                              'int8'::regtype)
+    ) AS pk
+FROM pg_catalog.pg_class rel
+WHERE rel.oid = {{ conn|qtIdent(data.schema, data.table)|qtLiteral }}::regclass
@@ -0,0 +1,166 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import os
+import shutil
+import sys
+import tempfile
+
+import simplejson as json
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.tools.import_export import get_export_items, \
+    get_import_items, get_ranges, MANIFEST_FORMAT
+
+if sys.version_info < (3, 3):
+    from mock import MagicMock
+else:
+    from unittest.mock import MagicMock
+
+
+DATA = dict(
+    schema='public', table='t', columns=None, format='csv', header=True,
+    delimiter='', quote='"', escape='\'', is_import=False
+)
+
+
+class ParallelCopyItemsTestCase(BaseTestGenerator):
+    """
+    This class validates that the table is split into the chunks copied in
+    parallel, and that the chunks listed in the manifest are imported.
+    """
+
+    scenarios = [(
+        'TestCase for partitioned table', dict(
+            version=110000,
+            results=[
+                [{'relkind': 'p', 'blocks': 0, 'pk': 'id'}],
+                [
+                    {'schema': 'public', 'name': 't_2'},
+                    {'schema': 'public', 'name': 't_1'}
+                ]
+            ],
+            data=dict(DATA, compression='gzip'),
+            expected_queries=[
+                'COPY public.t_2 TO STDOUT CSV HEADER QUOTE \'"\' '
+                'ESCAPE \'\'\'\';',
+                'COPY public.t_1 TO STDOUT CSV HEADER QUOTE \'"\' '
+                'ESCAPE \'\'\'\';'
+            ],
+            expected_files=['data.csv.0001.gz', 'data.csv.0002.gz']
+        )), (
+        'TestCase for ranges of blocks', dict(
+            version=140000,
+            results=[[{'relkind': 'r', 'blocks': 10, 'pk': None}]],
+            data=dict(DATA, columns=['a', 'b'], header=False),
+            expected_queries=[
+                'COPY (SELECT a, b FROM public.t WHERE '
+                'ctid < \'(4,0)\'::tid) TO STDOUT CSV QUOTE \'"\' '
+                'ESCAPE \'\'\'\';',
+                'COPY (SELECT a, b FROM public.t WHERE '
+                'ctid >= \'(4,0)\'::tid AND ctid < \'(8,0)\'::tid) TO STDOUT '
+                'CSV QUOTE \'"\' ESCAPE \'\'\'\';',
+                'COPY (SELECT a, b FROM public.t WHERE '
+                'ctid >= \'(8,0)\'::tid) TO STDOUT CSV QUOTE \'"\' '
+                'ESCAPE \'\'\'\';'
+            ],
+            expected_files=[
+                'data.csv.0001', 'data.csv.0002', 'data.csv.0003'
+            ]
+        )), (
+        'TestCase for ranges of primary key', dict(
+            version=120000,
+            results=[
+                [{'relkind': 'r', 'blocks': 10, 'pk': 'id'}],
+                [{'lower': 1, 'upper': 100}]
+            ],
+            data=dict(DATA, format='binary'),
+            expected_queries=[
+                'COPY (SELECT * FROM public.t WHERE id < 35) TO STDOUT '
+                'BINARY HEADER ;',
+                'COPY (SELECT * FROM public.t WHERE id >= 35 AND id < 69) '
+                'TO STDOUT BINARY HEADER ;',
+                'COPY (SELECT * FROM public.t WHERE id >= 69) TO STDOUT '
+                'BINARY HEADER ;'
+            ],
+            expected_files=[
+                'data.csv.0001', 'data.csv.0002', 'data.csv.0003'
+            ]
+        )), (
+        'TestCase for table without the key', dict(
+            version=120000,
+            results=[[{'relkind': 'r', 'blocks': 10, 'pk': None}]],
+            data=dict(DATA, format='text'),
+            expected_queries=['COPY public.t TO STDOUT HEADER ;'],
+            expected_files=['data.csv.0001']
+        )), (
+        'TestCase for import of the manifest', dict(
+            version=120000,
+            results=None,
+            data=dict(DATA, is_import=True, columns=['a']),
+            expected_queries=[
+                'COPY public.t (a) FROM STDIN CSV HEADER QUOTE \'"\' '
+                'ESCAPE \'\'\'\';'
+            ] * 2,
+            expected_files=['data.csv.0001.gz', 'data.csv.0002']
+        ))
+    ]
+
+    def setUp(self):
+        self.out_dir = tempfile.mkdtemp()
+
+    def runTest(self):
+        conn = MagicMock()
+        conn.manager.version = self.version
+        if self.results is not None:
+            conn.execute_dict.side_effect = [
+                (True, {'rows': rows}) for rows in self.results
+            ]
+
+        data = dict(self.data)
+        data['filename'] = os.path.join(self.out_dir, 'data.csv')
+
+        with self.app.test_request_context():
+            if data['is_import']:
+                status, items = get_import_items(conn, data, None, None)
+                # Not a manifest
+                self.assertFalse(status)
+
+                with open(data['filename'], 'w') as f:
+                    json.dump({'format': MANIFEST_FORMAT, 'chunks': [
+                        {'file': '../data.csv.0001.gz', 'rows': 1},
+                        {'file': 'data.csv.0002', 'rows': 1}
+                    ]}, f)
+                status, items = get_import_items(conn, data, '(a)', None)
+            else:
+                status, items = get_export_items(conn, data, 3, None, None)
+
+        self.assertTrue(status)
+        # Ignore the spacing of the options
+        self.assertEqual(
+            [' '.join(item['query'].split()) for item in items],
+            self.expected_queries
+        )
+        self.assertEqual(
+            [item['file'] for item in items],
+            [os.path.join(self.out_dir, f) for f in self.expected_files]
+        )
+        self.assertEqual(
+            [item['compress'] for item in items],
+            [f.endswith('.gz') for f in self.expected_files]
+        )
+
+        self.assertEqual(get_ranges(None, None, 4), [(None, None)])
+        self.assertEqual(get_ranges(5, 5, 4), [(None, None)])
+        self.assertEqual(get_ranges(0, 3, 8), [
+            (None, 1), (1, 2), (2, 3), (3, None)
+        ])
+
+    def tearDown(self):
+        shutil.rmtree(self.out_dir, True)
@@ -14,7 +14,8 @@ import simplejson as json
 from flask import url_for, Response, render_template, request, current_app
 from flask_babelex import gettext as _
 from flask_security import login_required, current_user
-from pgadmin.misc.bgprocess.processes import BatchProcess, IProcessDesc
+from pgadmin.misc.bgprocess.processes import BatchProcess, IProcessDesc, \
+    parallel_executor, get_parallel_jobs
 from pgadmin.utils import PgAdminModule, html, is_utility_exists
 from pgadmin.utils.ajax import bad_request, make_json_response
 from pgadmin.utils.driver import get_driver
@@ -24,6 +25,9 @@ from pgadmin.model import Server
 
 MODULE_NAME = 'maintenance'
 
+# Number of the statements shown in the details of a parallel maintenance job
+MAX_QUERIES_SHOWN = 10
+
 
 class MaintenanceModule(PgAdminModule):
     """
@@ -120,7 +124,7 @@ class Message(IProcessDesc):
                 res += '(' + _('VERBOSE') + ')'
 
         if self.data['op'] == "REINDEX":
-            if 'schema' in self.data and self.data['schema']:
+            if 'table' in self.data and self.data['table']:
                 if 'primary_key' in self.data or\
                     'unique_constraint' in self.data or\
                         'index' in self.data:
@@ -135,7 +139,13 @@ class Message(IProcessDesc):
         res = '<div>' + html.safe_str(res)
 
         res += '</div><div class="py-1">'
-        res += _("Running Query:")
+        if self.data.get('relations'):
+            res += _(
+                "Running the queries for {0} relation(s) using {1} "
+                "connection(s):"
+            ).format(self.data['relations'], self.data['jobs'])
+        else:
+            res += _("Running Query:")
         res += '<div class="pg-bg-cmd enable-selection p-1">'
         res += html.safe_str(self.query)
         res += '</div></div>'
@@ -143,6 +153,65 @@ class Message(IProcessDesc):
         return res
 
 
+def get_jobs(data):
+    """
+    Returns the number of the connections requested for the maintenance job.
+    """
+    return get_parallel_jobs(data.get('jobs', None))
+
+
+def is_per_relation(data):
+    """
+    Whether the maintenance job runs the statement for each relation of the
+    database or schema, rather than a single statement for all of them.
+
+    There is no statement maintaining a whole schema, and the maintenance of
+    the database can only be run in parallel one relation at a time.
+    """
+    if data.get('table', None):
+        return False
+
+    return bool(data.get('schema', None)) or get_jobs(data) > 1
+
+
+def get_work_items(conn, data):
+    """
+    Expands the database or schema of the maintenance job into the
+    statements for each of its relations, largest first.
+
+    The system catalogs are marked as exclusive for the operations, which
+    rewrite them (i.e. VACUUM FULL, CLUSTER and REINDEX), as they may
+    deadlock, when processed in parallel.
+
+    Returns:
+        (status, list of the work items or error message)
+    """
+    status, res = conn.execute_dict(render_template(
+        'maintenance/sql/relations.sql', conn=conn, data=data
+    ))
+    if not status:
+        return False, res
+
+    rewrite = data['op'] in ('CLUSTER', 'REINDEX') or (
+        data['op'] == 'VACUUM' and data.get('vacuum_full', False)
+    )
+    driver = get_driver(PG_DEFAULT_DRIVER)
+    items = []
+
+    for row in res['rows']:
+        items.append({
+            'name': driver.qtIdent(conn, row['schema'], row['name']),
+            'query': render_template(
+                'maintenance/sql/command.sql', conn=conn,
+                data=dict(data, schema=row['schema'], table=row['name']),
+                index_name=None
+            ).strip(),
+            'exclusive': bool(rewrite and row['is_catalog'])
+        })
+
+    return True, items
+
+
 @blueprint.route("/")
 @login_required
 def index():
@@ -221,28 +290,67 @@ def create_maintenance_job(sid, did):
             errormsg=ret_val
         )
 
-    # Create the command for the vacuum operation
-    query = render_template(
-        'maintenance/sql/command.sql', conn=conn, data=data,
-        index_name=index_name
-    )
+    items = None
+    if is_per_relation(data):
+        db_conn = manager.connection(did=did)
+        if not db_conn.connected():
+            return make_json_response(
+                success=0,
+                errormsg=_("Please connect to the database first.")
+            )
+
+        status, items = get_work_items(db_conn, data)
+        if not status:
+            return make_json_response(success=0, errormsg=items)
+
+        if not items and data.get('schema', None):
+            return make_json_response(
+                success=0,
+                errormsg=_("There are no relations to maintain.")
+            )
+
+    host = manager.local_bind_host if manager.use_ssh_tunnel else server.host
+    port = str(manager.local_bind_port) if manager.use_ssh_tunnel \
+        else str(server.port)
+
+    if items:
+        # Run the statements for each relation using multiple connections
+        jobs = get_jobs(data)
+        data['jobs'] = jobs
+        data['relations'] = len(items)
+        query = '\n'.join(
+            item['query'] for item in items[:MAX_QUERIES_SHOWN]
+        )
+        if len(items) > MAX_QUERIES_SHOWN:
+            query += '\n...'
+
+        utility, args = parallel_executor()
+        args.extend([
+            '--host', host, '--port', port,
+            '--username', server.username, '--dbname', data['database'],
+            '--jobs', str(jobs)
+        ])
+    else:
+        # Create the command for the vacuum operation
+        query = render_template(
+            'maintenance/sql/command.sql', conn=conn, data=data,
+            index_name=index_name
+        )
 
-    args = [
-        '--host',
-        manager.local_bind_host if manager.use_ssh_tunnel else server.host,
-        '--port',
-        str(manager.local_bind_port) if manager.use_ssh_tunnel
-        else str(server.port),
-        '--username', server.username, '--dbname',
-        data['database'],
-        '--command', query
-    ]
+        args = [
+            '--host', host, '--port', port,
+            '--username', server.username, '--dbname',
+            data['database'],
+            '--command', query
+        ]
 
     try:
         p = BatchProcess(
             desc=Message(sid, data, query),
             cmd=utility, args=args
         )
+        if items:
+            p.set_plan({'items': items})
         manager.export_password_env(p.id)
         # Check for connection timeout and if it is greater than 0 then
         # set the environment variable PGCONNECT_TIMEOUT.
@@ -37,6 +37,7 @@ define([
       vacuum_freeze: false,
       vacuum_analyze: false,
       verbose: true,
+      jobs: 1,
     },
     initialize: function() {
       var node_info = arguments[1]['node_info'];
@@ -141,6 +142,16 @@ define([
       label: gettext('Verbose Messages'),
       disabled: 'isDisabled',
     },
+    {
+      id: 'jobs',
+      group: gettext('Options'),
+      type: 'int',
+      label: gettext('Number of jobs'),
+      min: 1,
+      max: 8,
+      disabled: 'isDisabled',
+      helpMessage: gettext('Maintain the tables of the database or schema one by one, using the given number of connections in parallel.'),
+    },
     ],
 
     // Enable/Disable the items based on the user maintenance operation
@@ -164,6 +175,9 @@ define([
           }
         }
         return m.get('op') == 'REINDEX';
+      case 'jobs':
+        // Only the database, or schema can be maintained in parallel
+        return ('table' in node_info || 'partition' in node_info);
       default:
         return false;
       }
@@ -8,6 +8,6 @@
 //////////////////////////////////////////////////////////////
 
 export const maintenanceSupportedNodes = [
-  'database', 'table', 'primary_key',
+  'database', 'schema', 'table', 'primary_key',
   'unique_constraint', 'index', 'partition',
 ];
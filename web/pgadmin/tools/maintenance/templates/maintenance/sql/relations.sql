@@ -0,0 +1,18 @@
+{# Relations to be maintained one by one, largest first #}
+SELECT nsp.nspname AS schema, rel.relname AS name,
+    nsp.nspname IN ('pg_catalog', 'information_schema') AS is_catalog,
+    pg_catalog.pg_total_relation_size(rel.oid) AS size
+FROM pg_catalog.pg_class rel
+    JOIN pg_catalog.pg_namespace nsp ON nsp.oid = rel.relnamespace
+WHERE rel.relkind IN ('r', 'm')
+    AND rel.relpersistence <> 't'
+{% if data.schema %}
+    AND nsp.nspname = {{ data.schema|qtLiteral }}
+{% endif %}
+{% if data.op == "CLUSTER" %}
+    AND EXISTS (
+        SELECT 1 FROM pg_catalog.pg_index ind
+        WHERE ind.indrelid = rel.oid AND ind.indisclustered
+    )
+{% endif %}
+ORDER BY size DESC, nsp.nspname, rel.relname
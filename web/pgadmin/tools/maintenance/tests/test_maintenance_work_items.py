@@ -0,0 +1,121 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import sys
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.tools.maintenance import get_work_items, is_per_relation, \
+    get_jobs
+
+if sys.version_info < (3, 3):
+    from mock import MagicMock
+else:
+    from unittest.mock import MagicMock
+
+
+ROWS = [
+    {'schema': 'public', 'name': 'Big', 'is_catalog': False},
+    {'schema': 'pg_catalog', 'name': 'pg_class', 'is_catalog': True},
+]
+
+
+class MaintenanceWorkItemsTestCase(BaseTestGenerator):
+    """
+    This class validates the expansion of a database or schema into the
+    maintenance statements for each relation.
+    """
+
+    scenarios = [(
+        'TestCase for database in parallel', dict(
+            data=dict(
+                database='postgres', op='VACUUM', vacuum_full=False,
+                vacuum_freeze=False, vacuum_analyze=False, verbose=True,
+                jobs=4
+            ),
+            per_relation=True,
+            expected_jobs=4,
+            expected_queries=[
+                'VACUUM VERBOSE public."Big";',
+                'VACUUM VERBOSE pg_catalog.pg_class;'
+            ],
+            expected_exclusive=[False, False]
+        )), (
+        'TestCase for VACUUM FULL of the catalogs', dict(
+            data=dict(
+                database='postgres', op='VACUUM', vacuum_full=True,
+                vacuum_freeze=False, vacuum_analyze=False, verbose=False,
+                jobs=100
+            ),
+            per_relation=True,
+            expected_jobs=8,
+            expected_queries=[
+                'VACUUM FULL public."Big";',
+                'VACUUM FULL pg_catalog.pg_class;'
+            ],
+            expected_exclusive=[False, True]
+        )), (
+        'TestCase for schema', dict(
+            data=dict(
+                database='postgres', schema='public', op='REINDEX',
+                verbose=False
+            ),
+            per_relation=True,
+            expected_jobs=1,
+            expected_queries=[
+                'REINDEX TABLE public."Big";',
+                'REINDEX TABLE pg_catalog.pg_class;'
+            ],
+            expected_exclusive=[False, True]
+        )), (
+        'TestCase for database with single job', dict(
+            data=dict(database='postgres', op='ANALYZE', verbose=False),
+            per_relation=False,
+            expected_jobs=1,
+            expected_queries=None,
+            expected_exclusive=None
+        )), (
+        'TestCase for table', dict(
+            data=dict(
+                database='postgres', schema='public', table='Big',
+                op='ANALYZE', verbose=False, jobs=4
+            ),
+            per_relation=False,
+            expected_jobs=4,
+            expected_queries=None,
+            expected_exclusive=None
+        ))
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        self.assertEqual(is_per_relation(self.data), self.per_relation)
+        self.assertEqual(get_jobs(self.data), self.expected_jobs)
+
+        if not self.per_relation:
+            return
+
+        conn = MagicMock()
+        conn.execute_dict.return_value = (True, {'rows': ROWS})
+
+        with self.app.test_request_context():
+            status, items = get_work_items(conn, self.data)
+
+        self.assertTrue(status)
+        self.assertEqual(
+            [item['name'] for item in items],
+            ['public."Big"', 'pg_catalog.pg_class']
+        )
+        self.assertEqual(
+            [item['query'] for item in items], self.expected_queries
+        )
+        self.assertEqual(
+            [item['exclusive'] for item in items], self.expected_exclusive
+        )
@@ -10,13 +10,17 @@
 """Implements Restore Utility"""
 
 import simplejson as json
+import multiprocessing
 import os
+import re
+import subprocess
 
 from flask import render_template, request, current_app, \
     url_for, Response
 from flask_babelex import gettext as _
 from flask_security import login_required, current_user
-from pgadmin.misc.bgprocess.processes import BatchProcess, IProcessDesc
+from pgadmin.misc.bgprocess.processes import BatchProcess, IProcessDesc, \
+    get_parallel_jobs
 from pgadmin.utils import PgAdminModule, get_storage_directory, html, \
     fs_short_path, document_dir, is_utility_exists
 from pgadmin.utils.ajax import make_json_response, bad_request
@@ -28,6 +32,16 @@ from pgadmin.model import Server
 MODULE_NAME = 'restore'
 server_info = {}
 
+# Entries of the archive restored in parallel, the data of the tables, and
+# the indexes and the constraints built after it.
+DATA_ENTRIES = ('TABLE DATA', 'MATERIALIZED VIEW DATA')
+POST_DATA_ENTRIES = ('INDEX', 'CONSTRAINT', 'FK CONSTRAINT')
+# Formats of the archive pg_restore restores in parallel
+PARALLEL_FORMATS = ('CUSTOM', 'DIRECTORY')
+
+ARCHIVE_FORMAT_RE = re.compile(r'^;\s+Format:\s+(\w+)')
+ARCHIVE_ENTRY_RE = re.compile(r'^\d+;\s+\d+\s+\d+\s+(.*)$')
+
 
 class RestoreModule(PgAdminModule):
     """
@@ -66,9 +80,10 @@ blueprint = RestoreModule(
 
 
 class RestoreMessage(IProcessDesc):
-    def __init__(self, _sid, _bfile, *_args):
+    def __init__(self, _sid, _bfile, *_args, **_kwargs):
         self.sid = _sid
         self.bfile = _bfile
+        self.plan = _kwargs['plan'] if 'plan' in _kwargs else None
         self.cmd = ''
 
         def cmdArg(x):
@@ -128,6 +143,18 @@ class RestoreMessage(IProcessDesc):
             )
         )
 
+        # The processes created before the planning of the jobs do not
+        # have it
+        if getattr(self, 'plan', None):
+            res += '</div><div class="py-1">'
+            res += html.safe_str(_(
+                "Using {0} job(s) planned for {1} table(s) and {2} "
+                "index(es) or constraint(s) on {3} core(s)."
+            ).format(
+                self.plan['jobs'], self.plan['data'],
+                self.plan['post_data'], self.plan['cores']
+            ))
+
         res += '</div><div class="py-1">'
         res += _("Running command:")
         res += '<div class="pg-bg-cmd enable-selection p-1">'
@@ -177,6 +204,91 @@ def filename_with_file_manager_path(_file):
     return fs_short_path(_file)
 
 
+def get_archive_listing(utility, _file):
+    """
+    Returns the table of contents of the archive, as listed by pg_restore.
+
+    Args:
+        utility: Path of pg_restore
+        _file: Archive file (or directory)
+
+    Returns:
+        (status, listing or error message)
+    """
+    try:
+        p = subprocess.Popen(
+            [utility, '--list', _file],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+        out, err = p.communicate()
+    except OSError as e:
+        return False, str(e)
+
+    if p.returncode != 0:
+        return False, err.decode('utf-8', 'replace')
+
+    return True, out.decode('utf-8', 'replace')
+
+
+def plan_restore_jobs(listing, cores):
+    """
+    Proposes the number of the jobs restoring the archive, from the entries
+    of its table of contents restored in parallel.
+
+    Args:
+        listing: Table of contents of the archive (see get_archive_listing())
+        cores: Number of the cores of the host running pg_restore
+
+    Returns:
+        The restore plan
+    """
+    plan = {'format': None, 'data': 0, 'post_data': 0, 'cores': cores}
+
+    for line in listing.splitlines():
+        line = line.strip()
+
+        match = ARCHIVE_FORMAT_RE.match(line)
+        if match:
+            plan['format'] = match.group(1).upper()
+            continue
+
+        # The entries commented out are not restored
+        match = ARCHIVE_ENTRY_RE.match(line)
+        if not match:
+            continue
+
+        desc = match.group(1)
+        if any(desc.startswith(e + ' ') for e in DATA_ENTRIES):
+            plan['data'] += 1
+        elif any(desc.startswith(e + ' ') for e in POST_DATA_ENTRIES):
+            plan['post_data'] += 1
+
+    jobs = 1
+    if plan['format'] in PARALLEL_FORMATS:
+        jobs = min(cores, max(plan['data'], plan['post_data']))
+    plan['jobs'] = get_parallel_jobs(jobs)
+
+    return plan
+
+
+def is_plannable(data):
+    """
+    Returns True, when the number of the jobs of the restore is not given,
+    and pg_restore restores the whole archive in parallel.
+    """
+    if data.get('no_of_jobs', None) or not data.get('database', None) or \
+            data.get('single_transaction', False):
+        return False
+
+    # The archive restored partially
+    for key in ('schemas', 'tables', 'functions', 'triggers',
+                'trigger_funcs', 'indexes'):
+        if data.get(key, None):
+            return False
+
+    return True
+
+
 @blueprint.route('/job/<int:sid>', methods=['POST'], endpoint='create_job')
 @login_required
 def create_restore_job(sid):
@@ -240,6 +352,7 @@ def create_restore_job(sid):
         )
 
     args = []
+    plan = None
 
     if 'list' in data:
         args.append('--list')
@@ -324,6 +437,18 @@ def create_restore_job(sid):
         if manager.version >= 110000:
             set_param('no_comments', '--no-comments')
 
+        if is_plannable(data):
+            status, res = get_archive_listing(utility, _file)
+            if not status:
+                # Restore using a single job
+                current_app.logger.warning(
+                    'Could not plan the jobs of the restore: {0}'.format(res)
+                )
+            else:
+                plan = plan_restore_jobs(res, multiprocessing.cpu_count())
+                if plan['jobs'] > 1:
+                    data['no_of_jobs'] = str(plan['jobs'])
+
         set_value('no_of_jobs', '--jobs')
         set_param('verbose', '--verbose')
 
@@ -343,10 +468,14 @@ def create_restore_job(sid):
                 data['file'].encode('utf-8') if hasattr(
                     data['file'], 'encode'
                 ) else data['file'],
-                *args
+                *args,
+                plan=plan
             ),
             cmd=utility, args=args
         )
+        if plan is not None:
+            # Keep the plan to compare it with the time taken
+            p.set_plan(plan)
         manager.export_password_env(p.id)
         # Check for connection timeout and if it is greater than 0 then
         # set the environment variable PGCONNECT_TIMEOUT.
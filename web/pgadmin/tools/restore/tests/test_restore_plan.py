@@ -0,0 +1,91 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.tools.restore import plan_restore_jobs, is_plannable
+
+LISTING = """;
+; Archive created at 2019-06-03 10:00:00 UTC
+;     dbname: postgres
+;     TOC Entries: 12
+;     Compression: -1
+;     Dump Version: 1.13-0
+;     Format: {0}
+;
+;
+; Selected TOC Entries:
+;
+3; 2615 2200 SCHEMA - public postgres
+200; 1259 16385 TABLE public t1 postgres
+201; 1259 16390 TABLE public t2 postgres
+202; 1259 16395 MATERIALIZED VIEW public mv postgres
+2900; 0 16385 TABLE DATA public t1 postgres
+2901; 0 16390 TABLE DATA public t2 postgres
+;2902; 0 16395 TABLE DATA public t3 postgres
+2903; 0 16395 MATERIALIZED VIEW DATA public mv postgres
+2750; 2606 16400 CONSTRAINT public t1 t1_pkey postgres
+2751; 2606 16401 CONSTRAINT public t2 t2_pkey postgres
+2752; 1259 16402 INDEX public t1_idx postgres
+2753; 1259 16403 INDEX public t2_idx postgres
+2754; 1259 16404 INDEX public mv_idx postgres
+2760; 2606 16405 FK CONSTRAINT public t2 t2_fk postgres
+"""
+
+
+class RestorePlanTestCase(BaseTestGenerator):
+    """
+    This class validates the number of the jobs proposed for the restore of
+    the archive listed by pg_restore.
+    """
+
+    scenarios = [(
+        'TestCase for custom archive', dict(
+            format='CUSTOM',
+            cores=4,
+            expected_jobs=4
+        )), (
+        'TestCase for directory archive with less cores', dict(
+            format='DIRECTORY',
+            cores=2,
+            expected_jobs=2
+        )), (
+        'TestCase for more cores than entries', dict(
+            format='CUSTOM',
+            cores=16,
+            expected_jobs=6
+        )), (
+        'TestCase for tar archive', dict(
+            format='TAR',
+            cores=4,
+            expected_jobs=1
+        ))
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        plan = plan_restore_jobs(LISTING.format(self.format), self.cores)
+
+        self.assertEqual(plan['format'], self.format)
+        self.assertEqual(plan['data'], 3)
+        self.assertEqual(plan['post_data'], 6)
+        self.assertEqual(plan['jobs'], self.expected_jobs)
+
+        self.assertTrue(is_plannable({'database': 'postgres'}))
+        self.assertFalse(is_plannable({}))
+        self.assertFalse(
+            is_plannable({'database': 'postgres', 'no_of_jobs': '2'})
+        )
+        self.assertFalse(
+            is_plannable({'database': 'postgres', 'single_transaction': True})
+        )
+        self.assertFalse(
+            is_plannable({'database': 'postgres', 'tables': ['t1']})
+        )
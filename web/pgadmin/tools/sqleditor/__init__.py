@@ -18,24 +18,29 @@ from flask import Response, url_for, render_template, session, request, \
 from flask_babelex import gettext
 from flask_security import login_required, current_user
 
-from config import PG_DEFAULT_DRIVER, ON_DEMAND_RECORD_COUNT
+from config import PG_DEFAULT_DRIVER, ON_DEMAND_RECORD_COUNT, \
+    QUERY_TOOL_TYPECASTER_PROFILE, QUERY_HISTORY_PLANS
 from pgadmin.misc.file_manager import Filemanager
 from pgadmin.tools.sqleditor.command import QueryToolCommand
 from pgadmin.tools.sqleditor.utils.constant_definition import ASYNC_OK, \
     ASYNC_EXECUTION_ABORTED, \
     CONNECTION_STATUS_MESSAGE_MAPPING, TX_STATUS_INERROR
 from pgadmin.tools.sqleditor.utils.start_running_query import StartRunningQuery
+from pgadmin.tools.sqleditor.utils.script_runner import poll_script, \
+    progress_message, format_report
+from pgadmin.tools.sqleditor.utils.explain_analyzer import parse_plan, \
+    analyze_plan
+from pgadmin.tools.sqleditor.utils.plan_comparison import normalize_plan
 from pgadmin.tools.sqleditor.utils.update_session_grid_transaction import \
     update_session_grid_transaction
 from pgadmin.utils import PgAdminModule
 from pgadmin.utils import get_storage_directory
 from pgadmin.utils.ajax import make_json_response, bad_request, \
-    success_return, internal_server_error
+    success_return, internal_server_error, gone
 from pgadmin.utils.driver import get_driver
 from pgadmin.utils.menu import MenuItem
 from pgadmin.utils.exception import ConnectionLost, SSHTunnelConnectionLost,\
     CryptKeyMissing
-from pgadmin.utils.sqlautocomplete.autocomplete import SQLAutoComplete
 from pgadmin.tools.sqleditor.utils.query_tool_preferences import \
     RegisterQueryToolPreferences
 from pgadmin.tools.sqleditor.utils.query_tool_fs_utils import \
@@ -98,6 +103,7 @@ class SqlEditorModule(PgAdminModule):
             'sqleditor.poll',
             'sqleditor.fetch',
             'sqleditor.fetch_all',
+            'sqleditor.fetch_cell',
             'sqleditor.save',
             'sqleditor.inclusive_filter',
             'sqleditor.exclusive_filter',
@@ -117,6 +123,7 @@ class SqlEditorModule(PgAdminModule):
             'sqleditor.get_query_history',
             'sqleditor.add_query_history',
             'sqleditor.clear_query_history',
+            'sqleditor.compare_query_plans',
         ]
 
     def register_preferences(self):
@@ -173,7 +180,8 @@ def check_transaction_status(trans_id):
             conn_id=trans_obj.conn_id,
             auto_reconnect=False,
             use_binary_placeholder=True,
-            array_to_string=True
+            array_to_string=True,
+            typecaster_profile=QUERY_TOOL_TYPECASTER_PROFILE
         )
     except (ConnectionLost, SSHTunnelConnectionLost, CryptKeyMissing):
         raise
@@ -244,13 +252,28 @@ def start_view_data(trans_id):
         sql = trans_obj.get_sql(default_conn)
         pk_names, primary_keys = trans_obj.get_primary_keys(default_conn)
 
-        session_obj['command_obj'] = pickle.dumps(trans_obj, -1)
-
         has_oids = False
         if trans_obj.object_type == 'table':
             # Fetch OIDs status
             has_oids = trans_obj.has_oids(default_conn)
 
+        # Fetch the first characters of the wide values, the whole value
+        # of the cell is fetched when opened in the editor (see fetch_cell())
+        query = sql
+        truncated_columns = dict()
+        cell_length = blueprint.view_data_cell_length.get()
+        if trans_obj.object_type == 'table' and cell_length > 0 and \
+                (len(primary_keys) > 0 or has_oids):
+            columns = trans_obj.get_columns(default_conn, primary_keys)
+            query = trans_obj.get_sql(
+                default_conn, columns=columns, cell_length=cell_length
+            )
+            for col in columns:
+                if col['fetch'] == 'prefix':
+                    truncated_columns[col['name']] = col['type_code']
+
+        session_obj['command_obj'] = pickle.dumps(trans_obj, -1)
+
         # Fetch the applied filter.
         filter_applied = trans_obj.is_filter_applied()
 
@@ -266,11 +289,15 @@ def start_view_data(trans_id):
         # Store the OIDs status into session object
         session_obj['has_oids'] = has_oids
 
+        # Store the columns fetched truncated into session object
+        session_obj['truncated_columns'] = truncated_columns
+        session_obj['cell_length'] = cell_length
+
         update_session_grid_transaction(trans_id, session_obj)
 
         # Execute sql asynchronously
         try:
-            status, result = conn.execute_async(sql)
+            status, result = conn.execute_async(query)
         except (ConnectionLost, SSHTunnelConnectionLost) as e:
             raise
     else:
@@ -384,6 +411,11 @@ def poll(trans_id):
     rset = None
     has_oids = False
     oids = None
+    truncated_columns = None
+    cell_length = 0
+    script_report = None
+    script_progress = None
+    explain_summary = None
 
     # Check the transaction and connection status
     status, error_msg, conn, trans_obj, session_obj = \
@@ -395,8 +427,17 @@ def poll(trans_id):
                                   status=404)
 
     if status and conn is not None and session_obj is not None:
-        status, result = conn.poll(
-            formatted_exception_msg=True, no_result=True)
+        script = session_obj.get('script', None)
+        if script is not None:
+            # Run the next statements of the script as the previous complete
+            status, result = poll_script(conn, script)
+            if script['finished']:
+                session_obj.pop('script')
+                script_report = format_report(script)
+            update_session_grid_transaction(trans_id, session_obj)
+        else:
+            status, result = conn.poll(
+                formatted_exception_msg=True, no_result=True)
         if not status:
             messages = conn.messages()
             if messages and len(messages) > 0:
@@ -406,6 +447,8 @@ def poll(trans_id):
                     gettext('******* Error *******'),
                     result
                 )
+            if script_report is not None:
+                result = u'{0}\n\n{1}'.format(result, script_report)
             return internal_server_error(result)
         elif status == ASYNC_OK:
             status = 'Success'
@@ -431,6 +474,10 @@ def poll(trans_id):
                     if has_oids:
                         oids = {'oid': 'oid'}
 
+                if session_obj.get('truncated_columns', None):
+                    truncated_columns = session_obj['truncated_columns']
+                    cell_length = session_obj['cell_length']
+
                 # Fetch column information
                 columns_info = conn.get_column_info()
                 client_primary_key = generate_client_primary_key_name(
@@ -460,6 +507,11 @@ def poll(trans_id):
                     for key, col in enumerate(columns_info):
                         col_type = dict()
                         col_type['type_code'] = col['type_code']
+                        # The truncated values are fetched as text
+                        if truncated_columns and \
+                                col['name'] in truncated_columns:
+                            col_type['type_code'] = col['type_code'] = \
+                                truncated_columns[col['name']]
                         col_type['type_name'] = None
                         col_type['internal_size'] = col['internal_size']
                         columns[col['name']] = col_type
@@ -488,6 +540,19 @@ def poll(trans_id):
                                 col_info['type_name'] = typname
 
                     session_obj['columns_info'] = columns
+
+                # Summarize where the time went in the plan of EXPLAIN
+                if result and len(result) == 1 and columns_info and \
+                        len(columns_info) == 1 and \
+                        columns_info[0]['name'] == 'QUERY PLAN':
+                    explain = parse_plan(result[0][0])
+                    if explain is not None:
+                        explain_summary = analyze_plan(explain)
+                        # Saved with the query history by the next request
+                        if QUERY_HISTORY_PLANS:
+                            session_obj['last_plan'] = normalize_plan(
+                                explain_summary)
+
                 # status of async_fetchmany_2darray is True and result is none
                 # means nothing to fetch
                 if result and rows_affected > -1:
@@ -512,9 +577,13 @@ def poll(trans_id):
             status = 'Cancel'
         else:
             status = 'Busy'
-            messages = conn.messages()
-            if messages and len(messages) > 0:
-                result = ''.join(messages)
+            if script is not None:
+                # The notices are reported along with their statement
+                script_progress = progress_message(script)
+            else:
+                messages = conn.messages()
+                if messages and len(messages) > 0:
+                    result = ''.join(messages)
 
     else:
         status = 'NotConnected'
@@ -555,7 +624,12 @@ def poll(trans_id):
             'client_primary_key': client_primary_key,
             'has_oids': has_oids,
             'oids': oids,
+            'truncated_columns': list(truncated_columns or []),
+            'cell_length': cell_length,
             'transaction_status': transaction_status,
+            'script_report': script_report,
+            'script_progress': script_progress,
+            'explain_summary': explain_summary,
         },
         encoding=conn.python_encoding
     )
@@ -634,6 +708,80 @@ def fetch(trans_id, fetch_all=None):
     )
 
 
+@blueprint.route(
+    '/fetch/cell/<int:trans_id>', methods=["PUT", "POST"],
+    endpoint='fetch_cell'
+)
+@login_required
+def fetch_cell(trans_id):
+    """
+    This method fetches the whole value of the cell, View Data fetched
+    truncated, of the row identified by its primary keys (or OID).
+
+    Args:
+        trans_id: unique transaction id
+    """
+    data = json.loads(request.data, encoding='utf-8')
+
+    # Check the transaction and connection status
+    status, error_msg, conn, trans_obj, session_obj = \
+        check_transaction_status(trans_id)
+
+    if error_msg == gettext('Transaction ID not found in the session.'):
+        return make_json_response(success=0, errormsg=error_msg,
+                                  info='DATAGRID_TRANSACTION_REQUIRED',
+                                  status=404)
+
+    if not status or conn is None or trans_obj is None or \
+            session_obj is None:
+        return internal_server_error(errormsg=error_msg)
+
+    column = data.get('column', None)
+    if column not in session_obj.get('truncated_columns', dict()):
+        return bad_request(
+            errormsg=gettext('The column was not fetched truncated.')
+        )
+
+    # Identify the row using the same keys as the save
+    primary_keys = session_obj['primary_keys']
+    has_oids = len(primary_keys) == 0 and session_obj['has_oids']
+    key_names = ['oid'] if has_oids else list(primary_keys)
+    keys = data.get('keys', dict())
+    if any(name not in keys for name in key_names):
+        return bad_request(
+            errormsg=gettext('The keys of the row are missing.')
+        )
+
+    # get the default connection as current connection attached to trans id
+    # holds the cursor which has query result so we cannot use that connection
+    # to execute another query otherwise we'll lose query result.
+    manager = get_driver(PG_DEFAULT_DRIVER).connection_manager(trans_obj.sid)
+    default_conn = manager.connection(did=trans_obj.did)
+
+    # Connect to the Server if not connected.
+    if not default_conn.connected():
+        status, msg = default_conn.connect()
+        if not status:
+            return internal_server_error(errormsg=msg)
+
+    sql = trans_obj.get_cell_sql(column, has_oids, primary_keys)
+    status, res = default_conn.execute_2darray(
+        sql, dict((name, keys[name]) for name in key_names)
+    )
+    if not status:
+        return internal_server_error(errormsg=res)
+
+    if len(res['rows']) == 0:
+        return gone(
+            errormsg=gettext('The row has been deleted or its keys changed.')
+        )
+
+    return make_json_response(
+        data={'value': res['rows'][0][0]},
+        encoding=default_conn.python_encoding
+    )
+
+
 def fetch_pg_types(columns_info, trans_obj):
     """
     This method is used to fetch the pg types, which is required
@@ -1203,10 +1351,15 @@ def auto_complete(trans_id):
 
     if status and conn is not None and \
        trans_obj is not None and session_obj is not None:
+        # The autocomplete (and its parser) is imported on first use, as it
+        # is slow to import
+        from pgadmin.utils.sqlautocomplete.autocomplete import \
+            SQLAutoComplete
 
         # Create object of SQLAutoComplete class and pass connection object
         auto_complete_obj = SQLAutoComplete(
-            sid=trans_obj.sid, did=trans_obj.did, conn=conn)
+            sid=trans_obj.sid, did=trans_obj.did, conn=conn,
+            prevalence=session_obj.get('prevalence'))
 
         # Get the auto completion suggestions.
         res = auto_complete_obj.get_completions(full_sql, text_before_cursor)
@@ -1521,11 +1674,17 @@ def add_query_history(trans_id):
         did: database id
     """
 
-    status, error_msg, conn, trans_obj, session_ob = \
+    status, error_msg, conn, trans_obj, session_obj = \
         check_transaction_status(trans_id)
 
+    # The plan of the query, if it was explained
+    plan = None
+    if session_obj is not None and 'last_plan' in session_obj:
+        plan = session_obj.pop('last_plan')
+        update_session_grid_transaction(trans_id, session_obj)
+
     return QueryHistory.save(current_user.id, trans_obj.sid, conn.db,
-                             request=request)
+                             request=request, plan=plan)
 
 
 @blueprint.route(
@@ -1566,3 +1725,32 @@ def get_query_history(trans_id):
         check_transaction_status(trans_id)
 
     return QueryHistory.get(current_user.id, trans_obj.sid, conn.db)
+
+
+@blueprint.route(
+    '/query_history/compare/<int:trans_id>',
+    methods=["POST"], endpoint='compare_query_plans'
+)
+@login_required
+def compare_query_plans(trans_id):
+    """
+    This method compares the plans saved with the query history of the
+    given query for user/server/database (the latest two, unless the start
+    times of their entries are given)
+
+    Args:
+        trans_id: unique transaction id
+    """
+
+    status, error_msg, conn, trans_obj, session_ob = \
+        check_transaction_status(trans_id)
+
+    if request.data:
+        data = json.loads(request.data, encoding='utf-8')
+    else:
+        data = request.args or request.form
+
+    return QueryHistory.compare(current_user.id, trans_obj.sid, conn.db,
+                                data.get('query', ''),
+                                data.get('first', None),
+                                data.get('second', None))
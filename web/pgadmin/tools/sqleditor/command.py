@@ -27,6 +27,11 @@ VIEW_LAST_100_ROWS = 2
 VIEW_ALL_ROWS = 3
 VIEW_FILTERED_ROWS = 4
 
+# Types of the columns, whose values are fetched truncated by View Data
+PREFIX_TYPES = ('text', 'varchar', 'json', 'jsonb', 'xml')
+# Types of the columns, whose values are shown as placeholders
+PLACEHOLDER_TYPES = ('bytea',)
+
 
 class ObjectRegistry(ABCMeta):
     """
@@ -459,10 +464,16 @@ class TableCommand(GridCommand):
         # call base class init to fetch the table name
         super(TableCommand, self).__init__(**kwargs)
 
-    def get_sql(self, default_conn=None):
+    def get_sql(self, default_conn=None, columns=None, cell_length=0):
         """
         This method is used to create a proper SQL query
         to fetch the data for the specified table
+
+        Args:
+            default_conn: Connection object
+            columns: Columns to be fetched, the wide values truncated to
+                     cell_length characters (see get_columns())
+            cell_length: Number of the characters of the wide values
         """
 
         # Fetch the primary keys for the table
@@ -495,18 +506,80 @@ class TableCommand(GridCommand):
                 "/".join([self.sql_path, 'objectquery.sql']),
                 object_name=self.object_name,
                 nsp_name=self.nsp_name, limit=self.limit, has_oids=has_oids,
-                data_sorting=data_sorting
+                data_sorting=data_sorting, columns=columns,
+                cell_length=cell_length
             )
         else:
             sql = render_template(
                 "/".join([self.sql_path, 'objectquery.sql']),
                 object_name=self.object_name,
                 nsp_name=self.nsp_name, limit=self.limit, has_oids=has_oids,
-                sql_filter=sql_filter, data_sorting=data_sorting
+                sql_filter=sql_filter, data_sorting=data_sorting,
+                columns=columns, cell_length=cell_length
             )
 
         return sql
 
+    def get_columns(self, default_conn=None, primary_keys=None):
+        """
+        This function is used to fetch the columns of the table in their
+        order, and how View Data fetches their values:
+          'prefix' - the first characters of the wide values
+          'placeholder' - nothing, the values are shown as placeholders
+          None - the whole values
+
+        The values of the primary keys are always fetched whole, as the rows
+        are identified by them when edited, deleted, or when the whole value
+        of a cell is fetched.
+        """
+        driver = get_driver(PG_DEFAULT_DRIVER)
+        if default_conn is None:
+            manager = driver.connection_manager(self.sid)
+            conn = manager.connection(did=self.did, conn_id=self.conn_id)
+        else:
+            conn = default_conn
+
+        query = render_template(
+            "/".join([self.sql_path, 'get_columns.sql']),
+            obj_id=self.obj_id
+        )
+        status, result = conn.execute_dict(query)
+        if not status:
+            raise Exception(result)
+
+        columns = []
+        for row in result['rows']:
+            fetch = None
+            if row['attname'] in (primary_keys or ()):
+                # Primary keys are fetched whole
+                pass
+            elif row['typname'] in PREFIX_TYPES:
+                fetch = 'prefix'
+            elif row['typname'] in PLACEHOLDER_TYPES:
+                fetch = 'placeholder'
+
+            columns.append({
+                'name': row['attname'],
+                'type_code': row['atttypid'],
+                'fetch': fetch
+            })
+
+        return columns
+
+    def get_cell_sql(self, column, has_oids, primary_keys):
+        """
+        This function returns the SQL query fetching the whole value of the
+        cell of the row identified by its primary keys (or OID).
+        """
+        return render_template(
+            "/".join([self.sql_path, 'cell.sql']),
+            object_name=self.object_name,
+            nsp_name=self.nsp_name,
+            column=column,
+            has_oids=has_oids,
+            primary_keys=primary_keys
+        )
+
     def get_primary_keys(self, default_conn=None):
         """
         This function is used to fetch the primary key columns.
@@ -114,6 +114,7 @@ define('tools.querytool', [
       'click #btn-auto-rollback': 'on_auto_rollback',
       'click #btn-clear-history': 'on_clear_history',
       'click .noclose': 'do_not_close_menu',
+      'click #btn-execute-script': 'on_execute_script',
       'click #btn-explain': 'on_explain',
       'click #btn-explain-analyze': 'on_explain_analyze',
       'click #btn-explain-verbose': 'on_explain_verbose',
@@ -743,6 +744,9 @@ define('tools.querytool', [
       // To store primary keys before they gets changed
       self.handler.primary_keys_data = {};
 
+      // To store the fields of the rows having the values truncated
+      self.handler.truncated_cells = {};
+
       self.client_primary_key = client_primary_key;
 
       self.client_primary_key_counter = 0;
@@ -1011,6 +1015,15 @@ define('tools.querytool', [
           return false;
         }
 
+        // Fetch the whole value before opening it in the editor
+        if (self.is_truncated(args.item, args.column.field)) {
+          self.fetch_cell(args.item, args.column.field, function() {
+            grid.setActiveCell(args.row, args.cell);
+            grid.editActiveCell();
+          });
+          return false;
+        }
+
         var before_data = args.item;
 
         // If newly added row is saved but grid is not refreshed,
@@ -1199,10 +1212,77 @@ define('tools.querytool', [
         }
 
         item[self.client_primary_key] = (self.client_primary_key_counter++).toString();
+        self.mark_truncated_cells(item);
         collection[i] = item;
       }
       dataView.setItems(collection, self.client_primary_key);
     },
+
+    // Remember the fields of the row having the values fetched truncated
+    mark_truncated_cells: function(item) {
+      var handler = this.handler,
+        fields = _.filter(handler.truncated_columns, function(name) {
+          return _.isString(item[name]) &&
+            item[name].length > handler.cell_length;
+        });
+
+      if (fields.length > 0) {
+        handler.truncated_cells[item[this.client_primary_key]] = fields;
+      }
+    },
+
+    is_truncated: function(item, field) {
+      var fields = this.handler.truncated_cells[item[this.client_primary_key]];
+      return _.contains(fields, field);
+    },
+
+    // Fetch the whole value of the cell fetched truncated
+    fetch_cell: function(item, field, cb) {
+      var self = this,
+        _pk = item[self.client_primary_key],
+        keys = self.handler.primary_keys_data[_pk];
+
+      // Identify the row using its keys before they got modified
+      if (_.isUndefined(keys)) {
+        keys = {};
+        _.each(self.handler.primary_keys, function(value, key) {
+          keys[key] = item[key];
+        });
+      }
+
+      self.handler.trigger(
+        'pgadmin-sqleditor:loading-icon:show',
+        gettext('Fetching the value...')
+      );
+
+      $.ajax({
+        url: url_for('sqleditor.fetch_cell', {
+          'trans_id': self.transId,
+        }),
+        method: 'POST',
+        contentType: 'application/json',
+        data: JSON.stringify({
+          'column': field,
+          'keys': keys,
+        }),
+      })
+        .done(function(res) {
+          self.handler.trigger('pgadmin-sqleditor:loading-icon:hide');
+          item[field] = res.data.value;
+          self.handler.truncated_cells[_pk] = _.without(
+            self.handler.truncated_cells[_pk], field
+          );
+          self.dataView.updateItem(_pk, item);
+          cb();
+        })
+        .fail(function(e) {
+          self.handler.trigger('pgadmin-sqleditor:loading-icon:hide');
+          let msg = httpErrorHandler.handleQueryToolAjaxError(
+            pgAdmin, self, e, null, [], false
+          );
+          self.update_msg_history(false, msg);
+        });
+    },
     fetch_next_all: function(cb) {
       this.fetch_next(true, cb);
     },
@@ -1275,6 +1355,7 @@ define('tools.querytool', [
         }
 
         item[this.client_primary_key] = (this.client_primary_key_counter++).toString();
+        this.mark_truncated_cells(item);
         this.dataView.addItem(item);
       }
 
@@ -1608,6 +1689,14 @@ define('tools.querytool', [
       queryToolActions.executeQuery(this.handler);
     },
 
+    // Callback function for the execute as script menu click.
+    on_execute_script: function(event) {
+      this._stopEventPropogation(event);
+      this._closeDropDown(event);
+
+      queryToolActions.executeScript(this.handler);
+    },
+
     // Callback function for the cancel query button click.
     on_cancel_query: function() {
       var self = this;
@@ -2354,6 +2443,9 @@ define('tools.querytool', [
         self.changedModels = [];
         self.has_oids = data.has_oids;
         self.oids = data.oids;
+        // Columns whose values are fetched truncated to cell_length characters
+        self.truncated_columns = data.truncated_columns || [];
+        self.cell_length = data.cell_length;
         $('.sql-editor-explain').empty();
 
         /* If object don't have primary keys then set the
@@ -2422,6 +2514,11 @@ define('tools.querytool', [
               _msg = data.additional_messages + '\n' + _msg;
             }
 
+            // Summary of the plan of EXPLAIN, computed by the server
+            if (data.explain_summary) {
+              _msg = _msg + '\n\n' + data.explain_summary.report;
+            }
+
             self.update_msg_history(true, _msg, false);
 
             /* Add the data to the collection and render the grid.
@@ -3441,6 +3538,17 @@ define('tools.querytool', [
           }
         }
 
+        // The values fetched truncated would be pasted truncated
+        if (_.some(copied_rows, function(row) {
+          return !_.isEmpty(self.truncated_cells[row[self.client_primary_key]]);
+        })) {
+          alertify.alert(
+            gettext('Paste error'),
+            gettext('The rows cannot be pasted, as some of their values were fetched truncated. Open these values in the editor to fetch them.')
+          );
+          return;
+        }
+
         rows = rows.length == 0 ? self.last_copied_rows : rows;
 
         self.last_copied_rows = rows;
@@ -3580,7 +3688,7 @@ define('tools.querytool', [
 
       // This function will fetch the sql query from the text box
       // and execute the query.
-      execute: function(explain_prefix, shouldReconnect=false) {
+      execute: function(explain_prefix, shouldReconnect=false, script=false) {
         var self = this,
           sql = '';
 
@@ -3601,7 +3709,7 @@ define('tools.querytool', [
         }
 
         const executeQuery = new ExecuteQuery.ExecuteQuery(this, pgAdmin.Browser.UserManagement);
-        executeQuery.execute(sql, explain_prefix, shouldReconnect);
+        executeQuery.execute(sql, explain_prefix, shouldReconnect, script);
       },
 
       /* This function is used to highlight the error line and
@@ -1,9 +1,10 @@
 {# ============= Fetch the columns ============= #}
 {% if obj_id %}
-SELECT at.attname, ty.typname
+SELECT at.attname, ty.typname, at.atttypid
     FROM pg_attribute at
     LEFT JOIN pg_type ty ON (ty.oid = at.atttypid)
 WHERE attrelid={{obj_id}}::oid
     AND at.attnum > 0
     AND at.attisdropped = FALSE
+ORDER BY at.attnum
 {% endif %}
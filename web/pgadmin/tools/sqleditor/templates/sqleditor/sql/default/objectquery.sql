@@ -1,11 +1,15 @@
 {# SQL query for objects #}
-SELECT {% if has_oids %}oid, {% endif %}* FROM {{ conn|qtIdent(nsp_name, object_name) }}
+SELECT {% if has_oids %}oid, {% endif %}{% if columns %}{% for col in columns %}{% if not loop.first %}, {% endif %}
+{% if col.fetch == 'prefix' %}
+pg_catalog.left({{ conn|qtIdent(col.name) }}::text, {{ cell_length + 1 }}) AS {{ conn|qtIdent(col.name) }}{% elif col.fetch == 'placeholder' %}
+pg_catalog.substring({{ conn|qtIdent(col.name) }}, 1, 0) AS {{ conn|qtIdent(col.name) }}{% else %}
+{{ conn|qtIdent(col.name) }}{% endif %}{% endfor %}{% else %}*{% endif %} FROM {{ conn|qtIdent(nsp_name, object_name) }}
 {% if sql_filter %}
 WHERE {{ sql_filter }}
 {% endif %}
 {% if data_sorting and data_sorting|length > 0 %}
 ORDER BY {% for obj in data_sorting %}
-{{ conn|qtIdent(obj.name) }} {{ obj.order|upper }}{% if not loop.last %}, {% else %} {% endif %}
+{% if columns %}{{ conn|qtIdent(nsp_name, object_name, obj.name) }}{% else %}{{ conn|qtIdent(obj.name) }}{% endif %} {{ obj.order|upper }}{% if not loop.last %}, {% else %} {% endif %}
 {% endfor %}
 {% endif %}
 {% if limit > 0 %}
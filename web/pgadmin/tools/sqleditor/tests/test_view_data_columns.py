@@ -0,0 +1,77 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import sys
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.tools.sqleditor.command import TableCommand
+try:
+    from collections import OrderedDict
+except ImportError:
+    from ordereddict import OrderedDict
+
+if sys.version_info < (3, 3):
+    from mock import MagicMock
+else:
+    from unittest.mock import MagicMock
+
+
+def _column(name, typname, typid):
+    return {'attname': name, 'typname': typname, 'atttypid': typid}
+
+
+class TestViewDataColumns(BaseTestGenerator):
+    """
+    This class validates how View Data fetches the values of the columns,
+    the primary keys being always fetched whole.
+    """
+    scenarios = [
+        (
+            'When the table has an integer primary key',
+            dict(
+                rows=[
+                    _column('id', 'int4', 23),
+                    _column('doc', 'text', 25),
+                    _column('img', 'bytea', 17)
+                ],
+                primary_keys=OrderedDict([('id', 'int4')]),
+                expected={'id': None, 'doc': 'prefix', 'img': 'placeholder'}
+            )),
+        (
+            'When the table has a text primary key',
+            dict(
+                rows=[
+                    _column('code', 'text', 25),
+                    _column('name', 'varchar', 1043),
+                    _column('doc', 'text', 25)
+                ],
+                primary_keys=OrderedDict([('code', 'text'),
+                                          ('name', 'varchar')]),
+                expected={'code': None, 'name': None, 'doc': 'prefix'}
+            ))
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        conn = MagicMock()
+        conn.execute_dict.return_value = (True, {'rows': self.rows})
+
+        command = TableCommand.__new__(TableCommand)
+        command.sql_path = 'sqleditor/sql/default'
+        command.obj_id = 1
+
+        with self.app.app_context():
+            columns = command.get_columns(conn, self.primary_keys)
+
+        self.assertEqual(
+            dict((col['name'], col['fetch']) for col in columns),
+            self.expected
+        )
@@ -0,0 +1,135 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+import re
+
+from flask import render_template
+
+from pgadmin.utils.route import BaseTestGenerator
+from pgadmin.tools.sqleditor.tests.test_view_data_templates import FakeApp
+try:
+    from collections import OrderedDict
+except ImportError:
+    from ordereddict import OrderedDict
+
+COLUMNS = [
+    dict(name='id', type_code=23, fetch=None),
+    dict(name='doc', type_code=3802, fetch='prefix'),
+    dict(name='img', type_code=17, fetch='placeholder')
+]
+
+
+class TestViewDataTruncatedTemplates(BaseTestGenerator):
+    """
+    This class validates the template queries fetching the wide values
+    truncated, and the whole value of a cell.
+    """
+    scenarios = [
+        (
+            'When selecting the whole values',
+            dict(
+                template_path='sqleditor/sql/default/objectquery.sql',
+                parameters=dict(
+                    object_name='test_table',
+                    nsp_name='test_schema',
+                    has_oids=False,
+                    limit=100,
+                    data_sorting=[dict(name='doc', order='asc')]
+                ),
+                expected_return_value='SELECT * FROM test_schema.test_table '
+                                      'ORDER BY doc ASC LIMIT 100'
+            )),
+        (
+            'When selecting the wide values truncated',
+            dict(
+                template_path='sqleditor/sql/default/objectquery.sql',
+                parameters=dict(
+                    object_name='test_table',
+                    nsp_name='test_schema',
+                    has_oids=True,
+                    limit=100,
+                    columns=COLUMNS,
+                    cell_length=1024,
+                    sql_filter='id > 10',
+                    data_sorting=[dict(name='doc', order='asc')]
+                ),
+                expected_return_value='SELECT oid, id, '
+                                      'pg_catalog.left(doc::text, 1025) '
+                                      'AS doc, '
+                                      'pg_catalog.substring(img, 1, 0) '
+                                      'AS img FROM test_schema.test_table '
+                                      'WHERE id > 10 '
+                                      'ORDER BY test_schema.test_table.doc '
+                                      'ASC LIMIT 100'
+            )),
+        (
+            'When selecting the wide values with a text primary key',
+            dict(
+                template_path='sqleditor/sql/default/objectquery.sql',
+                parameters=dict(
+                    object_name='test_table',
+                    nsp_name='test_schema',
+                    has_oids=False,
+                    limit=100,
+                    columns=[
+                        dict(name='code', type_code=25, fetch=None),
+                        dict(name='doc', type_code=25, fetch='prefix')
+                    ],
+                    cell_length=1024,
+                    data_sorting=[dict(name='code', order='asc')]
+                ),
+                expected_return_value='SELECT code, '
+                                      'pg_catalog.left(doc::text, 1025) '
+                                      'AS doc FROM test_schema.test_table '
+                                      'ORDER BY test_schema.test_table.code '
+                                      'ASC LIMIT 100'
+            )),
+        (
+            'When selecting the cell with PK',
+            dict(
+                template_path='sqleditor/sql/default/cell.sql',
+                parameters=dict(
+                    object_name='test_table',
+                    nsp_name='test_schema',
+                    column='doc',
+                    has_oids=False,
+                    primary_keys=OrderedDict([('id', 'int4'),
+                                              ('text', 'text')])
+                ),
+                expected_return_value='SELECT doc FROM '
+                                      'test_schema.test_table WHERE '
+                                      'id = %(id)s AND text = %(text)s ;'
+            )),
+        (
+            'When selecting the cell with OID',
+            dict(
+                template_path='sqleditor/sql/default/cell.sql',
+                parameters=dict(
+                    object_name='test_table',
+                    nsp_name='test_schema',
+                    column='doc',
+                    has_oids=True,
+                    primary_keys=OrderedDict()
+                ),
+                expected_return_value='SELECT doc FROM '
+                                      'test_schema.test_table WHERE '
+                                      'oid = %(oid)s ;'
+            ))
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        with FakeApp().app_context():
+            result = render_template(self.template_path, **self.parameters)
+            self.assertEqual(
+                re.sub(' +', ' ', str(result).replace("\n", " ")).strip(),
+                self.expected_return_value
+            )
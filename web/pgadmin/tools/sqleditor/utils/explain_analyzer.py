@@ -0,0 +1,254 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""Analyze the JSON plan of EXPLAIN, to summarize where the time went."""
+
+import json
+
+from flask_babelex import gettext
+
+# Rows read by a sequential scan beyond which it is reported
+SEQ_SCAN_ROWS = 100000
+
+# Outer rows of a nested loop beyond which it is reported
+NESTED_LOOP_ROWS = 10000
+
+# Factor between the estimated and the actual rows beyond which it is
+# reported
+MISESTIMATE_FACTOR = 10
+
+# Number of the nodes ranked in the summary
+HOTSPOT_COUNT = 5
+
+
+def parse_plan(value):
+    """
+    Returns the plan in the JSON output of EXPLAIN (as text or parsed), or
+    None if it is not one.
+    """
+    if not isinstance(value, list):
+        try:
+            value = json.loads(value)
+        except (TypeError, ValueError):
+            return None
+
+    if isinstance(value, list) and len(value) == 1 and \
+            isinstance(value[0], dict) and \
+            isinstance(value[0].get('Plan', None), dict):
+        return value[0]
+    return None
+
+
+def _exclusive(plan, children, key):
+    value = plan.get(key, None)
+    if value is None:
+        return None
+    return max(value - sum(c.get(key, 0) for c in children), 0)
+
+
+def _describe(plan):
+    description = plan['Node Type']
+    if 'Relation Name' in plan:
+        description += ' on {0}'.format(plan['Relation Name'])
+        if plan.get('Alias', plan['Relation Name']) != plan['Relation Name']:
+            description += ' {0}'.format(plan['Alias'])
+    elif 'CTE Name' in plan:
+        description += ' on {0}'.format(plan['CTE Name'])
+    if 'Index Name' in plan:
+        description += ' using {0}'.format(plan['Index Name'])
+    return description
+
+
+def _flags(plan, node, children):
+    flags = []
+    analyzed = node['actual_rows'] is not None
+
+    if plan['Node Type'] == 'Seq Scan':
+        if analyzed:
+            rows = (plan['Actual Rows'] +
+                    plan.get('Rows Removed by Filter', 0)) * node['loops']
+        else:
+            rows = plan.get('Plan Rows', 0)
+        if rows >= SEQ_SCAN_ROWS:
+            flags.append(gettext(
+                'Sequential scan reading {0} rows.').format(int(rows)))
+
+    if plan['Node Type'] == 'Nested Loop':
+        outer = [c for c in children
+                 if c.get('Parent Relationship', None) == 'Outer']
+        if outer:
+            rows = outer[0].get('Actual Rows', outer[0].get('Plan Rows', 0))
+            rows *= outer[0].get('Actual Loops', 1)
+            if rows >= NESTED_LOOP_ROWS:
+                flags.append(gettext(
+                    'Nested loop over {0} outer rows.').format(int(rows)))
+
+    if plan.get('Sort Space Type', None) == 'Disk' or \
+            'external' in plan.get('Sort Method', ''):
+        flags.append(gettext('Sort spilled to disk ({0} kB).').format(
+            plan.get('Sort Space Used', 0)))
+
+    if plan.get('Hash Batches', 1) > 1:
+        flags.append(gettext(
+            'Hash spilled to disk in {0} batches.').format(
+            plan['Hash Batches']))
+
+    if node['temp_written_blocks']:
+        flags.append(gettext('Wrote {0} temporary blocks.').format(
+            node['temp_written_blocks']))
+
+    if node['misestimate'] is not None and \
+            node['misestimate'] >= MISESTIMATE_FACTOR:
+        flags.append(gettext(
+            'Rows misestimated by {0:.0f}x (estimated {1}, actual {2}).'
+        ).format(
+            node['misestimate'], plan['Plan Rows'], plan['Actual Rows']
+        ))
+
+    return flags
+
+
+def _walk(plan, parent, path, parallelism, nodes):
+    children = plan.get('Plans', [])
+    node = {
+        'id': len(nodes) + 1,
+        'parent': parent,
+        # Position of the node in the tree (i.e. to match it across plans)
+        'path': path,
+        'depth': path.count('.'),
+        'node_type': plan['Node Type'],
+        'description': _describe(plan),
+        'loops': plan.get('Actual Loops', 1),
+        'cost': plan.get('Total Cost', None),
+        'plan_rows': plan.get('Plan Rows', None),
+        'actual_rows': None,
+        'misestimate': None,
+        'hit_ratio': None,
+        'temp_written_blocks': _exclusive(
+            plan, children, 'Temp Written Blocks'),
+        'time': None,
+        'exclusive_time': None
+    }
+    nodes.append(node)
+
+    # The costs are estimated per execution of the node
+    if node['cost'] is not None:
+        node['cost'] = node['cost'] * node['loops']
+
+    if 'Actual Rows' in plan:
+        node['actual_rows'] = plan['Actual Rows'] * node['loops']
+        if node['loops']:
+            actual = max(plan['Actual Rows'], 1)
+            estimated = max(plan.get('Plan Rows', 1), 1)
+            node['misestimate'] = max(actual, estimated) / \
+                float(min(actual, estimated))
+
+    hit = _exclusive(plan, children, 'Shared Hit Blocks')
+    read = _exclusive(plan, children, 'Shared Read Blocks')
+    if hit or read:
+        node['hit_ratio'] = float(hit) / (hit + read)
+
+    # The time of the nodes run by the parallel workers is averaged over
+    # the leader and the workers.
+    if 'Actual Total Time' in plan:
+        node['time'] = plan['Actual Total Time'] * node['loops'] / \
+            parallelism
+    if plan.get('Workers Launched', None) is not None:
+        parallelism = plan['Workers Launched'] + 1
+
+    children_nodes = [
+        _walk(child, node['id'], '{0}.{1}'.format(path, idx), parallelism,
+              nodes)
+        for idx, child in enumerate(children)
+    ]
+
+    if node['time'] is not None:
+        node['exclusive_time'] = max(
+            node['time'] - sum(c['time'] or 0 for c in children_nodes), 0
+        )
+    node['exclusive_cost'] = None
+    if node['cost'] is not None:
+        node['exclusive_cost'] = max(
+            node['cost'] - sum(c['cost'] or 0 for c in children_nodes), 0
+        )
+    node['flags'] = _flags(plan, node, children)
+
+    return node
+
+
+def analyze_plan(explain):
+    """
+    Computes the exclusive time, the row misestimation factor, the buffer
+    hit ratio and the cost (multiplied by the loops) of each node of the
+    plan, and ranks the nodes by their exclusive time (or cost, if the
+    query was not analyzed), flagging the typical problems.
+    """
+    nodes = []
+    root = _walk(explain['Plan'], None, '0', 1, nodes)
+    analyzed = root['exclusive_time'] is not None
+    key = 'exclusive_time' if analyzed else 'exclusive_cost'
+    total = root['time'] if analyzed else root['cost']
+
+    hotspots = []
+    for node in sorted(nodes, key=lambda n: n[key] or 0, reverse=True):
+        if len(hotspots) == HOTSPOT_COUNT or not node[key]:
+            break
+        hotspots.append({
+            'id': node['id'],
+            'percent': round(100.0 * node[key] / total, 1) if total else 0
+        })
+
+    issues = [
+        {'id': node['id'], 'message': flag}
+        for node in nodes for flag in node['flags']
+    ]
+
+    summary = {
+        'analyzed': analyzed,
+        'planning_time': explain.get('Planning Time', None),
+        'execution_time': explain.get('Execution Time', None),
+        'total': total,
+        'nodes': nodes,
+        'hotspots': hotspots,
+        'issues': issues
+    }
+    summary['report'] = format_summary(summary)
+    return summary
+
+
+def format_summary(summary):
+    """Returns the text of the summary of the plan."""
+    nodes = summary['nodes']
+    if summary['analyzed']:
+        lines = [gettext('Where did the time go ({0:.3f} ms):').format(
+            summary['total'])]
+    else:
+        lines = [gettext('Where would the cost go ({0:.2f}):').format(
+            summary['total'] or 0)]
+
+    for hotspot in summary['hotspots']:
+        node = nodes[hotspot['id'] - 1]
+        lines.append(u'{0:>7.1f}%  {1:>12}  #{2} {3}'.format(
+            hotspot['percent'],
+            '{0:.3f} ms'.format(node['exclusive_time'])
+            if summary['analyzed'] else
+            '{0:.2f}'.format(node['exclusive_cost']),
+            node['id'], node['description']
+        ))
+
+    if summary['issues']:
+        lines.append('')
+        lines.append(gettext('Possible problems:'))
+        for issue in summary['issues']:
+            lines.append(u'  #{0} {1}: {2}'.format(
+                issue['id'], nodes[issue['id'] - 1]['description'],
+                issue['message']
+            ))
+
+    return u'\n'.join(lines)
@@ -0,0 +1,183 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""Compare the plans of EXPLAIN of a query, to find its regressions."""
+
+from flask_babelex import gettext
+
+# Keys of the nodes of the plans saved with the query history
+PLAN_NODE_KEYS = (
+    'path', 'node_type', 'description', 'loops', 'cost', 'plan_rows',
+    'actual_rows', 'misestimate', 'time', 'exclusive_time'
+)
+
+# Ratio of the new time (or cost) to the old one, beyond which the plan is
+# reported as regressed
+REGRESSION_FACTOR = 1.2
+
+# Ratio between the misestimation factors of a node in both plans, beyond
+# which its estimate is reported as drifting
+DRIFT_FACTOR = 2
+
+
+def normalize_plan(summary):
+    """
+    Returns the plan analyzed by analyze_plan, without the details which
+    are not compared, to be saved with the query history.
+    """
+    return {
+        'analyzed': summary['analyzed'],
+        'planning_time': summary['planning_time'],
+        'execution_time': summary['execution_time'],
+        'total': summary['total'],
+        'nodes': [
+            dict((key, node[key]) for key in PLAN_NODE_KEYS)
+            for node in summary['nodes']
+        ]
+    }
+
+
+def _delta(old, new):
+    if old is None or new is None:
+        return None
+    return new - old
+
+
+def _change(old, new, unit):
+    if old is None or new is None:
+        return gettext('n/a')
+    text = u'{0:.3f}{2} -> {1:.3f}{2}'.format(old, new, unit)
+    if old:
+        text += u' ({0:+.1f}%)'.format(100.0 * (new - old) / old)
+    return text
+
+
+def _path_key(path):
+    return [int(idx) for idx in path.split('.')]
+
+
+def compare_plans(old, new):
+    """
+    Compares the nodes of two normalized plans of a query, matched by their
+    position in the plans, to find the changed nodes, and their cost and
+    time deltas and estimate drifts.
+    """
+    old_nodes = dict((node['path'], node) for node in old['nodes'])
+    new_nodes = dict((node['path'], node) for node in new['nodes'])
+
+    nodes = []
+    for path in sorted(set(old_nodes) | set(new_nodes), key=_path_key):
+        old_node = old_nodes.get(path, None)
+        new_node = new_nodes.get(path, None)
+        if old_node is None:
+            change = 'added'
+        elif new_node is None:
+            change = 'removed'
+        elif old_node['description'] != new_node['description']:
+            change = 'changed'
+        else:
+            change = None
+
+        old_node = old_node or {}
+        new_node = new_node or {}
+        nodes.append({
+            'path': path,
+            'change': change,
+            'old': old_node.get('description', None),
+            'new': new_node.get('description', None),
+            'cost_delta': _delta(
+                old_node.get('cost', None), new_node.get('cost', None)),
+            'time_delta': _delta(
+                old_node.get('exclusive_time', None),
+                new_node.get('exclusive_time', None)),
+            'old_misestimate': old_node.get('misestimate', None),
+            'new_misestimate': new_node.get('misestimate', None)
+        })
+
+    # Compare the time, if both plans were analyzed
+    if old['analyzed'] and new['analyzed']:
+        old_total = old['execution_time'] or old['total']
+        new_total = new['execution_time'] or new['total']
+    else:
+        old_total = old['nodes'][0]['cost']
+        new_total = new['nodes'][0]['cost']
+
+    comparison = {
+        'analyzed': old['analyzed'] and new['analyzed'],
+        'old_total': old_total,
+        'new_total': new_total,
+        'regressed': bool(
+            old_total is not None and new_total is not None and
+            new_total > old_total * REGRESSION_FACTOR
+        ),
+        'nodes': nodes
+    }
+    comparison['report'] = format_comparison(comparison)
+    return comparison
+
+
+def format_comparison(comparison):
+    """Returns the text of the comparison of the plans."""
+    nodes = comparison['nodes']
+    if comparison['analyzed']:
+        lines = [gettext('Execution time: {0}').format(_change(
+            comparison['old_total'], comparison['new_total'], ' ms'))]
+    else:
+        lines = [gettext('Cost: {0}').format(_change(
+            comparison['old_total'], comparison['new_total'], ''))]
+    if comparison['regressed']:
+        lines.append(gettext('The query regressed.'))
+
+    changes = [node for node in nodes if node['change']]
+    if changes:
+        lines.append('')
+        lines.append(gettext('Plan changes:'))
+        for node in changes:
+            if node['change'] == 'added':
+                lines.append(u'  {0} + {1}'.format(node['path'], node['new']))
+            elif node['change'] == 'removed':
+                lines.append(u'  {0} - {1}'.format(node['path'], node['old']))
+            else:
+                lines.append(u'  {0} {1} -> {2}'.format(
+                    node['path'], node['old'], node['new']))
+
+    key = 'time_delta' if comparison['analyzed'] else 'cost_delta'
+    deltas = sorted(
+        [node for node in nodes if not node['change'] and node[key]],
+        key=lambda node: abs(node[key]), reverse=True
+    )
+    if deltas:
+        lines.append('')
+        lines.append(gettext('Time deltas:') if comparison['analyzed']
+                     else gettext('Cost deltas:'))
+        for node in deltas:
+            lines.append(u'  {0:>+12.3f}  {1} {2}'.format(
+                node[key], node['path'], node['new']))
+
+    drifts = [
+        node for node in nodes
+        if node['old_misestimate'] and node['new_misestimate'] and (
+            node['new_misestimate'] >= node['old_misestimate'] *
+            DRIFT_FACTOR or
+            node['old_misestimate'] >= node['new_misestimate'] *
+            DRIFT_FACTOR
+        )
+    ]
+    if drifts:
+        lines.append('')
+        lines.append(gettext('Estimate drift:'))
+        for node in drifts:
+            lines.append(gettext(
+                '  {0} {1}: rows misestimated by {2:.0f}x -> {3:.0f}x'
+            ).format(
+                node['path'], node['new'], node['old_misestimate'],
+                node['new_misestimate']
+            ))
+
+    return u'\n'.join(lines)
@@ -1,5 +1,9 @@
+import simplejson as json
+from flask_babelex import gettext
+
 from pgadmin.utils.ajax import make_json_response
 from pgadmin.model import db, QueryHistoryModel
+from pgadmin.tools.sqleditor.utils.plan_comparison import compare_plans
 from config import MAX_QUERY_HIST_STORED
 
 
@@ -38,8 +42,16 @@ class QueryHistory:
             # do not affect query execution if history clear fails
 
     @staticmethod
-    def save(uid, sid, dbname, request):
+    def save(uid, sid, dbname, request, plan=None):
         try:
+            query_info = request.data
+            # Save the plan of EXPLAIN with the query, to compare it with the
+            # next ones.
+            if plan is not None:
+                query_info = json.loads(request.data, encoding='utf-8')
+                query_info['plan'] = plan
+                query_info = json.dumps(query_info)
+
             max_srno = db.session\
                 .query(db.func.max(QueryHistoryModel.srno)) \
                 .filter(QueryHistoryModel.uid == uid,
@@ -88,7 +100,7 @@ class QueryHistory:
 
             history_entry = QueryHistoryModel(
                 srno=new_srno, uid=uid, sid=sid, dbname=dbname,
-                query_info=request.data, last_updated_flag='Y')
+                query_info=query_info, last_updated_flag='Y')
 
             db.session.merge(history_entry)
 
@@ -104,6 +116,62 @@ class QueryHistory:
             }
         )
 
+    @staticmethod
+    def compare(uid, sid, dbname, query, first=None, second=None):
+        """
+        Compares the plans saved with the history of the given query (the
+        latest two, unless the start times of their entries are given).
+        """
+        result = db.session \
+            .query(QueryHistoryModel.query_info) \
+            .filter(QueryHistoryModel.uid == uid,
+                    QueryHistoryModel.sid == sid,
+                    QueryHistoryModel.dbname == dbname) \
+            .all()
+
+        # The same query may be formatted differently
+        query = ' '.join(query.split())
+        entries = []
+        for rec in result:
+            try:
+                info = json.loads(rec.query_info, encoding='utf-8')
+            except ValueError:
+                continue
+            if info.get('plan', None) and \
+                    ' '.join(info.get('query', '').split()) == query:
+                entries.append(info)
+        entries.sort(key=lambda info: info.get('start_time', ''))
+
+        if first is not None or second is not None:
+            entries = [
+                info for start_time in (first, second) for info in entries
+                if info.get('start_time', None) == start_time
+            ]
+
+        if len(entries) < 2:
+            return make_json_response(
+                data={
+                    'status': False,
+                    'msg': gettext(
+                        'At least two plans of the query are required in '
+                        'the history.'),
+                    'result': None
+                }
+            )
+
+        old, new = entries[-2:]
+        comparison = compare_plans(old['plan'], new['plan'])
+        comparison['old_start_time'] = old.get('start_time', None)
+        comparison['new_start_time'] = new.get('start_time', None)
+
+        return make_json_response(
+            data={
+                'status': True,
+                'msg': '',
+                'result': comparison
+            }
+        )
+
     @staticmethod
     def clear_history(uid, sid, dbname=None):
         try:
@@ -252,6 +252,19 @@ def RegisterQueryToolPreferences(self):
         }
     )
 
+    self.view_data_cell_length = self.preference.register(
+        'Results_grid', 'view_data_cell_length',
+        gettext("View Data cell length"), 'integer', 1024,
+        category_label=gettext('Results grid'),
+        min_val=0,
+        max_val=1048576,
+        help_str=gettext(
+            'The number of the characters of the text, JSON and XML values '
+            'fetched by View Data. The whole value is fetched when the cell '
+            'is opened in its editor. A value of 0 fetches the whole values.'
+        )
+    )
+
     self.display_connection_status = self.preference.register(
         'display', 'connection_status',
         gettext("Connection status"), 'boolean', True,
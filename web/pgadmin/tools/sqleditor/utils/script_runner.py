@@ -0,0 +1,239 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""Run the statements of a script one by one, timing each of them."""
+
+import re
+import select
+import time
+
+from flask_babelex import gettext
+
+from pgadmin.tools.sqleditor.utils.constant_definition import ASYNC_OK, \
+    ASYNC_READ_TIMEOUT, ASYNC_WRITE_TIMEOUT, ASYNC_EXECUTION_ABORTED
+
+# Maximum time (in seconds) spent running the statements of a script in a
+# single poll request, before reporting the progress. The poll waits for the
+# statements meanwhile, and the client polls again right away.
+SCRIPT_POLL_TIME = 1
+
+# Number of rows kept from the result sets of the statements but the last
+# (whose result is shown in the data output)
+SCRIPT_PREVIEW_ROWS = 10
+
+# Matches the whitespace and the comments before a statement
+leading_regex = re.compile(r'(?:\s+|--[^\n]*|/\*[\s\S]*?\*/)*')
+
+
+def split_script(sql):
+    """
+    Splits the script into its statements, using the lexer of the
+    autocomplete (aware of the literals, the comments and the dollar quoted
+    strings), skipping the empty ones.
+
+    Returns the list of the statements with their line in the script.
+
+    >>> [s['line'] for s in split_script('select 1;\\n\\n-- x\\nselect 2;;')]
+    [1, 4]
+    """
+    # The parser of the autocomplete is imported on first use
+    from pgadmin.utils.sqlautocomplete.parseutils.utils import \
+        statement_ends
+
+    statements = []
+    start = 0
+    for end in list(statement_ends(sql)) + [len(sql)]:
+        match = leading_regex.match(sql, start)
+        statement = sql[match.end():end]
+        if statement.strip() not in ('', ';'):
+            statements.append({
+                'sql': statement,
+                'line': sql.count('\n', 0, match.end()) + 1
+            })
+        start = end
+    return statements
+
+
+def start_script(statements):
+    """Returns the state of the script to run in the session."""
+    return {
+        'statements': statements,
+        'index': 0,
+        'started': time.time(),
+        'results': [],
+        'finished': False
+    }
+
+
+def _preview(statement, limit=60):
+    statement = ' '.join(statement.split())
+    if len(statement) > limit:
+        return statement[:limit - 3] + '...'
+    return statement
+
+
+def _record(conn, script, ended, status_message, error=None, last=False):
+    statement = script['statements'][script['index']]
+    result = {
+        'line': statement['line'],
+        'statement': _preview(statement['sql']),
+        'duration': round((ended - script['started']) * 1000, 3),
+        'rows': conn.rows_affected() if error is None else None,
+        'status': status_message,
+        'notices': ''.join(conn.messages()),
+        'columns': None,
+        'preview': None,
+        'error': error
+    }
+
+    # The result of the last statement is fetched for the data output
+    columns = conn.get_column_info() if error is None else None
+    if columns and not last:
+        status, rows = conn.async_fetchmany_2darray(SCRIPT_PREVIEW_ROWS)
+        if status:
+            result['columns'] = [col['name'] for col in columns]
+            result['preview'] = [
+                ['' if v is None else u'{0}'.format(v) for v in row]
+                for row in (rows or [])
+            ]
+
+    script['results'].append(result)
+
+
+def _wait(conn, status, timeout):
+    """Waits (up to timeout seconds) for the statement being executed."""
+    if status == ASYNC_WRITE_TIMEOUT:
+        select.select([], [conn.fileno()], [], timeout)
+    else:
+        select.select([conn.fileno()], [], [], timeout)
+
+
+def poll_script(conn, script, time_slice=SCRIPT_POLL_TIME):
+    """
+    Waits for the statement of the script being executed, and executes the
+    next ones on the same connection as they complete, within the given time.
+
+    A statement found completed at the start of the poll, completed between
+    the polls - it is timed until the end of the previous poll (when it was
+    last seen running), hence - the time between the polls is not counted.
+
+    Returns the status and the result of the poll of the connection, the
+    status being ASYNC_OK once the last statement completes, and
+    ASYNC_READ_TIMEOUT while some statements are still to be run.
+    """
+    deadline = time.time() + time_slice
+    # Time the statement was last seen running, by the previous poll
+    seen = script.pop('seen', None)
+
+    while True:
+        status, result = conn.poll(
+            formatted_exception_msg=True, no_result=True)
+        now = time.time()
+        ended = now if seen is None else seen
+        seen = None
+
+        if not status or status == ASYNC_EXECUTION_ABORTED:
+            _record(conn, script, ended, None,
+                    error=result if not status else gettext('Cancelled'))
+            script['finished'] = True
+            return status, result
+
+        if status != ASYNC_OK:
+            if now >= deadline:
+                script['seen'] = now
+                return status, result
+            _wait(conn, status, deadline - now)
+            continue
+
+        last = script['index'] == len(script['statements']) - 1
+        _record(conn, script, ended, conn.status_message(), last=last)
+        if last:
+            script['finished'] = True
+            return status, result
+
+        script['index'] += 1
+        script['started'] = time.time()
+        status, result = conn.execute_async(
+            script['statements'][script['index']]['sql'])
+        if not status:
+            _record(conn, script, time.time(), None, error=result)
+            script['finished'] = True
+            return status, result
+
+        if time.time() >= deadline:
+            script['seen'] = time.time()
+            return ASYNC_READ_TIMEOUT, None
+
+
+def progress_message(script):
+    """Returns the message of the progress of the script."""
+    return gettext(
+        'Running statement {0} of {1} (line {2})...'
+    ).format(
+        script['index'] + 1, len(script['statements']),
+        script['statements'][script['index']]['line']
+    )
+
+
+def format_report(script):
+    """
+    Returns the profiling report of the script, with the duration, the rows
+    and the notices of each executed statement.
+    """
+    results = script['results']
+    lines = [
+        gettext(
+            'Script: {0} of {1} statements executed in {2:.3f} ms'
+        ).format(
+            len(results), len(script['statements']),
+            sum(r['duration'] for r in results)
+        ),
+        u'{0:>5}  {1:>6}  {2:>12}  {3:>8}  {4}'.format(
+            '#', gettext('Line'), gettext('Time (ms)'), gettext('Rows'),
+            gettext('Statement')
+        )
+    ]
+    for idx, r in enumerate(results, 1):
+        lines.append(u'{0:>5}  {1:>6}  {2:>12.3f}  {3:>8}  {4}'.format(
+            idx, r['line'], r['duration'],
+            '' if r['rows'] is None or r['rows'] < 0 else r['rows'],
+            r['statement']
+        ))
+        if r['status']:
+            lines.append(u'{0:29}{1}'.format('', r['status']))
+        if r['error']:
+            lines.append(u'{0:29}{1}'.format(
+                '', r['error'].strip().split('\n')[0]))
+
+    for idx, r in enumerate(results, 1):
+        if not (r['notices'] or r['columns']):
+            continue
+        lines.append('')
+        lines.append(gettext('Statement {0} (line {1}):').format(
+            idx, r['line']))
+        if r['notices']:
+            lines.append(r['notices'].rstrip('\n'))
+        if r['columns']:
+            lines.append(u'\t'.join(r['columns']))
+            for row in r['preview']:
+                lines.append(u'\t'.join(row))
+            if r['rows'] > len(r['preview']):
+                lines.append(gettext('({0} rows)').format(r['rows']))
+
+    slowest = sorted(
+        enumerate(results, 1), key=lambda r: r[1]['duration'], reverse=True
+    )[:3]
+    if len(results) > 1:
+        lines.append('')
+        lines.append(gettext('Slowest statements: {0}').format(', '.join(
+            u'#{0} ({1:.3f} ms)'.format(idx, r['duration'])
+            for idx, r in slowest
+        )))
+
+    return u'\n'.join(lines)
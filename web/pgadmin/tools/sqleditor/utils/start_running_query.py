@@ -11,16 +11,19 @@
 
 import pickle
 import random
+import time
 
 from flask import Response
 from flask_babelex import gettext
 
-from config import PG_DEFAULT_DRIVER
+from config import PG_DEFAULT_DRIVER, QUERY_TOOL_TYPECASTER_PROFILE
 from pgadmin.tools.sqleditor.utils.apply_explain_plan_wrapper import \
     apply_explain_plan_wrapper_if_needed
 from pgadmin.tools.sqleditor.utils.constant_definition import TX_STATUS_IDLE, \
     TX_STATUS_INERROR
 from pgadmin.tools.sqleditor.utils.is_begin_required import is_begin_required
+from pgadmin.tools.sqleditor.utils.script_runner import split_script, \
+    start_script
 from pgadmin.tools.sqleditor.utils.update_session_grid_transaction import \
     update_session_grid_transaction
 from pgadmin.utils.ajax import make_json_response, internal_server_error
@@ -63,7 +66,10 @@ class StartRunningQuery:
                                           conn_id=self.connection_id,
                                           auto_reconnect=False,
                                           use_binary_placeholder=True,
-                                          array_to_string=True)
+                                          array_to_string=True,
+                                          typecaster_profile=(
+                                              QUERY_TOOL_TYPECASTER_PROFILE
+                                          ))
             except (ConnectionLost, SSHTunnelConnectionLost, CryptKeyMissing):
                 raise
             except Exception as e:
@@ -80,12 +86,21 @@ class StartRunningQuery:
             effective_sql_statement = apply_explain_plan_wrapper_if_needed(
                 manager, sql)
 
+            # Run the statements of a script one by one (the next ones are
+            # executed as they complete when polled), to time each of them.
+            script = None
+            if sql.get('script') and not sql.get('explain_plan'):
+                statements = split_script(effective_sql_statement)
+                if len(statements) > 1:
+                    script = start_script(statements)
+
             result, status = self.__execute_query(
                 conn,
                 session_obj,
                 effective_sql_statement,
                 trans_id,
-                transaction_object
+                transaction_object,
+                script
             )
 
             can_edit = transaction_object.can_edit()
@@ -115,10 +130,13 @@ class StartRunningQuery:
         if conn_id is not None:
             self.connection_id = conn_id
 
-    def __execute_query(self, conn, session_obj, sql, trans_id, trans_obj):
+    def __execute_query(self, conn, session_obj, sql, trans_id, trans_obj,
+                        script=None):
         # on successful connection set the connection id to the
         # transaction object
         trans_obj.set_connection_id(self.connection_id)
+        session_obj.pop('script', None)
+        session_obj.pop('last_plan', None)
 
         StartRunningQuery.save_transaction_in_session(session_obj,
                                                       trans_id, trans_obj)
@@ -134,10 +152,27 @@ class StartRunningQuery:
         # Execute sql asynchronously with params is None
         # and formatted_error is True.
         try:
-            status, result = conn.execute_async(sql)
+            if script is not None:
+                script['started'] = time.time()
+                status, result = conn.execute_async(
+                    script['statements'][0]['sql'])
+            else:
+                status, result = conn.execute_async(sql)
         except (ConnectionLost, SSHTunnelConnectionLost, CryptKeyMissing):
             raise
 
+        if status:
+            if script is not None:
+                session_obj['script'] = script
+            # Count the keywords and names used in the transaction (while the
+            # query runs), to prioritize them in the autocomplete suggestions.
+            from pgadmin.utils.sqlautocomplete.prioritization import \
+                PrevalenceCounter
+            PrevalenceCounter(
+                session_obj.setdefault('prevalence', dict())
+            ).update(sql)
+            update_session_grid_transaction(trans_id, session_obj)
+
         # If the transaction aborted for some reason and
         # Auto RollBack is True then issue a rollback to cleanup.
         if StartRunningQuery.is_rollback_statement_required(trans_obj,
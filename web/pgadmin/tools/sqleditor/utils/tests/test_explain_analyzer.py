@@ -0,0 +1,134 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""Analyze the JSON plan of EXPLAIN."""
+import json
+
+from pgadmin.tools.sqleditor.utils.explain_analyzer import parse_plan, \
+    analyze_plan
+from pgadmin.utils.route import BaseTestGenerator
+
+
+ANALYZED_PLAN = [{
+    'Plan': {
+        'Node Type': 'Sort', 'Total Cost': 5000.0, 'Plan Rows': 10,
+        'Actual Total Time': 100.0, 'Actual Rows': 2000, 'Actual Loops': 1,
+        'Sort Method': 'external merge', 'Sort Space Type': 'Disk',
+        'Sort Space Used': 1024, 'Shared Hit Blocks': 100,
+        'Shared Read Blocks': 100, 'Temp Written Blocks': 128,
+        'Plans': [{
+            'Node Type': 'Nested Loop', 'Parent Relationship': 'Outer',
+            'Total Cost': 4000.0, 'Plan Rows': 10,
+            'Actual Total Time': 80.0, 'Actual Rows': 2000,
+            'Actual Loops': 1, 'Shared Hit Blocks': 100,
+            'Shared Read Blocks': 100,
+            'Plans': [{
+                'Node Type': 'Seq Scan', 'Parent Relationship': 'Outer',
+                'Relation Name': 'orders', 'Alias': 'o',
+                'Total Cost': 1000.0, 'Plan Rows': 20000,
+                'Actual Total Time': 30.0, 'Actual Rows': 20000,
+                'Actual Loops': 1, 'Rows Removed by Filter': 180000,
+                'Shared Hit Blocks': 0, 'Shared Read Blocks': 100
+            }, {
+                'Node Type': 'Index Scan', 'Parent Relationship': 'Inner',
+                'Relation Name': 'customers', 'Alias': 'customers',
+                'Index Name': 'customers_pkey',
+                'Total Cost': 0.1, 'Plan Rows': 1,
+                'Actual Total Time': 0.002, 'Actual Rows': 0.1,
+                'Actual Loops': 20000, 'Shared Hit Blocks': 100,
+                'Shared Read Blocks': 0
+            }]
+        }]
+    },
+    'Planning Time': 0.5,
+    'Execution Time': 101.0
+}]
+
+ESTIMATED_PLAN = [{
+    'Plan': {
+        'Node Type': 'Hash Join', 'Total Cost': 100.0, 'Plan Rows': 10,
+        'Plans': [{
+            'Node Type': 'Seq Scan', 'Parent Relationship': 'Outer',
+            'Relation Name': 'a', 'Total Cost': 70.0, 'Plan Rows': 10
+        }, {
+            'Node Type': 'Hash', 'Parent Relationship': 'Inner',
+            'Total Cost': 20.0, 'Plan Rows': 10,
+            'Plans': [{
+                'Node Type': 'Seq Scan', 'Parent Relationship': 'Outer',
+                'Relation Name': 'b', 'Total Cost': 20.0, 'Plan Rows': 10
+            }]
+        }]
+    }
+}]
+
+
+class ExplainAnalyzerTestCase(BaseTestGenerator):
+    """
+    This class validates that the nodes of the plans are ranked by their
+    exclusive time (or cost), and that their problems are flagged.
+    """
+    scenarios = [
+        ('When the plan was analyzed', dict(
+            plan=json.dumps(ANALYZED_PLAN),
+            expected_analyzed=True,
+            expected_hotspots=[(4, 40.0), (3, 30.0), (1, 20.0), (2, 10.0)],
+            expected_exclusive_times=[20.0, 10.0, 30.0, 40.0],
+            expected_issues=[
+                (1, 'Sort spilled to disk (1024 kB).'),
+                (1, 'Wrote 128 temporary blocks.'),
+                (1, 'Rows misestimated by 200x (estimated 10, actual 2000).'),
+                (2, 'Nested loop over 20000 outer rows.'),
+                (2, 'Rows misestimated by 200x (estimated 10, actual 2000).'),
+                (3, 'Sequential scan reading 200000 rows.')
+            ],
+            expected_hit_ratios=[None, None, 0.0, 1.0]
+        )),
+        ('When the plan was only estimated', dict(
+            plan=ESTIMATED_PLAN,
+            expected_analyzed=False,
+            expected_hotspots=[(2, 70.0), (4, 20.0), (1, 10.0)],
+            expected_exclusive_times=[None, None, None, None],
+            expected_issues=[],
+            expected_hit_ratios=[None, None, None, None]
+        ))
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        self.assertIsNone(parse_plan('not json'))
+        self.assertIsNone(parse_plan('[{"a": 1}]'))
+
+        explain = parse_plan(self.plan)
+        summary = analyze_plan(explain)
+
+        self.assertEqual(summary['analyzed'], self.expected_analyzed)
+        self.assertEqual(
+            [(h['id'], h['percent']) for h in summary['hotspots']],
+            self.expected_hotspots
+        )
+        self.assertEqual(
+            [n['exclusive_time'] and round(n['exclusive_time'], 3)
+             for n in summary['nodes']],
+            self.expected_exclusive_times
+        )
+        self.assertEqual(
+            [(i['id'], i['message']) for i in summary['issues']],
+            self.expected_issues
+        )
+        self.assertEqual(
+            [n['hit_ratio'] for n in summary['nodes']],
+            self.expected_hit_ratios
+        )
+        for hotspot in summary['hotspots']:
+            self.assertIn(
+                summary['nodes'][hotspot['id'] - 1]['description'],
+                summary['report']
+            )
@@ -0,0 +1,94 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""Compare the plans of EXPLAIN of a query."""
+
+from pgadmin.tools.sqleditor.utils.explain_analyzer import analyze_plan
+from pgadmin.tools.sqleditor.utils.plan_comparison import normalize_plan, \
+    compare_plans
+from pgadmin.utils.route import BaseTestGenerator
+
+
+def _plan(scan, scan_time, scan_rows, execution_time):
+    return {
+        'Plan': {
+            'Node Type': 'Aggregate', 'Total Cost': 110.0, 'Plan Rows': 1,
+            'Actual Total Time': execution_time - 1, 'Actual Rows': 1,
+            'Actual Loops': 1,
+            'Plans': [dict(scan, **{
+                'Parent Relationship': 'Outer', 'Relation Name': 'orders',
+                'Total Cost': 100.0, 'Plan Rows': 100,
+                'Actual Total Time': scan_time, 'Actual Rows': scan_rows,
+                'Actual Loops': 1
+            })]
+        },
+        'Execution Time': execution_time
+    }
+
+
+SEQ_SCAN = {'Node Type': 'Seq Scan'}
+INDEX_SCAN = {'Node Type': 'Index Scan', 'Index Name': 'orders_pkey'}
+
+
+class PlanComparisonTestCase(BaseTestGenerator):
+    """
+    This class validates that the plans of a query are compared node by
+    node, reporting the changed nodes, the deltas and the estimate drift.
+    """
+    scenarios = [
+        ('When the plan of the query changed', dict(
+            old=_plan(INDEX_SCAN, 1.0, 100, 3.0),
+            new=_plan(SEQ_SCAN, 40.0, 100, 42.0),
+            expected_regressed=True,
+            expected_changes=[
+                (None, 'Aggregate', 'Aggregate'),
+                ('changed', 'Index Scan on orders using orders_pkey',
+                 'Seq Scan on orders')
+            ],
+            expected_report=['The query regressed.', 'Plan changes:',
+                             '0.0 Index Scan on orders using orders_pkey -> '
+                             'Seq Scan on orders']
+        )),
+        ('When the estimates of the query drifted', dict(
+            old=_plan(SEQ_SCAN, 10.0, 100, 12.0),
+            new=_plan(SEQ_SCAN, 10.0, 10000, 11.0),
+            expected_regressed=False,
+            expected_changes=[
+                (None, 'Aggregate', 'Aggregate'),
+                (None, 'Seq Scan on orders', 'Seq Scan on orders')
+            ],
+            expected_report=['Estimate drift:', 'rows misestimated by 1x '
+                             '-> 100x']
+        ))
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        comparison = compare_plans(
+            normalize_plan(analyze_plan(self.old)),
+            normalize_plan(analyze_plan(self.new))
+        )
+
+        self.assertEqual(comparison['regressed'], self.expected_regressed)
+        self.assertEqual(
+            [(n['change'], n['old'], n['new']) for n in comparison['nodes']],
+            self.expected_changes
+        )
+        for text in self.expected_report:
+            self.assertIn(text, comparison['report'])
+
+        # A node missing from a plan
+        old = normalize_plan(analyze_plan(self.old))
+        new = normalize_plan(analyze_plan(self.new))
+        del new['nodes'][1:]
+        self.assertEqual(
+            compare_plans(old, new)['nodes'][1]['change'], 'removed'
+        )
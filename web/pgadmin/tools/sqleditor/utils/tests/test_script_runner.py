@@ -0,0 +1,107 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""Run the statements of a script one by one."""
+import sys
+
+from pgadmin.tools.sqleditor.utils.constant_definition import ASYNC_OK, \
+    ASYNC_READ_TIMEOUT
+from pgadmin.tools.sqleditor.utils.script_runner import split_script, \
+    start_script, poll_script, format_report
+from pgadmin.utils.route import BaseTestGenerator
+
+if sys.version_info < (3, 3):
+    from mock import MagicMock
+else:
+    from unittest.mock import MagicMock
+
+
+SCRIPT = """-- Create the table
+CREATE TABLE t (a text);
+
+INSERT INTO t VALUES ('a;b'), ($$c;$$);
+/* ; */ ;
+CREATE FUNCTION f() RETURNS int AS $body$
+BEGIN
+    RAISE NOTICE 'f;';
+    RETURN 1;
+END;
+$body$ LANGUAGE plpgsql;
+SELECT * FROM t"""
+
+
+class ScriptRunnerTestCase(BaseTestGenerator):
+    """
+    This class validates that the scripts are split into their statements,
+    which are run one by one, with their time, rows and notices reported.
+    """
+    scenarios = [
+        ('When all the statements succeed', dict(
+            statuses=[ASYNC_OK, ASYNC_READ_TIMEOUT, ASYNC_OK, ASYNC_OK,
+                      ASYNC_OK],
+            error=None,
+            expected_polls=[ASYNC_READ_TIMEOUT] * 4 + [ASYNC_OK],
+            expected_results=4
+        )),
+        ('When a statement fails', dict(
+            statuses=[ASYNC_OK, False],
+            error='ERROR:  relation "t" already exists',
+            expected_polls=[ASYNC_READ_TIMEOUT, False],
+            expected_results=2
+        ))
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        statements = split_script(SCRIPT)
+        self.assertEqual(
+            [s['line'] for s in statements], [2, 4, 6, 12]
+        )
+        self.assertEqual(statements[1]['sql'],
+                         "INSERT INTO t VALUES ('a;b'), ($$c;$$);")
+        self.assertTrue(statements[2]['sql'].endswith('plpgsql;'))
+        self.assertEqual(statements[3]['sql'], 'SELECT * FROM t')
+        self.assertEqual(split_script('SELECT 1; -- done'),
+                         [{'sql': 'SELECT 1;', 'line': 1}])
+
+        conn = MagicMock()
+        conn.poll.side_effect = [
+            (status, self.error if status is False else None)
+            for status in self.statuses
+        ]
+        conn.execute_async.return_value = (True, None)
+        conn.rows_affected.return_value = 2
+        conn.status_message.return_value = 'INSERT 0 2'
+        conn.messages.return_value = ['NOTICE:  f;\n']
+        conn.get_column_info.return_value = None
+
+        script = start_script(statements)
+        polls = []
+        while not script['finished']:
+            status, result = poll_script(conn, script, time_slice=0)
+            polls.append(status)
+
+        self.assertEqual(polls, self.expected_polls)
+        self.assertEqual(len(script['results']), self.expected_results)
+        # The next statements are run on the same connection
+        self.assertEqual(
+            [c[0][0] for c in conn.execute_async.call_args_list],
+            [s['sql'] for s in statements[1:self.expected_results]]
+        )
+
+        report = format_report(script)
+        self.assertIn('Script: {0} of 4 statements executed'.format(
+            self.expected_results), report)
+        self.assertIn('NOTICE:  f;', report)
+        if self.error:
+            self.assertIn(self.error, report)
+        else:
+            self.assertIn('INSERT 0 2', report)
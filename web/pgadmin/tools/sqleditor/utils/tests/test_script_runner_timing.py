@@ -0,0 +1,113 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""Time the statements of a script, as they complete."""
+import socket
+import sys
+import time
+from threading import Timer
+
+from pgadmin.tools.sqleditor.utils.constant_definition import ASYNC_OK, \
+    ASYNC_READ_TIMEOUT
+from pgadmin.tools.sqleditor.utils.script_runner import start_script, \
+    poll_script
+from pgadmin.utils.route import BaseTestGenerator
+
+if sys.version_info < (3, 3):
+    from mock import MagicMock
+else:
+    from unittest.mock import MagicMock
+
+
+class FakeConnection(object):
+    """
+    Connection running a statement, which completes when complete() is
+    called (making its socket readable).
+    """
+
+    def __init__(self):
+        self.sock, self.peer = socket.socketpair()
+        self.completed = False
+        self.statement = MagicMock()
+
+    def complete(self):
+        self.completed = True
+        self.peer.send(b'x')
+
+    def poll(self, **kwargs):
+        return (ASYNC_OK if self.completed else ASYNC_READ_TIMEOUT), None
+
+    def fileno(self):
+        return self.sock.fileno()
+
+    def close(self):
+        self.sock.close()
+        self.peer.close()
+
+    def __getattr__(self, name):
+        return getattr(self.statement, name)
+
+
+class ScriptRunnerTimingTestCase(BaseTestGenerator):
+    """
+    This class validates that the poll waits for the statement of the
+    script, and that the time between the polls is not counted in its
+    duration.
+    """
+    scenarios = [
+        ('When the statement completes between the polls', dict(
+            time_slice=0,
+            complete_after=None,
+            expected_polls=[ASYNC_READ_TIMEOUT, ASYNC_OK]
+        )),
+        ('When the statement completes while the poll waits', dict(
+            time_slice=5,
+            complete_after=0.1,
+            expected_polls=[ASYNC_OK]
+        ))
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        conn = FakeConnection()
+        conn.rows_affected.return_value = 1
+        conn.status_message.return_value = 'SELECT 1'
+        conn.messages.return_value = []
+        conn.get_column_info.return_value = None
+
+        script = start_script([{'sql': 'SELECT pg_sleep(1)', 'line': 1}])
+        polls = []
+        try:
+            if self.complete_after is None:
+                polls.append(
+                    poll_script(conn, script, self.time_slice)[0])
+                # Completes between the polls
+                time.sleep(0.3)
+                conn.complete()
+            else:
+                Timer(self.complete_after, conn.complete).start()
+
+            started = time.time()
+            polls.append(poll_script(conn, script, self.time_slice)[0])
+            elapsed = time.time() - started
+        finally:
+            conn.close()
+
+        self.assertEqual(polls, self.expected_polls)
+        self.assertTrue(script['finished'])
+        duration = script['results'][0]['duration']
+        if self.complete_after is None:
+            # The time between the polls is not counted
+            self.assertLess(duration, 300)
+        else:
+            # Waited for the statement, not the whole time slice
+            self.assertLess(elapsed, self.time_slice)
+            self.assertGreaterEqual(duration, self.complete_after * 1000)
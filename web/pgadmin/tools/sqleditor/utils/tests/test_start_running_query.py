@@ -535,6 +535,7 @@ class StartRunningQueryTest(BaseTestGenerator):
                 conn_id,
                 use_binary_placeholder,
                 array_to_string,
+                typecaster_profile,
                 auto_reconnect
             ):
                 return self.connection
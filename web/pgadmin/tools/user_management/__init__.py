@@ -23,6 +23,7 @@ from pgadmin.utils import PgAdminModule
 from pgadmin.utils.ajax import make_response as ajax_response, \
     make_json_response, bad_request, internal_server_error
 from pgadmin.utils.csrf import pgCSRFProtect
+from pgadmin.utils.render_cache import cached_render
 
 from pgadmin.model import db, Role, User, UserPreference, Server, \
     ServerGroup, Process, Setting
@@ -139,6 +140,7 @@ def script():
 @blueprint.route("/current_user.js")
 @pgCSRFProtect.exempt
 @login_required
+@cached_render()
 def current_user_info():
     return Response(
         response=render_template(
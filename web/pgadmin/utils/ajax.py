@@ -16,6 +16,8 @@ import simplejson as json
 from flask import Response
 from flask_babelex import gettext as _
 
+from pgadmin.utils import instrumentation
+
 
 class DataTypeJSONEncoder(json.JSONEncoder):
     def default(self, obj):
@@ -70,9 +72,12 @@ def make_json_response(
     doc['result'] = result
     doc['data'] = data
 
+    with instrumentation.timed(instrumentation.JSON):
+        response = json.dumps(doc, cls=DataTypeJSONEncoder,
+                              separators=(',', ':'), encoding=encoding)
+
     return Response(
-        response=json.dumps(doc, cls=DataTypeJSONEncoder,
-                            separators=(',', ':'), encoding=encoding),
+        response=response,
         status=status,
         mimetype="application/json",
         headers=get_no_cache_header()
@@ -81,9 +86,12 @@ def make_json_response(
 
 def make_response(response=None, status=200):
     """Create a JSON response handled by the backbone models."""
+    with instrumentation.timed(instrumentation.JSON):
+        response = json.dumps(
+            response, cls=DataTypeJSONEncoder, separators=(',', ':'))
+
     return Response(
-        response=json.dumps(
-            response, cls=DataTypeJSONEncoder, separators=(',', ':')),
+        response=response,
         status=status,
         mimetype="application/json",
         headers=get_no_cache_header()
@@ -151,6 +151,14 @@ class BaseConnection(object):
       - Implement this method to poll the data of query running on asynchronous
         connection.
 
+    * is_executing()
+      - Implement this method to find out, if an asynchronous query is still
+        being executed, and its result has not been polled yet.
+
+    * fileno()
+      - Implement this method to return the file descriptor of the
+        connection, which can be used to wait for the asynchronous result.
+
     * cancel_transaction(conn_id, did=None)
       - Implement this method to cancel the running transaction.
 
@@ -238,6 +246,14 @@ class BaseConnection(object):
     def poll(self, formatted_exception_msg=True, no_result=False):
         pass
 
+    @abstractmethod
+    def is_executing(self):
+        pass
+
+    @abstractmethod
+    def fileno(self):
+        pass
+
     @abstractmethod
     def status_message(self):
         pass
@@ -14,6 +14,11 @@ object.
 
 """
 import datetime
+import re
+import threading
+from collections import OrderedDict
+
+import six
 from flask import session, request
 from flask_login import current_user
 from flask_babelex import gettext
@@ -27,6 +32,110 @@ from ..abstract import BaseDriver
 from .connection import Connection
 from .server_manager import ServerManager
 
+# Additional keywords (mostly from other databases), which we quote anyway to
+# keep the generated scripts portable.
+# UNRESERVED_KEYWORD      0
+# COL_NAME_KEYWORD        1
+# TYPE_FUNC_NAME_KEYWORD  2
+# RESERVED_KEYWORD        3
+EXTRA_KEYWORDS = {
+    'connect': 3,
+    'convert': 3,
+    'distributed': 0,
+    'exec': 3,
+    'log': 0,
+    'long': 3,
+    'minus': 3,
+    'nocache': 3,
+    'number': 3,
+    'package': 3,
+    'pls_integer': 3,
+    'raw': 3,
+    'return': 3,
+    'smalldatetime': 3,
+    'smallfloat': 3,
+    'smallmoney': 3,
+    'sysdate': 3,
+    'systimestap': 3,
+    'tinyint': 3,
+    'tinytext': 3,
+    'varchar2': 3
+}
+
+# Certain types should not be quoted even though they contain a space.
+# Evilness.
+UNQUOTED_TYPES = frozenset([
+    u'bit varying',
+    u'"char"',
+    u'character varying',
+    u'double precision',
+    u'timestamp without time zone',
+    u'timestamp with time zone',
+    u'time without time zone',
+    u'time with time zone',
+    u'"trigger"',
+    u'"unknown"'
+])
+
+# Any character other than lower case letters, digits and underscore forces
+# quoting of the identifier.
+NEEDS_QUOTING_CHARS = re.compile(u'[^a-z0-9_]')
+
+# Maximum number of quoted identifiers kept in memory by qtIdent/qtTypeIdent.
+QUOTED_IDENT_CACHE_SIZE = 10000
+
+
+class QuotedIdentCache(object):
+    """
+    class QuotedIdentCache(object)
+
+    A bounded, thread-safe LRU cache for the results of the qtIdent and
+    qtTypeIdent functions. The quoting only depends on the given names (the
+    connection object is not used for the time being), hence - the results
+    can be shared across the sessions.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._data.pop(key, None)
+            if value is not None:
+                # Move it to the end (most recently used)
+                self._data[key] = value
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = value
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+quoted_ident_cache = QuotedIdentCache(QUOTED_IDENT_CACHE_SIZE)
+
+
+def _quoted_ident_cache_key(forTypes, args):
+    """
+    Returns the key for the quoted identifier cache, or None when the
+    arguments can not be cached (i.e. a list of identifiers).
+    """
+    for val in args:
+        if not isinstance(val, six.string_types):
+            return None
+    return (forTypes,) + args
+
 
 class Driver(BaseDriver):
     """
@@ -246,35 +355,7 @@ class Driver(BaseDriver):
 
     @staticmethod
     def ScanKeywordExtraLookup(key):
-        # UNRESERVED_KEYWORD      0
-        # COL_NAME_KEYWORD        1
-        # TYPE_FUNC_NAME_KEYWORD  2
-        # RESERVED_KEYWORD        3
-        extraKeywords = {
-            'connect': 3,
-            'convert': 3,
-            'distributed': 0,
-            'exec': 3,
-            'log': 0,
-            'long': 3,
-            'minus': 3,
-            'nocache': 3,
-            'number': 3,
-            'package': 3,
-            'pls_integer': 3,
-            'raw': 3,
-            'return': 3,
-            'smalldatetime': 3,
-            'smallfloat': 3,
-            'smallmoney': 3,
-            'sysdate': 3,
-            'systimestap': 3,
-            'tinyint': 3,
-            'tinytext': 3,
-            'varchar2': 3
-        }
-
-        return extraKeywords.get(key, None) or ScanKeyword(key)
+        return EXTRA_KEYWORDS.get(key, None) or ScanKeyword(key)
 
     @staticmethod
     def needsQuoting(key, forTypes):
@@ -284,23 +365,10 @@ class Driver(BaseDriver):
         # check if the string is number or not
         if isinstance(value, int):
             return True
-        # certain types should not be quoted even though it contains a space.
-        # Evilness.
         elif forTypes and value[-2:] == u"[]":
             valNoArray = value[:-2]
 
-        if forTypes and valNoArray.lower() in [
-            u'bit varying',
-            u'"char"',
-            u'character varying',
-            u'double precision',
-            u'timestamp without time zone',
-            u'timestamp with time zone',
-            u'time without time zone',
-            u'time with time zone',
-            u'"trigger"',
-            u'"unknown"'
-        ]:
+        if forTypes and valNoArray.lower() in UNQUOTED_TYPES:
             return False
 
         # If already quoted?, If yes then do not quote again
@@ -312,10 +380,8 @@ class Driver(BaseDriver):
         if u'0' <= valNoArray[0] <= u'9':
             return True
 
-        for c in valNoArray:
-            if (not (u'a' <= c <= u'z') and c != u'_' and
-                    not (u'0' <= c <= u'9')):
-                return True
+        if NEEDS_QUOTING_CHARS.search(valNoArray):
+            return True
 
         # check string is keywaord or not
         category = Driver.ScanKeywordExtraLookup(value)
@@ -338,6 +404,12 @@ class Driver(BaseDriver):
         # We're not using the conn object at the moment, but - we will
         # modify the
         # logic to use the server version specific keywords later.
+        cache_key = _quoted_ident_cache_key(True, args)
+        if cache_key is not None:
+            res = quoted_ident_cache.get(cache_key)
+            if res is not None:
+                return res
+
         res = None
         value = None
 
@@ -359,12 +431,21 @@ class Driver(BaseDriver):
 
             res = ((res and res + '.') or '') + value
 
+        if cache_key is not None and res is not None:
+            quoted_ident_cache.set(cache_key, res)
+
         return res
 
     @staticmethod
     def qtIdent(conn, *args):
         # We're not using the conn object at the moment, but - we will
         # modify the logic to use the server version specific keywords later.
+        cache_key = _quoted_ident_cache_key(False, args)
+        if cache_key is not None:
+            res = quoted_ident_cache.get(cache_key)
+            if res is not None:
+                return res
+
         res = None
         value = None
 
@@ -390,4 +471,7 @@ class Driver(BaseDriver):
 
             res = ((res and res + '.') or '') + value
 
+        if cache_key is not None and res is not None:
+            quoted_ident_cache.set(cache_key, res)
+
         return res
@@ -30,13 +30,15 @@ from psycopg2.extensions import adapt, encodings
 import config
 from pgadmin.model import User
 from pgadmin.utils.exception import ConnectionLost, CryptKeyMissing
-from pgadmin.utils import get_complete_file_path
+from pgadmin.utils import get_complete_file_path, instrumentation
 from ..abstract import BaseConnection
 from .cursor import DictCursor
 from .typecast import register_global_typecasters, \
     register_string_typecasters, register_binary_typecasters, \
-    register_array_to_string_typecasters, ALL_JSON_TYPES
+    register_array_to_string_typecasters, register_native_typecasters, \
+    ALL_JSON_TYPES, COMPATIBILITY_PROFILE, FAST_PROFILE
 from .encoding import getEncoding, configureDriverEncodings
+from .query_logging import log_query, log_query_event
 from pgadmin.utils import csv
 from pgadmin.utils.master_password import get_crypt_key
 
@@ -150,7 +152,8 @@ class Connection(BaseConnection):
     """
 
     def __init__(self, manager, conn_id, db, auto_reconnect=True, async_=0,
-                 use_binary_placeholder=False, array_to_string=False):
+                 use_binary_placeholder=False, array_to_string=False,
+                 typecaster_profile=COMPATIBILITY_PROFILE):
         assert (manager is not None)
         assert (conn_id is not None)
 
@@ -174,6 +177,7 @@ class Connection(BaseConnection):
         self.reconnecting = False
         self.use_binary_placeholder = use_binary_placeholder
         self.array_to_string = array_to_string
+        self.typecaster_profile = typecaster_profile
 
         super(Connection, self).__init__()
 
@@ -194,6 +198,7 @@ class Connection(BaseConnection):
         res['auto_reconnect'] = self.auto_reconnect
         res['use_binary_placeholder'] = self.use_binary_placeholder
         res['array_to_string'] = self.array_to_string
+        res['typecaster_profile'] = self.typecaster_profile
 
         return res
 
@@ -396,7 +401,10 @@ class Connection(BaseConnection):
             else:
                 self.conn.autocommit = True
 
-        register_string_typecasters(self.conn)
+        register_string_typecasters(self.conn, self.typecaster_profile)
+
+        if self.typecaster_profile == FAST_PROFILE:
+            register_native_typecasters(self.conn)
 
         if self.array_to_string:
             register_array_to_string_typecasters(self.conn)
@@ -579,6 +587,7 @@ WHERE
                 )
             else:
                 cur = self.conn.cursor(cursor_factory=DictCursor)
+            cur.typecaster_profile = self.typecaster_profile
         except psycopg2.Error as pe:
             current_app.logger.exception(pe)
             errmsg = gettext(
@@ -659,9 +668,10 @@ WHERE
         query = query.encode(self.python_encoding)
 
         params = self.escape_params_sqlascii(params)
-        cur.execute(query, params)
-        if self.async_ == 1:
-            self._wait(cur.connection)
+        with instrumentation.timed(instrumentation.SQL):
+            cur.execute(query, params)
+            if self.async_ == 1:
+                self._wait(cur.connection)
 
     def execute_on_server_as_csv(self,
                                  query, params=None,
@@ -685,17 +695,8 @@ WHERE
             return False, str(cur)
         query_id = random.randint(1, 9999999)
 
-        current_app.logger.log(
-            25,
-            u"Execute (with server cursor) for server #{server_id} - "
-            u"{conn_id} (Query-id: {query_id}):\n{query}".format(
-                server_id=self.manager.sid,
-                conn_id=self.conn_id,
-                query=query.decode(self.python_encoding) if
-                sys.version_info < (3,) else query,
-                query_id=query_id
-            )
-        )
+        log_query('with server cursor', self.manager.sid, self.conn_id,
+                  query_id, query, self.python_encoding)
         try:
             self.__internal_blocking_execute(cur, query, params)
         except psycopg2.Error as pe:
@@ -807,11 +808,11 @@ WHERE
 
             for c in cur.ordered_description():
                 # This is to handle the case in which column name is non-ascii
-                column_name = c.to_dict()['name']
+                column_name = c.name
                 if IS_PY2:
                     column_name = column_name.decode(conn_encoding)
                 header.append(column_name)
-                if c.to_dict()['type_code'] in ALL_JSON_TYPES:
+                if c.type_code in ALL_JSON_TYPES:
                     json_columns.append(column_name)
 
             if IS_PY2:
@@ -892,16 +893,7 @@ WHERE
             return False, str(cur)
         query_id = random.randint(1, 9999999)
 
-        current_app.logger.log(
-            25,
-            u"Execute (scalar) for server #{server_id} - {conn_id} (Query-id: "
-            u"{query_id}):\n{query}".format(
-                server_id=self.manager.sid,
-                conn_id=self.conn_id,
-                query=query,
-                query_id=query_id
-            )
-        )
+        log_query('scalar', self.manager.sid, self.conn_id, query_id, query)
         try:
             self.__internal_blocking_execute(cur, query, params)
         except psycopg2.Error as pe:
@@ -965,23 +957,16 @@ WHERE
 
         query = query.encode(encoding)
 
-        current_app.logger.log(
-            25,
-            u"Execute (async) for server #{server_id} - {conn_id} (Query-id: "
-            u"{query_id}):\n{query}".format(
-                server_id=self.manager.sid,
-                conn_id=self.conn_id,
-                query=query.decode(encoding),
-                query_id=query_id
-            )
-        )
+        log_query('async', self.manager.sid, self.conn_id, query_id,
+                  query, encoding)
 
         try:
             self.__notices = []
             self.__notifies = []
             self.execution_aborted = False
-            cur.execute(query, params)
-            res = self._wait_timeout(cur.connection)
+            with instrumentation.timed(instrumentation.SQL):
+                cur.execute(query, params)
+                res = self._wait_timeout(cur.connection)
         except psycopg2.Error as pe:
             errmsg = self._formatted_exception_msg(pe, formatted_exception_msg)
             current_app.logger.error(
@@ -1029,16 +1014,7 @@ WHERE
             return False, str(cur)
         query_id = random.randint(1, 9999999)
 
-        current_app.logger.log(
-            25,
-            u"Execute (void) for server #{server_id} - {conn_id} (Query-id: "
-            u"{query_id}):\n{query}".format(
-                server_id=self.manager.sid,
-                conn_id=self.conn_id,
-                query=query,
-                query_id=query_id
-            )
-        )
+        log_query('void', self.manager.sid, self.conn_id, query_id, query)
 
         try:
             self.__internal_blocking_execute(cur, query, params)
@@ -1113,16 +1089,7 @@ WHERE
             return False, str(cur)
 
         query_id = random.randint(1, 9999999)
-        current_app.logger.log(
-            25,
-            u"Execute (2darray) for server #{server_id} - {conn_id} "
-            u"(Query-id: {query_id}):\n{query}".format(
-                server_id=self.manager.sid,
-                conn_id=self.conn_id,
-                query=query,
-                query_id=query_id
-            )
-        )
+        log_query('2darray', self.manager.sid, self.conn_id, query_id, query)
         try:
             self.__internal_blocking_execute(cur, query, params)
         except psycopg2.Error as pe:
@@ -1168,16 +1135,7 @@ WHERE
         if not status:
             return False, str(cur)
         query_id = random.randint(1, 9999999)
-        current_app.logger.log(
-            25,
-            u"Execute (dict) for server #{server_id} - {conn_id} (Query-id: "
-            u"{query_id}):\n{query}".format(
-                server_id=self.manager.sid,
-                conn_id=self.conn_id,
-                query=query,
-                query_id=query_id
-            )
-        )
+        log_query('dict', self.manager.sid, self.conn_id, query_id, query)
         try:
             self.__internal_blocking_execute(cur, query, params)
         except psycopg2.Error as pe:
@@ -1440,16 +1398,12 @@ Failed to reset the connection to the server due to following error:
                 "Cursor could not be found for the async connection."
             )
 
-        current_app.logger.log(
-            25,
-            "Polling result for (Query-id: {query_id})".format(
-                query_id=self.__async_query_id
-            )
-        )
+        log_query_event('Polling result for', self.__async_query_id)
 
         is_error = False
         try:
-            status = self._wait_timeout(self.conn)
+            with instrumentation.timed(instrumentation.SQL):
+                status = self._wait_timeout(self.conn)
         except psycopg2.Error as pe:
             if self.conn.closed:
                 raise ConnectionLost(
@@ -1506,7 +1460,9 @@ Failed to reset the connection to the server due to following error:
                     # and DDL operations, we need to rely on exception to
                     # figure that out at the moment.
                     try:
-                        for row in cur:
+                        # Fetch them at once, to convert the values of the
+                        # columns (if required) column by column.
+                        for row in cur.fetchall():
                             new_row = []
                             for col in self.column_info:
                                 new_row.append(row[col['name']])
@@ -1517,6 +1473,21 @@ Failed to reset the connection to the server due to following error:
 
         return status, result
 
+    def is_executing(self):
+        """
+        Returns True, if an asynchronous query is being executed on this
+        connection, and its result has not been polled yet.
+        """
+        return self.conn is not None and not self.conn.closed and \
+            self.conn.isexecuting()
+
+    def fileno(self):
+        """
+        Returns the file descriptor of the connection socket, which can be
+        used to wait for the result of the asynchronous query using select.
+        """
+        return self.conn.fileno()
+
     def status_message(self):
         """
         This function will return the status message returned by the last
@@ -1528,12 +1499,7 @@ Failed to reset the connection to the server due to following error:
                 "Cursor could not be found for the async connection."
             )
 
-        current_app.logger.log(
-            25,
-            "Status message for (Query-id: {query_id})".format(
-                query_id=self.__async_query_id
-            )
-        )
+        log_query_event('Status message for', self.__async_query_id)
 
         return cur.statusmessage
 
@@ -18,14 +18,21 @@ try:
 except ImportError:
     from ordereddict import OrderedDict
 
-import psycopg2
-
 from psycopg2.extensions import cursor as _cursor, encodings
 from .encoding import configureDriverEncodings
+from .typecast import FAST_PROFILE, get_column_typecasters
 
 configureDriverEncodings(encodings)
 
 
+# The fields of the description of a result column, in the order of the
+# DB-API (and of the psycopg2 named tuple/Column objects).
+COLUMN_FIELDS = (
+    'name', 'type_code', 'display_size', 'internal_size', 'precision',
+    'scale', 'null_ok', 'table_oid', 'table_column'
+)
+
+
 class _WrapperColumn(object):
     """
     class _WrapperColumn(object)
@@ -34,16 +41,19 @@ class _WrapperColumn(object):
     to allow identify the duplicate column name, created by PostgreSQL database
     server implicitly during query execution.
 
+    The fields of the original column description are resolved once, when the
+    wrapper is created (i.e. once per execution), and kept in the slots of this
+    object, along with their dictionary form.
+
     Methods:
     -------
     * __init__(_col, _name)
     - Initialize the wrapper around the description column object, which will
       present the dummy name when available instead of the duplicate name.
 
-    * __getattribute__(name)
-    - Get attributes from the original column description (which is a named
-      tuple) except for few of the attributes of this object (i.e. orig_col,
-      dummy_name, __class__, to_dict) are part of this object.
+    * __getattr__(name)
+    - Get the attributes, which are not resolved by the wrapper, from the
+      original column description.
 
     * __getitem__(idx)
     - Get the item from the original object except for the 0th index item,
@@ -54,25 +64,42 @@ class _WrapperColumn(object):
     - Override them to make the operations on original object.
 
     * to_dict()
-    - Converts original objects data as OrderedDict (except the name will same
-      as dummy name (if available), and one more parameter as 'display_name'.
+    - Returns a copy of the fields of the original object as OrderedDict
+      (except the name will same as dummy name (if available), and one more
+      parameter as 'display_name'.
     """
 
+    __slots__ = ('orig_col', 'dummy_name', '_dict') + COLUMN_FIELDS
+
     def __init__(self, _col, _name):
         """Initializer for _WrapperColumn"""
         self.orig_col = _col
         self.dummy_name = _name
 
-    def __getattribute__(self, name):
-        """Getting the attributes from the original object. (except few)"""
-        if (name == 'orig_col' or name == 'dummy_name' or
-                name == '__class__' or name == 'to_dict'):
-            return object.__getattribute__(self, name)
-        elif name == 'name':
-            res = object.__getattribute__(self, 'dummy_name')
-            if res is not None:
-                return res
-        return self.orig_col.__getattribute__(name)
+        # Before psycopg2 2.8 the description attribute was a sequence of
+        # simple tuples or namedtuples, and the Column objects since then.
+        # Both of them are sequences of these fields.
+        ores = OrderedDict()
+        for idx, field in enumerate(COLUMN_FIELDS):
+            if hasattr(_col, field):
+                value = getattr(_col, field)
+            else:
+                value = _col[idx] if idx < len(_col) else None
+            setattr(self, field, value)
+            ores[field] = value
+
+        ores['display_name'] = ores['name']
+        if _name is not None:
+            self.name = _name
+            ores['name'] = _name
+        self._dict = ores
+
+    def __getattr__(self, name):
+        """Getting the remaining attributes from the original object."""
+        if name == 'orig_col':
+            # Not initialized yet (i.e. while being copied)
+            raise AttributeError(name)
+        return getattr(self.orig_col, name)
 
     def __getitem__(self, idx):
         """Overrides __getitem__ to fetch item from original object"""
@@ -90,33 +117,38 @@ class _WrapperColumn(object):
 
     def to_dict(self):
         """
-        Generates an OrderedDict from the fields of the original objects
-        with avoiding the duplicate name.
-        """
-
-        # In psycopg2 2.8, the description of one result column,
-        # exposed as items of the cursor.description sequence.
-        # Before psycopg2 2.8 the description attribute was a sequence
-        # of simple tuples or namedtuples.
-        if psycopg2.__version__.find('2.8') != -1:
-            ores = OrderedDict()
-            ores['name'] = self.orig_col.name
-            ores['type_code'] = self.orig_col.type_code
-            ores['display_size'] = self.orig_col.display_size
-            ores['internal_size'] = self.orig_col.internal_size
-            ores['precision'] = self.orig_col.precision
-            ores['scale'] = self.orig_col.scale
-            ores['null_ok'] = self.orig_col.null_ok
-            ores['table_oid'] = self.orig_col.table_oid
-            ores['table_column'] = self.orig_col.table_column
-        else:
-            ores = OrderedDict(self.orig_col._asdict())
+        Returns the OrderedDict generated from the fields of the original
+        objects with avoiding the duplicate name.
+
+        The callers are allowed to modify it, hence - a copy is returned.
+        """
+        return OrderedDict(self._dict)
+
 
-        name = ores['name']
-        if self.dummy_name:
-            ores['name'] = self.dummy_name
-        ores['display_name'] = name
-        return ores
+def wrap_description(desc):
+    """
+    Transform the regular description to the tuple of the wrapper objects,
+    which handles duplicate column name.
+    """
+    if desc is None or len(desc) == 0:
+        return desc
+
+    res = list()
+    od = dict((d[0], 0) for d in desc)
+    for d in desc:
+        dummy = None
+        idx = od[d[0]]
+        if idx == 0:
+            od[d[0]] = 1
+        else:
+            name = d[0]
+            while name in od:
+                idx += 1
+                name = ("%s-%s" % (d[0], idx))
+                od[d[0]] = idx
+            dummy = name
+        res.append(_WrapperColumn(d, dummy))
+    return tuple(res)
 
 
 class DictCursor(_cursor):
@@ -138,6 +170,10 @@ class DictCursor(_cursor):
     * _ordered_description()
     - Generates the _WrapperColumn object from the description column, and
       identifies duplicate column name
+
+    * _cast_tuples(tuples)
+    - Converts the values of the columns, which need it, using the fast
+      profile of the type casters.
     """
 
     def __init__(self, *args, **kwargs):
@@ -145,6 +181,12 @@ class DictCursor(_cursor):
         Initialize the cursor object.
         """
         self._odt_desc = None
+        self._odt_names = None
+        self._odt_casts = None
+        # The profile of the type casters of the connection, the values of
+        # the columns which need it are converted after fetching the rows
+        # using the fast profile.
+        self.typecaster_profile = None
         _cursor.__init__(self, *args, **kwargs)
 
     def _dict_tuple(self, tup):
@@ -153,35 +195,37 @@ class DictCursor(_cursor):
         """
         if self._odt_desc is None:
             self._ordered_description()
-        return dict((k[0], v) for k, v in zip(self._odt_desc, tup))
+        return dict(zip(self._odt_names, tup))
 
     def _ordered_description(self):
         """
         Transform the regular description to wrapper object, which handles
-        duplicate column name.
+        duplicate column name, and resolve the names of the columns once.
         """
-        self._odt_desc = _cursor.__getattribute__(self, 'description')
-        desc = self._odt_desc
-
-        if desc is None or len(desc) == 0:
-            return
+        self._odt_desc = wrap_description(
+            _cursor.__getattribute__(self, 'description')
+        )
+        self._odt_names = tuple(
+            d[0] for d in self._odt_desc
+        ) if self._odt_desc else ()
+        self._odt_casts = get_column_typecasters(
+            self._odt_desc, self.connection.encoding
+        ) if self._odt_desc and self.typecaster_profile == FAST_PROFILE \
+            else None
+
+    def _cast_tuples(self, tuples):
+        """
+        Convert the values of the columns, which need it, column by column.
+        """
+        if self._odt_desc is None:
+            self._ordered_description()
+        if not self._odt_casts:
+            return tuples
 
-        res = list()
-        od = dict((d[0], 0) for d in desc)
-        for d in desc:
-            dummy = None
-            idx = od[d.name]
-            if idx == 0:
-                od[d.name] = 1
-            else:
-                name = d.name
-                while name in od:
-                    idx += 1
-                    name = ("%s-%s" % (d.name, idx))
-                    od[d.name] = idx
-                dummy = name
-            res.append(_WrapperColumn(d, dummy))
-        self._odt_desc = tuple(res)
+        rows = [list(t) for t in tuples]
+        for pos, cast in self._odt_casts:
+            cast(rows, pos)
+        return rows
 
     def ordered_description(self):
         """
@@ -196,6 +240,7 @@ class DictCursor(_cursor):
         Execute function
         """
         self._odt_desc = None
+        self._odt_names = None
         return _cursor.execute(self, query, params)
 
     def executemany(self, query, params=None):
@@ -203,6 +248,7 @@ class DictCursor(_cursor):
         Execute many function of regular cursor.
         """
         self._odt_desc = None
+        self._odt_names = None
         return _cursor.executemany(self, query, params)
 
     def callproc(self, proname, params=None):
@@ -210,6 +256,7 @@ class DictCursor(_cursor):
         Call a procedure by a name.
         """
         self._odt_desc = None
+        self._odt_names = None
         return _cursor.callproc(self, proname, params)
 
     def fetchmany(self, size=None):
@@ -218,7 +265,7 @@ class DictCursor(_cursor):
         """
         tuples = _cursor.fetchmany(self, size)
         if tuples is not None:
-            return [self._dict_tuple(t) for t in tuples]
+            return [self._dict_tuple(t) for t in self._cast_tuples(tuples)]
         return None
 
     def fetchall(self):
@@ -227,13 +274,13 @@ class DictCursor(_cursor):
         """
         tuples = _cursor.fetchall(self)
         if tuples is not None:
-            return [self._dict_tuple(t) for t in tuples]
+            return [self._dict_tuple(t) for t in self._cast_tuples(tuples)]
 
     def __iter__(self):
         it = _cursor.__iter__(self)
         try:
-            yield self._dict_tuple(next(it))
+            yield self._dict_tuple(self._cast_tuples((next(it),))[0])
             while 1:
-                yield self._dict_tuple(next(it))
+                yield self._dict_tuple(self._cast_tuples((next(it),))[0])
         except StopIteration:
             pass
@@ -32,10 +32,15 @@ if __name__ == '__main__':
 ##########################################################################
 """)
     keywords_file.write('# ScanKeyword function for ' + version)
-    keywords_file.write('\n\ndef ScanKeyword(key):')
-    keywords_file.write('\n    keywordDict = {\n')
+    keywords_file.write("""
 
-    idx = 0
+# Keyword categories:
+# UNRESERVED_KEYWORD      0
+# COL_NAME_KEYWORD        1
+# TYPE_FUNC_NAME_KEYWORD  2
+# RESERVED_KEYWORD        3
+""")
+    keywords_file.write('KEYWORDS = {\n')
 
     with open(include_dir + "/postgresql/server/parser/kwlist.h", "rb") as ins:
 
@@ -49,15 +54,12 @@ if __name__ == '__main__':
             line = line.decode().rstrip()
             if line[0:11] == 'PG_KEYWORD(' and line[-1] == ')':
                 match = pattern.match(line[11:-1])
-                if idx != 0:
-                    keywords_file.write(", ")
-                else:
-                    keywords_file.write("        ")
                 keywords_file.write(
-                    '"' + match.group(1) + u'": ' +
-                    str(keyword_types.index(match.group(2)))
+                    "    '" + match.group(1) + u"': " +
+                    str(keyword_types.index(match.group(2))) + ",\n"
                 )
-                idx += 1
-    keywords_file.write('\n        }\n')
+    keywords_file.write('}\n\n\n')
     keywords_file.write(
-        '    return (key in keywordDict and keywordDict[key]) or None')
+        'def ScanKeyword(key):\n    return KEYWORDS.get(key, None)\n'
+    )
+    keywords_file.close()
@@ -0,0 +1,122 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Logging of the queries executed by the psycopg2 driver, at the SQL level.
+
+The records are built only when a handler accepts the SQL level, and the
+query is decoded and truncated only when the record is formatted, hence -
+the (possibly huge) generated queries cost nothing to log when the SQL level
+is not logged.
+"""
+
+import sys
+
+from flask import current_app
+
+import config
+
+# Logging level of the queries (named 'SQL' by the application)
+SQL = 25
+
+# Resolution of the sampling of the queries
+SAMPLE_SCALE = 10000
+
+
+def is_logged(logger, level):
+    """
+    Returns whether a record of the given level is emitted by any handler
+    of the logger (or of its ancestors).
+
+    The level of the application logger is DEBUG (its handlers filter the
+    records), hence - the level of the logger alone does not tell.
+    """
+    if not logger.isEnabledFor(level):
+        return False
+
+    while logger is not None:
+        for handler in logger.handlers:
+            if level >= handler.level:
+                return True
+        if not logger.propagate:
+            break
+        logger = logger.parent
+    return False
+
+
+def is_sampled(query_id):
+    """
+    Returns whether the query is logged, according to SQL_LOG_SAMPLE_RATE.
+    The decision depends on the query id only, hence - all the records of a
+    query are either logged or not.
+    """
+    rate = config.SQL_LOG_SAMPLE_RATE
+    return rate >= 1 or (query_id % SAMPLE_SCALE) < rate * SAMPLE_SCALE
+
+
+class QueryText(object):
+    """
+    Defers the decoding and the truncation (to SQL_LOG_MAX_LENGTH) of the
+    query until the record is formatted.
+    """
+    __slots__ = ('query', 'encoding')
+
+    def __init__(self, query, encoding=None):
+        self.query = query
+        self.encoding = encoding
+
+    def text(self):
+        query = self.query
+        if isinstance(query, bytes):
+            query = query.decode(self.encoding or 'utf-8', 'replace')
+
+        max_length = config.SQL_LOG_MAX_LENGTH
+        if max_length and len(query) > max_length:
+            query = u'{0}... ({1} characters)'.format(
+                query[:max_length], len(query))
+        return query
+
+    __unicode__ = text
+
+    def __str__(self):
+        if sys.version_info < (3,):
+            return self.text().encode('utf-8')
+        return self.text()
+
+
+def log_query(kind, server_id, conn_id, query_id, query, encoding=None):
+    """
+    Logs the query being executed, with its details as the attributes of
+    the record (i.e. for the structured handlers).
+    """
+    logger = current_app.logger
+    if not is_logged(logger, SQL) or not is_sampled(query_id):
+        return
+
+    logger.log(
+        SQL,
+        u"Execute (%s) for server #%s - %s (Query-id: %s):\n%s",
+        kind, server_id, conn_id, query_id, QueryText(query, encoding),
+        extra={
+            'query_kind': kind, 'server_id': server_id, 'conn_id': conn_id,
+            'query_id': query_id
+        }
+    )
+
+
+def log_query_event(event, query_id):
+    """Logs an event (i.e. polling) of the query being executed."""
+    logger = current_app.logger
+    if not is_logged(logger, SQL) or not is_sampled(query_id):
+        return
+
+    logger.log(
+        SQL, u"%s (Query-id: %s)", event, query_id,
+        extra={'query_id': query_id}
+    )
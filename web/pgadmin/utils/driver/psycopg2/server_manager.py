@@ -21,15 +21,13 @@ from pgadmin.utils import get_complete_file_path
 from pgadmin.utils.crypto import decrypt
 from pgadmin.utils.master_password import process_masterpass_disabled
 from .connection import Connection
+from .typecast import COMPATIBILITY_PROFILE
 from pgadmin.model import Server, User
 from pgadmin.utils.exception import ConnectionLost, SSHTunnelConnectionLost,\
     CryptKeyMissing
 from pgadmin.utils.master_password import get_crypt_key
 from threading import Lock
 
-if config.SUPPORT_SSH_TUNNEL:
-    from sshtunnel import SSHTunnelForwarder, BaseSSHTunnelForwarderError
-
 connection_restore_lock = Lock()
 
 
@@ -73,6 +71,8 @@ class ServerManager(object):
         self.ssl_mode = server.ssl_mode
         self.pinged = datetime.datetime.now()
         self.db_info = dict()
+        # Facts about the server, and its databases (see capability())
+        self.capabilities = dict()
         self.server_types = None
         self.db_res = server.db_res
         self.passfile = server.passfile
@@ -171,9 +171,38 @@ class ServerManager(object):
             return int(int(self.sversion / 100) / 100)
         raise Exception("Information is not available.")
 
+    def capability(self, key, probe, did=None):
+        """
+        Returns the capability of the server (or the database), i.e. the
+        installed extensions, the feature flags, the kind of the relations
+        etc., identified by the key.
+
+        The probe is run only the first time the capability is requested,
+        and its result is kept until the connection to the server (or the
+        database) is released. The failures are not kept.
+
+        Args:
+            key: identifier of the capability
+            probe: function returning (status, value)
+            did: database id, or None for the server wide capabilities
+
+        Returns:
+            (status, value or error message)
+        """
+        caps = self.capabilities.get(did, None)
+        if caps is not None and key in caps:
+            return True, caps[key]
+
+        status, res = probe()
+        if status:
+            self.capabilities.setdefault(did, dict())[key] = res
+
+        return status, res
+
     def connection(
             self, database=None, conn_id=None, auto_reconnect=True, did=None,
-            async_=None, use_binary_placeholder=False, array_to_string=False
+            async_=None, use_binary_placeholder=False, array_to_string=False,
+            typecaster_profile=COMPATIBILITY_PROFILE
     ):
         if database is not None:
             if hasattr(str, 'decode') and \
@@ -241,7 +270,8 @@ WHERE db.oid = {0}""".format(did))
             self.connections[my_id] = Connection(
                 self, my_id, database, auto_reconnect, async_,
                 use_binary_placeholder=use_binary_placeholder,
-                array_to_string=array_to_string
+                array_to_string=array_to_string,
+                typecaster_profile=typecaster_profile
             )
 
             return self.connections[my_id]
@@ -300,7 +330,10 @@ WHERE db.oid = {0}""".format(did))
                         conn_info['auto_reconnect'], conn_info['async_'],
                         use_binary_placeholder=conn_info[
                             'use_binary_placeholder'],
-                        array_to_string=conn_info['array_to_string']
+                        array_to_string=conn_info['array_to_string'],
+                        typecaster_profile=conn_info.get(
+                            'typecaster_profile', COMPATIBILITY_PROFILE
+                        )
                     )
 
                 # only try to reconnect if connection was connected previously
@@ -388,8 +421,10 @@ WHERE db.oid = {0}""".format(did))
                 del self.connections[my_id]
                 if did is not None:
                     del self.db_info[did]
+                    self.capabilities.pop(did, None)
 
                 if len(self.connections) == 0:
+                    self.capabilities = dict()
                     self.ver = None
                     self.sversion = None
                     self.server_type = None
@@ -406,6 +441,7 @@ WHERE db.oid = {0}""".format(did))
             self.connections[con]._release()
 
         self.connections = dict()
+        self.capabilities = dict()
         self.ver = None
         self.sversion = None
         self.server_type = None
@@ -463,6 +499,10 @@ WHERE db.oid = {0}""".format(did))
         SSHTunnelForwarder class.
         :return: True if tunnel is successfully created else error message.
         """
+        # sshtunnel (and paramiko) are slow to import, and only needed by the
+        # servers using a SSH tunnel
+        from sshtunnel import SSHTunnelForwarder, BaseSSHTunnelForwarderError
+
         # Fetch Logged in User Details.
         user = User.query.filter_by(id=current_user.id).first()
         if user is None:
@@ -123,6 +123,30 @@ PSYCOPG_SUPPORTED_RANGE_TYPES = (3904, 3926, 3906, 3912, 3908, 3910)
 PSYCOPG_SUPPORTED_RANGE_ARRAY_TYPES = (3905, 3927, 3907, 3913, 3909, 3911)
 
 
+# The profiles of the type casters of a connection.
+# The compatibility profile casts the values as strings, using the casters
+# registered globally and the Python function for the text values of the
+# databases not using UTF8. The fast profile lets psycopg2 cast the bigint
+# values, and the text values of the databases using the same encoding to
+# decode them (i.e. all except SQL_ASCII and MULE_INTERNAL), and converts the
+# values which need it after fetching, column by column
+# (see get_column_typecasters).
+COMPATIBILITY_PROFILE = 'compatibility'
+FAST_PROFILE = 'fast'
+TYPECASTER_PROFILES = (COMPATIBILITY_PROFILE, FAST_PROFILE)
+
+# OIDs of data types cast natively using the fast profile.
+# bigint
+NATIVE_INTEGER_DATATYPES = (20,)
+
+# Integers beyond this range can not be represented as JavaScript numbers,
+# and are converted to strings.
+MAX_SAFE_INTEGER = 2 ** 53 - 1
+
+# "char", name, text, character, character varying, unknown
+TEXT_DATATYPES = (19, 18, 25, 1042, 1043, 0)
+
+
 def register_global_typecasters():
     if sys.version_info < (3,):
         psycopg2.extensions.register_type(psycopg2.extensions.UNICODE)
@@ -177,7 +201,7 @@ def register_global_typecasters():
     psycopg2.extensions.register_adapter(dict, psycopg2_json)
 
 
-def register_string_typecasters(connection):
+def register_string_typecasters(connection, profile=COMPATIBILITY_PROFILE):
     # raw_unicode_escape used for SQL ASCII will escape the
     # characters. Here we unescape them using unicode_escape
     # and send ahead. When insert update is done, the characters
@@ -186,6 +210,14 @@ def register_string_typecasters(connection):
     postgres_encoding, python_encoding, typecast_encoding = \
         getEncoding(connection.encoding)
     if postgres_encoding != 'UNICODE':
+        # Using the fast profile, the values decoded by psycopg2 using the
+        # same encoding are left as they are, and the escaped characters of
+        # the scalar types are unescaped after fetching the rows (see
+        # get_column_typecasters).
+        fast = profile == FAST_PROFILE and sys.version_info >= (3,)
+        if fast and python_encoding == typecast_encoding:
+            return
+
         if sys.version_info >= (3,):
             def non_ascii_escape(value, cursor):
                 if value is None:
@@ -202,7 +234,7 @@ def register_string_typecasters(connection):
 
         unicode_type = psycopg2.extensions.new_type(
             # "char", name, text, character, character varying
-            (19, 18, 25, 1042, 1043, 0),
+            TEXT_DATATYPES,
             'UNICODE', non_ascii_escape)
 
         unicode_array_type = psycopg2.extensions.new_array_type(
@@ -210,10 +242,79 @@ def register_string_typecasters(connection):
             (1002, 1003, 1009, 1014, 1015, 0
              ), 'UNICODEARRAY', unicode_type)
 
-        psycopg2.extensions.register_type(unicode_type, connection)
+        if not fast:
+            psycopg2.extensions.register_type(unicode_type, connection)
         psycopg2.extensions.register_type(unicode_array_type, connection)
 
 
+def register_native_typecasters(connection):
+    """
+    Registers the C-level type casters of psycopg2 for the data types cast as
+    strings globally, for the connections using the fast profile.
+    """
+    psycopg2.extensions.register_type(
+        psycopg2.extensions.new_type(
+            NATIVE_INTEGER_DATATYPES, 'NATIVE_LONGINTEGER',
+            psycopg2.extensions.LONGINTEGER
+        ),
+        connection
+    )
+
+
+def _cast_unsafe_integers(rows, pos):
+    """
+    Converts the integers of a column, which can not be represented as
+    JavaScript numbers, to strings.
+    """
+    for row in rows:
+        value = row[pos]
+        if value is not None and \
+                not -MAX_SAFE_INTEGER <= value <= MAX_SAFE_INTEGER:
+            row[pos] = str(value)
+
+
+def _escaped_text_caster(python_encoding, typecast_encoding):
+    """
+    Returns the function unescaping the text values of a column, which
+    contain the escaped characters (see register_string_typecasters).
+    """
+    def cast(rows, pos):
+        for row in rows:
+            value = row[pos]
+            if value is not None and '\\' in value:
+                row[pos] = bytes(value, python_encoding).decode(
+                    typecast_encoding, errors='replace'
+                )
+    return cast
+
+
+def get_column_typecasters(description, encoding):
+    """
+    Returns the list of the position of the columns, which values need to be
+    converted after fetching them using the fast profile, and the function
+    converting them in place (in the rows fetched).
+
+    Args:
+        description: the (ordered) description of the result columns
+        encoding: the encoding of the connection
+    """
+    casters = []
+    postgres_encoding, python_encoding, typecast_encoding = \
+        getEncoding(encoding)
+    text_caster = None
+    if postgres_encoding != 'UNICODE' and sys.version_info >= (3,) and \
+            python_encoding != typecast_encoding:
+        text_caster = _escaped_text_caster(python_encoding, typecast_encoding)
+
+    for pos, column in enumerate(description):
+        if column.type_code in NATIVE_INTEGER_DATATYPES:
+            casters.append((pos, _cast_unsafe_integers))
+        elif text_caster is not None and column.type_code in TEXT_DATATYPES:
+            casters.append((pos, text_caster))
+
+    return casters
+
+
 def register_binary_typecasters(connection):
     psycopg2.extensions.register_type(
         psycopg2.extensions.new_type(
@@ -0,0 +1,200 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Opt-in instrumentation of the requests (PERFORMANCE_INSTRUMENTATION).
+
+It records the count and the duration of the session load/save, template
+rendering, queries and JSON encoding of each request, returns them in the
+Server-Timing header of the response, and aggregates them per endpoint.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+
+from flask import g, request, has_request_context, template_rendered, \
+    before_render_template
+
+import config
+
+# Categories of the timings
+SESSION = 'session'
+TEMPLATE = 'template'
+SQL = 'sql'
+JSON = 'json'
+TOTAL = 'total'
+CATEGORIES = (SESSION, TEMPLATE, SQL, JSON)
+
+# Upper bounds (in ms) of the buckets of the histograms of the durations per
+# request, the last bucket being unbounded
+HISTOGRAM_BUCKETS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+
+_statistics = dict()
+_statistics_lock = threading.Lock()
+
+
+def _request_timings():
+    """
+    Returns the timings of the current request (started on the first
+    record, as the session is loaded before the before_request handlers),
+    or None if the requests are not instrumented.
+    """
+    if not config.PERFORMANCE_INSTRUMENTATION or not has_request_context():
+        return None
+
+    timings = g.get('instrumentation', None)
+    if timings is None:
+        timings = g.instrumentation = {
+            'start': time.time(),
+            'categories': dict(),
+            'templates': []
+        }
+    return timings
+
+
+def record(category, duration):
+    """Records a duration (in seconds) of the category in the request."""
+    timings = _request_timings()
+    if timings is None:
+        return
+
+    count, total = timings['categories'].get(category, (0, 0))
+    timings['categories'][category] = (count + 1, total + duration)
+
+
+@contextmanager
+def timed(category):
+    """Records the duration of the block in the category."""
+    if not config.PERFORMANCE_INSTRUMENTATION:
+        yield
+        return
+
+    start = time.time()
+    try:
+        yield
+    finally:
+        record(category, time.time() - start)
+
+
+def _template_started(sender, template, context, **extra):
+    timings = _request_timings()
+    if timings is not None:
+        timings['templates'].append(time.time())
+
+
+def _template_rendered(sender, template, context, **extra):
+    timings = _request_timings()
+    if timings is not None and timings['templates']:
+        record(TEMPLATE, time.time() - timings['templates'].pop())
+
+
+def server_timing(timings):
+    """Returns the value of the Server-Timing header for the timings."""
+    metrics = [
+        '{0};desc="{1} calls";dur={2:.3f}'.format(
+            category, count, total * 1000
+        )
+        for category, (count, total) in sorted(timings['categories'].items())
+    ]
+    metrics.append('{0};dur={1:.3f}'.format(
+        TOTAL, (time.time() - timings['start']) * 1000
+    ))
+    return ', '.join(metrics)
+
+
+def _bucket(duration):
+    for idx, bound in enumerate(HISTOGRAM_BUCKETS):
+        if duration <= bound:
+            return idx
+    return len(HISTOGRAM_BUCKETS)
+
+
+def aggregate(endpoint, timings, duration):
+    """
+    Adds the timings of a request (and its total duration, in seconds) to
+    the statistics of its endpoint.
+    """
+    categories = dict(timings['categories'])
+    categories[TOTAL] = (1, duration)
+
+    with _statistics_lock:
+        statistics = _statistics.setdefault(
+            endpoint, {'requests': 0, 'categories': dict()})
+        statistics['requests'] += 1
+
+        for category, (count, total) in categories.items():
+            stats = statistics['categories'].setdefault(category, {
+                'calls': 0,
+                'time': 0.0,
+                'max': 0.0,
+                'histogram': [0] * (len(HISTOGRAM_BUCKETS) + 1)
+            })
+            total *= 1000
+            stats['calls'] += count
+            stats['time'] += total
+            stats['max'] = max(stats['max'], total)
+            stats['histogram'][_bucket(total)] += 1
+
+
+def get_statistics():
+    """Returns the statistics of the endpoints."""
+    with _statistics_lock:
+        return {
+            'buckets': list(HISTOGRAM_BUCKETS),
+            'endpoints': dict(
+                (endpoint, {
+                    'requests': statistics['requests'],
+                    'categories': dict(
+                        (category, dict(
+                            stats, histogram=list(stats['histogram'])
+                        ))
+                        for category, stats in
+                        statistics['categories'].items()
+                    )
+                })
+                for endpoint, statistics in _statistics.items()
+            )
+        }
+
+
+def reset_statistics():
+    with _statistics_lock:
+        _statistics.clear()
+
+
+def _before_request():
+    _request_timings()
+
+
+def _after_request(response):
+    timings = _request_timings()
+    if timings is not None:
+        response.headers['Server-Timing'] = server_timing(timings)
+    return response
+
+
+def _teardown_request(exception=None):
+    # The session is saved after the after_request handlers
+    timings = _request_timings()
+    if timings is not None:
+        aggregate(request.endpoint or 'unknown', timings,
+                  time.time() - timings['start'])
+
+
+def init_app(app):
+    """Instruments the requests of the application, if enabled."""
+    if not config.PERFORMANCE_INSTRUMENTATION:
+        return
+
+    before_render_template.connect(_template_started, app)
+    template_rendered.connect(_template_rendered, app)
+    app.before_request(_before_request)
+    app.after_request(_after_request)
+    app.teardown_request(_teardown_request)
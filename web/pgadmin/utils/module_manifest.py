@@ -0,0 +1,98 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+The manifest of the modules defining the pgAdmin modules (blueprints).
+
+At startup, every package of pgAdmin (including the tests, the model and the
+utilities) is imported and scanned for the modules to register. The manifest
+lists, for each package, the sub-packages which define a module, hence - the
+other packages are neither imported nor scanned (MODULE_MANIFEST).
+"""
+
+import json
+from importlib import import_module
+
+from werkzeug.utils import find_modules
+
+import config
+
+
+def find_blueprints(module):
+    """Returns the pgAdmin modules defined by the given (python) module."""
+    from pgadmin.utils import PgAdminModule
+
+    return [
+        value for value in list(module.__dict__.values())
+        if isinstance(value, PgAdminModule)
+    ]
+
+
+def generate_manifest(basemodule='pgadmin', blacklist=None):
+    """
+    Imports the packages the way the application does (i.e. the sub-packages
+    of the packages defining a module), and returns the manifest of the
+    packages defining a module.
+    """
+    blacklist = blacklist or []
+    modules = dict()
+    pending = [basemodule]
+
+    while pending:
+        package = pending.pop(0)
+        if package in modules:
+            continue
+
+        modules[package] = []
+        for module_name in find_modules(package, True):
+            if module_name in blacklist:
+                continue
+
+            blueprints = find_blueprints(import_module(module_name))
+            if blueprints:
+                modules[package].append(module_name)
+                pending.extend(
+                    blueprint.import_name for blueprint in blueprints
+                )
+
+    return {'version': config.APP_VERSION, 'modules': modules}
+
+
+def dump_manifest(filename, basemodule='pgadmin', blacklist=None):
+    """Generates the manifest, and writes it to the given file."""
+    manifest = generate_manifest(basemodule, blacklist)
+    with open(filename, 'w') as f:
+        json.dump(manifest, f, indent=4, sort_keys=True)
+    return manifest
+
+
+def load_manifest(filename, logger):
+    """
+    Returns the packages defining a module per package, from the manifest
+    file, or None if it cannot be used (in which case all the packages are
+    scanned).
+    """
+    try:
+        with open(filename) as f:
+            manifest = json.load(f)
+    except (IOError, OSError, ValueError) as e:
+        logger.warning(
+            'Failed to read the module manifest %s (%s), all the modules '
+            'will be scanned.' % (filename, e)
+        )
+        return None
+
+    if manifest.get('version') != config.APP_VERSION:
+        logger.warning(
+            'The module manifest %s was generated for pgAdmin %s, all the '
+            'modules will be scanned.' % (filename, manifest.get('version'))
+        )
+        return None
+
+    return manifest.get('modules', dict())
@@ -0,0 +1,121 @@
+##########################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+
+"""
+Caching of the scripts and stylesheets generated from the templates.
+
+The generated content depends on the application version, the locale and
+the user (with the preferences and settings) only, hence - it is rendered
+once per combination of these, and served with a strong ETag, so that the
+browser revalidates it (and gets a 304 response while it is unchanged).
+"""
+
+import hashlib
+from collections import OrderedDict
+from functools import wraps
+from threading import Lock
+
+from flask import g, request, session, make_response
+from flask_babelex import get_locale
+from flask_security import current_user
+
+import config
+
+# Maximum number of the responses kept
+CACHE_SIZE = 500
+
+_cache = OrderedDict()
+_cache_lock = Lock()
+
+
+def user_snapshot():
+    """
+    Returns the digest of the user with the roles, preferences and settings
+    (the state of the user which the generated content may depend upon), or
+    None for an anonymous user.
+    """
+    if 'render_cache_snapshot' in g:
+        return g.render_cache_snapshot
+
+    snapshot = None
+    if current_user.is_authenticated:
+        from pgadmin.model import db, Setting, UserPreference
+
+        state = [
+            current_user.id, current_user.email,
+            sorted(role.name for role in current_user.roles),
+            sorted(db.session.query(
+                UserPreference.pid, UserPreference.value
+            ).filter_by(uid=current_user.id).all()),
+            sorted(db.session.query(
+                Setting.setting, Setting.value
+            ).filter_by(user_id=current_user.id).all())
+        ]
+        snapshot = hashlib.sha1(repr(state).encode('utf-8')).hexdigest()
+
+    g.render_cache_snapshot = snapshot
+    return snapshot
+
+
+def clear():
+    with _cache_lock:
+        _cache.clear()
+
+
+def cached_render(per_session=False):
+    """
+    Caches the (successful) responses of the decorated view per URL,
+    application version, locale and user snapshot - and per session too, if
+    per_session is set (i.e. for the content embedding the CSRF token).
+    """
+    def decorator(f):
+        @wraps(f)
+        def wrapped(*args, **kwargs):
+            if request.method != 'GET':
+                return f(*args, **kwargs)
+
+            key = (
+                request.url, config.APP_VERSION, config.APP_VERSION_INT,
+                str(get_locale()), user_snapshot(),
+                getattr(session, 'sid', None) if per_session else None
+            )
+
+            with _cache_lock:
+                entry = _cache.pop(key, None)
+                if entry is not None:
+                    # Most recently used
+                    _cache[key] = entry
+
+            if entry is None:
+                response = make_response(f(*args, **kwargs))
+                if response.status_code != 200 or \
+                        response.direct_passthrough:
+                    return response
+
+                data = response.get_data()
+                entry = (
+                    data, response.headers.get('Content-Type'),
+                    hashlib.sha1(data).hexdigest()
+                )
+                with _cache_lock:
+                    _cache[key] = entry
+                    while len(_cache) > CACHE_SIZE:
+                        _cache.popitem(False)
+
+            data, content_type, etag = entry
+            response = make_response(data)
+            response.headers['Content-Type'] = content_type
+            response.set_etag(etag)
+            # The content depends on the preferences, the browser must always
+            # revalidate it
+            response.headers['Cache-Control'] = 'no-cache'
+            return response.make_conditional(request)
+
+        return wrapped
+    return decorator
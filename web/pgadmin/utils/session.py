@@ -28,6 +28,7 @@ from uuid import uuid4
 from threading import Lock
 from flask import current_app, request, flash, redirect
 from flask_login import login_url
+from pgadmin.utils import instrumentation
 from pgadmin.utils.ajax import make_json_response
 
 try:
@@ -290,41 +291,45 @@ class ManagedSessionInterface(SessionInterface):
         self.manager = manager
 
     def open_session(self, app, request):
-        cookie_val = request.cookies.get(app.session_cookie_name)
+        with instrumentation.timed(instrumentation.SESSION):
+            cookie_val = request.cookies.get(app.session_cookie_name)
 
-        if not cookie_val or '!' not in cookie_val:
-            return self.manager.new_session()
+            if not cookie_val or '!' not in cookie_val:
+                return self.manager.new_session()
 
-        sid, digest = cookie_val.split('!', 1)
+            sid, digest = cookie_val.split('!', 1)
 
-        if self.manager.exists(sid):
-            return self.manager.get(sid, digest)
+            if self.manager.exists(sid):
+                return self.manager.get(sid, digest)
 
-        return self.manager.new_session()
+            return self.manager.new_session()
 
     def save_session(self, app, session, response):
-        domain = self.get_cookie_domain(app)
-        if not session:
-            self.manager.remove(session.sid)
-            if session.modified:
-                response.delete_cookie(app.session_cookie_name, domain=domain)
-            return
-
-        if not session.modified:
-            # No need to save an unaltered session
-            # TODO: put logic here to test if the cookie is older than N days,
-            # if so, update the expiration date
-            return
-
-        self.manager.put(session)
-        session.modified = False
-
-        cookie_exp = self.get_expiration_time(app, session)
-        response.set_cookie(
-            app.session_cookie_name,
-            '%s!%s' % (session.sid, session.hmac_digest),
-            expires=cookie_exp, httponly=True, domain=domain
-        )
+        with instrumentation.timed(instrumentation.SESSION):
+            domain = self.get_cookie_domain(app)
+            if not session:
+                self.manager.remove(session.sid)
+                if session.modified:
+                    response.delete_cookie(
+                        app.session_cookie_name, domain=domain
+                    )
+                return
+
+            if not session.modified:
+                # No need to save an unaltered session
+                # TODO: put logic here to test if the cookie is older than N
+                # days, if so, update the expiration date
+                return
+
+            self.manager.put(session)
+            session.modified = False
+
+            cookie_exp = self.get_expiration_time(app, session)
+            response.set_cookie(
+                app.session_cookie_name,
+                '%s!%s' % (session.sid, session.hmac_digest),
+                expires=cookie_exp, httponly=True, domain=domain
+            )
 
 
 def create_session_interface(app, skip_paths=[]):
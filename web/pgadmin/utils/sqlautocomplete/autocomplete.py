@@ -149,7 +149,9 @@ class SQLAutoComplete(object):
                         continue
                     self.keywords.append(record['word'])
 
-        self.prioritizer = PrevalenceCounter(self.keywords)
+        # The prevalence of the keywords and names in the queries executed in
+        # the transaction (if given).
+        self.prioritizer = PrevalenceCounter(kwargs.get('prevalence'))
 
         self.reserved_words = set()
         for x in self.keywords:
@@ -1,8 +1,8 @@
-from sqlparse import parse
 from sqlparse.tokens import Keyword, CTE, DML
 from sqlparse.sql import Identifier, IdentifierList, Parenthesis
 from collections import namedtuple
 from .meta import TableMetadata, ColumnMetadata
+from .utils import cached_parse
 
 
 # TableExpression is a namedtuple representing a CTE, used internally
@@ -55,7 +55,7 @@ def extract_ctes(sql):
         been stripped.
     """
 
-    p = parse(sql)[0]
+    p = cached_parse(sql)[0]
 
     # Make sure the first meaningful token is "WITH" which is necessary to
     # define CTEs
@@ -1,5 +1,5 @@
 from __future__ import print_function
-import sqlparse
+from .utils import cached_parse
 from collections import namedtuple
 from sqlparse.sql import IdentifierList, Identifier, Function
 from sqlparse.tokens import Keyword, DML, Punctuation
@@ -127,7 +127,7 @@ def extract_tables(sql):
     Returns a list of TableReference namedtuples
 
     """
-    parsed = sqlparse.parse(sql)
+    parsed = cached_parse(sql)
     if not parsed:
         return ()
 
@@ -1,5 +1,8 @@
 from __future__ import print_function
 import re
+import threading
+from collections import OrderedDict
+
 import sqlparse
 from sqlparse.sql import Identifier
 from sqlparse.tokens import Token, Error
@@ -16,6 +19,106 @@ cleanup_regex = {
 }
 
 
+# Number of the statements, which parse results are kept (see cached_parse).
+PARSE_CACHE_SIZE = 32
+
+_parse_cache = OrderedDict()
+_parse_cache_lock = threading.Lock()
+
+
+def cached_parse(sql):
+    """
+    Parse the given SQL using sqlparse, and keep the result in a small LRU
+    cache keyed by the SQL, as the same statement is parsed again and again
+    for a completion request (and the following ones, while the cursor does
+    not move).
+
+    The results are shared, hence - they must not be modified.
+    """
+    with _parse_cache_lock:
+        parsed = _parse_cache.pop(sql, None)
+        if parsed is not None:
+            # Move it to the end (most recently used)
+            _parse_cache[sql] = parsed
+            return parsed
+
+    parsed = sqlparse.parse(sql)
+
+    with _parse_cache_lock:
+        _parse_cache[sql] = parsed
+        while len(_parse_cache) > PARSE_CACHE_SIZE:
+            _parse_cache.popitem(last=False)
+    return parsed
+
+
+# The tokens, which may contain a semicolon not ending the statement, and the
+# semicolons.
+statement_lexer_regex = re.compile(r"""
+    (?<![\w$])(?P<dollar>\$(?:[^\W\d]\w*)?\$) |
+    (?P<comment>/\*) |
+    --[^\n]* |
+    (?<!\w)[Ee]'(?:[^'\\]|\\.|'')*'? |
+    '(?:[^']|'')*'? |
+    "(?:[^"]|"")*"? |
+    (?P<semicolon>;)
+""", re.VERBOSE)
+
+comment_regex = re.compile(r'/\*|\*/')
+
+
+def statement_ends(text):
+    """
+    Yields the position after each semicolon ending a statement in the
+    given text, skipping the ones in the literals, quoted identifiers,
+    comments and dollar quoted strings (i.e. function bodies).
+    """
+    pos = 0
+    while True:
+        match = statement_lexer_regex.search(text, pos)
+        if match is None:
+            return
+        pos = match.end()
+
+        if match.group('semicolon'):
+            yield pos
+        elif match.group('dollar'):
+            end = text.find(match.group('dollar'), pos)
+            if end == -1:
+                return
+            pos = end + len(match.group('dollar'))
+        elif match.group('comment'):
+            # Comments may be nested
+            depth = 1
+            while depth:
+                match = comment_regex.search(text, pos)
+                if match is None:
+                    return
+                pos = match.end()
+                depth += 1 if match.group(0) == '/*' else -1
+
+
+def isolate_statement(full_text, text_before_cursor):
+    """
+    Returns the full text, and the text before the cursor, of the statement
+    under the cursor, located by a lexer pass (without parsing the others).
+
+    >>> isolate_statement('select 1; select 2; select 3', 'select 1; sel')
+    (' select 2;', ' sel')
+    >>> isolate_statement("select ';'; select $$;$$", "select ';'")
+    ("select ';';", "select ';'")
+    """
+    current_pos = len(text_before_cursor)
+    stmt_start = 0
+
+    for stmt_end in statement_ends(full_text):
+        if stmt_end >= current_pos:
+            return full_text[stmt_start:stmt_end], \
+                text_before_cursor[stmt_start:]
+        stmt_start = stmt_end
+
+    return full_text[stmt_start:], text_before_cursor[stmt_start:]
+
+
 def last_word(text, include='alphanum_underscore'):
     r"""
     Find the last word in a sentence.
@@ -73,7 +176,7 @@ def find_prev_keyword(sql, n_skip=0):
     if not sql.strip():
         return None, ''
 
-    parsed = sqlparse.parse(sql)[0]
+    parsed = cached_parse(sql)[0]
     flattened = list(parsed.flatten())
     flattened = flattened[:len(flattened) - n_skip]
 
@@ -1,47 +1,83 @@
+import heapq
 import re
-import sqlparse
-from sqlparse.tokens import Name
-from collections import defaultdict
+from sqlparse.keywords import KEYWORDS, KEYWORDS_COMMON
 
+# Matches the words of the queries, skipping the comments, the literals and
+# the quoted names, and the dollar quoted strings (i.e. function bodies).
+word_regex = re.compile(r"""
+    --[^\n]* |
+    /\*[\s\S]*?(?:\*/|$) |
+    (\$(?:[^\W\d]\w*)?\$)[\s\S]*?(?:\1|$) |
+    [Ee]?'(?:[^'\\]|\\.|'')*'? |
+    "(?:[^"]|"")*"? |
+    \d[\w.]* |
+    (?P<word>[^\W\d][\w$]*)
+""", re.VERBOSE)
 
-white_space_regex = re.compile(r'\\s+', re.MULTILINE)
 
-
-def _compile_regex(keyword):
-    # Surround the keyword with word boundaries and replace interior whitespace
-    # with whitespace wildcards
-    pattern = r'\\b' + white_space_regex.sub(r'\\s+', keyword) + r'\\b'
-    return re.compile(pattern, re.MULTILINE | re.IGNORECASE)
+def _is_keyword(word):
+    upper = word.upper()
+    return upper in KEYWORDS_COMMON or upper in KEYWORDS
 
 
 class PrevalenceCounter(object):
-    def __init__(self, keywords):
-        self.keyword_counts = defaultdict(int)
-        self.name_counts = defaultdict(int)
-        self.keyword_regexs = dict((kw, _compile_regex(kw)) for kw in keywords)
+    """
+    Counts the prevalence of the keywords and the names in the queries, in a
+    single pass over their words (without parsing them).
+
+    The counts are kept in the given dictionary, which is updated in place,
+    hence - they can be kept and counted incrementally (i.e. for the queries
+    executed in a Query Tool transaction). Only the 'max_counts' most
+    prevalent words, and names are kept, so that the counts stay small.
+    """
+
+    max_counts = 1000
+
+    def __init__(self, counts=None):
+        if counts is None:
+            counts = dict()
+        self.counts = counts
+        # Words (lower case) of the keywords, and names (as typed)
+        self.word_counts = counts.setdefault('words', dict())
+        self.name_counts = counts.setdefault('names', dict())
 
     def update(self, text):
-        self.update_keywords(text)
-        self.update_names(text)
+        word_counts = self.word_counts
+        name_counts = self.name_counts
 
-    def update_names(self, text):
-        for parsed in sqlparse.parse(text):
-            for token in parsed.flatten():
-                if token.ttype in Name:
-                    self.name_counts[token.value] += 1
+        # Count keywords from all the words (i.e. the names too). Can't rely
+        # for sqlparse to identify them, because it's database agnostic
+        for match in word_regex.finditer(text):
+            word = match.group('word')
+            if word is None:
+                continue
+            if not _is_keyword(word):
+                name_counts[word] = name_counts.get(word, 0) + 1
+            word = word.lower()
+            word_counts[word] = word_counts.get(word, 0) + 1
 
-    def clear_names(self):
-        self.name_counts = defaultdict(int)
+        self._prune(word_counts)
+        self._prune(name_counts)
+
+    def _prune(self, counts):
+        if len(counts) <= self.max_counts:
+            return
 
-    def update_keywords(self, text):
-        # Count keywords. Can't rely for sqlparse for this, because it's
-        # database agnostic
-        for keyword, regex in self.keyword_regexs.items():
-            for _ in regex.finditer(text):
-                self.keyword_counts[keyword] += 1
+        kept = heapq.nlargest(
+            self.max_counts, counts.items(), key=lambda item: item[1]
+        )
+        counts.clear()
+        counts.update(kept)
+
+    def clear_names(self):
+        self.name_counts.clear()
 
     def keyword_count(self, keyword):
-        return self.keyword_counts[keyword]
+        words = keyword.lower().split()
+        if len(words) == 1:
+            return self.word_counts.get(words[0], 0)
+        # At most, as many as its least prevalent word
+        return min(self.word_counts.get(word, 0) for word in words)
 
     def name_count(self, name):
-        return self.name_counts[name]
+        return self.name_counts.get(name, 0)
@@ -1,11 +1,11 @@
 from __future__ import print_function
 import sys
 import re
-import sqlparse
 from collections import namedtuple
 from sqlparse.sql import Comparison, Identifier, Where
 from .parseutils.utils import (
-    last_word, find_prev_keyword, parse_partial_identifier)
+    last_word, find_prev_keyword, parse_partial_identifier, cached_parse,
+    isolate_statement)
 from .parseutils.tables import extract_tables
 from .parseutils.ctes import isolate_query_ctes
 
@@ -65,6 +65,11 @@ class SqlStatement(object):
         full_text = _strip_named_query(full_text)
         text_before_cursor = _strip_named_query(text_before_cursor)
 
+        # Only the statement under the cursor is parsed (the large scripts
+        # are not parsed as a whole for every request).
+        full_text, text_before_cursor = \
+            isolate_statement(full_text, text_before_cursor)
+
         full_text, text_before_cursor, self.local_tables = \
             isolate_query_ctes(full_text, text_before_cursor)
 
@@ -78,14 +83,14 @@ class SqlStatement(object):
         # keywords as completion.
         if self.word_before_cursor:
             if word_before_cursor[-1] == '(' or word_before_cursor[0] == '\\':
-                parsed = sqlparse.parse(text_before_cursor)
+                parsed = cached_parse(text_before_cursor)
             else:
                 text_before_cursor = \
                     text_before_cursor[:-len(word_before_cursor)]
-                parsed = sqlparse.parse(text_before_cursor)
+                parsed = cached_parse(text_before_cursor)
                 self.identifier = parse_partial_identifier(word_before_cursor)
         else:
-            parsed = sqlparse.parse(text_before_cursor)
+            parsed = cached_parse(text_before_cursor)
 
         full_text, text_before_cursor, parsed = \
             _split_multiple_statements(full_text, text_before_cursor, parsed)
@@ -186,7 +191,7 @@ def _statement_from_function(full_text, text_before_cursor, statement):
         return full_text, text_before_cursor, statement
     full_text = full_text[body_start:body_end]
     text_before_cursor = text_before_cursor[body_start:]
-    parsed = sqlparse.parse(text_before_cursor)
+    parsed = cached_parse(text_before_cursor)
     return _split_multiple_statements(full_text, text_before_cursor, parsed)
 
 
@@ -267,7 +272,7 @@ def suggest_based_on_last_token(token, stmt):
     if not token:
         return (Keyword(),)
     elif token_v.endswith('('):
-        p = sqlparse.parse(stmt.text_before_cursor)[0]
+        p = cached_parse(stmt.text_before_cursor)[0]
 
         if p.tokens and isinstance(p.tokens[-1], Where):
             # Four possibilities:
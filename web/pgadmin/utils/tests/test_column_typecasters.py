@@ -0,0 +1,82 @@
+#######################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+import sys
+
+from psycopg2.extensions import Column
+
+from pgadmin.utils.driver.psycopg2.typecast import get_column_typecasters
+from pgadmin.utils.route import BaseTestGenerator
+
+DESCRIPTION = [
+    Column(name='id', type_code=20),
+    Column(name='name', type_code=25),
+    Column(name='size', type_code=23)
+]
+
+ROWS = [
+    (1, 'a\\\\b', 2 ** 53),
+    (-2 ** 53, 'd\\u0101', 4),
+    (None, None, None),
+    (2 ** 53 - 1, 'plain', 5)
+]
+
+
+class TestColumnTypecasters(BaseTestGenerator):
+    scenarios = [
+        (
+            'When the database uses UTF8',
+            dict(
+                encoding='UTF8',
+                expected_positions=[0],
+                expected_rows=[
+                    [1, 'a\\\\b', 2 ** 53],
+                    ['-9007199254740992', 'd\\u0101', 4],
+                    [None, None, None],
+                    [2 ** 53 - 1, 'plain', 5]
+                ]
+            )
+        ), (
+            'When the database uses the same encoding to unescape',
+            dict(
+                encoding='LATIN1',
+                expected_positions=[0],
+                expected_rows=[
+                    [1, 'a\\\\b', 2 ** 53],
+                    ['-9007199254740992', 'd\\u0101', 4],
+                    [None, None, None],
+                    [2 ** 53 - 1, 'plain', 5]
+                ]
+            )
+        ), (
+            'When the database uses SQL_ASCII',
+            dict(
+                encoding='SQL_ASCII',
+                expected_positions=[0, 1],
+                expected_rows=[
+                    [1, 'a\\b', 2 ** 53],
+                    ['-9007199254740992', u'd\u0101', 4],
+                    [None, None, None],
+                    [2 ** 53 - 1, 'plain', 5]
+                ]
+            )
+        ),
+    ]
+
+    def setUp(self):
+        if sys.version_info < (3,):
+            self.skipTest('The text values are unescaped while fetching')
+
+    def runTest(self):
+        casters = get_column_typecasters(DESCRIPTION, self.encoding)
+        self.assertEqual([pos for pos, _ in casters], self.expected_positions)
+
+        rows = [list(row) for row in ROWS]
+        for pos, cast in casters:
+            cast(rows, pos)
+        self.assertEqual(rows, self.expected_rows)
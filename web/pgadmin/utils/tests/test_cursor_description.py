@@ -0,0 +1,75 @@
+#######################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+from collections import namedtuple
+
+from psycopg2.extensions import Column
+
+from pgadmin.utils.driver.psycopg2.cursor import wrap_description
+from pgadmin.utils.route import BaseTestGenerator
+
+# The description of a column before psycopg2 2.8
+LegacyColumn = namedtuple('Column', [
+    'name', 'type_code', 'display_size', 'internal_size', 'precision',
+    'scale', 'null_ok'
+])
+
+
+class TestCursorDescription(BaseTestGenerator):
+    scenarios = [
+        (
+            'When the description is a sequence of Column objects',
+            dict(
+                desc=[
+                    Column(name='id', type_code=23),
+                    Column(name='id', type_code=25),
+                    Column(name='name', type_code=25, table_oid=1259)
+                ],
+                expected_names=('id', 'id-2', 'name'),
+                expected_table_oids=[None, None, 1259]
+            )
+        ), (
+            'When the description is a sequence of named tuples',
+            dict(
+                desc=[
+                    LegacyColumn('a', 23, None, 4, None, None, None),
+                    LegacyColumn('a', 23, None, 4, None, None, None),
+                    LegacyColumn('a-2', 23, None, 4, None, None, None)
+                ],
+                expected_names=('a', 'a-3', 'a-2'),
+                expected_table_oids=[None, None, None]
+            )
+        ),
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        columns = wrap_description(self.desc)
+
+        self.assertEqual(tuple(c.name for c in columns), self.expected_names)
+        self.assertEqual(tuple(c[0] for c in columns), self.expected_names)
+        self.assertEqual(
+            [c.table_oid for c in columns], self.expected_table_oids
+        )
+
+        for col, orig in zip(columns, self.desc):
+            self.assertEqual(col.type_code, orig[1])
+            res = col.to_dict()
+            self.assertEqual(list(res.keys())[:2], ['name', 'type_code'])
+            self.assertEqual(res['name'], col.name)
+            self.assertEqual(res['display_name'], orig[0])
+            self.assertEqual(res['type_code'], orig[1])
+
+            # The callers may modify the dictionary
+            res['type_code'] = None
+            self.assertEqual(col.to_dict()['type_code'], orig[1])
+
+        self.assertIsNone(wrap_description(None))
+        self.assertEqual(wrap_description(()), ())
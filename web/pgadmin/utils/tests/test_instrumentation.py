@@ -0,0 +1,82 @@
+#######################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+from flask import Flask, render_template_string
+
+import config
+from pgadmin.utils import instrumentation
+from pgadmin.utils.ajax import make_json_response
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class TestInstrumentation(BaseTestGenerator):
+    scenarios = [
+        (
+            'When the requests are instrumented',
+            dict(
+                enabled=True, queries=2,
+                expected_header=[
+                    'json;desc="1 calls"', 'sql;desc="2 calls"',
+                    'template;desc="1 calls"', 'total;dur='
+                ],
+                expected_calls=dict(json=1, sql=2, template=1, total=1)
+            )
+        ), (
+            'When the requests are not instrumented',
+            dict(
+                enabled=False, queries=2, expected_header=None,
+                expected_calls=None
+            )
+        )
+    ]
+
+    def setUp(self):
+        self.saved_config = config.PERFORMANCE_INSTRUMENTATION
+        instrumentation.reset_statistics()
+
+    def runTest(self):
+        config.PERFORMANCE_INSTRUMENTATION = self.enabled
+
+        app = Flask(__name__)
+        instrumentation.init_app(app)
+
+        @app.route('/objects', endpoint='objects')
+        def objects():
+            for idx in range(self.queries):
+                with instrumentation.timed(instrumentation.SQL):
+                    pass
+            return make_json_response(
+                data=render_template_string('{{ name }}', name='table')
+            )
+
+        response = app.test_client().get('/objects')
+        header = response.headers.get('Server-Timing')
+
+        if self.expected_header is None:
+            self.assertIsNone(header)
+        else:
+            for metric in self.expected_header:
+                self.assertIn(metric, header)
+
+        statistics = instrumentation.get_statistics()['endpoints']
+        if self.expected_calls is None:
+            self.assertEqual(statistics, dict())
+            return
+
+        self.assertEqual(statistics['objects']['requests'], 1)
+        categories = statistics['objects']['categories']
+        self.assertEqual(
+            dict((c, s['calls']) for c, s in categories.items()),
+            self.expected_calls
+        )
+        for stats in categories.values():
+            self.assertEqual(sum(stats['histogram']), 1)
+
+    def tearDown(self):
+        config.PERFORMANCE_INSTRUMENTATION = self.saved_config
+        instrumentation.reset_statistics()
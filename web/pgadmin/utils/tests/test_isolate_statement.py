@@ -0,0 +1,78 @@
+#######################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+from pgadmin.utils.sqlautocomplete.parseutils.utils import isolate_statement
+from pgadmin.utils.sqlautocomplete.sqlcompletion import suggest_type, \
+    FromClauseItem
+from pgadmin.utils.route import BaseTestGenerator
+
+SCRIPT = 'SELECT * FROM t1;\n' * 1000
+
+
+class TestIsolateStatement(BaseTestGenerator):
+    scenarios = [
+        (
+            'When the cursor is in the middle of a large script',
+            dict(
+                full_text=SCRIPT + 'SELECT * FROM t2 WHERE ;\n' + SCRIPT,
+                text_before_cursor=SCRIPT + 'SELECT * FROM t2 WHERE ',
+                expected=('\nSELECT * FROM t2 WHERE ;',
+                          '\nSELECT * FROM t2 WHERE ')
+            )
+        ), (
+            'When the cursor is just after the end of a statement',
+            dict(
+                full_text='SELECT 1; SELECT 2;',
+                text_before_cursor='SELECT 1;',
+                expected=('SELECT 1;', 'SELECT 1;')
+            )
+        ), (
+            'When the semicolons are quoted or in comments',
+            dict(
+                full_text="SELECT ';', \"a;\", E'\\';' /* ; /* ; */ ; */ "
+                          "-- ;\nFROM ; SELECT 2",
+                text_before_cursor="SELECT ';', \"a;\", E'\\';' "
+                                   "/* ; /* ; */ ; */ -- ;\nFROM ",
+                expected=("SELECT ';', \"a;\", E'\\';' /* ; /* ; */ ; */ "
+                          "-- ;\nFROM ;",
+                          "SELECT ';', \"a;\", E'\\';' /* ; /* ; */ ; */ "
+                          "-- ;\nFROM ")
+            )
+        ), (
+            'When the cursor is in the body of a function',
+            dict(
+                full_text='SELECT 1; CREATE FUNCTION f() RETURNS int AS '
+                          '$body$ SELECT 1; SELECT * FROM ; $body$ '
+                          'LANGUAGE sql; SELECT 3',
+                text_before_cursor='SELECT 1; CREATE FUNCTION f() RETURNS '
+                                   'int AS $body$ SELECT 1; SELECT * FROM ',
+                expected=(' CREATE FUNCTION f() RETURNS int AS $body$ '
+                          'SELECT 1; SELECT * FROM ; $body$ LANGUAGE sql;',
+                          ' CREATE FUNCTION f() RETURNS int AS $body$ '
+                          'SELECT 1; SELECT * FROM '),
+                suggestion=FromClauseItem(
+                    schema=None, table_refs=(), local_tables=()
+                )
+            )
+        ),
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        self.assertEqual(
+            isolate_statement(self.full_text, self.text_before_cursor),
+            self.expected
+        )
+
+        if hasattr(self, 'suggestion'):
+            self.assertIn(
+                self.suggestion,
+                suggest_type(self.full_text, self.text_before_cursor)
+            )
@@ -0,0 +1,90 @@
+#######################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+import json
+import os
+import tempfile
+
+import config
+from pgadmin.utils.module_manifest import generate_manifest, load_manifest
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class TestModuleManifest(BaseTestGenerator):
+    scenarios = [
+        (
+            'When the manifest matches the version',
+            dict(
+                basemodule='pgadmin.misc', version=config.APP_VERSION,
+                blacklist=[],
+                expected_modules={
+                    'pgadmin.misc': [
+                        'pgadmin.misc.bgprocess',
+                        'pgadmin.misc.dependencies',
+                        'pgadmin.misc.dependents',
+                        'pgadmin.misc.file_manager',
+                        'pgadmin.misc.sql',
+                        'pgadmin.misc.statistics'
+                    ],
+                    'pgadmin.misc.bgprocess': [],
+                    'pgadmin.misc.dependencies': [],
+                    'pgadmin.misc.dependents': [],
+                    'pgadmin.misc.file_manager': [],
+                    'pgadmin.misc.sql': [],
+                    'pgadmin.misc.statistics': []
+                }
+            )
+        ), (
+            'When a module is blacklisted',
+            dict(
+                basemodule='pgadmin.misc', version=config.APP_VERSION,
+                blacklist=['pgadmin.misc.file_manager'],
+                expected_modules={
+                    'pgadmin.misc': [
+                        'pgadmin.misc.bgprocess',
+                        'pgadmin.misc.dependencies',
+                        'pgadmin.misc.dependents',
+                        'pgadmin.misc.sql',
+                        'pgadmin.misc.statistics'
+                    ],
+                    'pgadmin.misc.bgprocess': [],
+                    'pgadmin.misc.dependencies': [],
+                    'pgadmin.misc.dependents': [],
+                    'pgadmin.misc.sql': [],
+                    'pgadmin.misc.statistics': []
+                }
+            )
+        ), (
+            'When the manifest is generated for another version',
+            dict(
+                basemodule='pgadmin.misc', version='1.0', blacklist=[],
+                expected_modules=None
+            )
+        )
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        manifest = generate_manifest(self.basemodule, self.blacklist)
+        manifest['version'] = self.version
+
+        fd, filename = tempfile.mkstemp(suffix='.json')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(manifest, f)
+            modules = load_manifest(filename, self.app.logger)
+        finally:
+            os.remove(filename)
+
+        self.assertEqual(modules, self.expected_modules)
+
+        # The modules registered by the application were timed
+        self.assertIn('pgadmin.misc', self.app.startup_timings)
+        self.assertIn('pgadmin.misc', self.app.startup_report())
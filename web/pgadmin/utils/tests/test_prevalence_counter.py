@@ -0,0 +1,71 @@
+#######################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+from pgadmin.utils.sqlautocomplete.prioritization import PrevalenceCounter
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class TestPrevalenceCounter(BaseTestGenerator):
+    scenarios = [
+        (
+            'When the queries are counted one by one',
+            dict(
+                queries=[
+                    'SELECT id, "Name" FROM users ORDER BY id',
+                    "select 'from' AS id -- FROM\nfrom Users /* from */;"
+                ],
+                expected_keywords={
+                    'SELECT': 2, 'from': 2, 'ORDER BY': 1, 'as': 1,
+                    'where': 0
+                },
+                expected_names={'id': 3, 'users': 1, 'Users': 1, 'Name': 0},
+                max_counts=1000
+            )
+        ), (
+            'When the query contains a function body',
+            dict(
+                queries=[
+                    'CREATE FUNCTION f() RETURNS int AS $body$ '
+                    'SELECT 1 FROM t $body$ LANGUAGE sql; SELECT 1e5'
+                ],
+                expected_keywords={'select': 1, 'from': 0, 'create': 1},
+                expected_names={'f': 1, 't': 0, 'e5': 0},
+                max_counts=1000
+            )
+        ), (
+            'When more names than kept are counted',
+            dict(
+                queries=['SELECT a, a, a, b, b, c FROM t'],
+                expected_keywords={'select': 0, 'from': 0},
+                expected_names={'a': 3, 'b': 2, 'c': 0, 't': 0},
+                max_counts=2
+            )
+        ),
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        counts = dict()
+        for query in self.queries:
+            # Counted incrementally
+            counter = PrevalenceCounter(counts)
+            counter.max_counts = self.max_counts
+            counter.update(query)
+
+        counter = PrevalenceCounter(counts)
+        self.assertLessEqual(len(counts['words']), self.max_counts)
+        self.assertLessEqual(len(counts['names']), self.max_counts)
+        for keyword, count in self.expected_keywords.items():
+            self.assertEqual(counter.keyword_count(keyword), count)
+        for name, count in self.expected_names.items():
+            self.assertEqual(counter.name_count(name), count)
+
+        counter.clear_names()
+        self.assertEqual(counts['names'], {})
@@ -0,0 +1,118 @@
+#######################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+from pgadmin.utils.driver.psycopg2 import Driver, quoted_ident_cache
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class TestQtIdent(BaseTestGenerator):
+    scenarios = [
+        (
+            'When the identifier is a plain lower case name',
+            dict(
+                func='qtIdent',
+                args=('public', 'orders'),
+                expected_return_value='public.orders'
+            )
+        ), (
+            'When the identifier contains upper case letters',
+            dict(
+                func='qtIdent',
+                args=('Public', 'Orders'),
+                expected_return_value='"Public"."Orders"'
+            )
+        ), (
+            'When the identifier contains a double quote',
+            dict(
+                func='qtIdent',
+                args=('my"table',),
+                expected_return_value='"my""table"'
+            )
+        ), (
+            'When the identifier starts with a digit',
+            dict(
+                func='qtIdent',
+                args=('1st_table',),
+                expected_return_value='"1st_table"'
+            )
+        ), (
+            'When the identifier is a reserved keyword',
+            dict(
+                func='qtIdent',
+                args=('select',),
+                expected_return_value='"select"'
+            )
+        ), (
+            'When the identifier is an unreserved keyword',
+            dict(
+                func='qtIdent',
+                args=('abort',),
+                expected_return_value='abort'
+            )
+        ), (
+            'When the identifier is an extra keyword',
+            dict(
+                func='qtIdent',
+                args=('varchar2',),
+                expected_return_value='"varchar2"'
+            )
+        ), (
+            'When the identifier is an empty string',
+            dict(
+                func='qtIdent',
+                args=('public', ''),
+                expected_return_value='public'
+            )
+        ), (
+            'When the type name is a column name keyword',
+            dict(
+                func='qtTypeIdent',
+                args=('pg_catalog', 'int'),
+                expected_return_value='pg_catalog.int'
+            )
+        ), (
+            'When the type name contains a space',
+            dict(
+                func='qtTypeIdent',
+                args=('character varying[]',),
+                expected_return_value='character varying[]'
+            )
+        ), (
+            'When the type name is already quoted',
+            dict(
+                func='qtTypeIdent',
+                args=('"MyType"',),
+                expected_return_value='"MyType"'
+            )
+        ), (
+            'When the type name contains upper case letters',
+            dict(
+                func='qtTypeIdent',
+                args=('public', 'MyType'),
+                expected_return_value='public."MyType"'
+            )
+        ),
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        quoted_ident_cache.clear()
+        func = getattr(Driver, self.func)
+
+        # The first call computes the result, the second one is served from
+        # the cache, both must return the same value.
+        self.assertEqual(func(None, *self.args), self.expected_return_value)
+        self.assertEqual(func(None, *self.args), self.expected_return_value)
+        self.assertEqual(len(quoted_ident_cache), 1)
+
+        # Quoting for types and non-types must not share the cache entries.
+        other = 'qtIdent' if self.func == 'qtTypeIdent' else 'qtTypeIdent'
+        getattr(Driver, other)(None, *self.args)
+        self.assertEqual(len(quoted_ident_cache), 2)
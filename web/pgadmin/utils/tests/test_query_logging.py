@@ -0,0 +1,95 @@
+#######################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+import logging
+
+import config
+from pgadmin.utils.driver.psycopg2.query_logging import log_query, \
+    log_query_event, QueryText, SQL
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class RecordsHandler(logging.Handler):
+    def __init__(self, level):
+        logging.Handler.__init__(self, level)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class TestQueryLogging(BaseTestGenerator):
+    scenarios = [
+        (
+            'When the SQL level is logged',
+            dict(
+                level=SQL, max_length=0, sample_rate=1.0, query_id=1234,
+                expected_messages=[
+                    u'Execute (dict) for server #1 - CONN:1 (Query-id: '
+                    u'1234):\nSELECT \u00e9 FROM t',
+                    u'Polling result for (Query-id: 1234)'
+                ]
+            )
+        ), (
+            'When the SQL level is not logged',
+            dict(
+                level=logging.WARNING, max_length=0, sample_rate=1.0,
+                query_id=1234, expected_messages=[]
+            )
+        ), (
+            'When the queries are truncated',
+            dict(
+                level=SQL, max_length=6, sample_rate=1.0, query_id=1234,
+                expected_messages=[
+                    u'Execute (dict) for server #1 - CONN:1 (Query-id: '
+                    u'1234):\nSELECT... (15 characters)',
+                    u'Polling result for (Query-id: 1234)'
+                ]
+            )
+        ), (
+            'When the query is not sampled',
+            dict(
+                level=SQL, max_length=0, sample_rate=0.5, query_id=9999,
+                expected_messages=[]
+            )
+        )
+    ]
+
+    def setUp(self):
+        self.saved_config = (config.SQL_LOG_MAX_LENGTH,
+                             config.SQL_LOG_SAMPLE_RATE)
+        self.handler = RecordsHandler(self.level)
+        self.app.logger.addHandler(self.handler)
+
+    def runTest(self):
+        config.SQL_LOG_MAX_LENGTH = self.max_length
+        config.SQL_LOG_SAMPLE_RATE = self.sample_rate
+
+        # The query is decoded only when the record is formatted
+        query = u'SELECT \u00e9 FROM t'.encode('utf-8')
+        self.assertTrue(QueryText(query, 'utf-8').text().endswith(
+            u'characters)' if self.max_length else u'\u00e9 FROM t'))
+
+        with self.app.app_context():
+            log_query('dict', 1, 'CONN:1', self.query_id, query, 'utf-8')
+            log_query_event('Polling result for', self.query_id)
+
+        # Other handlers may accept the SQL level
+        records = [
+            r for r in self.handler.records if r.levelno >= self.level
+        ]
+        self.assertEqual(
+            [r.getMessage() for r in records], self.expected_messages
+        )
+        for record in records:
+            self.assertEqual(record.query_id, self.query_id)
+
+    def tearDown(self):
+        self.app.logger.removeHandler(self.handler)
+        config.SQL_LOG_MAX_LENGTH, config.SQL_LOG_SAMPLE_RATE = \
+            self.saved_config
@@ -0,0 +1,47 @@
+#######################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+from pgadmin.utils.driver.psycopg2 import QuotedIdentCache
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class TestQuotedIdentCache(BaseTestGenerator):
+    scenarios = [
+        (
+            'When the cache is full, the least recently used entry is evicted',
+            dict(
+                maxsize=2,
+                keys=['a', 'b', 'a', 'c'],
+                expected_keys=['a', 'c'],
+                evicted_keys=['b']
+            )
+        ), (
+            'When the cache is not full, nothing is evicted',
+            dict(
+                maxsize=3,
+                keys=['a', 'b', 'c'],
+                expected_keys=['a', 'b', 'c'],
+                evicted_keys=[]
+            )
+        ),
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        cache = QuotedIdentCache(self.maxsize)
+        for key in self.keys:
+            if cache.get(key) is None:
+                cache.set(key, key.upper())
+
+        self.assertEqual(len(cache), len(self.expected_keys))
+        for key in self.expected_keys:
+            self.assertEqual(cache.get(key), key.upper())
+        for key in self.evicted_keys:
+            self.assertIsNone(cache.get(key))
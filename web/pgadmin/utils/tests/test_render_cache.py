@@ -0,0 +1,72 @@
+#######################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+from flask import Response
+
+from pgadmin.utils import render_cache
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class TestRenderCache(BaseTestGenerator):
+    scenarios = [
+        (
+            'When the script is requested again',
+            dict(
+                url='/test/script.js', revalidate=False,
+                expected_status=200, expected_renderings=1
+            )
+        ), (
+            'When the script is revalidated by the browser',
+            dict(
+                url='/test/script.js', revalidate=True,
+                expected_status=304, expected_renderings=1
+            )
+        ), (
+            'When another version of the script is requested',
+            dict(
+                url='/test/script.js?ver=2', revalidate=False,
+                expected_status=200, expected_renderings=2
+            )
+        )
+    ]
+
+    def setUp(self):
+        render_cache.clear()
+        self.renderings = 0
+
+    def runTest(self):
+        @render_cache.cached_render()
+        def script():
+            self.renderings += 1
+            return Response(
+                response='var x = 1;', status=200,
+                mimetype='application/javascript'
+            )
+
+        with self.app.test_request_context('/test/script.js'):
+            first = script()
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.mimetype, 'application/javascript')
+        self.assertEqual(first.headers['Cache-Control'], 'no-cache')
+        etag, weak = first.get_etag()
+        self.assertFalse(weak)
+
+        headers = {'If-None-Match': '"%s"' % etag} if self.revalidate \
+            else {}
+        with self.app.test_request_context(self.url, headers=headers):
+            response = script()
+
+        self.assertEqual(response.status_code, self.expected_status)
+        self.assertEqual(response.get_etag(), (etag, False))
+        self.assertEqual(self.renderings, self.expected_renderings)
+        if self.expected_status == 200:
+            self.assertEqual(response.get_data(), b'var x = 1;')
+
+    def tearDown(self):
+        render_cache.clear()
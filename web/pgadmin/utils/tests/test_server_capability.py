@@ -0,0 +1,56 @@
+#######################################################################
+#
+# pgAdmin 4 - PostgreSQL Tools
+#
+# Copyright (C) 2013 - 2019, The pgAdmin Development Team
+# This software is released under the PostgreSQL Licence
+#
+##########################################################################
+from pgadmin.utils.driver.psycopg2.server_manager import ServerManager
+from pgadmin.utils.route import BaseTestGenerator
+
+
+class TestServerCapability(BaseTestGenerator):
+    scenarios = [
+        (
+            'When the probe succeeds, it is run only once',
+            dict(
+                results=[(True, 'p'), (True, 'r')],
+                expected=[(True, 'p'), (True, 'p')],
+                expected_probes=1
+            )
+        ), (
+            'When the probe fails, the failure is not kept',
+            dict(
+                results=[(False, 'error'), (True, 'r')],
+                expected=[(False, 'error'), (True, 'r')],
+                expected_probes=2
+            )
+        ),
+    ]
+
+    def setUp(self):
+        pass
+
+    def runTest(self):
+        # The capabilities do not need the server to be connected.
+        manager = ServerManager.__new__(ServerManager)
+        manager.capabilities = dict()
+        results = list(self.results)
+
+        def probe():
+            return results.pop(0)
+
+        for expected in self.expected:
+            self.assertEqual(
+                manager.capability(('relkind', 1), probe, did=1), expected
+            )
+        self.assertEqual(
+            len(self.results) - len(results), self.expected_probes
+        )
+
+        # The capabilities are kept per database
+        self.assertEqual(
+            manager.capability(('relkind', 1), lambda: (True, 'v'), did=2),
+            (True, 'v')
+        )
@@ -550,6 +550,111 @@ describe('BackupDialogWrapper', () => {
     });
   });
 
+  describe('#proposeBackupPlan', () => {
+    let networkMock;
+    let model;
+    let tableTreeNode;
+    let treeInfo;
+
+    beforeEach(() => {
+      networkMock = new MockAdapter(axios);
+      backupDialogWrapper = new BackupDialogWrapper(
+        '<div class=\'backup_dialog\'></div>',
+        'backupDialogTitle',
+        'backup_objects',
+        jquerySpy,
+        pgBrowser,
+        alertifySpy,
+        dialogModelKlassSpy,
+        backform
+      );
+
+      model = new FakeModel();
+      model.set('format', 'custom');
+      spyOn(model, 'set').and.callThrough();
+      backupDialogWrapper.view = {model: model};
+
+      tableTreeNode = new TreeNode('table-tree-node', {
+        _type: 'table',
+        _label: 'some-table-label',
+      }, [{id: 'table-tree-node'}]);
+      treeInfo = {
+        server: {_id: 10},
+        database: {_label: 'some-database-label'},
+        schema: {_label: 'some-schema-label'},
+      };
+    });
+
+    afterEach(() => {
+      networkMock.restore();
+    });
+
+    it('requests the plan of the selected objects', (done) => {
+      let requestData;
+      networkMock.onPost('/backup/plan/10').reply((request) => {
+        requestData = JSON.parse(request.data);
+        return [200, {data: {format: 'directory', jobs: 4}}];
+      });
+
+      backupDialogWrapper.proposeBackupPlan(tableTreeNode, treeInfo);
+
+      setTimeout(() => {
+        expect(requestData).toEqual({
+          database: 'some-database-label',
+          tables: [['some-schema-label', 'some-table-label']],
+        });
+        done();
+      }, 0);
+    });
+
+    context('when the plan uses several jobs', () => {
+      beforeEach(() => {
+        networkMock.onPost('/backup/plan/10').reply(() => {
+          return [200, {data: {format: 'directory', jobs: 4}}];
+        });
+      });
+
+      it('proposes the format and the number of jobs', (done) => {
+        backupDialogWrapper.proposeBackupPlan(tableTreeNode, treeInfo);
+
+        setTimeout(() => {
+          expect(model.set).toHaveBeenCalledWith({
+            format: 'directory',
+            no_of_jobs: 4,
+          });
+          done();
+        }, 0);
+      });
+
+      it('keeps the format chosen by the user meanwhile', (done) => {
+        backupDialogWrapper.proposeBackupPlan(tableTreeNode, treeInfo);
+        model.set('format', 'plain');
+        model.set.calls.reset();
+
+        setTimeout(() => {
+          expect(model.set).not.toHaveBeenCalled();
+          done();
+        }, 0);
+      });
+    });
+
+    context('when the plan uses a single job', () => {
+      it('keeps the options of the dialog', (done) => {
+        networkMock.onPost('/backup/plan/10').reply(() => {
+          return [200, {data: {format: 'custom', jobs: 1}}];
+        });
+
+        backupDialogWrapper.proposeBackupPlan(tableTreeNode, treeInfo);
+        model.set.calls.reset();
+
+        setTimeout(() => {
+          expect(model.set).not.toHaveBeenCalled();
+          done();
+        }, 0);
+      });
+    });
+  });
+
   xdescribe('#setExtraParameters', () => {
     let selectedTreeNode;
     let treeInfo;
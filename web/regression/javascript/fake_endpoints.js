@@ -14,6 +14,7 @@ define(function () {
     'sqleditor.query_tool_start': '/sqleditor/query_tool/start/<path:trans_id>',
     'backup.create_server_job':  '/backup/job/<int:sid>',
     'backup.create_object_job':  '/backup/job/<int:sid>/object',
+    'backup.plan':  '/backup/plan/<int:sid>',
     'datagrid.initialize_datagrid': '/initialize/datagrid/<int:cmd_type>/<obj_type>/<int:sgid>/<int:sid>/<int:did>/<int:obj_id>',
     'datagrid.initialize_query_tool': '/initialize/query_tool/<int:sgid>/<int:sid>',
     'datagrid.initialize_query_tool_with_did': '/initialize/query_tool/<int:sgid>/<int:sid>/<int:did>',
@@ -226,6 +226,41 @@ describe('ExecuteQuery', () => {
               }, 0);
             });
           });
+
+          context('when a script is running', () => {
+            beforeEach(() => {
+              response = {
+                data: {
+                  status: 'Busy',
+                  script_progress: 'Running statement 2 of 3 (line 4)...',
+                },
+              };
+
+              networkMock.onGet('/sqleditor/query_tool/poll/123').reply(200, response);
+              const poll = executeQuery.poll.bind(executeQuery);
+              executeQuery.poll = jasmine.createSpy('ExecuteQuery.poll');
+              poll();
+            });
+
+            it('should show the progress of the script', (done) => {
+              setTimeout(() => {
+                expect(sqlEditorMock.trigger)
+                  .toHaveBeenCalledWith(
+                    'pgadmin-sqleditor:loading-icon:message',
+                    'Running statement 2 of 3 (line 4)...'
+                  );
+                done();
+              }, 0);
+            });
+
+            it('should poll again right away', (done) => {
+              setTimeout(() => {
+                expect(executeQuery.poll).toHaveBeenCalled();
+                expect(executeQuery.delayedPoll).not.toHaveBeenCalled();
+                done();
+              }, 0);
+            });
+          });
         });
 
         describe('when the application lost connection with the database', () => {
@@ -7,18 +7,39 @@
 #
 ##########################################################################
 
-from jinja2 import BaseLoader
+import os
+
+from jinja2 import BaseLoader, FileSystemLoader
 from jinja2 import Environment
 
+PGADMIN_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', '..', 'pgadmin'
+)
+
+
+def _template_dirs():
+    """Returns the template directories of all the modules"""
+    dirs = []
+    for root, subdirs, _ in os.walk(PGADMIN_DIR):
+        if 'templates' in subdirs:
+            dirs.append(os.path.join(root, 'templates'))
+    return dirs
+
 
 class SimpleTemplateLoader(BaseLoader):
     """ This class pretends to load whatever file content it is initialized
-    with"""
+    with. The templates imported by it (i.e. macros) are loaded from the
+    template directories of the modules."""
 
     def __init__(self, file_content):
         self.file_content = file_content
+        self.module_loader = None
 
-    def get_source(self, *args):
+    def get_source(self, environment, template):
+        if template:
+            if self.module_loader is None:
+                self.module_loader = FileSystemLoader(_template_dirs())
+            return self.module_loader.get_source(environment, template)
         return self.file_content, "fake-file-name", True
 
 
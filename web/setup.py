@@ -339,6 +339,20 @@ def load_servers(args):
         print_summary()
 
 
+def dump_module_manifest(args):
+    """Dump the manifest of the packages defining the modules.
+
+    Args:
+        args (ArgParse): The parsed command line options
+    """
+    from pgadmin.utils.module_manifest import dump_manifest
+
+    manifest = dump_manifest(args.dump_module_manifest,
+                             blacklist=config.MODULE_BLACKLIST)
+    print("Module manifest of %d packages written to %s" %
+          (len(manifest['modules']), args.dump_module_manifest))
+
+
 def setup_db():
     """Setup the configuration database."""
 
@@ -397,6 +411,11 @@ if __name__ == '__main__':
                                help='Dump/load servers for the specified '
                                     'username', required=False)
 
+    imp_exp_group.add_argument('--dump-module-manifest',
+                               metavar="OUTPUT_FILE",
+                               help='Dump the manifest of the packages '
+                                    'defining the modules', required=False)
+
     args, extra = parser.parse_known_args()
 
     config.SETTINGS_SCHEMA_VERSION = SCHEMA_VERSION
@@ -409,5 +428,7 @@ if __name__ == '__main__':
         dump_servers(args)
     elif args.load_servers is not None:
         load_servers(args)
+    elif args.dump_module_manifest is not None:
+        dump_module_manifest(args)
     else:
         setup_db()